@@ -4,16 +4,42 @@ Lee `DATABASE_URL` del entorno (por defecto, SQLite local) y expone:
 - `engine`
 - `create_db_and_tables()`
 - `get_session()`
+- `async_engine` / `get_async_session()`: misma BD con driver asíncrono
+  (aiosqlite / asyncpg) para los handlers `async def` de lectura
+- `get_read_session()` / `get_async_read_session()`: lecturas de los GET; van a
+  la réplica si se define `DATABASE_READ_URL` (si no, al mismo engine), salvo
+  para quien acaba de escribir (ver `app/helpers/read_your_writes.py`)
+- `pool_stats()` (uso del pool de conexiones, para `/health/db`)
+
+Todos los engines cuentan y cronometran sus sentencias por petición
+(`app/helpers/query_stats.py`) y guardan las lentas con su plan
+(`app/helpers/slow_queries.py`).
+
+Pool (PostgreSQL y SQLite en fichero): `DB_POOL_SIZE`, `DB_MAX_OVERFLOW`,
+`DB_POOL_TIMEOUT`; solo PostgreSQL: `DB_POOL_RECYCLE`, `DB_POOL_PRE_PING`.
+SQLite: cada conexión nueva aplica WAL (los lectores no esperan al escritor),
+`synchronous=NORMAL`, `busy_timeout` (espera en vez de "database is locked"),
+`cache_size` y `mmap_size` (`SQLITE_*`).
 """
 
 from __future__ import annotations
-from typing import Generator
-from sqlmodel import SQLModel, create_engine, Session
-from sqlalchemy import text
+import threading
+import weakref
+from typing import Any, AsyncGenerator, Generator
+from sqlmodel import create_engine, Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlalchemy.exc import OperationalError
+from fastapi import Request
 import os
 from dotenv import load_dotenv
 
+from app.helpers.query_stats import attach_query_stats
+from app.helpers.read_your_writes import prefers_primary
+from app.helpers.slow_queries import attach_slow_query_log
+
 # Carga .env si existe; si está corrupto, continúa con valores por defecto.
 try:
     load_dotenv()
@@ -32,94 +58,248 @@ if any(token in DATABASE_URL for token in [
     print("[WARN] DATABASE_URL parece un ejemplo; usando SQLite (./data.db).")
     DATABASE_URL = "sqlite:///./data.db"
 
-# Para SQLite conviene activar check_same_thread=False para uso con FastAPI
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {},
-)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # segundos; -1 desactiva
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "1").lower() not in {"0", "false", "no"}
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+SQLITE_CACHE_SIZE_KB = int(os.getenv("SQLITE_CACHE_SIZE_KB", "20000"))
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+SQLITE_WAL = os.getenv("SQLITE_WAL", "1").lower() not in {"0", "false", "no"}
 
 
-def create_db_and_tables() -> None:
-    """Crear todas las tablas definidas en los modelos SQLModel.
+def _sqlite_in_memory(url: str) -> bool:
+    return url.split("?", 1)[0] in ("sqlite://", "sqlite:///:memory:")
 
-    Importa cada módulo de modelos que define una clase *Table para que se
-    registren en el metadata antes de crear las tablas.
-    """
-    global engine
-    import app.models.barber          # BarberTable
+
+def _apply_sqlite_pragmas(dbapi_conn, _record) -> None:
+    cur = dbapi_conn.cursor()
+    try:
+        if SQLITE_WAL:
+            cur.execute("PRAGMA journal_mode=WAL")  # persistente en el fichero; en memoria se ignora
+            cur.execute("PRAGMA synchronous=NORMAL")  # seguro con WAL y mucho más rápido que FULL
+        cur.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS:d}")
+        cur.execute(f"PRAGMA cache_size={-SQLITE_CACHE_SIZE_KB:d}")  # negativo = KiB
+        cur.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE:d}")
+        cur.execute("PRAGMA temp_store=MEMORY")
+    finally:
+        cur.close()
+
+
+class _PoolUsage:
+    """Contadores del pool alimentados por eventos (checkout/checkin)."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.in_use = 0
+        self.peak = 0
+        self.checkouts = 0
+        self.connects = 0
+
+    def attach(self, target: Engine) -> None:
+        @event.listens_for(target, "connect")
+        def _on_connect(_dbapi_conn, _record):
+            with self.lock:
+                self.connects += 1
+
+        @event.listens_for(target, "checkout")
+        def _on_checkout(_dbapi_conn, _record, _proxy):
+            with self.lock:
+                self.checkouts += 1
+                self.in_use += 1
+                self.peak = max(self.peak, self.in_use)
+
+        @event.listens_for(target, "checkin")
+        def _on_checkin(_dbapi_conn, _record):
+            with self.lock:
+                self.in_use = max(0, self.in_use - 1)
+
+
+_pool_usage: "weakref.WeakKeyDictionary[Engine, _PoolUsage]" = weakref.WeakKeyDictionary()
+
+
+def _engine_kwargs(url: str) -> dict[str, Any]:
+    kwargs: dict[str, Any] = {}
+    if url.startswith("sqlite"):
+        # check_same_thread=False para uso con FastAPI; timeout = busy_timeout del driver
+        kwargs["connect_args"] = {"check_same_thread": False, "timeout": SQLITE_BUSY_TIMEOUT_MS / 1000}
+        if not _sqlite_in_memory(url):
+            kwargs.update(pool_size=DB_POOL_SIZE, max_overflow=DB_MAX_OVERFLOW, pool_timeout=DB_POOL_TIMEOUT)
+    else:
+        kwargs.update(
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT,
+            pool_recycle=DB_POOL_RECYCLE,
+            pool_pre_ping=DB_POOL_PRE_PING,
+        )
+    return kwargs
+
+
+def _instrument(target: Engine, url: str) -> None:
+    if url.startswith("sqlite"):
+        event.listen(target, "connect", _apply_sqlite_pragmas)
+    usage = _PoolUsage()
+    usage.attach(target)
+    _pool_usage[target] = usage
+    attach_query_stats(target)  # consultas por petición (Server-Timing, N+1)
+    attach_slow_query_log(target)  # consultas lentas con su plan (/admin/slow-queries)
+
+
+def make_engine(url: str) -> Engine:
+    """Engine con el pool y, en SQLite, los PRAGMA configurados por entorno."""
+    new_engine = create_engine(url, **_engine_kwargs(url))
+    _instrument(new_engine, url)
+    return new_engine
+
+
+def async_url(url: str) -> str:
+    """URL equivalente con driver asíncrono: sqlite -> aiosqlite, postgresql -> asyncpg."""
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite":
+        return parsed.set(drivername="sqlite+aiosqlite").render_as_string(hide_password=False)
+    if parsed.get_backend_name() == "postgresql":
+        return parsed.set(drivername="postgresql+asyncpg").render_as_string(hide_password=False)
+    return url
+
+
+def make_async_engine(url: str) -> AsyncEngine:
+    """Engine asíncrono con el mismo pool y PRAGMA que `make_engine` (eventos en `sync_engine`)."""
+    kwargs = _engine_kwargs(url)
+    if url.startswith("sqlite"):
+        kwargs["connect_args"] = {"timeout": SQLITE_BUSY_TIMEOUT_MS / 1000}  # aiosqlite ya usa su propio hilo
+    new_engine = create_async_engine(url, **kwargs)
+    _instrument(new_engine.sync_engine, url)
+    return new_engine
+
+
+engine = make_engine(DATABASE_URL)
+async_engine = make_async_engine(os.getenv("ASYNC_DATABASE_URL") or async_url(DATABASE_URL))
+
+# Réplica de lectura opcional: sin ella, las lecturas usan los mismos engines
+DATABASE_READ_URL = os.getenv("DATABASE_READ_URL") or None
+read_engine = make_engine(DATABASE_READ_URL) if DATABASE_READ_URL else None
+async_read_engine = make_async_engine(async_url(DATABASE_READ_URL)) if DATABASE_READ_URL else None
+
+
+def read_replica_enabled() -> bool:
+    return read_engine is not None
+
+
+def _import_models() -> None:
+    """Importa cada módulo con clases *Table para registrarlas en el metadata."""
+    import app.models.barber          # BarberTable & BarberServiceTable
     import app.models.barbershop      # BarbershopTable
     import app.models.service         # ServiceTable
     import app.models.category        # ProductCategoryTable & ServiceCategoryTable
-    import app.models.product         # ProductTable
+    import app.models.product         # ProductTable & InventoryTable
     import app.models.gallery         # GalleryItemTable
     import app.models.review          # ReviewTable
     import app.models.booking         # BookingTable
     import app.models.user            # UserTable
+    import app.models.token           # RevokedTokenTable
+    import app.models.seed_state      # SeedStateTable
+    import app.models.schema_migration  # SchemaMigrationTable
+
+
+def create_db_and_tables() -> None:
+    """Crear/actualizar el esquema con las migraciones versionadas (`app/migrations.py`).
+
+    Con la BD al día es una sola consulta a `schema_migrations`; las pendientes
+    se aplican una vez, bajo bloqueo, aunque arranquen varios workers a la vez.
+    """
+    global engine, async_engine, read_engine, async_read_engine
+    from app.migrations import migrate
+    _import_models()
     try:
-        SQLModel.metadata.create_all(engine)
-        # Migración ligera: añadir columnas si faltan (SQLite/PostgreSQL)
-        if engine.url.drivername.startswith("sqlite"):
-            with engine.connect() as conn:
-                cols = [row[1] for row in conn.execute(text("PRAGMA table_info('user')"))]
-                changed = False
-                if "phone" not in cols:
-                    conn.execute(text("ALTER TABLE user ADD COLUMN phone VARCHAR(30)"))
-                    changed = True
-                if "birth_date" not in cols:
-                    conn.execute(text("ALTER TABLE user ADD COLUMN birth_date DATE"))
-                    changed = True
-                if "photo_url" not in cols:
-                    conn.execute(text("ALTER TABLE user ADD COLUMN photo_url VARCHAR(255)"))
-                    changed = True
-                review_cols = [row[1] for row in conn.execute(text("PRAGMA table_info('reviews')"))]
-                if "userPhotoUrl" not in review_cols:
-                    conn.execute(text("ALTER TABLE reviews ADD COLUMN userPhotoUrl VARCHAR(255)"))
-                    changed = True
-                if "userId" not in review_cols:
-                    conn.execute(text("ALTER TABLE reviews ADD COLUMN userId INTEGER"))
-                    changed = True
-                if changed:
-                    conn.commit()
-        elif engine.url.drivername.startswith("postgresql"):
-            # Soporte básico de migración para Postgres en despliegues con esa BD
-            with engine.connect() as conn:
-                changed = False
-                # Columnas de user
-                user_cols = [row[0] for row in conn.execute(text("SELECT column_name FROM information_schema.columns WHERE table_name = 'user'"))]
-                if "phone" not in user_cols:
-                    conn.execute(text("ALTER TABLE \"user\" ADD COLUMN phone VARCHAR(30)"))
-                    changed = True
-                if "birth_date" not in user_cols:
-                    conn.execute(text("ALTER TABLE \"user\" ADD COLUMN birth_date DATE"))
-                    changed = True
-                if "photo_url" not in user_cols:
-                    conn.execute(text("ALTER TABLE \"user\" ADD COLUMN photo_url VARCHAR(255)"))
-                    changed = True
-                # Columnas de reviews
-                review_cols = [row[0] for row in conn.execute(text("SELECT column_name FROM information_schema.columns WHERE table_name = 'reviews'"))]
-                if "userPhotoUrl" not in review_cols:
-                    conn.execute(text("ALTER TABLE reviews ADD COLUMN \"userPhotoUrl\" VARCHAR(255)"))
-                    changed = True
-                if "userId" not in review_cols:
-                    conn.execute(text("ALTER TABLE reviews ADD COLUMN \"userId\" INTEGER"))
-                    changed = True
-                if changed:
-                    conn.commit()
+        applied = migrate(engine)
     except OperationalError as e:
         # Si falla (p. ej. Postgres sin credenciales), usar SQLite local
         if DATABASE_URL.startswith("postgresql"):
             print(f"[WARN] Conexión BD falló: {e}. Fallback a SQLite ./data.db")
             fallback_url = "sqlite:///./data.db"
-            engine = create_engine(
-                fallback_url,
-                connect_args={"check_same_thread": False},
-            )
-            SQLModel.metadata.create_all(engine)
+            engine = make_engine(fallback_url)
+            async_engine = make_async_engine(async_url(fallback_url))
+            read_engine = async_read_engine = None  # sin primario, tampoco réplica
+            applied = migrate(engine)
         else:
             raise
+    if applied and engine.dialect.name == "sqlite":
+        # Las conexiones abiertas antes de migrar planifican con el esquema anterior
+        # (p. ej. no usan índices de expresión nuevos): renovarlas
+        engine.dispose()
+
+
+def _pool_info(target: Engine) -> dict[str, Any]:
+    pool = target.pool
+    stats: dict[str, Any] = {"driver": target.dialect.driver, "pool": type(pool).__name__}
+    capacity = None
+    if hasattr(pool, "checkedout"):  # QueuePool
+        capacity = pool.size() + max(0, pool._max_overflow)
+        stats.update(
+            size=pool.size(),
+            maxOverflow=pool._max_overflow,
+            checkedOut=pool.checkedout(),
+            checkedIn=pool.checkedin(),
+            overflow=pool.overflow(),
+            timeoutSeconds=pool.timeout(),
+        )
+    usage = _pool_usage.get(target) or _PoolUsage()
+    with usage.lock:
+        stats.update(
+            inUse=usage.in_use,
+            peakInUse=usage.peak,
+            checkouts=usage.checkouts,
+            connects=usage.connects,
+        )
+    stats["utilization"] = round(stats["inUse"] / capacity, 3) if capacity else None
+    return stats
+
+
+def pool_stats() -> dict[str, Any]:
+    """Uso de los pools (síncrono y asíncrono): conexiones en uso (actual y pico) y ocupación sobre el máximo."""
+    stats: dict[str, Any] = {"dialect": engine.dialect.name, **_pool_info(engine), "async": _pool_info(async_engine.sync_engine)}
+    if read_engine is not None and async_read_engine is not None:
+        stats["replica"] = {**_pool_info(read_engine), "async": _pool_info(async_read_engine.sync_engine)}
+    if engine.dialect.name == "sqlite":
+        with engine.connect() as conn:
+            stats["sqlite"] = {
+                p: conn.exec_driver_sql(f"PRAGMA {p}").scalar()
+                for p in ("journal_mode", "synchronous", "busy_timeout", "cache_size", "mmap_size")
+            }
+    return stats
 
 
 def get_session() -> Generator[Session, None, None]:
     """Dependencia FastAPI para obtener una sesión de BD."""
     with Session(engine) as session:
         yield session
+
+
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    """Dependencia FastAPI para handlers `async def`: las consultas no ocupan el threadpool.
+
+    El código síncrono existente (p. ej. `load_barbers(session)`) se reutiliza
+    con `await session.run_sync(load_barbers)`, que ejecuta la misma lógica ORM
+    sobre el driver asíncrono.
+    """
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        yield session
+
+
+def get_read_session(request: Request) -> Generator[Session, None, None]:
+    """Dependencia para GET: sesión sobre la réplica (o el primario si no hay réplica
+    o si quien pide acaba de escribir). Las comprobaciones que deciden una escritura
+    (p. ej. `_is_slot_booked_sql`) deben seguir usando `get_session`.
+    """
+    target = engine if read_engine is None or prefers_primary(request) else read_engine
+    with Session(target) as session:
+        yield session
+
+
+async def get_async_read_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """`get_read_session` para handlers `async def`."""
+    target = async_engine if async_read_engine is None or prefers_primary(request) else async_read_engine
+    async with AsyncSession(target, expire_on_commit=False) as session:
+        yield session
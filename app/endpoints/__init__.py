@@ -1,36 +1,70 @@
 """
 Registro central de routers. Se añade aquí cualquier nuevo recurso.
+
+Los límites de peticiones se definen aquí por router; cada uno admite
+sobreescritura por entorno (p. ej. `RATE_LIMIT_AUTH_IP=5/minute`, `off` desactiva).
 """
-from fastapi import FastAPI
+from fastapi import FastAPI, Depends
+
+from app.helpers.rate_limit import rate_limit, limit_from_env
 
 from .root import router as root_router
 from .health import router as health_router
 from .barbers import router as barbers_router
 from .barbershop import router as barbershop_router
+from .barbershops import router as barbershops_router
 from .services import router as services_router
 from .service_categories import router as service_categories_router
 from .products import router as products_router
 from .product_categories import router as product_categories_router
+from .inventory import router as inventory_router
 from .gallery import router as gallery_router
 from .reviews import router as reviews_router
 from .availability import router as availability_router
 from .bookings import router as bookings_router
 from .auth import router as auth_router
 from .users import router as users_router
+from .bootstrap import router as bootstrap_router
+from .admin import router as admin_router
 
 
 def register_routers(app: FastAPI) -> None:
     app.include_router(root_router)
     app.include_router(health_router)
+    app.include_router(bootstrap_router)
     app.include_router(barbers_router)
     app.include_router(barbershop_router)
+    app.include_router(barbershops_router)
     app.include_router(services_router)
     app.include_router(service_categories_router)
     app.include_router(products_router)
     app.include_router(product_categories_router)
+    app.include_router(inventory_router)
     app.include_router(gallery_router)
     app.include_router(reviews_router)
-    app.include_router(availability_router)
-    app.include_router(bookings_router)
-    app.include_router(auth_router)
-    app.include_router(users_router)
\ No newline at end of file
+    app.include_router(
+        availability_router,
+        dependencies=[Depends(rate_limit(
+            "availability",
+            per_ip=limit_from_env("RATE_LIMIT_AVAILABILITY_IP", "120/minute"),
+        ))],
+    )
+    app.include_router(
+        bookings_router,
+        dependencies=[Depends(rate_limit(
+            "bookings",
+            per_ip=limit_from_env("RATE_LIMIT_BOOKINGS_IP", "30/minute"),
+            per_user=limit_from_env("RATE_LIMIT_BOOKINGS_USER", "10/minute"),
+            methods=["POST"],
+        ))],
+    )
+    app.include_router(
+        auth_router,
+        dependencies=[Depends(rate_limit(
+            "auth",
+            per_ip=limit_from_env("RATE_LIMIT_AUTH_IP", "10/minute"),
+            methods=["POST"],
+        ))],
+    )
+    app.include_router(users_router)
+    app.include_router(admin_router)
\ No newline at end of file
@@ -0,0 +1,24 @@
+from fastapi import APIRouter, Depends, Query
+
+from app.endpoints.auth import require_admin
+from app.helpers.slow_queries import slow_query_log
+
+router = APIRouter(prefix="/admin", tags=["admin"], dependencies=[Depends(require_admin)])
+
+
+@router.get("/slow-queries", summary="Consultas lentas agrupadas por fingerprint (con plan de ejecución)")
+def get_slow_queries(limit: int = Query(50, ge=1, le=500)):
+    groups = slow_query_log.grouped()
+    return {
+        "enabled": slow_query_log.enabled,
+        "thresholdMs": slow_query_log.threshold_ms,
+        "capacity": slow_query_log.capacity,
+        "entries": sum(g["count"] for g in groups),
+        "groups": groups[:limit],
+    }
+
+
+@router.delete("/slow-queries", summary="Vaciar el registro de consultas lentas", status_code=204)
+def clear_slow_queries():
+    slow_query_log.clear()
+    return None
@@ -1,6 +1,7 @@
 from datetime import datetime, timedelta, timezone
 from typing import Optional, List
 import os
+import uuid
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
@@ -10,7 +11,10 @@ from pydantic import BaseModel, Field
 from sqlmodel import Session, select
 
 from app.db import get_session
+from app.helpers.cache import catalog_cache
+from app.helpers.conditional import conditional_get
 from app.models.user import UserTable
+from app.helpers.token_store import revocation_store
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -76,7 +80,7 @@ def authenticate_user(session: Session, username: str, password: str) -> Optiona
         return None
     return user
 
-def create_token(subject: str, roles: List[str], expires_delta: timedelta) -> str:
+def create_token(subject: str, roles: List[str], expires_delta: timedelta, extra: Optional[dict] = None) -> str:
     now = datetime.now(timezone.utc)
     payload = {
         "sub": subject,
@@ -84,13 +88,21 @@ def create_token(subject: str, roles: List[str], expires_delta: timedelta) -> st
         "iat": int(now.timestamp()),
         "exp": int((now + expires_delta).timestamp()),
     }
+    if extra:
+        payload.update(extra)
     return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
 
 def create_access_token(username: str, roles: List[str]) -> str:
     return create_token(username, roles, timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
 
 def create_refresh_token(username: str, roles: List[str]) -> str:
-    return create_token(username, roles, timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS))
+    # `jti` único por token: permite rotarlo (un solo uso) y revocarlo
+    return create_token(
+        username,
+        roles,
+        timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS),
+        extra={"typ": "refresh", "jti": uuid.uuid4().hex},
+    )
 
 def decode_token(token: str) -> dict:
     try:
@@ -98,14 +110,28 @@ def decode_token(token: str) -> dict:
     except JWTError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token inválido")
 
-def get_current_user(token: str = Depends(oauth2_scheme)) -> UserInfo:
+def _decode_refresh_token(token: str) -> dict:
     payload = decode_token(token)
+    if payload.get("typ") != "refresh" or not payload.get("jti") or not payload.get("sub"):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Refresh token inválido")
+    return payload
+
+async def get_current_user(token: str = Depends(oauth2_scheme)) -> UserInfo:
+    # Sin E/S (solo decodifica el JWT): `async def` evita un salto al threadpool por petición
+    payload = decode_token(token)
+    if payload.get("typ") == "refresh":
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token inválido (refresh token)")
     username: str = payload.get("sub")
     roles: List[str] = payload.get("roles") or []
     if not username:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token inválido (sin sub)")
     return UserInfo(username=username, roles=roles)
 
+async def require_admin(current: UserInfo = Depends(get_current_user)) -> UserInfo:
+    if "admin" not in current.roles:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Se requiere rol de administrador")
+    return current
+
 # Endpoints
 @router.post("/register", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
 def register(req: RegisterRequest, session: Session = Depends(get_session)):
@@ -128,6 +154,7 @@ def register(req: RegisterRequest, session: Session = Depends(get_session)):
     )
     session.add(user)
     session.commit()
+    catalog_cache.invalidate("users")
     session.refresh(user)
 
     access = create_access_token(user.username, user.roles)
@@ -143,16 +170,25 @@ def login(req: LoginRequest, session: Session = Depends(get_session)):
     refresh = create_refresh_token(user.username, user.roles)
     return TokenResponse(access_token=access, refresh_token=refresh)
 
-@router.post("/refresh", response_model=AccessTokenResponse)
-def refresh(req: RefreshRequest):
-    payload = decode_token(req.refresh_token)
-    username: str = payload.get("sub")
+@router.post("/refresh", response_model=TokenResponse)
+def refresh(req: RefreshRequest, session: Session = Depends(get_session)):
+    """Rota el refresh token: el recibido queda consumido y se emite uno nuevo."""
+    payload = _decode_refresh_token(req.refresh_token)
+    username: str = payload["sub"]
     roles: List[str] = payload.get("roles") or []
-    if not username:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Refresh token inválido")
+    if not revocation_store.revoke(session, payload["jti"], int(payload["exp"])):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Refresh token revocado o ya utilizado")
     access = create_access_token(username, roles)
-    return AccessTokenResponse(access_token=access)
+    new_refresh = create_refresh_token(username, roles)
+    return TokenResponse(access_token=access, refresh_token=new_refresh)
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+def logout(req: RefreshRequest, session: Session = Depends(get_session)):
+    """Revoca el refresh token indicado (idempotente)."""
+    payload = _decode_refresh_token(req.refresh_token)
+    revocation_store.revoke(session, payload["jti"], int(payload["exp"]))
+    return None
 
-@router.get("/me", response_model=UserInfo)
+@router.get("/me", response_model=UserInfo, dependencies=[Depends(conditional_get(user_dependency=get_current_user))])
 def me(current: UserInfo = Depends(get_current_user)):
     return current
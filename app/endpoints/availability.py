@@ -3,11 +3,13 @@ from pydantic import BaseModel, Field
 from datetime import datetime, timedelta
 from typing import Optional
 
-from app.helpers.db_memory import DB
+from app.helpers.db_memory import memory_repo
 from app.helpers.scheduling import parse_hhmm, daterange_times, get_weekly_hours, is_slot_booked
 from app.models.availability import AvailabilityResponse
-from sqlmodel import Session, select, col
-from app.db import get_session
+from sqlmodel import select, col
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.db import get_async_read_session
+from app.helpers.conditional import conditional_get
 from app.models.booking import BookingTable as BookingDB
 from app.models.service import ServiceTable as ServiceDB
 from app.models.barber import BarberTable as BarberDB
@@ -25,16 +27,16 @@ class AvailabilityRequest(BaseModel):
     serviceId: Optional[int] = None
 
 
-def _compute_availability(barber_id: int, date_str: str, slot_minutes: int, service_id: Optional[int], session: Session) -> AvailabilityResponse:
+async def _compute_availability(barber_id: int, date_str: str, slot_minutes: int, service_id: Optional[int], session: AsyncSession) -> AvailabilityResponse:
     # Buscar primero en SQL; si no existe, caer a memoria para compatibilidad
-    b_sql = session.get(BarberDB, barber_id)
+    b_sql = await session.get(BarberDB, barber_id)
     if b_sql:
         barber = {
             "id": b_sql.id,
             "workingHours": b_sql.workingHours or {},
         }
     else:
-        barber = next((x for x in DB.get("barbers", []) if x.get("id") == barber_id), None)
+        barber = memory_repo().get("barbers", barber_id)
         if not barber:
             raise HTTPException(status_code=404, detail="No existe un barbero con ese id")
 
@@ -54,7 +56,7 @@ def _compute_availability(barber_id: int, date_str: str, slot_minutes: int, serv
     # Determinar duración efectiva a bloquear: si hay serviceId, usar su duración; si no, usar slotMinutes o 30.
     duration_minutes = slot_minutes
     if service_id is not None:
-        svc = session.get(ServiceDB, service_id)
+        svc = await session.get(ServiceDB, service_id)
         if svc and getattr(svc, "durationMinutes", None):
             try:
                 duration_minutes = int(svc.durationMinutes)
@@ -64,9 +66,16 @@ def _compute_availability(barber_id: int, date_str: str, slot_minutes: int, serv
 
     slots = daterange_times(open_t, close_t, slot_minutes)
     available = []
-    # Cargar reservas existentes para el barbero y fecha (SQL + memoria) y construir intervalos
+    # Cargar reservas existentes para el barbero y fecha (SQL + memoria) y construir intervalos.
+    # Solo las del día: rango sobre "YYYY-MM-DDTHH:MM" en lugar de todo el histórico del barbero
     existing_intervals: list[tuple[datetime, datetime]] = []
-    sql_rows = session.exec(select(BookingDB).where(col(BookingDB.barberId) == barber_id)).all()
+    sql_rows = (await session.exec(
+        select(BookingDB).where(
+            col(BookingDB.barberId) == barber_id,
+            col(BookingDB.start) >= f"{date_str}T",
+            col(BookingDB.start) < f"{date_str}U",
+        )
+    )).all()
     for r in sql_rows:
         # Ignorar canceladas
         if getattr(r, "status", None) and r.status.lower() in CANCELLED_STATES:
@@ -78,10 +87,12 @@ def _compute_availability(barber_id: int, date_str: str, slot_minutes: int, serv
                 existing_intervals.append((sdt, edt))
             except Exception:
                 pass
-    for r in DB.get("bookings", []):
+    # Reservas en memoria: solo si el barbero es de memoria (BD sin datos)
+    mem_rows = [] if b_sql else memory_repo().find("bookings", "barberId", barber_id)
+    for r in mem_rows:
         if r.get("status", "").lower() in CANCELLED_STATES:
             continue
-        if r.get("barberId") == barber_id and isinstance(r.get("start"), str) and r["start"].startswith(f"{date_str}T"):
+        if isinstance(r.get("start"), str) and r["start"].startswith(f"{date_str}T"):
             try:
                 sdt = datetime.strptime(r["start"], "%Y-%m-%dT%H:%M")
                 edt = datetime.strptime(r["end"], "%Y-%m-%dT%H:%M")
@@ -113,17 +124,17 @@ def _compute_availability(barber_id: int, date_str: str, slot_minutes: int, serv
     return AvailabilityResponse(barberId=barber_id, date=date_str, timezone=tz, slotMinutes=slot_minutes, available=available)
 
 
-@router.get("", summary="Obtener disponibilidad (GET retrocompatible)", response_model=AvailabilityResponse)
-def get_availability(
+@router.get("", summary="Obtener disponibilidad (GET retrocompatible)", response_model=AvailabilityResponse, dependencies=[Depends(conditional_get("bookings", "barbers", "services"))])
+async def get_availability(
     barberId: int = Query(..., description="Id del barbero"),
     dateStr: str = Query(..., description="Fecha YYYY-MM-DD"),
     slotMinutes: int = Query(30, ge=5, le=60, description="Granularidad del slot (por defecto 30 minutos)"),
     serviceId: Optional[int] = Query(None, description="Opcional: id de servicio"),
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_read_session),
 ):
-    return _compute_availability(barberId, dateStr, slotMinutes, serviceId, session)
+    return await _compute_availability(barberId, dateStr, slotMinutes, serviceId, session)
 
 
 @router.post("", summary="Obtener disponibilidad (POST recomendado)", response_model=AvailabilityResponse)
-def post_availability(payload: AvailabilityRequest, session: Session = Depends(get_session)):
-    return _compute_availability(payload.barberId, payload.dateStr, payload.slotMinutes, payload.serviceId, session)
\ No newline at end of file
+async def post_availability(payload: AvailabilityRequest, session: AsyncSession = Depends(get_async_read_session)):
+    return await _compute_availability(payload.barberId, payload.dateStr, payload.slotMinutes, payload.serviceId, session)
\ No newline at end of file
@@ -1,10 +1,18 @@
+from typing import Optional
+
 from fastapi import APIRouter, HTTPException, Depends
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.db import get_session
+from app.db import get_async_read_session, get_session
+from app.helpers.conditional import conditional_get
+from app.helpers.cache import cached_response_async, catalog_cache
+from app.helpers.barber_services import delete_barber_links, sync_barber_services
 from app.models.barber import BarberTable as BarberDB
+from app.models.barber import BarberServiceTable as BarberServiceDB
 from app.models.barber import Barber
-from app.helpers.db_memory import DB
+from app.helpers.db_memory import memory_repo
+from app.helpers.fast_json import fast_json_enabled, project
 
 router = APIRouter(prefix="/barbers", tags=["barbers"])
 
@@ -31,44 +39,68 @@ def _from_mem(x: dict) -> Barber:
     )
 
 
-@router.get("", summary="Listado de barberos", response_model=list[Barber])
-def get_barbers(session: Session = Depends(get_session)):
-    items_db = session.exec(select(BarberDB)).all()
-    if items_db:                 # Si hay datos en la tabla, usar DB SQL
+def load_barbers(session: Session, barbershop_id: Optional[int] = None) -> list[Barber]:
+    if session.exec(select(BarberDB.id).limit(1)).first() is not None:  # Si hay datos en la tabla, usar DB SQL
+        stmt = select(BarberDB)
+        if barbershop_id is not None:
+            stmt = stmt.where(BarberDB.barbershopId == barbershop_id)
+        items_db = session.exec(stmt.order_by(BarberDB.id)).all()
+        if fast_json_enabled():
+            return project(items_db, Barber)  # sin modelo intermedio
         return [_to_pydantic(x) for x in items_db]
-    return [_from_mem(x) for x in DB.get("barbers", [])]
-
-
-@router.get("/{barber_id}", summary="Detalle de un barbero", response_model=Barber)
-def get_barber(barber_id: int, session: Session = Depends(get_session)):
-    b = session.get(BarberDB, barber_id)
-    if b:
-        return _to_pydantic(b)
-    m = next((x for x in DB.get("barbers", []) if x.get("id") == barber_id), None)
-    if not m:
-        raise HTTPException(status_code=404, detail="No existe un barbero con ese id")
-    return _from_mem(m)
-
-
-@router.get("/by-service/{service_id}", summary="Barberos que ofrecen un servicio", response_model=list[Barber])
-def get_barbers_by_service(service_id: int, session: Session = Depends(get_session)):
-    items_db = session.exec(select(BarberDB)).all()
-    if items_db:
-        filtered = [b for b in items_db if b.isActive and (b.servicesOffered and int(service_id) in b.servicesOffered)]
-        return [_to_pydantic(b) for b in filtered]
-    items_mem = DB.get("barbers", [])
-    filtered_mem = [
-        x for x in items_mem
-        if x.get("isActive", True) and int(service_id) in (x.get("servicesOffered") or [])
-    ]
-    return [_from_mem(x) for x in filtered_mem]
+    repo = memory_repo()
+    items_mem = repo.find("barbers", "barbershopId", barbershop_id) if barbershop_id is not None else repo.all("barbers")
+    return [_from_mem(x) for x in items_mem]
+
+
+@router.get("", summary="Listado de barberos", response_model=list[Barber], dependencies=[Depends(conditional_get("barbers"))])
+async def get_barbers(session: AsyncSession = Depends(get_async_read_session)):
+    return await cached_response_async("barbers", "all", lambda: session.run_sync(load_barbers))
+
+
+@router.get("/{barber_id}", summary="Detalle de un barbero", response_model=Barber, dependencies=[Depends(conditional_get("barbers"))])
+async def get_barber(barber_id: int, session: AsyncSession = Depends(get_async_read_session)):
+    def build(session: Session):
+        b = session.get(BarberDB, barber_id)
+        if b:
+            return _to_pydantic(b)
+        m = memory_repo().get("barbers", barber_id)
+        if not m:
+            raise HTTPException(status_code=404, detail="No existe un barbero con ese id")
+        return _from_mem(m)
+
+    return await cached_response_async("barbers", f"id:{barber_id}", lambda: session.run_sync(build))
+
+
+@router.get("/by-service/{service_id}", summary="Barberos que ofrecen un servicio", response_model=list[Barber], dependencies=[Depends(conditional_get("barbers"))])
+async def get_barbers_by_service(service_id: int, session: AsyncSession = Depends(get_async_read_session)):
+    def build(session: Session):
+        # Join indexado por (serviceId, barberId) en vez de filtrar el JSON en Python
+        rows = session.exec(
+            select(BarberDB)
+            .join(BarberServiceDB, BarberServiceDB.barberId == BarberDB.id)
+            .where(BarberServiceDB.serviceId == service_id, BarberDB.isActive == True)  # noqa: E712
+            .order_by(BarberDB.id)
+        ).all()
+        if rows or session.exec(select(BarberDB.id).limit(1)).first() is not None:
+            return [_to_pydantic(b) for b in rows]
+        filtered_mem = [
+            x for x in memory_repo().all("barbers")
+            if x.get("isActive", True) and int(service_id) in (x.get("servicesOffered") or [])
+        ]
+        return [_from_mem(x) for x in filtered_mem]
+
+    return await cached_response_async("barbers", f"service:{service_id}", lambda: session.run_sync(build))
 
 
 @router.post("", summary="Crear barbero (solo SQL)", response_model=Barber, status_code=201)
 def create_barber(payload: BarberDB, session: Session = Depends(get_session)):
     payload.id = None
     session.add(payload)
+    session.flush()
+    sync_barber_services(session, payload.id, payload.servicesOffered)
     session.commit()
+    catalog_cache.invalidate_shops("barbers", payload.barbershopId)
     session.refresh(payload)
     return _to_pydantic(payload)
 
@@ -78,12 +110,16 @@ def update_barber(barber_id: int, payload: BarberDB, session: Session = Depends(
     b = session.get(BarberDB, barber_id)
     if not b:
         raise HTTPException(status_code=404, detail="No existe un barbero con ese id (SQL)")
+    old_shop = b.barbershopId
     for field in ["barbershopId", "name", "specialty", "photoUrl", "isActive", "workingHours", "servicesOffered"]:
         val = getattr(payload, field, None)
         if val is not None:
             setattr(b, field, val)
+    if payload.servicesOffered is not None:
+        sync_barber_services(session, b.id, payload.servicesOffered)
     session.add(b)
     session.commit()
+    catalog_cache.invalidate_shops("barbers", old_shop, b.barbershopId)
     session.refresh(b)
     return _to_pydantic(b)
 
@@ -93,6 +129,9 @@ def delete_barber(barber_id: int, session: Session = Depends(get_session)):
     b = session.get(BarberDB, barber_id)
     if not b:
         raise HTTPException(status_code=404, detail="No existe un barbero con ese id (SQL)")
+    shop_id = b.barbershopId
+    delete_barber_links(session, barber_id=b.id)
     session.delete(b)
     session.commit()
+    catalog_cache.invalidate_shops("barbers", shop_id)
     return None
\ No newline at end of file
@@ -1,12 +1,24 @@
-from fastapi import APIRouter, Depends
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import and_, or_
 from sqlmodel import Session, select
 
-from app.db import get_session
-from app.helpers.db_memory import DB
-from app.models.barbershop import Barbershop, BarbershopTable as BarbershopDB
+from app.db import get_read_session, get_session
+from app.helpers.cache import cached_response, catalog_cache
+from app.helpers.conditional import conditional_get
+from app.helpers.db_memory import memory_repo
+from app.helpers.geo import covering_cells, is_open_at, nearest, set_geohash
+from app.models.barbershop import Barbershop, BarbershopTable as BarbershopDB, NearbyBarbershop, OpeningHours
 
 router = APIRouter(prefix="/barbershop", tags=["barbershop"])
 
+BARBERSHOP_FIELDS = [
+    "name", "phone", "email", "address", "city", "country",
+    "latitude", "longitude", "isActive", "timezone",
+    "images", "about", "social", "openingHours",
+]
+
 
 def _to_pydantic(b: BarbershopDB) -> Barbershop:
     return Barbershop(
@@ -28,37 +40,94 @@ def _to_pydantic(b: BarbershopDB) -> Barbershop:
     )
 
 
-@router.get("", summary="Información de la barbería", response_model=Barbershop)
-def get_barbershop(session: Session = Depends(get_session)):
-    row = session.exec(select(BarbershopDB)).first()
+def load_barbershop(session: Session, barbershop_id: Optional[int] = None) -> Barbershop:
+    """La barbería indicada o, sin id, la principal (primer registro)."""
+    if barbershop_id is None:
+        row = session.exec(select(BarbershopDB).order_by(BarbershopDB.id)).first()
+    else:
+        row = session.get(BarbershopDB, barbershop_id)
     if row:
         return _to_pydantic(row)
-    return Barbershop(**DB["barbershop"])
+    mem = memory_repo().document("barbershop") or {}
+    if session.exec(select(BarbershopDB.id).limit(1)).first() is None and barbershop_id in (None, mem.get("id")):
+        return Barbershop(**mem)
+    raise HTTPException(status_code=404, detail="No existe la barbería")
+
+
+def load_barbershops(session: Session) -> list[Barbershop]:
+    rows = session.exec(select(BarbershopDB).order_by(BarbershopDB.id)).all()
+    if rows:
+        return [_to_pydantic(r) for r in rows]
+    return [Barbershop(**memory_repo().document("barbershop"))]
+
+
+def query_nearby(
+    session: Session,
+    lat: float,
+    lng: float,
+    radius_km: float,
+    open_now: bool = False,
+    limit: int = 20,
+) -> list[NearbyBarbershop]:
+    """Barberías activas a <= `radius_km` de (lat, lng), de la más cercana a la más lejana.
+
+    Solo se leen las filas cuyo geohash cae en las celdas que cubren el radio
+    (rangos sobre `ix_barbershops_geohash`); la distancia exacta se calcula
+    después sobre esos candidatos.
+    """
+    stmt = select(BarbershopDB).where(BarbershopDB.isActive == True)  # noqa: E712
+    cells = [c for c in covering_cells(lat, lng, radius_km) if c]
+    if cells:
+        stmt = stmt.where(or_(*[
+            and_(BarbershopDB.geohash >= c, BarbershopDB.geohash < c + "{")  # '{' va justo después de 'z'
+            for c in cells
+        ]))
+    candidates = session.exec(stmt).all()
+    to_model = _to_pydantic
+    if not candidates and session.exec(select(BarbershopDB.id).limit(1)).first() is None:
+        candidates = [Barbershop(**memory_repo().document("barbershop"))]  # sin datos SQL: barbería en memoria
+        to_model = lambda b: b  # noqa: E731
+
+    result: list[NearbyBarbershop] = []
+    for distance, row in nearest(candidates, lat, lng, radius_km):
+        hours = row.openingHours.model_dump() if isinstance(row.openingHours, OpeningHours) else row.openingHours
+        is_open = is_open_at(hours, row.timezone)
+        if open_now and not is_open:
+            continue
+        shop = to_model(row)  # solo se convierten las que se devuelven
+        result.append(NearbyBarbershop(**shop.model_dump(), distanceKm=round(distance, 3), isOpenNow=is_open))
+        if len(result) >= limit:
+            break
+    return result
+
+
+@router.get("", summary="Información de la barbería", response_model=Barbershop, dependencies=[Depends(conditional_get("barbershop"))])
+def get_barbershop(session: Session = Depends(get_read_session)):
+    return cached_response("barbershop", "all", lambda: load_barbershop(session))
 
 
 @router.post("", summary="Actualizar datos de la barbería (POST upsert, solo SQL)", response_model=Barbershop)
 def upsert_barbershop(payload: BarbershopDB, session: Session = Depends(get_session)):
     """
-    Si existe, actualiza el registro único de barbershop. Si no existe, lo crea.
+    Si existe, actualiza la barbería principal (primer registro). Si no existe, la crea.
+    Para varias barberías: `/barbershops`.
     """
-    row = session.exec(select(BarbershopDB)).first()
-    fields = [
-        "name", "phone", "email", "address", "city", "country",
-        "latitude", "longitude", "isActive", "timezone",
-        "images", "about", "social", "openingHours",
-    ]
-
+    row = session.exec(select(BarbershopDB).order_by(BarbershopDB.id)).first()
     if row:
-        for f in fields:
+        for f in BARBERSHOP_FIELDS:
             setattr(row, f, getattr(payload, f))
+        set_geohash(row)
         session.add(row)
         session.commit()
+        catalog_cache.invalidate_shops("barbershop", row.id)
         session.refresh(row)
         return _to_pydantic(row)
 
     # Crear si no existía
     payload.id = None
+    set_geohash(payload)
     session.add(payload)
     session.commit()
+    catalog_cache.invalidate_shops("barbershop", payload.id)
     session.refresh(payload)
     return _to_pydantic(payload)
\ No newline at end of file
@@ -0,0 +1,170 @@
+"""Rutas multi-barbería: `/barbershops/{id}/...`.
+
+Cada listado consulta solo las filas de esa barbería (índices que empiezan por
+`barbershopId`) y se cachea bajo la versión de la barbería (`barbers@2`), así
+que una escritura en una barbería no invalida la caché ni los ETags del resto.
+Las rutas sin barbería (`/barbers`, `/barbershop`, ...) siguen funcionando igual.
+
+`/barbershops/nearby` busca por cercanía con el índice de geohash (ver
+`app/helpers/geo.py`).
+"""
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlmodel import Session
+
+from app.db import get_read_session, get_session
+from app.helpers.cache import cached_response, catalog_cache, shop_resource
+from app.helpers.conditional import conditional_get
+from app.helpers.geo import set_geohash
+from app.models.barber import Barber
+from app.models.barbershop import Barbershop, BarbershopTable as BarbershopDB, NearbyBarbershop
+from app.models.booking import Booking
+from app.models.bootstrap import Bootstrap
+from app.models.gallery import GalleryItem
+from app.models.service import Service
+from app.endpoints.barbershop import BARBERSHOP_FIELDS, load_barbershop, load_barbershops, query_nearby
+from app.endpoints.barbers import load_barbers
+from app.endpoints.bookings import query_bookings
+from app.endpoints.bootstrap import bootstrap_resources, bootstrap_response
+from app.endpoints.gallery import query_gallery
+from app.endpoints.services import load_services
+
+router = APIRouter(prefix="/barbershops", tags=["barbershops"])
+
+
+def _cached(session: Session, resource: str, barbershop_id: int, variant: str, load):
+    """Respuesta cacheada por barbería; 404 si la barbería no existe."""
+    def build():
+        if resource != "barbershop":
+            load_barbershop(session, barbershop_id)  # 404 si no existe
+        return load()
+
+    return cached_response(shop_resource(resource, barbershop_id), variant, build)
+
+
+@router.get("", summary="Listado de barberías", response_model=list[Barbershop], dependencies=[Depends(conditional_get("barbershop"))])
+def get_barbershops(session: Session = Depends(get_read_session)):
+    return cached_response("barbershop", "list", lambda: load_barbershops(session))
+
+
+@router.post("", summary="Crear barbería (solo SQL)", response_model=Barbershop, status_code=201)
+def create_barbershop(payload: BarbershopDB, session: Session = Depends(get_session)):
+    payload.id = None
+    set_geohash(payload)
+    session.add(payload)
+    session.commit()
+    catalog_cache.invalidate_shops("barbershop", payload.id)
+    return load_barbershop(session, payload.id)
+
+
+@router.get("/nearby", summary="Barberías cercanas ordenadas por distancia", response_model=list[NearbyBarbershop])
+def get_nearby_barbershops(
+    lat: float = Query(..., ge=-90, le=90, description="Latitud"),
+    lng: float = Query(..., ge=-180, le=180, description="Longitud"),
+    radius: float = Query(5.0, gt=0, le=500, description="Radio en km"),
+    openNow: bool = Query(False, description="Solo las abiertas ahora (según openingHours y su zona horaria)"),
+    limit: int = Query(20, ge=1, le=100),
+    session: Session = Depends(get_read_session),
+):
+    # Sin caché ni ETag: depende de la posición y de la hora actual
+    return query_nearby(session, lat, lng, radius, openNow, limit)
+
+
+@router.get(
+    "/{barbershop_id}",
+    summary="Detalle de una barbería",
+    response_model=Barbershop,
+    dependencies=[Depends(conditional_get("barbershop@{barbershop_id}"))],
+)
+def get_barbershop_by_id(barbershop_id: int, session: Session = Depends(get_read_session)):
+    # Misma clave que el fragmento de /barbershops/{id}/bootstrap
+    return _cached(session, "barbershop", barbershop_id, "all", lambda: load_barbershop(session, barbershop_id))
+
+
+@router.put("/{barbershop_id}", summary="Actualizar barbería (solo SQL)", response_model=Barbershop)
+def update_barbershop(barbershop_id: int, payload: BarbershopDB, session: Session = Depends(get_session)):
+    row = session.get(BarbershopDB, barbershop_id)
+    if not row:
+        raise HTTPException(status_code=404, detail="No existe la barbería (SQL)")
+    for f in BARBERSHOP_FIELDS:
+        setattr(row, f, getattr(payload, f))
+    set_geohash(row)
+    session.add(row)
+    session.commit()
+    catalog_cache.invalidate_shops("barbershop", barbershop_id)
+    return load_barbershop(session, barbershop_id)
+
+
+@router.get(
+    "/{barbershop_id}/barbers",
+    summary="Barberos de una barbería",
+    response_model=list[Barber],
+    dependencies=[Depends(conditional_get("barbers@{barbershop_id}"))],
+)
+def get_shop_barbers(barbershop_id: int, session: Session = Depends(get_read_session)):
+    return _cached(session, "barbers", barbershop_id, "all", lambda: load_barbers(session, barbershop_id))
+
+
+@router.get(
+    "/{barbershop_id}/services",
+    summary="Servicios de una barbería (filtro opcional por categoría)",
+    response_model=list[Service],
+    dependencies=[Depends(conditional_get("services@{barbershop_id}"))],
+)
+def get_shop_services(
+    barbershop_id: int,
+    categoryId: Optional[int] = Query(None),
+    session: Session = Depends(get_read_session),
+):
+    variant = "all" if categoryId is None else f"category:{categoryId}"
+    return _cached(session, "services", barbershop_id, variant, lambda: load_services(session, barbershop_id, categoryId))
+
+
+@router.get(
+    "/{barbershop_id}/gallery",
+    summary="Galería de una barbería (filtros opcionales)",
+    response_model=list[GalleryItem],
+    dependencies=[Depends(conditional_get("gallery@{barbershop_id}"))],
+)
+def get_shop_gallery(
+    barbershop_id: int,
+    barberId: Optional[int] = Query(None),
+    serviceId: Optional[int] = Query(None),
+    isVisible: Optional[bool] = Query(None),
+    session: Session = Depends(get_read_session),
+):
+    if barberId is None and serviceId is None and isVisible is None:
+        variant = "all"
+    else:
+        variant = f"list:{barberId}:{serviceId}:{isVisible}"
+    return _cached(
+        session, "gallery", barbershop_id, variant,
+        lambda: query_gallery(session, barbershop_id, barberId, serviceId, isVisible),
+    )
+
+
+@router.get(
+    "/{barbershop_id}/bookings",
+    summary="Reservas de una barbería (filtros opcionales)",
+    response_model=list[Booking],
+    dependencies=[Depends(conditional_get("bookings@{barbershop_id}", "barbers@{barbershop_id}", "services@{barbershop_id}"))],
+)
+def get_shop_bookings(
+    barbershop_id: int,
+    barberId: Optional[int] = Query(None),
+    date: Optional[str] = Query(None, description="YYYY-MM-DD"),
+    session: Session = Depends(get_read_session),
+):
+    load_barbershop(session, barbershop_id)  # 404 si no existe
+    return query_bookings(session, barbershop_id, barberId, date)
+
+
+@router.get(
+    "/{barbershop_id}/bootstrap",
+    summary="Datos de arranque de la app para una barbería",
+    response_model=Bootstrap,
+    dependencies=[Depends(conditional_get(*bootstrap_resources("barbershop_id")))],
+)
+def get_shop_bootstrap(barbershop_id: int, session: Session = Depends(get_read_session)):
+    return bootstrap_response(session, barbershop_id)
@@ -2,9 +2,13 @@ from fastapi import APIRouter, HTTPException, Query, Depends
 from datetime import datetime, timedelta
 from typing import Optional, List
 from sqlmodel import Session, select, col
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.db import get_session
-from app.helpers.db_memory import DB
+from app.db import get_async_read_session, get_read_session, get_session
+from app.helpers.cache import catalog_cache
+from app.helpers.conditional import conditional_get
+from app.helpers.db_memory import memory_repo
+from app.helpers.fast_json import FastJSONResponse, fast_json_enabled, select_columns
 from app.helpers.scheduling import parse_hhmm, get_weekly_hours
 from app.models.booking import Booking, CreateBooking
 from app.models.booking import BookingTable as BookingDB
@@ -37,29 +41,40 @@ def persist_completed_bookings(session: Session) -> int:
         changed += 1
     if changed:
         session.commit()
+        invalidate_bookings(*{r.barbershopId for r in rows})
     return changed
 
 
-def _to_model(b: BookingDB, session: Optional[Session] = None) -> Booking:
-    barber_name = None
-    service_name = None
+def invalidate_bookings(*barbershop_ids: Optional[int]) -> None:
+    """Invalida `bookings` y su versión en esas barberías (en todas si alguna reserva no tiene barbería)."""
+    if not barbershop_ids or None in barbershop_ids:
+        catalog_cache.invalidate_shops("bookings")
+    else:
+        catalog_cache.invalidate_shops("bookings", *barbershop_ids)
+
 
-    if session is not None:
-        bar = session.get(BarberDB, b.barberId)
-        svc = session.get(ServiceDB, b.serviceId)
-        if bar is not None and getattr(bar, "name", None):
-            barber_name = bar.name
-        if svc is not None and getattr(svc, "name", None):
-            service_name = svc.name
+NameMaps = tuple[dict[int, str], dict[int, str]]
 
-    if barber_name is None:
-        mem_bar = next((x for x in DB.get("barbers", []) if x["id"] == b.barberId), None)
-        barber_name = mem_bar.get("name") if mem_bar else None
 
-    if service_name is None:
-        mem_svc = next((x for x in DB.get("services", []) if x["id"] == b.serviceId), None)
-        service_name = mem_svc.get("name") if mem_svc else None
+def _name_maps(session: Optional[Session], rows: list[BookingDB]) -> NameMaps:
+    """Nombres de barbero/servicio de todas las filas con 2 consultas (evita N+1)."""
+    barber_ids = {r.barberId for r in rows}
+    service_ids = {r.serviceId for r in rows}
+    barbers: dict[int, str] = {}
+    services: dict[int, str] = {}
+    if session is not None and rows:
+        barbers = {i: n for i, n in session.exec(select(BarberDB.id, BarberDB.name).where(col(BarberDB.id).in_(barber_ids))).all() if n}
+        services = {i: n for i, n in session.exec(select(ServiceDB.id, ServiceDB.name).where(col(ServiceDB.id).in_(service_ids))).all() if n}
+    # Fallback a memoria solo para ids que no estén en SQL
+    for collection, ids, names in (("barbers", barber_ids, barbers), ("services", service_ids, services)):
+        for i in ids - names.keys():
+            m = memory_repo().get(collection, i)
+            if m:
+                names[i] = m.get("name")
+    return barbers, services
 
+
+def _to_dict(b: BookingDB, names: NameMaps) -> dict:
     # Normalizar status y marcar como 'completed' si la cita ya terminó.
     # No persiste el cambio, solo lo refleja en la respuesta.
     status = (getattr(b, "status", None) or "").strip()
@@ -68,7 +83,7 @@ def _to_model(b: BookingDB, session: Optional[Session] = None) -> Booking:
     try:
         # Intentar usar 'end' y si no existe, fallback a 'start'
         end_str = getattr(b, "end", None) or getattr(b, "start", None)
-        end_dt = datetime.strptime(end_str, "%Y-%m-%dT%H:%M") if end_str else None
+        end_dt = datetime.fromisoformat(end_str) if end_str else None  # "YYYY-MM-DDTHH:MM" (más rápido que strptime)
     except Exception:
         end_dt = None
 
@@ -76,18 +91,30 @@ def _to_model(b: BookingDB, session: Optional[Session] = None) -> Booking:
         if end_dt <= datetime.now():
             status = "completed"  # literal en inglés para consistencia
 
-    return Booking(
-        id=b.id,
-        barberId=b.barberId,
-        serviceId=b.serviceId,
-        customerName=b.customerName,
-        customerPhone=b.customerPhone,
-        start=b.start,
-        end=getattr(b, "end", None),
-        status=status,
-        barberName=barber_name,
-        serviceName=service_name,
-    )
+    return {
+        "id": b.id,
+        "barbershopId": getattr(b, "barbershopId", None),
+        "barberId": b.barberId,
+        "serviceId": b.serviceId,
+        "customerName": b.customerName,
+        "customerPhone": b.customerPhone,
+        "start": b.start,
+        "end": getattr(b, "end", None),
+        "status": status,
+        "barberName": names[0].get(b.barberId),
+        "serviceName": names[1].get(b.serviceId),
+    }
+
+
+def _to_model(b: BookingDB, session: Optional[Session] = None, names: Optional[NameMaps] = None) -> Booking:
+    return Booking(**_to_dict(b, names if names is not None else _name_maps(session, [b])))
+
+
+def _list_response(rows: list[BookingDB], session: Session):
+    names = _name_maps(session, rows)
+    if fast_json_enabled():
+        return FastJSONResponse([_to_dict(r, names) for r in rows])
+    return [_to_model(r, names=names) for r in rows]
 
 
 def _is_slot_booked_sql(session: Session, barber_id: int, start_iso: str, exclude_booking_id: Optional[int] = None) -> bool:
@@ -109,9 +136,10 @@ def _find_barber(session: Session, barber_id: int) -> Optional[dict]:
     if b:
         return {
             "id": b.id,
+            "barbershopId": b.barbershopId,
             "workingHours": b.workingHours or {},
         }
-    return next((x for x in DB["barbers"] if x["id"] == barber_id), None)
+    return memory_repo().get("barbers", barber_id)
 
 
 def _find_service(session: Session, service_id: int) -> Optional[dict]:
@@ -121,35 +149,55 @@ def _find_service(session: Session, service_id: int) -> Optional[dict]:
             "id": s.id,
             "durationMinutes": s.durationMinutes,
         }
-    return next((x for x in DB["services"] if x["id"] == service_id), None)
+    return memory_repo().get("services", service_id)
 
 
-@router.get("", summary="Listado de reservas (filtros opcionales)", response_model=list[Booking])
+@router.get("", summary="Listado de reservas (filtros opcionales)", response_model=list[Booking], dependencies=[Depends(conditional_get("bookings", "barbers", "services"))])
 def list_bookings(
     barberId: Optional[int] = Query(None),
     date: Optional[str] = Query(None, description="YYYY-MM-DD"),
-    session: Session = Depends(get_session),
+    barbershopId: Optional[int] = Query(None),
+    session: Session = Depends(get_read_session),
+):
+    return query_bookings(session, barbershopId, barberId, date)
+
+
+def query_bookings(
+    session: Session,
+    barbershop_id: Optional[int] = None,
+    barber_id: Optional[int] = None,
+    date: Optional[str] = None,
 ):
-    items_db = session.exec(select(BookingDB)).all()
-    if items_db:
-        rows = items_db
-        if barberId is not None:
-            rows = [r for r in rows if r.barberId == barberId]
+    """Reservas filtradas en SQL (índices que empiezan por barbershopId/start)."""
+    if session.exec(select(BookingDB.id).limit(1)).first() is not None:
+        stmt = select_columns(BookingDB) if fast_json_enabled() else select(BookingDB)
+        if barbershop_id is not None:
+            stmt = stmt.where(BookingDB.barbershopId == barbershop_id)
+        if barber_id is not None:
+            stmt = stmt.where(BookingDB.barberId == barber_id)
         if date is not None:
-            rows = [r for r in rows if r.start.startswith(f"{date}T")]
-        return [_to_model(r, session) for r in rows]
+            # Rango sobre "YYYY-MM-DDTHH:MM" (usa el índice, a diferencia de LIKE)
+            stmt = stmt.where(BookingDB.start >= f"{date}T", BookingDB.start < f"{date}U")
+        return _list_response(session.exec(stmt.order_by(BookingDB.id)).all(), session)
 
-    rows_mem = DB.get("bookings", [])
-    if barberId is not None:
-        rows_mem = [r for r in rows_mem if r["barberId"] == barberId]
+    repo = memory_repo()
     if date is not None:
-        rows_mem = [r for r in rows_mem if r["start"].startswith(f"{date}T")]
+        rows_mem = repo.on_date("bookings", date)
+    elif barber_id is not None:
+        rows_mem = repo.find("bookings", "barberId", barber_id)
+    else:
+        rows_mem = repo.all("bookings")
+    if barbershop_id is not None:
+        shop_barbers = {x["id"] for x in repo.find("barbers", "barbershopId", barbershop_id)}
+        rows_mem = [r for r in rows_mem if r["barberId"] in shop_barbers]
+    if barber_id is not None:
+        rows_mem = [r for r in rows_mem if r["barberId"] == barber_id]
     return rows_mem
 
 
-@router.get("/me", summary="Listado de reservas del usuario autenticado", response_model=list[Booking])
+@router.get("/me", summary="Listado de reservas del usuario autenticado", response_model=list[Booking], dependencies=[Depends(conditional_get("bookings", "barbers", "services", "users", user_dependency=get_current_user))])
 def list_my_bookings(
-    session: Session = Depends(get_session),
+    session: Session = Depends(get_read_session),
     current: UserInfo = Depends(get_current_user),
 ):
     user_rec = session.exec(select(UserTable).where(UserTable.username == current.username)).first()
@@ -164,20 +212,20 @@ def list_my_bookings(
             select(BookingDB).where((col(BookingDB.customerName) == (user_rec.name or "")) | (col(BookingDB.customerName) == user_rec.username))
         ).all()
 
-    return [_to_model(r, session) for r in rows]
+    return _list_response(rows, session)
 
 
-@router.get("/me/upcoming", summary="Próximas reservas del usuario autenticado", response_model=list[Booking])
-def list_my_upcoming_bookings(
+@router.get("/me/upcoming", summary="Próximas reservas del usuario autenticado", response_model=list[Booking], dependencies=[Depends(conditional_get("bookings", "barbers", "services", "users", user_dependency=get_current_user, window=60))])
+async def list_my_upcoming_bookings(
     limit: int = Query(10, ge=1, le=50, description="Máximo de elementos a devolver"),
     states: List[str] = Query(["confirmed"], description="Estados a incluir (minúsculas)"),
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_read_session),
     current: UserInfo = Depends(get_current_user),
 ):
     now_iso = datetime.now().strftime("%Y-%m-%dT%H:%M")
     states_norm = [s.lower() for s in states]
 
-    user_rec = session.exec(select(UserTable).where(UserTable.username == current.username)).first()
+    user_rec = (await session.exec(select(UserTable).where(UserTable.username == current.username))).first()
     if not user_rec:
         raise HTTPException(status_code=404, detail="Usuario no encontrado")
 
@@ -192,14 +240,15 @@ def list_my_upcoming_bookings(
         .order_by(col(BookingDB.start).asc())
         .limit(limit)
     )
-    rows = session.exec(stmt).all()
+    rows = (await session.exec(stmt)).all()
     if rows:
-        return [_to_model(r, session) for r in rows]
+        # Nombres de barbero/servicio con el mismo código síncrono, sobre el driver asíncrono
+        return await session.run_sync(lambda s: _list_response(rows, s))
 
     name_candidates = set(filter(None, [getattr(user_rec, "name", None), current.username]))
     rows_mem = [
         r
-        for r in DB.get("bookings", [])
+        for r in memory_repo().all("bookings")
         if r.get("start", "") >= now_iso
         and r.get("status", "confirmed").lower() in states_norm
         and r.get("customerName") in name_candidates
@@ -208,12 +257,12 @@ def list_my_upcoming_bookings(
     return rows_mem[:limit]
 
 
-@router.get("/{booking_id}", summary="Detalle de reserva", response_model=Booking)
-def get_booking(booking_id: int, session: Session = Depends(get_session)):
+@router.get("/{booking_id}", summary="Detalle de reserva", response_model=Booking, dependencies=[Depends(conditional_get("bookings", "barbers", "services"))])
+def get_booking(booking_id: int, session: Session = Depends(get_read_session)):
     b = session.get(BookingDB, booking_id)
     if b:
         return _to_model(b, session)
-    m = next((x for x in DB["bookings"] if x["id"] == booking_id), None)
+    m = memory_repo().get("bookings", booking_id)
     if not m:
         raise HTTPException(status_code=404, detail="No existe la reserva")
     return m
@@ -261,6 +310,7 @@ def create_booking(
     user_id = user_rec.id if user_rec else None
 
     row = BookingDB(
+        barbershopId=barber.get("barbershopId"),
         barberId=payload.barberId,
         serviceId=payload.serviceId,
         userId=user_id,
@@ -272,6 +322,7 @@ def create_booking(
     )
     session.add(row)
     session.commit()
+    invalidate_bookings(row.barbershopId)
     session.refresh(row)
     return _to_model(row, session)
 
@@ -320,6 +371,7 @@ def cancel_booking(
     b.status = "cancelled"
     session.add(b)
     session.commit()
+    invalidate_bookings(b.barbershopId)
     session.refresh(b)
     return _to_model(b, session)
 
@@ -340,13 +392,18 @@ def update_booking(booking_id: int, payload: BookingDB, session: Session = Depen
         if _is_slot_booked_sql(session, new_barber_id, new_start, exclude_booking_id=b.id):
             raise HTTPException(status_code=409, detail="El horario ya fue reservado")
 
+    old_shop = b.barbershopId
     for field in ["barberId", "serviceId", "customerName", "customerPhone", "start", "end", "status"]:
         val = getattr(payload, field, None)
         if val is not None:
             setattr(b, field, val)
+    if payload.barberId is not None:
+        barber = session.get(BarberDB, b.barberId)
+        b.barbershopId = barber.barbershopId if barber else b.barbershopId
 
     session.add(b)
     session.commit()
+    invalidate_bookings(old_shop, b.barbershopId)
     session.refresh(b)
     return _to_model(b, session)
 
@@ -356,6 +413,8 @@ def delete_booking(booking_id: int, session: Session = Depends(get_session)):
     b = session.get(BookingDB, booking_id)
     if not b:
         raise HTTPException(status_code=404, detail="No existe la reserva (SQL)")
+    shop_id = b.barbershopId
     session.delete(b)
     session.commit()
+    invalidate_bookings(shop_id)
     return None
\ No newline at end of file
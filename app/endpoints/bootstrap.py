@@ -0,0 +1,96 @@
+"""`/bootstrap`: todo lo que la app necesita al arrancar, en una sola petición.
+
+La respuesta se compone concatenando los fragmentos JSON ya serializados que
+cachean los propios listados (`/barbers`, `/services`, ...), así que comparte
+caché con ellos. El documento completo se cachea a su vez por las versiones
+de todos los recursos: solo se recompone cuando alguno cambia.
+
+`/barbershops/{id}/bootstrap` usa las mismas piezas limitadas a una barbería
+(barbería, barberos, servicios y galería); categorías y productos son comunes.
+"""
+from functools import partial
+from typing import Any, Callable, Optional
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import Response
+from sqlmodel import Session
+
+from app.db import get_read_session
+from app.helpers.cache import catalog_cache, dump_json, shop_resource
+from app.helpers.conditional import conditional_get
+from app.models.bootstrap import Bootstrap
+from app.endpoints.barbershop import load_barbershop
+from app.endpoints.barbers import load_barbers
+from app.endpoints.services import load_services
+from app.endpoints.service_categories import load_service_categories
+from app.endpoints.products import load_products
+from app.endpoints.product_categories import load_product_categories
+from app.endpoints.gallery import load_gallery
+
+router = APIRouter(prefix="/bootstrap", tags=["bootstrap"])
+
+# clave en la respuesta -> (recurso de la caché, cargador, ¿limitado a la barbería?)
+_SECTIONS = {
+    "barbershop": ("barbershop", load_barbershop, True),
+    "barbers": ("barbers", load_barbers, True),
+    "services": ("services", load_services, True),
+    "serviceCategories": ("serviceCategories", load_service_categories, False),
+    "products": ("products", load_products, False),
+    "productCategories": ("productCategories", load_product_categories, False),
+    "gallery": ("gallery", load_gallery, True),
+}
+
+
+def _sections(barbershop_id: Optional[int]) -> list[tuple[str, str, Callable[[Session], Any]]]:
+    """(clave, recurso, cargador); con barbería, sus recursos por barbería (`barbers@2`)."""
+    sections = []
+    for key, (resource, load, scoped) in _SECTIONS.items():
+        if scoped and barbershop_id is not None:
+            sections.append((key, shop_resource(resource, barbershop_id), partial(load, barbershop_id=barbershop_id)))
+        else:
+            sections.append((key, resource, load))
+    return sections
+
+
+def bootstrap_resources(barbershop_param: Optional[str] = None) -> tuple[str, ...]:
+    """Recursos para `conditional_get`; `barbershop_param` es el parámetro de ruta de la barbería."""
+    return tuple(
+        shop_resource(resource, f"{{{barbershop_param}}}") if scoped and barbershop_param else resource
+        for resource, _, scoped in _SECTIONS.values()
+    )
+
+
+def _fragment(session: Session, resource: str, load) -> bytes:
+    # Misma clave que el listado del recurso: comparten el JSON cacheado
+    return catalog_cache.get_or_build(resource, "all", lambda: dump_json(load(session)))
+
+
+def _assemble(session: Session, sections) -> bytes:
+    parts = [
+        b'"' + key.encode() + b'":' + _fragment(session, resource, load)
+        for key, resource, load in sections
+    ]
+    return b"{" + b",".join(parts) + b"}"
+
+
+def bootstrap_response(session: Session, barbershop_id: Optional[int] = None) -> Response:
+    sections = _sections(barbershop_id)
+    versions = ".".join(str(catalog_cache.version(resource)) for _, resource, _ in sections)
+    variant = versions if barbershop_id is None else f"{barbershop_id}:{versions}"
+    if any(catalog_cache.settling(resource) for _, resource, _ in sections):
+        # Tras una escritura la réplica puede ir retrasada: no guardar el documento
+        # bajo la versión nueva (se serviría obsoleto hasta el TTL)
+        body = _assemble(session, sections)
+    else:
+        body = catalog_cache.get_or_build("bootstrap", variant, lambda: _assemble(session, sections))
+    return Response(content=body, media_type="application/json")
+
+
+@router.get(
+    "",
+    summary="Datos de arranque de la app (barbería, catálogo y galería)",
+    response_model=Bootstrap,
+    dependencies=[Depends(conditional_get(*bootstrap_resources()))],
+)
+def get_bootstrap(session: Session = Depends(get_read_session)):
+    return bootstrap_response(session)
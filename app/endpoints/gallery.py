@@ -1,9 +1,18 @@
-from fastapi import APIRouter, HTTPException, Depends
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
+from sqlalchemy import and_, or_
 from sqlmodel import Session, select
 
-from app.db import get_session
-from app.helpers.db_memory import DB
+from app.db import get_read_session, get_session
+from app.helpers.cache import cached_response, catalog_cache
+from app.helpers.conditional import conditional_get
+from app.helpers.db_memory import memory_repo
+from app.helpers.fast_json import fast_json_enabled, project
+from app.helpers.gallery_thumbs import schedule_thumbnails, thumbnail_url
+from app.helpers.pagination import decode_cursor, encode_cursor
 from app.models.gallery import GalleryItem as GalleryModel
+from app.models.gallery import GalleryItemPage
 from app.models.gallery import GalleryItemTable as GalleryDB
 
 router = APIRouter(prefix="/gallery", tags=["gallery"])
@@ -21,6 +30,7 @@ def _to_pydantic(g: GalleryDB) -> GalleryModel:
         order=g.order,
         serviceId=g.serviceId,
         barberId=g.barberId,
+        thumbnailUrl=thumbnail_url(g.imageUrl),
     )
 
 
@@ -36,24 +46,152 @@ def _from_mem(x: dict) -> GalleryModel:
         order=x.get("order", 0),
         serviceId=x.get("serviceId"),
         barberId=x.get("barberId"),
+        thumbnailUrl=thumbnail_url(x.get("imageUrl")),
     )
 
 
-@router.get("", summary="Listado de items de galería", response_model=list[GalleryModel])
-def get_gallery(session: Session = Depends(get_session)):
-    items_db = session.exec(select(GalleryDB)).all()
-    if items_db:
-        return [_to_pydantic(x) for x in sorted(items_db, key=lambda i: i.order)]
-    items_mem = sorted(DB.get("gallery", []), key=lambda i: i.get("order", 0))
-    return [_from_mem(x) for x in items_mem]
+def _project(rows) -> list[dict]:
+    items = project(rows, GalleryModel)
+    for item in items:
+        item["thumbnailUrl"] = thumbnail_url(item["imageUrl"])
+    return items
+
+
+def _query(
+    session: Session,
+    barbershopId: Optional[int] = None,
+    barberId: Optional[int] = None,
+    serviceId: Optional[int] = None,
+    isVisible: Optional[bool] = None,
+    after: Optional[tuple[int, int]] = None,
+    limit: Optional[int] = None,
+) -> list:
+    """Items filtrados en orden (order, id). Filas SQL o, si la tabla está vacía, dicts de memoria."""
+    if session.exec(select(GalleryDB.id).limit(1)).first() is None:
+        repo = memory_repo()
+        if barberId is not None:
+            rows = repo.find("gallery", "barberId", barberId)
+        elif barbershopId is not None:
+            rows = repo.find("gallery", "barbershopId", barbershopId)
+        else:
+            rows = repo.all("gallery")
+        if barbershopId is not None:
+            rows = [x for x in rows if x.get("barbershopId") == barbershopId]
+        if serviceId is not None:
+            rows = [x for x in rows if x.get("serviceId") == serviceId]
+        if isVisible is not None:
+            rows = [x for x in rows if x.get("isVisible", True) == isVisible]
+        rows = sorted(rows, key=lambda x: (x.get("order", 0), x["id"]))
+        if after is not None:
+            rows = [x for x in rows if (x.get("order", 0), x["id"]) > after]
+        return rows[:limit] if limit is not None else rows
+    stmt = select(GalleryDB)
+    if barbershopId is not None:
+        stmt = stmt.where(GalleryDB.barbershopId == barbershopId)
+    if barberId is not None:
+        stmt = stmt.where(GalleryDB.barberId == barberId)
+    if serviceId is not None:
+        stmt = stmt.where(GalleryDB.serviceId == serviceId)
+    if isVisible is not None:
+        stmt = stmt.where(GalleryDB.isVisible == isVisible)
+    if after is not None:
+        order, last_id = after
+        stmt = stmt.where(or_(GalleryDB.order > order, and_(GalleryDB.order == order, GalleryDB.id > last_id)))
+    stmt = stmt.order_by(GalleryDB.order, GalleryDB.id)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return session.exec(stmt).all()
+
+
+def _to_items(rows: list) -> list:
+    if rows and isinstance(rows[0], dict):
+        return [_from_mem(x) for x in rows]
+    if fast_json_enabled():
+        return _project(rows)
+    return [_to_pydantic(x) for x in rows]
+
+
+def load_gallery(session: Session, barbershop_id: Optional[int] = None) -> list[GalleryModel]:
+    return _to_items(_query(session, barbershop_id))
+
+
+def query_gallery(
+    session: Session,
+    barbershop_id: Optional[int],
+    barberId: Optional[int] = None,
+    serviceId: Optional[int] = None,
+    isVisible: Optional[bool] = None,
+) -> list[GalleryModel]:
+    return _to_items(_query(session, barbershop_id, barberId, serviceId, isVisible))
+
+
+def schedule_missing_thumbnails(session: Session) -> int:
+    """Encola las miniaturas que falten (arranque). Devuelve cuántas se encolaron."""
+    rows = _query(session)
+    return schedule_thumbnails(x["imageUrl"] if isinstance(x, dict) else x.imageUrl for x in rows)
+
+
+@router.get("", summary="Listado de items de galería (filtros opcionales)", response_model=list[GalleryModel], dependencies=[Depends(conditional_get("gallery"))])
+def get_gallery(
+    request: Request,
+    barberId: Optional[int] = Query(None),
+    serviceId: Optional[int] = Query(None),
+    isVisible: Optional[bool] = Query(None, description="true: solo visibles; sin valor: todos"),
+    session: Session = Depends(get_read_session),
+):
+    if barberId is None and serviceId is None and isVisible is None:
+        # Misma clave que el fragmento de /bootstrap
+        return cached_response("gallery", "all", lambda: load_gallery(session))
+    return cached_response(
+        "gallery",
+        f"list:{request.url.query}",
+        lambda: query_gallery(session, None, barberId, serviceId, isVisible),
+    )
 
 
-@router.get("/{item_id}", summary="Detalle de item de galería", response_model=GalleryModel)
-def get_gallery_item(item_id: int, session: Session = Depends(get_session)):
+@router.get(
+    "/page",
+    summary="Galería paginada por cursor (orden por `order`, id)",
+    response_model=GalleryItemPage,
+    dependencies=[Depends(conditional_get("gallery"))],
+)
+def get_gallery_page(
+    request: Request,
+    barberId: Optional[int] = Query(None),
+    serviceId: Optional[int] = Query(None),
+    isVisible: Optional[bool] = Query(None, description="true: solo visibles; sin valor: todos"),
+    limit: int = Query(24, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="`nextCursor` de la página anterior"),
+    session: Session = Depends(get_read_session),
+):
+    after: Optional[tuple[int, int]] = None
+    if cursor:
+        data = decode_cursor(cursor)
+        if not isinstance(data.get("o"), int) or not isinstance(data.get("id"), int):
+            raise HTTPException(status_code=400, detail="Cursor de paginación no válido")
+        after = (data["o"], data["id"])
+
+    def build():
+        rows = _query(session, None, barberId, serviceId, isVisible, after, limit + 1)
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            if isinstance(last, dict):
+                next_cursor = encode_cursor({"o": last.get("order", 0), "id": last["id"]})
+            else:
+                next_cursor = encode_cursor({"o": last.order, "id": last.id})
+        return {"items": _to_items(rows), "nextCursor": next_cursor}
+
+    return cached_response("gallery", f"page:{request.url.query}", build)
+
+
+@router.get("/{item_id}", summary="Detalle de item de galería", response_model=GalleryModel, dependencies=[Depends(conditional_get("gallery"))])
+def get_gallery_item(item_id: int, session: Session = Depends(get_read_session)):
     g = session.get(GalleryDB, item_id)
     if g:
         return _to_pydantic(g)
-    m = next((x for x in DB.get("gallery", []) if x.get("id") == item_id), None)
+    m = memory_repo().get("gallery", item_id)
     if not m:
         raise HTTPException(status_code=404, detail="No existe el item")
     return _from_mem(m)
@@ -64,7 +202,9 @@ def create_gallery_item(payload: GalleryDB, session: Session = Depends(get_sessi
     payload.id = None
     session.add(payload)
     session.commit()
+    catalog_cache.invalidate_shops("gallery", payload.barbershopId)
     session.refresh(payload)
+    schedule_thumbnails([payload.imageUrl])
     return _to_pydantic(payload)
 
 
@@ -73,6 +213,7 @@ def update_gallery_item(item_id: int, payload: GalleryDB, session: Session = Dep
     g = session.get(GalleryDB, item_id)
     if not g:
         raise HTTPException(status_code=404, detail="No existe el item (SQL)")
+    old_shop = g.barbershopId
     for field in [
         "barbershopId", "title", "description", "imageUrl", "date",
         "isVisible", "order", "serviceId", "barberId",
@@ -82,7 +223,9 @@ def update_gallery_item(item_id: int, payload: GalleryDB, session: Session = Dep
             setattr(g, field, val)
     session.add(g)
     session.commit()
+    catalog_cache.invalidate_shops("gallery", old_shop, g.barbershopId)
     session.refresh(g)
+    schedule_thumbnails([g.imageUrl])
     return _to_pydantic(g)
 
 
@@ -91,6 +234,8 @@ def delete_gallery_item(item_id: int, session: Session = Depends(get_session)):
     g = session.get(GalleryDB, item_id)
     if not g:
         raise HTTPException(status_code=404, detail="No existe el item (SQL)")
+    shop_id = g.barbershopId
     session.delete(g)
     session.commit()
+    catalog_cache.invalidate_shops("gallery", shop_id)
     return None
\ No newline at end of file
@@ -1,7 +1,20 @@
 from fastapi import APIRouter
 
+from app import db
+from app.helpers.cache import catalog_cache
+
 router = APIRouter(prefix="/health", tags=["health"])
 
 @router.get("", summary="Chequeo de salud de la API")
 def health():
-    return {"status": "ok"}
\ No newline at end of file
+    return {"status": "ok"}
+
+
+@router.get("/cache", summary="Métricas de la caché del catálogo (aciertos/fallos por recurso)")
+def cache_stats():
+    return catalog_cache.stats()
+
+
+@router.get("/db", summary="Métricas del pool de conexiones (uso, pico, ocupación) y PRAGMA de SQLite")
+def db_stats():
+    return db.pool_stats()
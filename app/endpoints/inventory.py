@@ -0,0 +1,113 @@
+from fastapi import APIRouter, HTTPException, Depends, Query
+from decimal import Decimal
+from sqlmodel import Session, select
+
+from app.db import get_session
+from app.helpers.cache import cached_response, catalog_cache
+from app.helpers.conditional import conditional_get
+from app.helpers.inventory import adjust_stock, reserve_stock
+from app.models.barbershop import BarbershopTable
+from app.models.product import (
+    InventoryItem,
+    InventoryRecord,
+    InventoryTable,
+    ProductTable,
+    StockAdjustment,
+    StockReservation,
+)
+
+router = APIRouter(prefix="/inventory", tags=["inventory"])
+
+
+def _to_record(r: InventoryTable) -> InventoryRecord:
+    return InventoryRecord(
+        barbershopId=r.barbershopId,
+        productId=r.productId,
+        stock=r.stock,
+        isVisible=r.isVisible,
+        order=r.order,
+    )
+
+
+def _to_item(p: ProductTable, r: InventoryTable) -> InventoryItem:
+    return InventoryItem(
+        id=p.id,
+        name=p.name,
+        brand=p.brand,
+        description=p.description,
+        price=p.price if p.price is not None else (p.displayedPrice or Decimal("0")),
+        stock=r.stock,
+        imageUrl=p.imageUrl,
+    )
+
+
+def _ensure_barbershop(session: Session, barbershop_id: int) -> None:
+    if session.get(BarbershopTable, barbershop_id) is None:
+        raise HTTPException(status_code=404, detail="No existe la barbería")
+
+
+@router.get(
+    "/{barbershop_id}",
+    summary="Productos a la venta en una barbería con su stock",
+    response_model=list[InventoryItem],
+    dependencies=[Depends(conditional_get("inventory", "products"))],
+)
+def get_inventory(
+    barbershop_id: int,
+    includeHidden: bool = Query(False, description="Incluir productos ocultos o inactivos"),
+    session: Session = Depends(get_session),
+):
+    def build():
+        _ensure_barbershop(session, barbershop_id)
+        stmt = (
+            select(ProductTable, InventoryTable)
+            .join(InventoryTable, InventoryTable.productId == ProductTable.id)
+            .where(InventoryTable.barbershopId == barbershop_id)
+            .order_by(InventoryTable.order, InventoryTable.productId)
+        )
+        if not includeHidden:
+            stmt = stmt.where(InventoryTable.isVisible == True, ProductTable.isActive == True)  # noqa: E712
+        return [_to_item(p, r) for p, r in session.exec(stmt).all()]
+
+    return cached_response("inventory", f"shop:{barbershop_id}:{int(includeHidden)}", build)
+
+
+@router.get(
+    "/{barbershop_id}/records",
+    summary="Registros de inventario de una barbería",
+    response_model=list[InventoryRecord],
+    dependencies=[Depends(conditional_get("inventory"))],
+)
+def get_inventory_records(barbershop_id: int, session: Session = Depends(get_session)):
+    def build():
+        _ensure_barbershop(session, barbershop_id)
+        rows = session.exec(
+            select(InventoryTable)
+            .where(InventoryTable.barbershopId == barbershop_id)
+            .order_by(InventoryTable.order, InventoryTable.productId)
+        ).all()
+        return [_to_record(r) for r in rows]
+
+    return cached_response("inventory", f"records:{barbershop_id}", build)
+
+
+@router.post(
+    "/{barbershop_id}/reserve",
+    summary="Descontar stock de una compra (todo o nada; 409 si no hay stock)",
+    response_model=list[InventoryRecord],
+)
+def reserve(barbershop_id: int, payload: StockReservation, session: Session = Depends(get_session)):
+    rows = reserve_stock(session, barbershop_id, payload.items)
+    catalog_cache.invalidate("inventory", "products")
+    return [_to_record(r) for r in rows]
+
+
+@router.post(
+    "/{barbershop_id}/adjust",
+    summary="Ajuste de inventario en bloque (recuento con `stock` o corrección con `delta`)",
+    response_model=list[InventoryRecord],
+)
+def adjust(barbershop_id: int, payload: StockAdjustment, session: Session = Depends(get_session)):
+    rows = adjust_stock(session, barbershop_id, payload.items)
+    catalog_cache.invalidate("inventory", "products")
+    return [_to_record(r) for r in rows]
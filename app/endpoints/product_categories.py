@@ -1,8 +1,11 @@
 from fastapi import APIRouter, HTTPException, Depends
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.db import get_session
-from app.helpers.db_memory import DB
+from app.db import get_async_read_session, get_session
+from app.helpers.conditional import conditional_get
+from app.helpers.cache import cached_response_async, catalog_cache
+from app.helpers.db_memory import memory_repo
 from app.models.category import ProductCategory as ProductCategoryModel
 from app.models.category import ProductCategoryTable as ProductCategoryDB
 
@@ -17,24 +20,31 @@ def _from_mem(x: dict) -> ProductCategoryModel:
     return ProductCategoryModel(id=x.get("id"), name=x.get("name"), order=x.get("order", 0))
 
 
-@router.get("", summary="Listado de categorías de productos", response_model=list[ProductCategoryModel])
-def get_product_categories(session: Session = Depends(get_session)):
+def load_product_categories(session: Session) -> list[ProductCategoryModel]:
     items_db = session.exec(select(ProductCategoryDB)).all()
     if items_db:
         return [_to_pydantic(x) for x in sorted(items_db, key=lambda i: i.order)]
-    cats = sorted(DB.get("productCategories", []), key=lambda c: c.get("order", 0))
+    cats = sorted(memory_repo().all("productCategories"), key=lambda c: c.get("order", 0))
     return [_from_mem(x) for x in cats]
 
 
-@router.get("/{category_id}", summary="Detalle de categoría de productos", response_model=ProductCategoryModel)
-def get_product_category(category_id: int, session: Session = Depends(get_session)):
-    c = session.get(ProductCategoryDB, category_id)
-    if c:
-        return _to_pydantic(c)
-    m = next((x for x in DB.get("productCategories", []) if x.get("id") == category_id), None)
-    if not m:
-        raise HTTPException(status_code=404, detail="No existe la categoría")
-    return _from_mem(m)
+@router.get("", summary="Listado de categorías de productos", response_model=list[ProductCategoryModel], dependencies=[Depends(conditional_get("productCategories"))])
+async def get_product_categories(session: AsyncSession = Depends(get_async_read_session)):
+    return await cached_response_async("productCategories", "all", lambda: session.run_sync(load_product_categories))
+
+
+@router.get("/{category_id}", summary="Detalle de categoría de productos", response_model=ProductCategoryModel, dependencies=[Depends(conditional_get("productCategories"))])
+async def get_product_category(category_id: int, session: AsyncSession = Depends(get_async_read_session)):
+    def build(session: Session):
+        c = session.get(ProductCategoryDB, category_id)
+        if c:
+            return _to_pydantic(c)
+        m = memory_repo().get("productCategories", category_id)
+        if not m:
+            raise HTTPException(status_code=404, detail="No existe la categoría")
+        return _from_mem(m)
+
+    return await cached_response_async("productCategories", f"id:{category_id}", lambda: session.run_sync(build))
 
 
 @router.post("", summary="Crear categoría de productos (solo SQL)", response_model=ProductCategoryModel, status_code=201)
@@ -42,6 +52,7 @@ def create_product_category(payload: ProductCategoryDB, session: Session = Depen
     payload.id = None
     session.add(payload)
     session.commit()
+    catalog_cache.invalidate("productCategories")
     session.refresh(payload)
     return _to_pydantic(payload)
 
@@ -57,6 +68,7 @@ def update_product_category(category_id: int, payload: ProductCategoryDB, sessio
             setattr(c, field, val)
     session.add(c)
     session.commit()
+    catalog_cache.invalidate("productCategories")
     session.refresh(c)
     return _to_pydantic(c)
 
@@ -68,4 +80,5 @@ def delete_product_category(category_id: int, session: Session = Depends(get_ses
         raise HTTPException(status_code=404, detail="No existe la categoría (SQL)")
     session.delete(c)
     session.commit()
+    catalog_cache.invalidate("productCategories")
     return None
\ No newline at end of file
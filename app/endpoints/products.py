@@ -1,9 +1,20 @@
-from fastapi import APIRouter, HTTPException, Depends
+from decimal import Decimal
+from typing import Any, List, Optional
+
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
+from sqlalchemy import and_, func, or_
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.db import get_session
-from app.helpers.db_memory import DB
+from app.db import get_async_read_session, get_session
+from app.helpers.conditional import conditional_get
+from app.helpers.cache import cached_response_async, catalog_cache
+from app.helpers.db_memory import memory_repo
+from app.helpers.fast_json import fast_json_enabled, project
+from app.helpers.inventory import adjust_stock, default_barbershop_id, delete_product_inventory
+from app.helpers.pagination import decode_cursor, encode_cursor, is_after
 from app.models.product import Product as ProductModel
+from app.models.product import ProductSearchPage, StockAdjustmentLine
 from app.models.product import ProductTable as ProductDB
 
 router = APIRouter(prefix="/products", tags=["products"])
@@ -39,39 +50,194 @@ def _from_mem(x: dict) -> ProductModel:
     )
 
 
-@router.get("", summary="Listado de productos", response_model=list[ProductModel])
-def get_products(session: Session = Depends(get_session)):
+def _to_dict(p: ProductDB) -> dict:
+    row = project([p], ProductModel)[0]
+    # Misma sincronización price/displayedPrice que hace el modelo
+    if row["price"] is None:
+        row["price"] = row["displayedPrice"]
+    if row["displayedPrice"] is None:
+        row["displayedPrice"] = row["price"]
+    return row
+
+
+def load_products(session: Session) -> list[ProductModel]:
     items_db = session.exec(select(ProductDB)).all()
+    if items_db and fast_json_enabled():
+        return [_to_dict(x) for x in items_db]
     if items_db:
         return [_to_pydantic(x) for x in items_db]
-    return [_from_mem(x) for x in DB.get("products", [])]
+    return [_from_mem(x) for x in memory_repo().all("products")]
 
 
-@router.get("/by-category/{category_id}", summary="Productos por categoría", response_model=list[ProductModel])
-def get_products_by_category(category_id: int, session: Session = Depends(get_session)):
-    items_db = session.exec(select(ProductDB).where(ProductDB.categoryId == category_id)).all()
-    if items_db:
-        return [_to_pydantic(x) for x in items_db]
-    items_mem = [p for p in DB.get("products", []) if p.get("categoryId") == category_id]
-    return [_from_mem(x) for x in items_mem]
+@router.get("", summary="Listado de productos", response_model=list[ProductModel], dependencies=[Depends(conditional_get("products"))])
+async def get_products(session: AsyncSession = Depends(get_async_read_session)):
+    return await cached_response_async("products", "all", lambda: session.run_sync(load_products))
 
 
-@router.get("/{product_id}", summary="Detalle de producto", response_model=ProductModel)
-def get_product(product_id: int, session: Session = Depends(get_session)):
-    p = session.get(ProductDB, product_id)
-    if p:
-        return _to_pydantic(p)
-    m = next((x for x in DB.get("products", []) if x.get("id") == product_id), None)
-    if not m:
-        raise HTTPException(status_code=404, detail="No existe un producto con ese id")
-    return _from_mem(m)
+@router.get("/by-category/{category_id}", summary="Productos por categoría", response_model=list[ProductModel], dependencies=[Depends(conditional_get("products"))])
+async def get_products_by_category(category_id: int, session: AsyncSession = Depends(get_async_read_session)):
+    def build(session: Session):
+        items_db = session.exec(select(ProductDB).where(ProductDB.categoryId == category_id)).all()
+        if items_db:
+            return [_to_pydantic(x) for x in items_db]
+        return [_from_mem(x) for x in memory_repo().find("products", "categoryId", category_id)]
+
+    return await cached_response_async("products", f"category:{category_id}", lambda: session.run_sync(build))
+
+
+_SORT_COLUMNS = {"price": ProductDB.price, "name": ProductDB.name, "stock": ProductDB.stock}
+
+
+def _cursor_value(field: str, value: Any) -> Any:
+    if value is None:
+        return None
+    return Decimal(str(value)) if field == "price" else value
+
+
+def _search_mem(
+    q: Optional[str],
+    categoryId: Optional[int],
+    brands: Optional[set[str]],
+    minPrice: Optional[Decimal],
+    maxPrice: Optional[Decimal],
+    inStock: Optional[bool],
+    isActive: Optional[bool],
+    field: str,
+    desc: bool,
+    after: Optional[tuple[Any, int]],
+) -> list[dict]:
+    def price(x: dict) -> Optional[Decimal]:
+        return _cursor_value("price", x.get("price", x.get("displayedPrice")))
+
+    repo = memory_repo()
+    rows = repo.find("products", "categoryId", categoryId) if categoryId is not None else repo.all("products")
+    if q:
+        needle = q.lower()
+        rows = [x for x in rows if needle in (x.get("name") or "").lower() or needle in (x.get("brand") or "").lower()]
+    if brands:
+        rows = [x for x in rows if (x.get("brand") or "").lower() in brands]
+    if minPrice is not None:
+        rows = [x for x in rows if price(x) is not None and price(x) >= minPrice]
+    if maxPrice is not None:
+        rows = [x for x in rows if price(x) is not None and price(x) <= maxPrice]
+    if inStock is not None:
+        rows = [x for x in rows if ((x.get("stock") or 0) > 0) == inStock]
+    if isActive is not None:
+        rows = [x for x in rows if x.get("isActive", True) == isActive]
+
+    value = price if field == "price" else (lambda x: x.get(field))
+    present = sorted((x for x in rows if value(x) is not None), key=lambda x: (value(x), x["id"]), reverse=desc)
+    missing = sorted((x for x in rows if value(x) is None), key=lambda x: x["id"], reverse=desc)
+    ordered = present + missing  # NULLs al final, como en SQL
+    if after is not None:
+        ordered = [x for x in ordered if is_after(value(x), x["id"], after, desc)]
+    return ordered
+
+
+@router.get(
+    "/search",
+    summary="Búsqueda de productos (filtros combinables, orden y paginación por cursor)",
+    response_model=ProductSearchPage,
+    dependencies=[Depends(conditional_get("products"))],
+)
+async def search_products(
+    request: Request,
+    q: Optional[str] = Query(None, description="Texto a buscar en nombre o marca"),
+    categoryId: Optional[int] = Query(None),
+    brand: Optional[List[str]] = Query(None, description="Una o varias marcas (repetir el parámetro)"),
+    minPrice: Optional[Decimal] = Query(None, ge=0),
+    maxPrice: Optional[Decimal] = Query(None, ge=0),
+    inStock: Optional[bool] = Query(None, description="true: con stock; false: agotados"),
+    isActive: Optional[bool] = Query(None),
+    sort: str = Query("name", pattern="^-?(price|name|stock)$", description="price, name o stock; prefijo '-' para descendente"),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="`nextCursor` de la página anterior"),
+    session: AsyncSession = Depends(get_async_read_session),
+):
+    field, desc = sort.lstrip("-"), sort.startswith("-")
+    after: Optional[tuple[Any, int]] = None
+    if cursor:
+        data = decode_cursor(cursor)
+        if data.get("s") != sort or not isinstance(data.get("id"), int):
+            raise HTTPException(status_code=400, detail="El cursor no corresponde a este orden")
+        after = (_cursor_value(field, data.get("v")), data["id"])
+    brands = {b.lower() for b in brand} if brand else None
+
+    def build(session: Session):
+        if session.exec(select(ProductDB.id).limit(1)).first() is None:
+            rows = _search_mem(q, categoryId, brands, minPrice, maxPrice, inStock, isActive, field, desc, after)
+            page = rows[: limit + 1]
+            items = [_from_mem(x) for x in page]
+        else:
+            column = _SORT_COLUMNS[field]
+            stmt = select(ProductDB)
+            if q:
+                like = f"%{q.lower()}%"
+                stmt = stmt.where(or_(func.lower(ProductDB.name).like(like), func.lower(ProductDB.brand).like(like)))
+            if categoryId is not None:
+                stmt = stmt.where(ProductDB.categoryId == categoryId)
+            if brands:
+                stmt = stmt.where(func.lower(ProductDB.brand).in_(brands))
+            if minPrice is not None:
+                stmt = stmt.where(ProductDB.price >= minPrice)
+            if maxPrice is not None:
+                stmt = stmt.where(ProductDB.price <= maxPrice)
+            if inStock is True:
+                stmt = stmt.where(ProductDB.stock > 0)
+            elif inStock is False:
+                stmt = stmt.where(or_(ProductDB.stock.is_(None), ProductDB.stock <= 0))
+            if isActive is not None:
+                stmt = stmt.where(ProductDB.isActive == isActive)
+            if after is not None:
+                value, last_id = after
+                next_id = ProductDB.id < last_id if desc else ProductDB.id > last_id
+                if value is None:
+                    stmt = stmt.where(and_(column.is_(None), next_id))
+                else:
+                    beyond = column < value if desc else column > value
+                    stmt = stmt.where(or_(beyond, and_(column == value, next_id), column.is_(None)))
+            if desc:
+                stmt = stmt.order_by(column.desc().nulls_last(), ProductDB.id.desc())
+            else:
+                stmt = stmt.order_by(column.asc().nulls_last(), ProductDB.id.asc())
+            items = [_to_pydantic(x) for x in session.exec(stmt.limit(limit + 1)).all()]
+
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            last = items[-1]
+            next_cursor = encode_cursor({"s": sort, "v": getattr(last, field), "id": last.id})
+        return ProductSearchPage(items=items, nextCursor=next_cursor)
+
+    return await cached_response_async("products", f"search:{request.url.query}", lambda: session.run_sync(build))
+
+
+@router.get("/{product_id}", summary="Detalle de producto", response_model=ProductModel, dependencies=[Depends(conditional_get("products"))])
+async def get_product(product_id: int, session: AsyncSession = Depends(get_async_read_session)):
+    def build(session: Session):
+        p = session.get(ProductDB, product_id)
+        if p:
+            return _to_pydantic(p)
+        m = memory_repo().get("products", product_id)
+        if not m:
+            raise HTTPException(status_code=404, detail="No existe un producto con ese id")
+        return _from_mem(m)
+
+    return await cached_response_async("products", f"id:{product_id}", lambda: session.run_sync(build))
 
 
 @router.post("", summary="Crear producto (solo SQL)", response_model=ProductModel, status_code=201)
 def create_product(payload: ProductDB, session: Session = Depends(get_session)):
     payload.id = None
     session.add(payload)
-    session.commit()
+    shop_id = default_barbershop_id(session)
+    if shop_id is not None:
+        # Sin commit todavía: producto e inventario inicial se confirman (o deshacen) juntos en `adjust_stock`
+        session.flush()
+        adjust_stock(session, shop_id, [StockAdjustmentLine(productId=payload.id, stock=max(payload.stock or 0, 0))])
+    else:
+        session.commit()
+    catalog_cache.invalidate("products", "inventory")
     session.refresh(payload)
     return _to_pydantic(payload)
 
@@ -88,7 +254,6 @@ def update_product(product_id: int, payload: ProductDB, session: Session = Depen
         "description",
         "price",
         "displayedPrice",
-        "stock",
         "imageUrl",
         "isActive",
     ]:
@@ -96,7 +261,17 @@ def update_product(product_id: int, payload: ProductDB, session: Session = Depen
         if val is not None:
             setattr(p, field, val)
     session.add(p)
-    session.commit()
+    shop_id = default_barbershop_id(session)
+    if payload.stock is not None and shop_id is not None:
+        # Sin lectura-modificación-escritura: `stock` es el recuento de la barbería principal.
+        # Los cambios del producto se confirman en la misma transacción que el recuento.
+        session.flush()
+        adjust_stock(session, shop_id, [StockAdjustmentLine(productId=product_id, stock=payload.stock)])
+    else:
+        if payload.stock is not None:
+            p.stock = payload.stock
+        session.commit()
+    catalog_cache.invalidate("products", "inventory")
     session.refresh(p)
     return _to_pydantic(p)
 
@@ -106,6 +281,8 @@ def delete_product(product_id: int, session: Session = Depends(get_session)):
     p = session.get(ProductDB, product_id)
     if not p:
         raise HTTPException(status_code=404, detail="No existe un producto con ese id (SQL)")
+    delete_product_inventory(session, product_id)
     session.delete(p)
     session.commit()
+    catalog_cache.invalidate("products", "inventory")
     return None
\ No newline at end of file
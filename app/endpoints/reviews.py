@@ -1,13 +1,18 @@
 from fastapi import APIRouter, HTTPException, Query, Depends, Request
 from datetime import datetime, timezone
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.db import get_session
-from app.helpers.db_memory import DB
+from app.db import get_async_read_session, get_read_session, get_session
+from app.helpers.cache import catalog_cache
+from app.helpers.conditional import conditional_get
+from app.helpers.db_memory import memory_repo
+from app.helpers.fast_json import FastJSONResponse, fast_json_enabled, select_columns
 from app.models.review import Review, CreateReview
 from app.models.review import ReviewTable as ReviewDB
-from app.models.user import UserTable
+from app.models.user import UserTable, PhotoVariant
 from app.helpers.urls import ensure_absolute
+from app.helpers.images import photo_variant_urls
 from app.endpoints.auth import get_current_user, UserInfo
 
 router = APIRouter(prefix="/reviews", tags=["reviews"])
@@ -31,10 +36,39 @@ def _to_legacy(r: ReviewDB) -> Review:
         userPhotoUrl=getattr(r, "userPhotoUrl", None),
     )
 
+def _to_dict(r: ReviewDB, users_by_id: dict[int, UserTable], base: str) -> dict:
+    """Proyección directa de la fila (listados): nombre y foto desde el perfil si hay userId."""
+    user_name = r.userName
+    photo = getattr(r, "userPhotoUrl", None)
+    uid = getattr(r, "userId", None)
+    u = users_by_id.get(uid) if uid else None
+    if u:
+        user_name = u.name or u.username
+        photo = getattr(u, "photo_url", None)
+    photo = ensure_absolute(photo, base) if photo else None
+    return {
+        "id": r.id,
+        "barberId": r.barberId,
+        "serviceId": r.serviceId,
+        "rating": r.rating,
+        "comment": r.comment,
+        "userName": user_name,
+        "createdAt": _iso_z(r.createdAt),
+        "userPhotoUrl": photo,
+        "userPhotoVariants": photo_variant_urls(photo),
+    }
+
+
+def _with_variants(review: Review) -> Review:
+    # Miniaturas derivadas de la foto (las apps pintan avatares pequeños)
+    variants = photo_variant_urls(review.userPhotoUrl)
+    review.userPhotoVariants = [PhotoVariant(**v) for v in variants] if variants else None
+    return review
+
 def _abs(request: Request, review: Review) -> Review:
     # Normaliza userPhotoUrl a absoluta si es relativa
     review.userPhotoUrl = ensure_absolute(review.userPhotoUrl, str(request.base_url)) if review.userPhotoUrl else review.userPhotoUrl
-    return review
+    return _with_variants(review)
 
 
 def _normalize_fk(value: int | None) -> int | None:
@@ -44,46 +78,36 @@ def _normalize_fk(value: int | None) -> int | None:
     return value if value != 0 else None
 
 
-@router.get("", summary="Listado de reviews (filtradas opcionalmente)", response_model=list[Review])
-def get_reviews(
+@router.get("", summary="Listado de reviews (filtradas opcionalmente)", response_model=list[Review], dependencies=[Depends(conditional_get("reviews", "users"))])
+async def get_reviews(
     request: Request,
     barberId: int | None = Query(None),
     serviceId: int | None = Query(None),
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_read_session),
 ):
-    items_db = session.exec(select(ReviewDB)).all()
-    if items_db:
-        reviews = items_db
+    if (await session.exec(select(ReviewDB.id).limit(1))).first() is not None:
+        stmt = select_columns(ReviewDB) if fast_json_enabled() else select(ReviewDB)
+        # Filtro y orden en SQL (mismo orden que el sort estable por createdAt de antes)
         if barberId is not None:
-            reviews = [r for r in reviews if r.barberId == barberId]
+            stmt = stmt.where(ReviewDB.barberId == barberId)
         if serviceId is not None:
-            reviews = [r for r in reviews if r.serviceId == serviceId]
-        reviews = sorted(reviews, key=lambda r: r.createdAt, reverse=True)
+            stmt = stmt.where(ReviewDB.serviceId == serviceId)
+        reviews = (await session.exec(stmt.order_by(ReviewDB.createdAt.desc(), ReviewDB.id))).all()
         # Componer SIEMPRE nombre y foto desde perfil del usuario si hay userId
         user_ids = {r.userId for r in reviews if getattr(r, "userId", None)}
         users_by_id: dict[int, UserTable] = {}
         if user_ids:
-            users = session.exec(select(UserTable).where(UserTable.id.in_(list(user_ids)))).all()
+            users = (await session.exec(select(UserTable).where(UserTable.id.in_(list(user_ids))))).all()
             users_by_id = {u.id: u for u in users if u and u.id is not None}
 
         base = str(request.base_url)
-        result: list[Review] = []
-        for r in reviews:
-            legacy = _to_legacy(r)
-            uid = getattr(r, "userId", None)
-            u = users_by_id.get(uid) if uid else None
-            if u:
-                legacy.userName = u.name or u.username
-                photo = getattr(u, "photo_url", None)
-                legacy.userPhotoUrl = ensure_absolute(photo, base) if photo else None
-            else:
-                legacy.userPhotoUrl = ensure_absolute(legacy.userPhotoUrl, base) if legacy.userPhotoUrl else None
-            result.append(legacy)
-        return result
+        rows = [_to_dict(r, users_by_id, base) for r in reviews]
+        if fast_json_enabled():
+            return FastJSONResponse(rows)
+        return [Review(**row) for row in rows]
 
-    reviews_mem = DB["reviews"]
-    if barberId is not None:
-        reviews_mem = [r for r in reviews_mem if r["barberId"] == barberId]
+    repo = memory_repo()
+    reviews_mem = repo.find("reviews", "barberId", barberId) if barberId is not None else repo.all("reviews")
     if serviceId is not None:
         reviews_mem = [r for r in reviews_mem if r["serviceId"] == serviceId]
     reviews_mem = sorted(reviews_mem, key=lambda r: r.get("createdAt", ""), reverse=True)
@@ -97,8 +121,8 @@ def get_reviews(
     return result
 
 
-@router.get("/{review_id}", summary="Detalle de review", response_model=Review)
-def get_review(review_id: int, request: Request, session: Session = Depends(get_session)):
+@router.get("/{review_id}", summary="Detalle de review", response_model=Review, dependencies=[Depends(conditional_get("reviews", "users"))])
+def get_review(review_id: int, request: Request, session: Session = Depends(get_read_session)):
     r = session.get(ReviewDB, review_id)
     if r:
         legacy = _to_legacy(r)
@@ -113,8 +137,8 @@ def get_review(review_id: int, request: Request, session: Session = Depends(get_
                 legacy.userPhotoUrl = ensure_absolute(legacy.userPhotoUrl, str(request.base_url)) if legacy.userPhotoUrl else None
         else:
             legacy.userPhotoUrl = ensure_absolute(legacy.userPhotoUrl, str(request.base_url)) if legacy.userPhotoUrl else None
-        return legacy
-    m = next((x for x in DB["reviews"] if x["id"] == review_id), None)
+        return _with_variants(legacy)
+    m = memory_repo().get("reviews", review_id)
     if not m:
         raise HTTPException(status_code=404, detail="No existe la review")
     photo = m.get("userPhotoUrl") or m.get("photoUrl")
@@ -148,13 +172,14 @@ def create_review(
     )
     session.add(r)
     session.commit()
+    catalog_cache.invalidate("reviews")
     session.refresh(r)
     # Responder con nombre/foto actuales del perfil
     legacy = _to_legacy(r)
     legacy.userName = user.name or user.username
     photo = getattr(user, "photo_url", None)
     legacy.userPhotoUrl = ensure_absolute(photo, str(request.base_url)) if photo else None
-    return legacy
+    return _with_variants(legacy)
 
 
 @router.put("/{review_id}", summary="Actualizar review (solo SQL)", response_model=Review)
@@ -170,6 +195,7 @@ def update_review(review_id: int, payload: ReviewDB, request: Request, session:
             setattr(r, field, val)
     session.add(r)
     session.commit()
+    catalog_cache.invalidate("reviews")
     session.refresh(r)
     return _abs(request, _to_legacy(r))
 
@@ -181,4 +207,5 @@ def delete_review(review_id: int, session: Session = Depends(get_session)):
         raise HTTPException(status_code=404, detail="No existe la review (SQL)")
     session.delete(r)
     session.commit()
+    catalog_cache.invalidate("reviews")
     return None
\ No newline at end of file
@@ -1,13 +1,16 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+
+from app.helpers.conditional import conditional_get
 
 router = APIRouter(tags=["root"])
 
-@router.get("/", summary="Información general de la API")
+@router.get("/", summary="Información general de la API", dependencies=[Depends(conditional_get())])
 def root():
     return {
         "name": "API Barbería 💈",
         "version": "1.0.0",
         "endpoints": [
+            "/bootstrap",
             "/barbers",
             "/barbers/{id}",
             "/barbers/by-service/{service_id}",
@@ -15,10 +18,13 @@ def root():
             "/products/{id}",
             "/products/by-category/{category_id}",
             "/product-categories",
+            "/inventory/{barbershop_id}",
             "/services",
             "/services/{id}",
             "/service-categories",
             "/barbershop",
+            "/barbershops",
+            "/barbershops/{id}/(barbers|services|gallery|bookings|bootstrap)",
             "/gallery",
             "/reviews (GET, POST)",
             "/availability",
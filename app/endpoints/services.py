@@ -1,8 +1,15 @@
+from typing import Optional
+
 from fastapi import APIRouter, HTTPException, Depends
 from sqlmodel import Session, select
-
-from app.db import get_session
-from app.helpers.db_memory import DB
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.db import get_async_read_session, get_session
+from app.helpers.conditional import conditional_get
+from app.helpers.cache import cached_response_async, catalog_cache
+from app.helpers.db_memory import memory_repo
+from app.helpers.fast_json import fast_json_enabled, project
+from app.helpers.barber_services import delete_barber_links
 from app.models.service import Service as ServiceModel
 from app.models.service import ServiceTable as ServiceDB
 
@@ -35,32 +42,56 @@ def _from_mem(x: dict) -> ServiceModel:
     )
 
 
-@router.get("", summary="Listado de servicios", response_model=list[ServiceModel])
-def get_services(session: Session = Depends(get_session)):
-    items_db = session.exec(select(ServiceDB)).all()
-    if items_db:
+def load_services(
+    session: Session,
+    barbershop_id: Optional[int] = None,
+    category_id: Optional[int] = None,
+) -> list[ServiceModel]:
+    if session.exec(select(ServiceDB.id).limit(1)).first() is not None:
+        stmt = select(ServiceDB)
+        if barbershop_id is not None:
+            stmt = stmt.where(ServiceDB.barbershopId == barbershop_id)
+        if category_id is not None:
+            stmt = stmt.where(ServiceDB.categoryId == category_id)
+        items_db = session.exec(stmt.order_by(ServiceDB.id)).all()
+        if fast_json_enabled():
+            return project(items_db, ServiceModel)  # sin modelo intermedio
         return [_to_pydantic(x) for x in items_db]
-    return [_from_mem(x) for x in DB.get("services", [])]
+    repo = memory_repo()
+    items_mem = repo.find("services", "categoryId", category_id) if category_id is not None else repo.all("services")
+    if barbershop_id is not None:
+        items_mem = [x for x in items_mem if x.get("barbershopId") == barbershop_id]
+    return [_from_mem(x) for x in items_mem]
 
 
-@router.get("/by-category/{category_id}", summary="Servicios por categoría", response_model=list[ServiceModel])
-def get_services_by_category(category_id: int, session: Session = Depends(get_session)):
-    items_db = session.exec(select(ServiceDB).where(ServiceDB.categoryId == category_id)).all()
-    if items_db:
-        return [_to_pydantic(x) for x in items_db]
-    items_mem = [s for s in DB.get("services", []) if s.get("categoryId") == category_id]
-    return [_from_mem(x) for x in items_mem]
+@router.get("", summary="Listado de servicios", response_model=list[ServiceModel], dependencies=[Depends(conditional_get("services"))])
+async def get_services(session: AsyncSession = Depends(get_async_read_session)):
+    return await cached_response_async("services", "all", lambda: session.run_sync(load_services))
 
 
-@router.get("/{service_id}", summary="Detalle de servicio", response_model=ServiceModel)
-def get_service(service_id: int, session: Session = Depends(get_session)):
-    s = session.get(ServiceDB, service_id)
-    if s:
-        return _to_pydantic(s)
-    m = next((x for x in DB.get("services", []) if x.get("id") == service_id), None)
-    if not m:
-        raise HTTPException(status_code=404, detail="No existe un servicio con ese id")
-    return _from_mem(m)
+@router.get("/by-category/{category_id}", summary="Servicios por categoría", response_model=list[ServiceModel], dependencies=[Depends(conditional_get("services"))])
+async def get_services_by_category(category_id: int, session: AsyncSession = Depends(get_async_read_session)):
+    def build(session: Session):
+        items_db = session.exec(select(ServiceDB).where(ServiceDB.categoryId == category_id)).all()
+        if items_db:
+            return [_to_pydantic(x) for x in items_db]
+        return [_from_mem(x) for x in memory_repo().find("services", "categoryId", category_id)]
+
+    return await cached_response_async("services", f"category:{category_id}", lambda: session.run_sync(build))
+
+
+@router.get("/{service_id}", summary="Detalle de servicio", response_model=ServiceModel, dependencies=[Depends(conditional_get("services"))])
+async def get_service(service_id: int, session: AsyncSession = Depends(get_async_read_session)):
+    def build(session: Session):
+        s = session.get(ServiceDB, service_id)
+        if s:
+            return _to_pydantic(s)
+        m = memory_repo().get("services", service_id)
+        if not m:
+            raise HTTPException(status_code=404, detail="No existe un servicio con ese id")
+        return _from_mem(m)
+
+    return await cached_response_async("services", f"id:{service_id}", lambda: session.run_sync(build))
 
 
 @router.post("", summary="Crear servicio (solo SQL)", response_model=ServiceModel, status_code=201)
@@ -68,6 +99,7 @@ def create_service(payload: ServiceDB, session: Session = Depends(get_session)):
     payload.id = None
     session.add(payload)
     session.commit()
+    catalog_cache.invalidate_shops("services", payload.barbershopId)
     session.refresh(payload)
     return _to_pydantic(payload)
 
@@ -77,12 +109,14 @@ def update_service(service_id: int, payload: ServiceDB, session: Session = Depen
     s = session.get(ServiceDB, service_id)
     if not s:
         raise HTTPException(status_code=404, detail="No existe un servicio con ese id (SQL)")
+    old_shop = s.barbershopId
     for field in ["barbershopId", "categoryId", "name", "description", "price", "durationMinutes", "isActive"]:
         val = getattr(payload, field, None)
         if val is not None:
             setattr(s, field, val)
     session.add(s)
     session.commit()
+    catalog_cache.invalidate_shops("services", old_shop, s.barbershopId)
     session.refresh(s)
     return _to_pydantic(s)
 
@@ -92,6 +126,10 @@ def delete_service(service_id: int, session: Session = Depends(get_session)):
     s = session.get(ServiceDB, service_id)
     if not s:
         raise HTTPException(status_code=404, detail="No existe un servicio con ese id (SQL)")
+    shop_id = s.barbershopId
+    delete_barber_links(session, service_id=s.id)
     session.delete(s)
     session.commit()
+    catalog_cache.invalidate_shops("services", shop_id)
+    catalog_cache.invalidate_shops("barbers")  # by-service en cualquier barbería
     return None
\ No newline at end of file
@@ -1,17 +1,29 @@
 from datetime import datetime, date
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Request
+from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from sqlmodel import Session, select
 
 from app.db import get_session
-from app.models.user import UserTable
+from app.helpers.cache import catalog_cache
+from app.helpers.conditional import conditional_get
+from app.models.user import UserTable, PhotoVariant
 from app.endpoints.auth import get_current_user, UserInfo
 from app.helpers.urls import ensure_absolute
+from app.helpers.uploads import receive_upload
+from app.helpers.images import (
+    MAX_PHOTO_BYTES,
+    SNIFF_BYTES,
+    InvalidImageError,
+    store_user_photo,
+    photo_variant_urls,
+    run_in_image_pool,
+    sniff_image_format,
+)
 
 from pathlib import Path
-from io import BytesIO
 import logging
 import traceback
 
@@ -28,6 +40,7 @@ class UserProfileResponse(BaseModel):
     phone: Optional[str] = None
     birthDate: Optional[date] = None
     photoUrl: Optional[str] = None
+    photoVariants: Optional[list[PhotoVariant]] = None
     createdAt: datetime
 
 
@@ -39,7 +52,7 @@ class UpdateUserProfileRequest(BaseModel):
     photoUrl: Optional[str] = None
 
 
-@router.get("/me", response_model=UserProfileResponse)
+@router.get("/me", response_model=UserProfileResponse, dependencies=[Depends(conditional_get("users", user_dependency=get_current_user))])
 def get_me(
     request: Request,
     current: UserInfo = Depends(get_current_user),
@@ -58,6 +71,7 @@ def get_me(
         phone=getattr(user, "phone", None),
         birthDate=getattr(user, "birth_date", None),
         photoUrl=photo_abs,
+        photoVariants=photo_variant_urls(photo_abs),
         createdAt=user.created_at,
     )
 
@@ -104,6 +118,7 @@ def update_me(
 
     session.add(user)
     session.commit()
+    catalog_cache.invalidate("users")
 
     return None
 
@@ -112,79 +127,85 @@ class PhotoUploadResponse(BaseModel):
     photoUrl: str
 
 
-@router.post("/me/photo", response_model=PhotoUploadResponse)
+_PHOTO_UPLOAD_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "required": ["file"],
+                    "properties": {"file": {"type": "string", "format": "binary"}},
+                }
+            }
+        },
+    }
+}
+
+
+def _save_photo_url(session: Session, user: UserTable, public_url: str) -> None:
+    user.photo_url = public_url
+    session.add(user)
+    session.commit()
+    catalog_cache.invalidate("users")
+
+
+@router.post("/me/photo", response_model=PhotoUploadResponse, openapi_extra=_PHOTO_UPLOAD_OPENAPI)
 async def upload_my_photo(
     request: Request,
-    file: UploadFile = File(...),
     current: UserInfo = Depends(get_current_user),
     session: Session = Depends(get_session),
 ):
+    """Sube la foto de perfil sin bloquear el event loop.
+
+    El cuerpo se recibe en streaming (límite aplicado al vuelo), el formato se
+    detecta por la cabecera del fichero y la recodificación con Pillow se hace
+    en un pool de procesos. El acceso a BD va al threadpool.
+    """
     # Obtener usuario actual desde la BD (necesitamos su id)
-    user = session.exec(select(UserTable).where(UserTable.username == current.username)).first()
+    user = await run_in_threadpool(
+        lambda: session.exec(select(UserTable).where(UserTable.username == current.username)).first()
+    )
     if not user:
         raise HTTPException(status_code=404, detail="Usuario no encontrado")
 
+    # Corta la subida en cuanto la cabecera del fichero no es JPG/PNG/WEBP
+    upload = await receive_upload(
+        request,
+        "file",
+        MAX_PHOTO_BYTES,
+        header_check=lambda head: sniff_image_format(head) is not None,
+        header_bytes=SNIFF_BYTES,
+    )
     try:
-        # Leer datos en memoria y validar tamaño
-        data = await file.read()
-        if len(data) > 5 * 1024 * 1024:
-            raise HTTPException(status_code=400, detail="Archivo demasiado grande (máx. 5 MB)")
+        # Validar formato real por cabecera (no por el content-type del cliente)
+        ext = sniff_image_format(upload.file.read(SNIFF_BYTES))
+        if ext is None:
+            raise HTTPException(status_code=400, detail="Formato de imagen no soportado (use JPG, PNG o WEBP)")
+        upload.file.seek(0)
+        data = await run_in_threadpool(upload.file.read)
+    finally:
+        upload.close()
 
-        # Validar contenido real de imagen (no solo cabeceras del cliente)
-        try:
-            from PIL import Image, UnidentifiedImageError  # type: ignore
-        except Exception:
-            logger.exception("Pillow no disponible")
-            raise HTTPException(status_code=500, detail="Validación de imagen no disponible en el servidor")
-
-        detected_ext = None
-        try:
-            bio = BytesIO(data)
-            img = Image.open(bio)
-            img.verify()  # valida integridad
-            fmt = img.format.upper() if img.format else ""
-            if fmt == "JPEG":
-                detected_ext = ".jpg"
-            elif fmt == "PNG":
-                detected_ext = ".png"
-            elif fmt == "WEBP":
-                detected_ext = ".webp"
-            else:
-                raise HTTPException(status_code=400, detail="Formato de imagen no soportado (use JPG, PNG o WEBP)")
-        except UnidentifiedImageError:
-            raise HTTPException(status_code=400, detail="El archivo no es una imagen válida")
-        except HTTPException:
-            raise
-        except Exception:
-            logger.exception("Error validando la imagen")
-            raise HTTPException(status_code=400, detail="El archivo no es una imagen válida")
-
-        ext = detected_ext
+    try:
         # Ruta absoluta: .../TFG/static/user-photos
         project_root = Path(__file__).resolve().parents[2]
         folder = project_root / "static" / "user-photos"
         folder.mkdir(parents=True, exist_ok=True)
 
-        filename = f"user-{user.id}-{int(datetime.utcnow().timestamp())}{ext}"
-        path = folder / filename
-
         try:
-            # Re-abrimos y guardamos para normalizar el archivo
-            img2 = Image.open(BytesIO(data))
-            save_params = {}
-            if ext == ".jpg":
-                save_params = {"quality": 90, "optimize": True}
-            img2.save(str(path), **save_params)
+            # Validar, normalizar y guardar por hash de contenido (+ miniaturas)
+            rel_path = await run_in_image_pool(store_user_photo, data, str(folder), ext)
+        except InvalidImageError:
+            raise HTTPException(status_code=400, detail="El archivo no es una imagen válida")
         except Exception:
-            logger.exception("Error guardando la imagen en disco: %s", path)
+            logger.exception("Error guardando la imagen en disco: %s", folder)
             raise HTTPException(status_code=500, detail="No se pudo guardar la imagen en el servidor")
 
         base = str(request.base_url)
-        public_url = ensure_absolute(f"static/user-photos/{filename}", base)
+        public_url = ensure_absolute(f"static/user-photos/{rel_path}", base)
 
-        user.photo_url = public_url
-        session.add(user)
-        session.commit()
+        await run_in_threadpool(_save_photo_url, session, user, public_url)
 
         return PhotoUploadResponse(photoUrl=public_url)
 
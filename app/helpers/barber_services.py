@@ -0,0 +1,71 @@
+"""Sincronización de la tabla `barber_services` con `BarberTable.servicesOffered`.
+
+`servicesOffered` (JSON) se mantiene por compatibilidad con los clientes; la
+tabla de relación es la que se consulta (índice por servicio).
+"""
+from __future__ import annotations
+
+from typing import Iterable, Optional
+
+from sqlalchemy import delete
+from sqlmodel import Session, select
+
+from app.models.barber import BarberServiceTable, BarberTable
+from app.models.service import ServiceTable
+
+
+def _existing_service_ids(session: Session, service_ids: Iterable[int]) -> set[int]:
+    ids = {int(s) for s in service_ids}
+    if not ids:
+        return set()
+    return set(session.exec(select(ServiceTable.id).where(ServiceTable.id.in_(ids))).all())
+
+
+def sync_barber_services(session: Session, barber_id: int, service_ids: Optional[Iterable[int]]) -> None:
+    """Deja en `barber_services` exactamente los servicios indicados (sin commit).
+
+    Se ignoran ids de servicios inexistentes (evita violar la FK).
+    """
+    wanted = _existing_service_ids(session, service_ids or [])
+    current = set(session.exec(
+        select(BarberServiceTable.serviceId).where(BarberServiceTable.barberId == barber_id)
+    ).all())
+    removed = current - wanted
+    if removed:
+        session.exec(delete(BarberServiceTable).where(
+            (BarberServiceTable.barberId == barber_id) & (BarberServiceTable.serviceId.in_(removed))
+        ))
+    for service_id in sorted(wanted - current):
+        session.add(BarberServiceTable(barberId=barber_id, serviceId=service_id))
+
+
+def delete_barber_links(session: Session, barber_id: Optional[int] = None, service_id: Optional[int] = None) -> None:
+    """Borra relaciones de un barbero o de un servicio (sin commit)."""
+    stmt = delete(BarberServiceTable)
+    if barber_id is not None:
+        stmt = stmt.where(BarberServiceTable.barberId == barber_id)
+    if service_id is not None:
+        stmt = stmt.where(BarberServiceTable.serviceId == service_id)
+    session.exec(stmt)
+
+
+def backfill_barber_services(session: Session) -> int:
+    """Rellena `barber_services` desde `servicesOffered` si la tabla está vacía.
+
+    Devuelve el número de relaciones creadas.
+    """
+    if session.exec(select(BarberServiceTable).limit(1)).first() is not None:
+        return 0
+    barbers = session.exec(select(BarberTable.id, BarberTable.servicesOffered)).all()
+    valid = _existing_service_ids(session, {s for _, offered in barbers for s in (offered or [])})
+    created = 0
+    for barber_id, offered in barbers:
+        for service_id in sorted({int(s) for s in (offered or [])} & valid):
+            session.add(BarberServiceTable(barberId=barber_id, serviceId=service_id))
+            created += 1
+    if created:
+        session.commit()
+    return created
+
+
+__all__ = ["sync_barber_services", "delete_barber_links", "backfill_barber_services"]
@@ -0,0 +1,224 @@
+"""Caché en proceso (read-through) de respuestas del catálogo.
+
+Guarda el JSON ya serializado por `(recurso, variante)`; p. ej.
+`("services", "category:2")`. Cada recurso tiene un contador de versión que
+los handlers de escritura incrementan con `invalidate()`: así se descartan
+todas sus variantes de una vez y una lectura que estuviese construyendo la
+respuesta en paralelo no deja en caché datos ya obsoletos.
+
+Los recursos del catálogo de cada barbería tienen además su propia versión
+(`barbers@2`, ver `shop_resource`): las rutas `/barbershops/{id}/...` dependen
+solo de ella, así que una escritura en una barbería no vacía la caché del resto.
+
+La caché es por worker: con varios workers una escritura solo invalida el
+suyo, y el TTL (`CATALOG_CACHE_TTL`) acota cuánto tarda en verse en el resto.
+
+Con réplica de lectura, una respuesta construida justo después de invalidar
+puede venir de una réplica que aún no tiene la escritura: durante
+`settle_seconds` tras cada invalidación el recurso no se guarda en caché (ni
+lleva ETag, ver `app/helpers/conditional.py`).
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Awaitable, Callable, Optional
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import Response
+
+from app.helpers.fast_json import dumps as fast_dumps, fast_json_enabled
+
+CATALOG_CACHE_TTL = float(os.getenv("CATALOG_CACHE_TTL", "300"))  # 0 desactiva
+CATALOG_CACHE_MAX_ENTRIES = int(os.getenv("CATALOG_CACHE_MAX_ENTRIES", "1024"))
+
+
+def dump_json(content: Any) -> bytes:
+    """Mismo formato que `JSONResponse` (lo que FastAPI devolvería sin caché)."""
+    if fast_json_enabled():
+        return fast_dumps(content)
+    return json.dumps(
+        jsonable_encoder(content),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def shop_resource(resource: str, barbershop_id: int | str) -> str:
+    """Nombre del recurso limitado a una barbería: `barbers` -> `barbers@2`."""
+    return f"{resource}@{barbershop_id}"
+
+
+class CatalogCache:
+    def __init__(self, ttl_seconds: float = CATALOG_CACHE_TTL, max_entries: int = CATALOG_CACHE_MAX_ENTRIES) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        # (recurso, variante) -> (versión, caduca_en, cuerpo)
+        self._entries: OrderedDict[tuple[str, str], tuple[int, float, bytes]] = OrderedDict()
+        self._versions: dict[str, int] = defaultdict(int)
+        self._hits: dict[str, int] = defaultdict(int)
+        self._misses: dict[str, int] = defaultdict(int)
+        self._invalidations: dict[str, int] = defaultdict(int)
+        self._invalidated_at: dict[str, float] = {}
+        self.settle_seconds = 0.0  # ventana tras invalidar sin guardar (retraso de la réplica)
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def _version(self, resource: str) -> int:
+        # Los recursos por barbería (`barbers@2`) cambian también con `barbers@*`
+        version = self._versions.get(resource, 0)  # sin crear la entrada (ids arbitrarios en la URL)
+        if "@" in resource:
+            version += self._versions.get(resource.split("@", 1)[0] + "@*", 0)
+        return version
+
+    def version(self, resource: str) -> int:
+        with self._lock:
+            return self._version(resource)
+
+    def _settling(self, resource: str, now: float) -> bool:
+        if self.settle_seconds <= 0:
+            return False
+        last = self._invalidated_at.get(resource, 0.0)
+        if "@" in resource:
+            last = max(last, self._invalidated_at.get(resource.split("@", 1)[0] + "@*", 0.0))
+        return now - last < self.settle_seconds if last else False
+
+    def settling(self, resource: str) -> bool:
+        """True si `resource` se invalidó hace menos de `settle_seconds`."""
+        with self._lock:
+            return self._settling(resource, time.monotonic())
+
+    def _lookup(self, key: tuple[str, str]) -> tuple[int, float, Optional[bytes]]:
+        """(versión, ahora, cuerpo si hay una entrada vigente) y cuenta el acierto/fallo."""
+        resource = key[0]
+        now = time.monotonic()
+        with self._lock:
+            version = self._version(resource)
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version and entry[1] > now:
+                self._entries.move_to_end(key)
+                self._hits[resource] += 1
+                return version, now, entry[2]
+            self._misses[resource] += 1
+        return version, now, None
+
+    def _store(self, key: tuple[str, str], version: int, now: float, body: bytes) -> None:
+        with self._lock:
+            # Nadie ha invalidado mientras tanto y la réplica ya ha tenido tiempo de ponerse al día
+            if self._version(key[0]) == version and not self._settling(key[0], now):
+                self._entries[key] = (version, now + self.ttl_seconds, body)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+    def get_or_build(self, resource: str, variant: str, build: Callable[[], bytes]) -> bytes:
+        if not self.enabled:
+            return build()
+        key = (resource, variant)
+        version, now, body = self._lookup(key)
+        if body is not None:
+            return body
+        # Fuera del lock: la consulta a BD no bloquea al resto de lecturas
+        body = build()
+        self._store(key, version, now, body)
+        return body
+
+    async def get_or_build_async(self, resource: str, variant: str, build: Callable[[], Awaitable[bytes]]) -> bytes:
+        """Como `get_or_build` para handlers `async def`: `build` es una corrutina."""
+        if not self.enabled:
+            return await build()
+        key = (resource, variant)
+        version, now, body = self._lookup(key)
+        if body is not None:
+            return body
+        body = await build()
+        self._store(key, version, now, body)
+        return body
+
+    def invalidate(self, *resources: str) -> None:
+        now = time.monotonic()
+        with self._lock:
+            for resource in resources:
+                self._versions[resource] += 1
+                self._invalidated_at[resource] = now
+                self._invalidations[resource] += 1
+                if resource.endswith("@*"):
+                    stale = [k for k in self._entries if k[0].startswith(resource[:-1])]
+                else:
+                    stale = [k for k in self._entries if k[0] == resource]
+                for key in stale:
+                    del self._entries[key]
+
+    def invalidate_shops(self, resource: str, *barbershop_ids: Optional[int]) -> None:
+        """Invalida `resource` (listados globales) y su versión en las barberías indicadas.
+
+        Sin ids se invalidan todas las barberías a la vez (`recurso@*`), p. ej.
+        cuando no se sabe a cuál afecta el cambio.
+        """
+        ids = {i for i in barbershop_ids if i is not None}
+        if ids:
+            self.invalidate(resource, *(shop_resource(resource, i) for i in sorted(ids)))
+        else:
+            self.invalidate(resource, shop_resource(resource, "*"))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            resources = sorted(set(self._hits) | set(self._misses) | set(self._invalidations))
+            per_resource = {}
+            for r in resources:
+                hits, misses = self._hits[r], self._misses[r]
+                per_resource[r] = {
+                    "hits": hits,
+                    "misses": misses,
+                    "hitRatio": round(hits / (hits + misses), 4) if hits + misses else None,
+                    "invalidations": self._invalidations[r],
+                    "version": self._version(r),
+                }
+            total_hits = sum(self._hits.values())
+            total_misses = sum(self._misses.values())
+            return {
+                "enabled": self.enabled,
+                "ttlSeconds": self.ttl_seconds,
+                "entries": len(self._entries),
+                "maxEntries": self.max_entries,
+                "hits": total_hits,
+                "misses": total_misses,
+                "hitRatio": round(total_hits / (total_hits + total_misses), 4) if total_hits + total_misses else None,
+                "resources": per_resource,
+            }
+
+
+catalog_cache = CatalogCache()
+
+
+def cached_response(resource: str, variant: str, build: Callable[[], Any]) -> Response:
+    """Devuelve la respuesta JSON cacheada; `build` solo se ejecuta en un fallo.
+
+    Las excepciones de `build` (p. ej. 404) se propagan y no se cachean.
+    """
+    body = catalog_cache.get_or_build(resource, variant, lambda: dump_json(build()))
+    return Response(content=body, media_type="application/json")
+
+
+async def cached_response_async(resource: str, variant: str, build: Callable[[], Awaitable[Any]]) -> Response:
+    """`cached_response` para handlers `async def` (p. ej. `lambda: session.run_sync(load_barbers)`)."""
+    async def build_body() -> bytes:
+        return dump_json(await build())
+
+    body = await catalog_cache.get_or_build_async(resource, variant, build_body)
+    return Response(content=body, media_type="application/json")
+
+
+__all__ = ["CatalogCache", "catalog_cache", "cached_response", "cached_response_async", "dump_json", "shop_resource"]
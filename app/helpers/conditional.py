@@ -0,0 +1,149 @@
+"""GET condicionales (ETag / If-None-Match / 304) sin ejecutar la consulta.
+
+El ETag no se calcula a partir del cuerpo: se deriva de los contadores de
+versión de los recursos de los que depende la respuesta (los mismos que
+incrementa `catalog_cache.invalidate()` en cada escritura), de la URL completa
+(ruta, query y host, que afecta a las URLs absolutas) y de un id de arranque
+del proceso. Así el dependency puede responder 304 antes de tocar la BD.
+
+Los contadores son por worker: con varios workers una escritura no incrementa
+los del resto, así que la ventana `ETAG_WINDOW_SECONDS` (por defecto el TTL
+de la caché) rota los ETags periódicamente y acota el tiempo que un cliente
+puede recibir 304 con datos ya cambiados en otro worker. Las respuestas que
+dependen de reservas (`/availability`, `/bookings`...) cambian a cada reserva
+y un 304 obsoleto ofrecería huecos ya ocupados (409 al reservar), así que usan
+una ventana corta, `BOOKINGS_ETAG_WINDOW_SECONDS` (por defecto 5 s); la de
+300 s queda para el catálogo.
+
+Con réplica de lectura, mientras un recurso está recién invalidado
+(`catalog_cache.settling`) no se emite ETag: la respuesta podría venir de la
+réplica aún sin la escritura y el cliente la revalidaría con un ETag nuevo.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+import uuid
+from typing import Any, Callable, Optional
+
+from fastapi import Depends, HTTPException, Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.helpers.cache import CATALOG_CACHE_TTL, catalog_cache
+
+BOOT_ID = uuid.uuid4().hex[:8]
+ETAG_WINDOW_SECONDS = int(os.getenv("ETAG_WINDOW_SECONDS", str(int(CATALOG_CACHE_TTL) or 300)))
+BOOKINGS_ETAG_WINDOW_SECONDS = int(os.getenv("BOOKINGS_ETAG_WINDOW_SECONDS", "5"))
+_BOOKING_RESOURCES = {"bookings"}  # recursos que cambian con cada reserva (también `bookings@{id}`)
+
+CACHE_CONTROL = "no-cache"  # el cliente puede guardar, pero revalida siempre
+
+
+def resource_etag(resources: tuple[str, ...], request: Request, extra: str = "", window: Optional[int] = None) -> str:
+    versions = ".".join(str(catalog_cache.version(r)) for r in resources)
+    window = ETAG_WINDOW_SECONDS if window is None else window
+    bucket = int(time.time() // window) if window > 0 else 0
+    digest = hashlib.blake2b(
+        f"{request.url}|{extra}".encode(), digest_size=8
+    ).hexdigest()
+    return f'"{BOOT_ID}-{bucket}-{versions}-{digest}"'
+
+
+def _matches(if_none_match: str, etag: str) -> bool:
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag == etag or tag == f"W/{etag}":
+            return True
+    return False
+
+
+def _effective_window(resources: tuple[str, ...], window: Optional[int]) -> Optional[int]:
+    # Respuestas derivadas de reservas: ventana corta aunque se pida una mayor
+    if not any(r.split("@", 1)[0] in _BOOKING_RESOURCES for r in resources):
+        return window
+    if window is None or window <= 0:
+        return BOOKINGS_ETAG_WINDOW_SECONDS
+    return min(window, BOOKINGS_ETAG_WINDOW_SECONDS)
+
+
+def _resolve(resources: tuple[str, ...], request: Request) -> tuple[str, ...]:
+    # "barbers@{barbershop_id}" -> "barbers@2" con los parámetros de ruta
+    if not any("{" in r for r in resources):
+        return resources
+    return tuple(r.format(**request.path_params) if "{" in r else r for r in resources)
+
+
+def _check(request: Request, resources: tuple[str, ...], etag: str, vary: Optional[str]) -> None:
+    if any(catalog_cache.settling(r) for r in resources):
+        return
+    request.state.etag = etag
+    request.state.etag_vary = vary
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _matches(if_none_match, etag):
+        headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+        if vary:
+            headers["Vary"] = vary
+        raise HTTPException(status_code=304, headers=headers)
+
+
+def conditional_get(
+    *resources: str,
+    user_dependency: Optional[Callable[..., Any]] = None,
+    window: Optional[int] = None,
+):
+    """Dependency: responde 304 si `If-None-Match` coincide con el ETag actual.
+
+    - `resources`: recursos cuyo cambio invalida la respuesta. Admiten
+      parámetros de ruta (`"barbers@{barbershop_id}"`) para versiones por barbería.
+    - `user_dependency`: para respuestas por usuario (p. ej. `get_current_user`);
+      se autentica antes de comparar y el ETag incluye la credencial.
+    - `window`: segundos de vida del ETag (respuestas que dependen de "ahora").
+      Con recursos de reservas se limita a `BOOKINGS_ETAG_WINDOW_SECONDS`.
+    """
+    window = _effective_window(resources, window)
+    # `async def`: no hay E/S, así que se evalúa en el bucle de eventos sin pasar por el threadpool
+    if user_dependency is None:
+        async def dependency(request: Request) -> None:
+            resolved = _resolve(resources, request)
+            _check(request, resolved, resource_etag(resolved, request, window=window), None)
+    else:
+        async def dependency(request: Request, current: Any = Depends(user_dependency)) -> None:
+            auth = request.headers.get("authorization", "")
+            resolved = _resolve(resources, request)
+            _check(request, resolved, resource_etag(resolved, request, extra=auth, window=window), "Authorization")
+    return dependency
+
+
+class ETagHeaderMiddleware:
+    """Añade `ETag`/`Cache-Control` a las respuestas 200 de rutas con `conditional_get`.
+
+    Se hace en ASGI puro para cubrir también las respuestas ya serializadas
+    (`cached_response`), a las que FastAPI no aplica las cabeceras del dependency.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                state = scope.get("state") or {}
+                etag = state.get("etag")
+                if etag:
+                    headers = list(message.get("headers", []))
+                    headers.append((b"etag", etag.encode("latin-1")))
+                    headers.append((b"cache-control", CACHE_CONTROL.encode("latin-1")))
+                    if state.get("etag_vary"):
+                        headers.append((b"vary", state["etag_vary"].encode("latin-1")))
+                    message = {**message, "headers": headers}
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+__all__ = ["BOOT_ID", "BOOKINGS_ETAG_WINDOW_SECONDS", "conditional_get", "resource_etag", "ETagHeaderMiddleware"]
@@ -1,220 +1,102 @@
 """
 Almacenamiento en memoria para entorno de desarrollo.
+
+Los datos están en `db_memory.json` (junto a este módulo) y solo se leen la
+primera vez que hacen falta: cuando una tabla SQL está vacía y un endpoint cae
+a memoria, o al sembrar una BD nueva. Con la BD ya poblada no se cargan.
+
+`memory_repo()` devuelve el repositorio: diccionarios por id y índices
+secundarios (por barbero, categoría, fecha...) que se construyen al primer uso.
+Los datos son de solo lectura. `DB` se mantiene por compatibilidad con el
+antiguo diccionario (`DB["barbers"]`, `DB.get(...)`) y también es perezoso.
 """
-from typing import Dict, Any
-
-# Nota: usamos tipos integrados (dict/list) para evitar depender de typing.List en tiempo de ejecución
-DB: dict[str, Any] = {
-    "barbers": [
-            {
-                "id": 1,
-                "barbershopId": 1,
-                "name": "Juan Díaz",
-                "phone": "+34 612 345 678",
-                "email": "juan.diaz@barberia.local",
-                "specialty": "Fade, Barba",
-                "specialties": ["Fade", "Barba"],
-                "bio": "Especialista en fades modernos, diseño de línea y arreglos de barba tradicionales.",
-                "photoUrl": "https://d375139ucebi94.cloudfront.net/region2/es/3103/resource_photos/7b39e48d87844e0980e897c7f1e4ca-madrid-shaving-club-moncloa-ancor-6629c1458f7241658f363b1494e76f-booksy.jpeg?size=250x250&size=100x100",
-                "photoThumbUrl": "https://d375139ucebi94.cloudfront.net/region2/es/3103/resource_photos/7b39e48d87844e0980e897c7f1e4ca-madrid-shaving-club-moncloa-ancor-6629c1458f7241658f363b1494e76f-booksy.jpeg?size=250x250&size=100x100",
-                "ratingAverage": 4.9,
-                "totalReviews": 124,
-                "experienceYears": 8,
-                "languages": ["es", "en"],
-                "servicesOffered": [1, 2, 3],
-                "workingHours": {
-                    "timezone": "Europe/Madrid",
-                    "weekly": [
-                        {"day": 1, "open": "09:00", "close": "18:00"},
-                        {"day": 2, "open": "09:00", "close": "18:00"},
-                        {"day": 3, "open": "09:00", "close": "18:00"},
-                        {"day": 4, "open": "09:00", "close": "20:00"},
-                        {"day": 5, "open": "09:00", "close": "20:00"},
-                        {"day": 6, "open": "10:00", "close": "16:00"},
-                    ],
-                    "exceptions": [],
-                },
-                "isActive": True,
-                "createdAt": "2025-11-03T08:00:00Z",
-            },
-            {
-                "id": 2,
-                "barbershopId": 1,
-                "name": "Carlos Ruiz",
-                "phone": "+34 678 112 334",
-                "email": "carlos.ruiz@barberia.local",
-                "specialty": "Clásicos, Niños",
-                "specialties": ["Clásicos", "Niños"],
-                "bio": "Cortes clásicos y trato excelente con clientes infantiles. Paciente y detallista.",
-                "photoUrl": "https://d375139ucebi94.cloudfront.net/region2/es/3103/resource_photos/8069c11f8733439da1b75fa95cc42584.jpeg?size=250x250&size=100x100",
-                "photoThumbUrl": "https://d375139ucebi94.cloudfront.net/region2/es/3103/resource_photos/8069c11f8733439da1b75fa95cc42584.jpeg?size=250x250&size=100x100",
-                "ratingAverage": 4.7,
-                "totalReviews": 76,
-                "experienceYears": 10,
-                "languages": ["es"],
-                "servicesOffered": [1, 5],
-                "workingHours": {
-                    "timezone": "Europe/Madrid",
-                    "weekly": [
-                        {"day": 1, "open": "09:00", "close": "17:00"},
-                        {"day": 2, "open": "09:00", "close": "17:00"},
-                        {"day": 3, "open": "09:00", "close": "17:00"},
-                        {"day": 4, "open": "12:00", "close": "20:00"},
-                        {"day": 5, "open": "09:00", "close": "19:00"},
-                        {"day": 6, "open": "10:00", "close": "14:00"},
-                    ],
-                    "exceptions": [],
-                },
-                "isActive": True,
-                "createdAt": "2025-11-03T08:10:00Z",
-            },
-            {
-                "id": 3,
-                "barbershopId": 1,
-                "name": "Miguel Santos",
-                "phone": "+34 644 333 221",
-                "email": "miguel.santos@barberia.local",
-                "specialty": "Corte rápido, Afeitado",
-                "specialties": ["Corte rápido", "Afeitado"],
-                "bio": "Muy eficiente en servicios express y afeitados tradicionales con toalla caliente.",
-                "photoUrl": "https://d375139ucebi94.cloudfront.net/region2/es/3103/resource_photos/a58721b0e0b6433188a7c7a5e7e967e3.jpeg?size=250x250&size=100x100",
-                "photoThumbUrl": "https://d375139ucebi94.cloudfront.net/region2/es/3103/resource_photos/a58721b0e0b6433188a7c7a5e7e967e3.jpeg?size=250x250&size=100x100",
-                "ratingAverage": 4.5,
-                "totalReviews": 58,
-                "experienceYears": 4,
-                "languages": ["es"],
-                "servicesOffered": [1, 2],
-                "workingHours": {
-                    "timezone": "Europe/Madrid",
-                    "weekly": [
-                        {"day": 1, "open": "08:00", "close": "16:00"},
-                        {"day": 2, "open": "08:00", "close": "16:00"},
-                        {"day": 3, "open": "08:00", "close": "16:00"},
-                        {"day": 4, "open": "12:00", "close": "20:00"},
-                        {"day": 5, "open": "12:00", "close": "20:00"},
-                        {"day": 6, "open": "09:00", "close": "14:00"},
-                    ],
-                    "exceptions": [],
-                },
-                "isActive": True,
-                "createdAt": "2025-11-03T08:20:00Z",
-            },
-            {
-                "id": 4,
-                "barbershopId": 1,
-                "name": "Raúl Fernández",
-                "phone": "+34 622 555 444",
-                "email": "raul.fernandez@barberia.local",
-                "specialty": "Corte + Barba, Perfilado",
-                "specialties": ["Corte", "Barba", "Perfilado"],
-                "bio": "Servicios combinados de corte y barba, experto en perfiles y degradados finos.",
-                "photoUrl": "https://d375139ucebi94.cloudfront.net/region2/es/3103/resource_photos/dffacbbc23b04d52a9711cf1c6790317.jpeg?size=250x250&size=100x100",
-                "photoThumbUrl": "https://d375139ucebi94.cloudfront.net/region2/es/3103/resource_photos/dffacbbc23b04d52a9711cf1c6790317.jpeg?size=250x250&size=100x100",
-                "ratingAverage": 4.6,
-                "totalReviews": 39,
-                "experienceYears": 5,
-                "languages": ["es"],
-                "servicesOffered": [3, 2],
-                "workingHours": {
-                    "timezone": "Europe/Madrid",
-                    "weekly": [
-                        {"day": 1, "open": "09:00", "close": "18:00"},
-                        {"day": 2, "open": "09:00", "close": "18:00"},
-                        {"day": 3, "open": "09:00", "close": "18:00"},
-                        {"day": 4, "open": "09:00", "close": "20:00"},
-                        {"day": 5, "open": "09:00", "close": "20:00"},
-                        {"day": 6, "open": "10:00", "close": "14:00"},
-                    ],
-                    "exceptions": [],
-                },
-                "isActive": True,
-                "createdAt": "2025-11-03T08:40:00Z",
-            },
-        ],
-        "products": [
-            {"id": 1, "categoryId": 1, "name": "Champú Anticaspa", "brand": "Head&Shoulders", "description": "Limpieza profunda y protección contra la caspa. Fórmula suave para uso diario.", "price": 6.99, "stock": 20, "imageUrl": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wCEAAkGBxITEBUSEhIQFRIWFxcVGBgVFhUaFhcXFRkWGBYYFxYYHSggGBolHRYXITEhJSorMTAuFx8zODMsOCgtLisBCgoKDg0OGxAQGy0lICYtNi0tLTAtLS0vLS8tLS0tLy0tLS0tLS0tLS0tLS0tLS0tLS0tLS0wLS0tLS0tLS0tLf/AABEIAOEA4QMBEQACEQEDEQH/xAAcAAEAAgMBAQEAAAAAAAAAAAAABQYDBAcCAQj/xABIEAACAQIDBAUIBggEBQUAAAABAgADEQQSIQUGMUETIjJRcQczYXKBkaGxFFJzssHRI0JigpKiwvAVNGPhJFOT0vFEg6PD4v/EABoBAQADAQEBAAAAAAAAAAAAAAABAwQCBQb/xAAxEQEAAgIBAwEFBwQDAQAAAAAAAQIDETEEEiFBIjJRYXEFEzOBkaHwFELR4VKxwfH/2gAMAwEAAhEDEQA/AO4wEBAQEBAQEBAQEDXx+LWlTao/ZUXP5D0k6e2d0pN7RWOZcXvFKzaXPtq7wV2w/wBKeo1OmzlKNGmcpqZeLPU7WUHSy24T18fSUjL9zWNzrczPp9IeVfqrzj+9tOo4iPi5/isW7uXerVzMSfO1Lam9gL6D0T2K9PjiNaeXPUZbTvbF0x/5lb/q1PzicOP4Ooy5p9WKpj3Bt01b2VnFve0mOnxT/b+y6t8sxy2KG0ahvlxGK07q1X2cGiemxf8AD9nFs2evNly3TeniWWkMZthMRYsyivmpgLzuwuAdPaZ5PWY7Yd27K9v08t/S3+98Tad/stlfarYbF0KBZ2SpYXYseJyjtXN72N81vRzmKnTxlw2ycTDRbNfHlrTmJW2ee9AgICAgICAgICAgICAgICAgICAgIFM8oNZ6hoYOkxD1XBNuQ4C/oHWb92ep9nVivdmtxEfz/DzuvvNu3FHMqDv1XV64oUiehw6LSUXOuW9204k34z1vs+kxScl+bTt5vWZqxeKV4r4VDHOQdSf77p6E61tXhiJhHNVPeZntlt6S1RWHjMe8ziL2+KfCV2I+rC/G3wvNOK0zzLH1ddxEuw+S3ZqLRqYi16lR8hPciAWUd2tyfZ3TwvtnLa2WKekR/wBvR+zIj7rba3p0x+FPoPwYGVdH56fJ/PQ6qdZ8f89V0nkvXICAgICAgICAgICAgICAgICAgICBzWttIHEYrHHVaK9FS9LvoLdxCg/xT3PupjFjwRzbzP0eLOTeS+af7fEfX/456zEkk6k6nxPGe1EajUPGmdzuUTtsHS0pzTLZ0sx52jAplG5bNw9hDJhz3QkNm9UknutL8U6nyzdR7Uah23yWvfA3/wBV/ks8P7Vnef8AJ6X2dGsOvmb4m2Lwp9D/ADWddD+Dkj+eqvrfxsf8+C6zyHsEBAQEBAQEBAQEBAQEBAQEBAQECK3nxvQ4Sq97HLlHi2l/Ze/smjpcf3mWtVHU5OzFMuR7UxoGHpYdeNzVqel31UHwXJ7QZ9JixTOa2SfpD53Lk1irSPXzKGCzWx7aeLInNphdj2j2Ez2nbVHgAnI2MNSZjZFZj3KCT7hE5a15lHZNuIdm8m6PRwWSspRjUZgG0NiFsfnPE67JXJl7qz6PW6PHNMepYt+a9jSrdbLTzdlHa+bKb3RWCgW4nvnPT9R91W1Yjl1n6eMlq2n0XqhUDKrDgwBHgReYW57gICAgICAgICAgICAgICAgICAgUTypY+yU6IOhu7ezRf6vdPX+yce7Tf4PJ+1cmqRX4uYKxbrHidffwnvR4h4WSfLzWrBRE2iHFaTaUa1Uu1kUsfQJkyZ6w348M6SGC3drVONl8f7/ADmO/V64aa4ZlZdmbrUEINX9Ie4jq/Ox90x5OpvbhppgrXlbMDUpIMqU0UDkFt8jM1tzy011HELDs2og7KovgoHylUwvrLBvJjwlK5B1uBbvIsDJpXbnJbSa2Yf0FO/HIn3RKpXQ2YSQEBAQEBAQEBAQEBAQEBAQEBA475UMdmxTgnRQE/P4lp9H9nVimDun1fPfaFpvn1Hoq+EwuIr6UaeVfrvp7hqfwneXrojxVTi6KZ83SVDdVFN6zNUb3L7h+cwX6i122MNacNzDYTo7KuXIL6W11NxrfgJT5dzMSmdk4SpUP6NGb0gaDxbgJXe0Rytx1meFiw26lUsC9RUW3ZAzH36AfGUTl+DVXDPqkBu5QpdazM3ex/AWErm8rYxxDa2UoDaACcu9IjftbU/j/ful+Fm6jhZNl+YpfZp90SmeWiOG1ISQEBAQEBAQEBAQEBAQEBAQEDzUcAEngBc+A4wOEYLGfSsVVqOotnJse9usfde3snpxmvOOK8RDy74qxeZ9ZXKioCWAAHolMu4fH2ZUbllHe34DjOZy1q6jBayS2fsGitiwNQ/tdn+Hh77ym2a0tFOnpX5rbgVAWwAAHADgJUvbMDVx3Zgaey+1AiN/vNjwHzMvw8s3UcLHsrzFL7NPuiUzy0Rw2pCSAgICAgICAgICAgICAgICAgRG9uI6PA124Hoyo8X6g+LCTHmUTOoca3SpE6jUu7EenO3VHxm7irzZ82dfobPo4amalRl6gu1RyAq24kX0UfGZO6151DdXHWkblRNs7/M1UJhMFWr3GYZm6NmXk608rPkPJmC35Xmn+j7Y3e0R+7qL74S+5O9KY5Klqb0a1FglWk+pRje2tgeKsNQDdTpKM2GcUx53Euona1bG2zh6tR6NKtTqVKfbVDmya2sxGgN7i176HunNsV61i1o1E8G44S8rS1sd2YGlsvtQIjf7zY8PxMvw8s3UcLHsrzFL7NPuiUzy0V4bUhJAQEBAQEBAQEBAQEBAQEBAQKn5TcRlwJH1mH8is/zUTvHG7QryzqkqR5P8LfE0E5LZv4FLfMCa806ow4Y3kWLyp4koMKaiM+DFbNXUcGy5citfQg3fQ6EgTv7Pr3d8Vn2teGvNOtb4cnxNNK21DXoPWxR6Xp1RUK1GbNmRWa5Wmg6oLkiwGi92zLM1xRS0a8a/2inmdws+26r7M2dXepUX/EdoVGLshsEvctkPHLTViAeTVB6JjwxGfLER7tf5+62Z1Ca8mO0MFs7AL01QitWOeoUp1HVOVOkzqpUMq6lb3BZp31WPL1GT2I8RxxH56cRatI8up4bELURaiMGRgGVhwIOoInmWrNZ1PK2J35hEbzbwYbDBRWqhXfsoAzVG1t1UQFjrpw4yzFgyZfdjj9EWvEctHYW36D1hTvVp1GvlWtSq0i9gSQhqKAxsCbDXSL4bVjfj8piSLRLxv95seH5zrDyo6jhYtk/5el9mn3RKZ5aK8Q25CSAgICAgICAgICAgICAgICAgULyr1L0qad+b4sgHwzS7BHtM/UzqqP8AJpRviXb6tM+9mW3wBlvUT40o6WPamXRaouCDYg8jMjegsXSVTZVVR3KAB7hJmZnkciZP8Y25k1bB4a4Nr2ZEOuo/5j6cjlHonp1n+nwb/ulX70rb5Q9oFjQ2XhlFzkYoosouctGnYCwHFj3WUzv7Ox6i2e/p/JVZ5mdUht7WFamEwyJiegwy9Cy00c1ayvSF8RSAGUlGvYXNiSbaCc4+y0zedbt5+UeeJ+pbceI4j+bRu/O6+MFZNoYUtUypSa1y1WmaSgXAcfpBpfhcknq6zvpuqxdk4cnjzP0nf/RfHbfdCa8lm9b40VFqooqUst2S4Rw+a2hJs3VN9efLhMnWdLGGY7Z8Stx3m0eUrv8AebHh+cpwcquo4WPZXmKX2afdEpnlorw2pCSAgICAgICAgICAgICAgICAgc38p73rU17gp9xqMfkJp6ePMsnVT4iG15LqXVrv3si/whifviOpnzEHSR4mV3eZmtXtuUOkV6eZkzqVzJbMuYWupINjrxkxOp2KxurgsBs1XpU3fMzgO9QEsSDlVSVUAAZj7CTw1mjLfJmncuY1Db3dwezxjHx4q4mrWfO96qMESym+UdGvZRcoGptbvvLsmTNOKMWoiPk41Xu7lpr7bwlRWpszFWuh6tRRrp27C3iD3WmaMWSs7h13RKvslFwKVLaW0QhsoU2PbW4XpqlEuDbva+h5iX2taPatSu/56ROv2cxEcRMpbdLY9DCr0VBAi3ueJZj3sx1JmbLmvlnuvLutYrGoYN/fNj2f1TvDyo6jhYtl+YpfZp90SmeWivENqQkgICAgICAgICAgICAgICAgIHLvKG98Xb6o/pUf1Ga+njww9VPtRCf8mtO2EY/WqsfcFX8JXnn2l3TR7C1vKGhB7Q7UCOXZWYk/SMWt2zWWpYDrZsoFuzewt3C3C87jJr0hGkrs3YIUA/SMYxGbV6pbtAjmLAi5I9nGwnU5pn0hHa2V2Hb/ANRiyb3uavhpa1rafGPvflB2sFXY2QhvpGLYgg2apdSBYWK2sQcovz466m6cu41qCKs+zO1KnSJ3982PZ+Mvw8s3UcLFsvzFL7NPuiUzy0V4htSEkBAQEBAQEBAQEBAQEBAQEBA5Nvo18XVPdp8bf0ibcHuvO6mfbWzcVsmzlc8B0rm3Gwdz8hKMvnJpqweMe059NU1WpagqLkm2XgDx8D8D3Svsnt2t7o3pW9obZTtZHsXyDs3zEA8L3AsZ391PCIvEsuE2hcKQlwzKoysh1OvI8hdj6FM57I+Lraw7JxQdTYEWNteY5MO9SOBkWroidt+cpa2O7MDS2Z2oEHvpikqUQ1N1deF1NxcX5zRirNZ1LL1ExMeFp2Z5in6ifdEonlprw2ZCSAgICAgICAgICAgICAgICAgcd3me9euf9T/um7D7rzOo/EleN2QBstb3t0Lk2IBscxNidBxma34v5tuP8KPoyu9M52cO13VWIZDdgLAKFADKQSp8SNLG3Wp8aNx6onbQRGKOuVqr57l1A6tnIz20AKKLW/XFieSu58x6OuPDGKgUIekxGvSICgo6BHVHbsa99xrYG2psZiOUp/Zr0qbVOipKq00TPkygFSCykKB1iBfnz5zi0WmI7pRuImdQmMNiw7MoB6p48mGouP3lYfu+kTia6iHUW2+Y7szl0p+0tp16Ndej7LKQq2Xr1CKneLkqeiOUG5Bawa1ppw462rO1OS9qyj8bhujwSjTKTdbcCo6im/O6oDf0634y2bbySz3jVHQdneZp+ov3RMU8tteGxISQEBAQEBAQEBAQEBAQEBAQEDim13vUrH9v8P8Aeb8Xuw8vN78uj7uZRs2ln0ToFLHuUpdj7rzJbf3nj4t+PX3cb+D3Wx+Eckl9deTjTLZhe2gtY+wHlOopkiODupKF2lj8MHV3rMWVioLAghitillQakOOVybDlaOy/EQmLV+LDhdqYPPfpyWVmIWzdRnbM4AyZjdhfW/DSwuJ1NMmuE7qtOB2UgDFS4V7ZlBGUgXsNRcDUiwI004Sqck+p2Q38PgUQgqoBAy3HFgbdrvOnHx75E2meUxWIMd2Zy6UrB189aph8VmanUqFB2Q1Jzc0ipUdhgOq1ycw155deoiIvT0/f4qN7nts1tqUSmHdGN2WswOuhOhzBeCZgQ9u9ydSbnre7RMfBRkjVdfNf9n+Zp+ov3RMc8tteGxISQEBAQEBAQEBAQEBAQEBAQEDh2PPXq+uPuiehi92Hl5vfl1TdP8AyWH+xpfcWYsnvy9HF7kfRJtTXuHuE53LrUIXaFMX4D3CNynT5Qor9VfcOfGO6TSdwfZkDDtrFNToO69rqqvi7BQfYWv7JZirFrREuMlu2u1Swu0K1arTzVKmVS2t1VXRS1qjKujBrqo0GqsRztqyY60rOo/nw/JRS9rWjcvO2WtXTJq6oXYC2b9HUptSv6Cc4/eJ4gSvD7s7d5eY02N8atN6QqUirK9muOZHV19ICgW9EjHExOpcZ5iY3C27P8zT9RfkJnnlprw2JCSAgICAgICAgICAgICAgICAgcO2kLVKw/bH3Zvxe7DzM3vy6lueb4HD/ZIPcoH4THk9+W/F7kfRMPOFiE2h2oHzDwJvB8IFa3xNMVELEsQFumVjYFjlKsOyxIbq3GbL3qJs6aJmsxH8/n7M2fW4alLZtPELUJI6UPmBcdIj02C5Gs4BdLq1iCCLtYi8m+Scevh+iK0i+/i092sBTqVhRcZMqNdUJGZ6bBH6wN+qSRwF1cDVeLJaax3QmlYmdS+7dwfQ0qlO98tXtG12ulMgtYWvrb2X04CIt3TE/JXlrqNL5gPNU/UX5CZJ5bK8M8hJAQEBAQEBAQEBAQEBAQEBAQOKbdW1asP9T5Zh+E3Yfdebn/El0Tc1r7OpH9hhz5Fhy15cplye/Lbi/Dht59Nai29epw58f70nX5DTxCuDZstvQWJv6SZXbXosjfqzYecpTOEPVgVbeHGFquiplUGzXJFWnlDEkKpBS5db2a1jcWY224aar/PEsuW25RlaoKRp2UDIwqALqzItzUKshZTdWzFb69YadQTuYm0Tuef5/P8A65idTD5hcUFxPTqbHpA5p6ZzTKCmxyjrG69fLyawIBJM47Z7e2fhz/P0d79ruetvYnpKVSpZhmrHQixACoq6cjlVSRyJI5SIr2zEfJXlncb+a+4HzSeovyEyTy2RwzyEkBAQEBAQEBAQEBAQEBAQEBA41vYlsRW+0b7zn8Ztwe687qfxGfd7fGpQw4oCkjKubUswPWZm5eM0x0Vckd+0V6maR26bi7/PfzH/AM1T8pH9FH/L9nf9TPw/dFY7f11fTDkkA6Gs5043sVltfs2t49/9v9kdVMf2/u1k8qdQW/4NTc2H6VtT3DqcZFvsqsf3/t/tZHU79Eym/DYqjkbDoozKxBcsDlN7EZRpJp9nxSdxb9lOTqpt4mGLEb1OKdOn0SWpkvck5mdiSxJtoDma4HfJ/pYiZnfLn76ZiI0hcVva4bN0ak2IJuoOpuSpVBbXx4DunNsMa06i/nbXob2VSmXo6GbP0maz5tf1e1bLbq2twA5i86p01bTzJbLMQs1DGtWwZd7ZjWN7ZrdinyYm3gNPRKupxVxZIrX4f5c1vN6zM/F1HA+aT1F+QnlTy9KOGeQkgICAgICAgICAgICAgICAgIHIN/Ftiaw/bH8yK34ma+n4YOqj2oVzAkcwSLi4GhI5gHlPWwTvHMQyzylXoUujarTVkK2Kkv1rhlF7D/bjztrVE27+2y6Yjt3CZ6ao2Lrmi/6cnZzMcyhjRCr9I1Y6r2cw98q1WMde6PHtfr6f6XVnd51z4aW2dpdDQetR6NsIEw4w6qwCmv07it0QQ5kqdGXuw1Gh5CRTHN7RW3vbnf01Gt/JZNoiNxw2q2Gz5KhZSLmmUW5HSXqmr1ybuwdCDfW3Rkk5pZiv2xNfz38vGvH0/wDWbLXcxLVxmEp9WyLYkjtMb9UtqR2RodfTfladd9vPlEVj4Iepg6eYg06ZszDrOVHaYW4G+n8IFzxldrT8VlYhEY1FD9QUwNNEYsOA1zEd99OVj6Jp6ffqqyrfsgf8B/7x+5TlHX/jR9P/AGXOL3J+v+HWsD5pPUX5CeNPL1Y4Z5CSAgICAgICAgICAgICAgICAgcn8piWxNT0rSf3hk/pmnp55Y+qjiUJuzswVxUBcqy5SoCZs2bNf9YWtYd/GehiyzTca8fVitMRHlKDcysTxP8ADr7s15Z/UYv+Trsya91p4ncJqhs1cU25Z6L5b+sDp7RL462KeYjcfKY/6V18zqdxP0nX6o+v5NSlZKVTGUVqvawWk7AZjZbtccbd0T1c5KTkpSe2Pnr9lndWl4x3n2p/P6eU/sPcWqoYZxZTluUK3t3XMrydbSIjfr+autb3tOq8fHw2a+5FSxzVFU20BXVj3AZpVPWUnWvz+S2uK/nca/8AUBjtzXspNS1yc3U7IHM9bxPsnM58e5jf0+ayKW1E6+vye9jbpUajqgr1mzEAlaQAAPM3Y/KWd2XHSb2iI/NxNqWtFa7lYcTs1aGDVVZmzMXN7aHRbacrKPfMvUZZyZfMcQjB5w7+bo+B80nqL8hPNnl6scM8hJAQEBAQEBAQEBAQEBAQEBAQOZeVilaor/Wokf8ATe//ANkvwT7TN1MeygNwcWUrMBU6MNTYE2udCpsPToZr7YmeNsUzMR4nSx4/FU0BcLXc3Az2vb6z5eYGnHmy8Zomcnu7iPkilaT7XmfmhNuGoW/y5rgnPmarTTSkx/We5Kq3EmwHVFyCt5wdsf3dv5TPK+d/DaMw20voalwlSkUCKKHVbIGBUOhzEKWJa9XjmVQRyfu1ZyW1ve/X4/Kf8JtETG55/wCnStlVA9CilSq9TpLVEf8AZcDKDm1PH2XmPJ79r0rEa8TDN2xqMWSZnzuJeca6PchHLUbKBm7QBNr6cRqdJNYtSIjcat+zr2bzvU7r4VfG10NXNaqtQngeFz8bS+9Lxh7dxNY/VNLVnJ3eYlm2Hi6jZaYqKlVXBt2Qw07uPhzEWxY6xN9brMfXUubXvOq71MT+qR3mqI1K6BgpY6HvvrbuHomOYtFoi3wdYppNZmkTHlecD5pPUX5CYp5epHDPISQEBAQEBAQEBAQEBAQEBAQECjeVbC5sPSfuZ6fsqIfxQSzFOrKs0bpLnG6Va1ambKesFs3Dr9XX3zfvy8+Y8LptTNUZKiO1qLlsqgi+gyjiANFZc3IN4zrt7PFo8zHq7rPdxPEq9jqvRsEFZaSg1Blfocppk3cJnUnIzMDlN9aZB1UW14698b1ufz/8InU63pHPTWqjoWZ1ZMq1CaJ0FRHdw6r1gpprmB5lRmUktItPZaJj9PPw/mlsRuNOh7tMi0qOHK1M1FF1Yi6nKGytlFjY2GndbXicuSttTk37zJa9ZyRXXDHtLFMQRVV1INwyWsfG3zl2LHETvHqflLmbTPi/7K7tDEWU3qMyNoCL3B9smabtqtNTHPwWRadeZ8Gzuz+kLFVsVde1qRoPf7JZS0bj7vmeY9FWSPHtenqn95qpakGzZgbEaWsp1A9x+M821e22taX4rTNNzO/K94LzSeovyExTy9OOGeQkgICAgICAgICAgICAgICAgIEBv1hekwFW3FAKg/cYMf5QZMTqUWjcacS2S2WqQOKtcew3E38w83WpXNazA3HFmBtytr3cOP4z09Uy/SIZ4macPuPSmCSzMEB1vw4BR2CCSLcx3aynHhvbXbrbv+qpHO0WcSlOqpW7s6jrkmwGpFxcl7a2LHQGwGpmmOjtbHNrTrXo4t1u/FI/NY9hYljSfpHDr3LxGo9wlWfHWLR2V19VFLTqdyxYiqVGamzZb2Kt3ei2knti89t48+kwsrOvMK9jXUXAIINyFI5znJFvE2jU8TKyr1sutYi4BZrXB4BRLa1i0ezOor+syrySsO1qpbDgllYZrDLyXkPETzc9e3Jxrwu6ed45+ro2C80nqr8hPNnl68cM0hJAQEBAQEBAQEBAQEBAQEBAQMeJoh0ZG4MpU+DCxgfnnojTxRRuIOU+KnKflNuOd1efljVloVmWxHCbemtW09lmfLWeYaePrC5H6rj3H/zPYwxOt+tXn5IQVTEdk81NvZNnZ7U0ni3lNYW7d+tZOpYX4m/wnlZ/M+3506r4lmxuJJN82nP/AMSns8dvb5nhdCubRrcdRHbvXbE+OdrYecBXIAseHxluKtZndo1E8fVXkWfEMDhAQLdb8BPO6yJjN5+C3pfwp+v+HT8H5tPVX5CeTPL2I4ZpCSAgICAgICAgICAgICAgICAgIHE/KLgeh2izAWD2qj97R/5gZpwT6MvUV9UjhbFB4S1RHCJ2phr8Daeh0/XXpGrRvf6s2TDWeFfr4KpfQA+B/Oerj+08NrTM7jx4V/dTCw7AcqvWuD8pnyZcVq1iLQ5+7nfDNi6/H+7ziO2dzv6O4rKv4+tOJ88b36roh4wVbh6dB4zThrXcT6T8fRXkheMThmp4NA4IYnMQeIvoL+wCeL1OWL5p7eIjTRjxzTHqfq6fhPNp6q/ITzJ5elHDNISQEBAQEBAQEBAQEBAQEBAQEBA595XtnZqNLEAa03yN6r8L+BH807xzqyvLXdVb2JVvSHeNJslhhjx0mriyPnTlI7PHoldltW+UHdOeFrLRw6E6qp8QI7rfE0suyMLTWxCID6AJVa08bXViEXvs4CDxnWNXmX7C9hfVHyEzS1RwywkgICAgICAgICAgICAgICAgICBH7f2aMThatA2GdCATwDcVPsIBgcafBYvBsUr0wl+BYnK1vqldCZprk3DLbHqWjisdUPAUz7Cf6xOos4mkNT6VV+on8P8A+5Pej7uG/gtoOP1E9w/75zNnUUhvf4o/1R/L/vOdutQyUtsMPq+8flG06hP7O26/Kx8Bf5CVzKysMG8GGxmLQJRWqpvxNMhQOevfJi2iaRLqGFUimoPEKAfGwvKlrLAQEBAQEBAQEBAQEBAQEBAQEBAQNbH9gyYRKr1+MlwwPJHoSENzDcoSk8PCUpS4CRLqHuQkgICAgICAgICAgf/Z"},
-            {"id": 2, "categoryId": 4, "name": "Mascarilla Hidratante", "brand": "L'Oréal", "description": "Mascarilla nutritiva para cabello seco. Resultados visibles desde la primera aplicación.", "price": 12.50, "stock": 12, "imageUrl": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wCEAAkGBxISEhAREBIVFhUWFRYVFhUSGBgVFxUVFRcYFxUWFRYYHCggGB0lHRcVITEhJSkrLi4uFx8zODMtNygtLi0BCgoKDg0OGxAQGzImICYtLy4tLS0tLy0tLy0vLS0rLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLf/AABEIAOEA4QMBEQACEQEDEQH/xAAbAAEAAgMBAQAAAAAAAAAAAAAAAgMBBAUGB//EAEcQAAEDAgMDBwcKBAUEAwAAAAEAAgMEERIhMQVBUQYTIjJhkdEUFVJxgaGxFjNCVGKSk8HS8AcjU3JDY4Ki4SREsvE0NXT/xAAbAQEAAgMBAQAAAAAAAAAAAAAAAQMCBAUGB//EADoRAAIBAgQDBQcCBgICAwAAAAABAgMRBBIhMRNBUQUUUmFxIjKBkaGx0RXwIzNCcsHhBpIk8TRDYv/aAAwDAQACEQMRAD8A+4oAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgMONs1DdgcR3KJu6M+0geK4r7Zj/AEwfzN9YCXNkDygO5g9pVb7Zlyh9f9GawC8X0MefH+i33+Kx/V6r2ivqT3GPVmPPUnBvcfFYvtWv0Xy/2T3KHVmPPEvEdyxfamI8vkT3On5kfO8vpDuCw/U8T1XyJ7nTMedZfS9w8EfaWJ8X0Q7pS6DznL6fub4KP1DE+L6L8E91pdCyOtmdo/3DwWccZipK+f6L8GEqFJciD9oTA2xnuHgsJY7Ep2z/AG/BksPSavYh5xl9M9w8Fj3/ABHj+34Mu7Uug85S+mfd4KO/4nx/b8DutLoY85S+mfd4J+oYnx/b8E91pdDHnOb0z3DwUfqGJ8f2/A7rS6DznN6Z7h4J+oYnx/b8DutLoPOs3p+5vgn6jifH9F+B3Sl0Hnab0/c3wU/qWJ8X0X4HdKXQeeJvT9zfBZLtPE+L6IjudLp9TPnmb0h3BT+qYnqvkO50jI23Lxb3LJdq4jqvkY9ypeZJu3ZeDe4+Ksj2rX8vl/sh4Kn5kht6T0W+/wAVmu1avNL6/kx7lDqzPyicNWD2EhZfq81vFfMxeBj4ixnKQb4z7Df8lZHthc4fUxeBfKR2qeUPa1w0IB7116c1OCkuZpSjlbTLFmYhAEBGTQ+pRLZkrc8IxeHWx6AmEBY1ZgkEBJCDCgkyEIZlSQblJotuj7pr1dyio6xVFX3mW0/dKlWZkUJBWJJFQSCoBhAYQGFIMKSDCkGWrJEMFZEFT1DBBQD2+zPmYv7G/Beuwv8AJh6I4lb+ZL1NpXlYQBARk0PqUS2ZKPBsXiFsegJhAWhZAkEBJSQRWJJIKSDKEG5Sae1bdH3Sirua8/WKoq+8Ww90qVZmYUEmFAMKCTCgGEBhSDCEGFIMKQZas0QwVJBU9QwQUA9xsv5mL+xvwXrsL/Jh6I4lb+ZL1NpXlYQBARk0PqKiWzJR4Ji8Qtj0BMIC1qyBIICSkGFiDKkGUINyk09q26PumvV3Neo6xVFX3mWw90rVZmYKgkwVAIlQSYKAwVAMKSDCAwVICkBqzRDBWRBU9YsEFAPc7L+Zi/sb8F67C/yYeiOJW/mS9TaV5WEAQEZND6ioewPlw25EMiHgjVrmFjh2Fr7Ee0LyDw04uz3O6qsXqiQ25Hua8+oDxWPAfUnOiY24N0Uv3VlwvMZyQ23whl+6fBRw/MZ/IkNsu/oSfdd+lTw11GfyA2u/6vJ3H9KjhrqM76GfO0n1eT3+CcOPiGZ9DPnaT6s/9+xTkj4iMz6FsW25gLClerINRVrmElfWxXJtaYm/kz+9YyjFu+Yyi2laxHzpN9Wf3hY5I+InM+hg7Um+rP7wo4cPEMz6EfOk31Z/eE4cfEM76GDtSb6s7vCjhw8Qzy6GPOk31Z/ePBOFHxDO+hjzrN9Wf3/8Jwo+IZ30MedZfqz/AN+xOFHxDO+g87SfV5Pf4KeFHxDO+hjzu/6vJ3HwThR8QzvoYO2Hf0JfunwUqkvEiM76AbbtrDL913gslSXVDP5GDt4b4pfulTwvNEZ/Irdt+PeyQetv/KcF9UOIjHn+HfiHrHgVHAkOIj6XsZ+KCB1nC8bTZwLXC40LXAEHsK9Rh4uNKMXySORVd5trqbquKwgCAw4XBCMHzTaOzXxSvjEzyGnI2YCQQDnZvavLYmEaVRwS26nYoyc4KRU2kfvlk7wPgFr5l0LbPqTbRn+pJ94pnXQZSzyD7cn33eKZkLGRQN9J/wB93ipuMpnze3i777vFRmYsZGz2fa+87xTMxYl5uZ2/ed4pmZNkPNzOB+8fFMzFkPN0fD3nxU5mRZDzdHw958VGZk2Rg7Pj4e8+KjOxlRE7Pj4e8+KZ2MqMeQR8PefFRnYyoj5Az9k+KZ2MqMGhZ+3HxTOxlMeQs4n7x8UzsZSPkLOJ+87xTOxlHkTfSd993iss4ymPIm+k777vFTnIymfIR6b/AL7vFZ5iMpB1Ed0kn3ymZdCMpWaV26WTv8QozLoMvmSipJDYCV2ZtmGn8lbTabtYxkmle59Noqfm42R3JwtDbmwJsLXsMl6eEFCKiuRx5PM7l6yICAIAgPl/8SmkTtfic0Asd0Sc+jY3AOYs0rgYxf8AkyXWJfUvwItPZs87VwuE0UmZIxMwkkDEdAfaLe1aFKpmpShI05KUaqktfI9HTzB2QdmLhzW6g6ZhciSlTd2vRnejWi+ep0Y3G/8AiHMcD9LF35E+sKpVeqX7VicyaLQwEbr2Js5tjd51uNeIW0pt2tfls+SF9RJTAXOmYAIOJpt1iTr2qadVysn5t8n5Eqoa8sgbiub24e6y2UmxUmoQzs5EvKaAYs3EA4TIGO5prr2IdLawA3nQLbWDm0tr9L6/I57x7vsb1RtaFj4Y3P6UxIjtmCW2vnu1AHElVxoTlGUktFubkMTCVvMqq9sxxyGLBK94a15EUbn2a4kNJtpm09yyhhpSjmukvN2MpVlGWXX4IhHt+ncYAH5zF4juC3pRkBzHX6rrm1jvUvCVEpO22/xCxEG0r77FlZtaKMyNeTdjY3usL5SvLGW45grGGHnNJrnf6K5lKrGLafL/ACVVe2I2PdGGySObbGIWOkwXzGIjIG2dtexTDDSlFS0Se13a4lXinbVvyRCTbkIbE9uJ4lLmsEbC5xLQS4FuoIsbg6WUrCzbaelt7sh4iFk1rfoWUO0I5i9rcQcy2JkjSxzcXVJa4aGxz7CsKlCVOzez5p3RZTrRnouRslqoyltytzVGUm5S5qxsZXKyFFgRIU5STBapykEbLKxACzSZDNzZdzNCLnORg/3BbFBN1IrzRTW0g35H1BerOCEAQBAEB8//AIjU+J4y+gx33XuvnbgVwe0nlxEX1X5Nm2bDNeZ52SlxtcBlvBG4jQ964LqcOoFRzwujo0tMJGiRlmuIIcd4NiHNvqNSMuK1alWVOWR6rkWwopxvEuLsOskxPFptY9LUE55kf7lhpLZINNaG7DM612Sh7dbSNscjZrSRl1TfRYzit7Nehksxtc+B1hhzLQ4Zg26xuOw9iup1FN6u/Oz+iXxJbutUczlBGXREsGWR6OpANrj3my6OGks1m/n9icTFyotL1PB7PklbG2IOqmyNYGNjhYwxuLRYHG6MtAOpJcLcMl2pRhnz+zZu929flc4yOrT7EqKlsj5Z3NcGshaSwdIwEO50YgC28oc4FtrgNVcsRTptKMbrffry+R0cPh5Sg5Xtf/H+y6jZUzzvlBfTuNNE114w5plbJMHN6Y0Bzy1Dgd4WE+FTpqLWZZnz5WRfDiTnmWmi5c9TVoNlc6aaOeKTqVYnLgfnnPicZGvAAFyC5pHAW0KzqVsqlKDX9NvTXS33MYUszipLxX9dP2iFXSVN6xsrXPIipWMka0nnmsnc7FYDJ1j0h2E6ELKM6VoOLtrJ26XX7sRKNS8lJX0WvXU3JmuhdKx7qpgM0krJKVgkEolIdhf0HFrm9XOwtbPhUmqiUlleiVpO1rfFbljvBtO61butb3+D2KY9lSB1IWGZjnzTSvdKI5HMLocILg1uBuKwy4uO9ZOtG007OySVrq+vzMVSleNrrVvWz5HR2FTvbNV8+XvkuwCUtAY+EAmMMwgAEEvxDW+ehC18RKLpwyaLp58y+ipKcs2/XyO0QtQ2StwSxKZQ9RYyRUVFjIipyhmLKcpBEhZKIuRss1Ei50OTzb1MA+3fuBP5LZwkf40fUoxLtSkfS16Q4YQBAEAQHkeWsd5Ie1jx3WI+K8727pkkbuH1pTXoeVoHXY12diN99/S3/wBy4GKVqjRfg9adzLGCK0jsZbJiwxsdgD+bHWe4EG5NgAL3GZBHV7eBwcHBSqK78+SZqVW4TeXY3I5IHuwMxRvdK6NgY50osL9KSN9ha4zDLkcRYkb1Ts+jVjrFeq0f0K1VZsNge0uywvb1gMxY9VwP0mmxsewjUELg4js+ph5ey7ovjPmjbie11x1XWIIG8HWy11Tp1dGrMuUr6M4PKLbsVLKxhjlLntxtbC3GLDI5Xv2rfw2AqTi2pKy66ESrxpu2vwOHJyqpGnE+lqQSbXMZaCTutjsSt5YCs9M0X8Sh1aF7uD+R0IuXFNcNkZPEDkHSx4W34XBNlh+n1bXi0/Rl6xlPZpr4HY2LtZlVC2eMODXEgB4APRJBuASNy161J0Z5JbmxSqqpHMjUn5TU7JKmOQuZzAYXucBY4xdoZY3ceyytjhKkoxlHXNt8OpW8TCLknyOYOXUGTnwVLIycpXR9A30NwdPUrv06eykm+l9Svv0N2nbrbQjJy8gaATBUgHJpLGgH1EuzyUrs2o9pL5h46C5P5GzByuhcYgYp2c5JzY5xoZnYHEbu6ueqrlgZq+qdlfQzji4u2jV3bU15OW8Au5sVQ6IEgztjvHlqb30WS7Oqc2r9L6mPfoX0Tt1toelutGxuXIOKWJKZN+uXuKixmilwte4OQz9Z0UpGSZEjXXLs3lZJEXMEeHDNZWIuYI/fq1WcY3FyGFWKmRc6nJEXq4+wPP8AtI/NbWEj/GRr4x/wWfRl2zjBAEAQBAeb5Xszpz9p47wPBcD/AJAv4MZeZu4PXMvI8RQi0ZDDfDjAOuhIGe/Qeyy4FeOatFPnb6meDnaDS5XOnWR09M7nap8TIegGGQnrhoa0YTl0Q1xBHpm4GG59RC8vZia8klqxX7SoOeEQqGMnuGgRuLXkyhoDbt1xAst/pIzAKvjGcdVsa8mkzf2bTuip6YSEc5E1sbg0WbzZwsLWfZb0XXOfRPFZyy1YtGUJWLq6k3hedxuFt7SNuLueI5S7RfDX0EgidK7m5mhjMnOuBp6r39i2uz2quGqRqO1mtWVVZuNWLtfRlfLGvfJRwTyU8kJZWR/y32LnBrSbj13I9i28JQjGo1GSacXqTXquUE2rao19v7ZfWjyGKkmjlkwuHlIEeFrXYi8Am50OnbroscPg1h5cZzVl0FXEOsuGo6vqdL+HAJoWW3PkH+8n81rdpp94b8l9i/BP+F8X9zyu1Y2P2yWS2LDNFiB0JETcIPtsPauhSlKOBvHez+5qTSeKs9rr7H0yTC4FrgCCLEOFwRwI0XAU7O6OvZNWPL8vT/8AX/8A64vzXR7Od+J/azTxv9H9yIctohJPs6MnJ8sjTbUAho/NTgZ5adSXRIYtXqQXmalLLX7Pi5t0LJ6ePF04zhcGEkklp9ZOntVjeGxU8yllk+T6mEeNQjlcc0V03ses2ZXNniZNHfC5mIXsCNxB9RyXPqw4c3CW6N6ElOKkuZf6IIGeeZyI/LRYaGdisWNr4czx09aluxNmRIblkMz25f8AClPWw16kWBpIy1JO85D8lMpqKvcPMZuLDLcXanUmw9RyUZ43fyGpGQga2A07s3Jx1+/oRY1auVrWOe4nIE6dlz7lKq5rK+5EpZE5PZG9/DbG6oeX6tY63GxLLX7cyurgUnUuuhz5V51cNeXi+h9KXYNIIAgCAIDhcrWXZCeEo7NWu/4XG7cjfCt+Zt4R+0/Q8ZRM6D7/AG9SCdSdQvLVKlq8H/aTQuov4kuUlNOeYlEEdQYp5CIbhuOKSNzGnp5YhcE9l162jKKbV7FU7vW1zg7MgEsWxomsiErWS1LnFoPRpAY4A5wzLcbo9+jFuvma9tEepfLPLHK9wa2MQzNc2zhI2YE2w3NizAddbjcqZQUdUTa5fUbcZGIxUEhziGggZOcbAeo5/vRcilUliE1zRtJqO553a8kMlVTVAeWtpmSOfdt8Qm6DbG+XSHDeFZCg+DOnb3rfQiUk5qXQntqmNXEIo3FuCWOXptOYaXWIz0JDh7Fq0HUwU7vVNPS5NS1RWRv8oNlCtETopBFUQvD45LXw5jE0jK7Tw7B2q/CY+OsZbPdGVSGezW6OeOSlXA+R1BWMibKcb4nsxtbIesYyb2HAcLDOy3HiKE0s6vyWpXwqkW8jsSj/AIfROglZPK6SeR4ldUAAOa8Xw4BuGZy333ZWl4l5k4bLSwVBOLUnq+ZU/kttJ7eZl2gOa0LmRgSubwxbj23PtVd6EXnVPX10MrVWsrnp9Te29yYMzaRrZCOYlZIS+7nPDBaxItmeK1aVRUXN295Nacrl1SPEUVfZ3MbX2C6aajlbIGiB7nEEXLr20O7Ra9GpwqdSG7krFlWOecZdDjy8nNo4HQitBiddt3MBkwnK2Lflle6u71Qi+I6PtLo9Crh1X7OfT01OxQ7NdTwiJjRhY0NGLra5nLI3NyfWuXWxE60nUkt9TepRpwioJ7Fzg8E9Fnze4ONzbTsPainFfItWV8xG53Q6ByYTkNCb5ZjMdqqlfkw0upAF/Q6BGTjmbAHPTJVO+uvQyWXqQjbJl0QLMdvdqb8Pgs+fPciTj1LXU7ybE2sGDLPQdKxIuM1nFyeq82YKUSXkoyvw19ZurqdJP3n+1oYubNfagBjda2h13ndf2kLYquOaKjyZS75X6HY/h3CBLPbOzGi/G5zPuXX7JW7/AHqzXxcVCnFHu12jnhAEAQBAcjlO28IPCRhz0zdbPvXM7XV8JI2MM/4h5DZrRhdpq4ZDLUjLiO1eSrU81PMWUtNDn7QoYZSY6lzrS2tgc4Oa6nY4ukLr2a217NAzxk55kelwtdzpxqR6fcplFXaZ2Nn0lJA6KZjmtvFHTREvBaYwS5jWZ5knO++3YtmM5PRhxiihlY6ZjnF0jQ8uh5mQCwc4gSFkgtja1rJcjexuMsgsq01CDZEY5mdKnpo5HOxsa6wBGIXsQQbj2gdy8d2jVnRSlSla71sbTjpqcfbEkNNPRQx00VqgyRlwa1pYGDnLABuYLiTbLPNbFOderRq1OI/Ys7db6GNJx9hNbkNm7RBq6ulbExgY2OUubYGR0gzLgBr25qqvKvHC06zqN5m1bpY2oqDqyhl2sc3ZXKVk9VPAIw0Nxc1ICf5vNuwyWy3HMW3LYxHZ9Sjh4VnK7drrpfVGOHqU6lVwy+nnbcjUcqntO0RgH/SiNwOLr4wTnllb2rcp4PMqMs3v3+FjKdaMXUWX3LfE1KbljVNdA6ppyyKZzWtkbI11i/q3ba9u5XSwcJZlSq3lHdNW2MeM4qLqUrRezvfc9Pyo266jpXVAbjIcxuEkt6xtqAVXhITryUMzXmYYmSpK6RoUW3a/HeqpGwwgOc+XnmvwNa0uvhGZ0961K7ha1Gu5Tuko5d9epEHPecLLrc0Ryvq3xuqotnl1KLnG6QNkcxvWeGW0yPH1q94OEZcGpiLVOltL9LlHeJNZow0N/aXKyJsNM+mjM0lT8zEDhJt1sZzw4TkfC5GlQwWJlVnGrUyxh70vtb1LJYhKKcVdvZENk8oZTUtpK6l5iSQF0TmvEjH4cy240IF9/dlfbeFg6XGoVM6W91Zoyp1nnyVI2fI5sXLSpMbqk0GKna5zXyRyguAYbE4CL5d3aug8BSTyZ/aa2sYLFTs5OGnqevp5mSMZLGbte1rmni1wuPcVxMSpU21zR0IKMkmit5XLdeb3ZfGnHoeWm5TVIlnbFSxyMjkMRc6XBdwa11iMP2vcV6TDdjcejGo6rTeuyOXXxjjNwUdtCFTymrcX/wAKLNzWm0xIxOc1gv0L6uar4/8AHlFW4r+SKo46Uf6fqQm25XFuMUkWEbxNvAGIdXcTh9YWa7CS/wDtfyRl39+BfM5FTy3lic1s1HGb9LDzpzF7ahvYrKfYkYu+dv4Fc8fJq2X6n1D+GO021UD6lsDYMTsOFji8HCXZ3IG++5bGCocGtUhe6WX4aMrnVlUinLzPaLplQQBAEAQHN5Rj/p5ezCe5zStLtGN8LP0LsP8AzEeP2drI3LJx001vkNwzXk6Mc9G3kXLSTMVbS27gCQb3Des04S0PZfImxIIOotvFjlgMT3f2Knu8n0M5wzao5EksDi7pvw3ZgbEyRsgLBYgnIAHPWw6RvcLvPEU4xzZl8zBUpS0t9DqNxPONwDdcLW/QDjicSd7nHMnsFtLnzuM7RdWWWPuo2aVPJq9zp7Ifd7gfRPxC5eNr8Sml5k1Voec5f7L8ofs5hY9zOecJCwHotczUuHVFwM12ezcTwKdaSavlVr83/k0lT4igvM4MNA6gm2g6milc3yVnN9F8mKUusACBnYkEjcFsSrrHUqPGkk87vsrKxdw3QnPInsrepou2BW0sVJPibJ5O7EIo2HnLSkc60kZv1K2Y9oYTFVKlKzWbS7emm3oYRoVqSjNa5eSWuu5dWUsjn7bIjfaSKHAcDumQzMNyzI4BWUZxUMOm1o3fXbUuqU5OddpPVK3noadNsuRkmz3zc/ND0CWHEeYksC0lgHVGXqsfUbXiYTjVjTtGWuuntL16h4epB0pTblHp0fp0PX/xDgfJs+RsbHPdjjOFjS4mzxfIZrV7NlGFVOTsrPf0IxycouxU3kbE1k7Y5JsUkL4v5she0YwM8NuIHvXLn2xUdWOeKtGSeis9DJYSKi7N6q25zqDbtVBSihNBUOqGMMTHNbeEi2Fri/hb2ZajdvVcHQrV3iVWjkbu9dfSxqqpOMOG4u+3kVnYNRQs2ZURxmY07ZGzRx5utMXOJj9K2Nw9g3XtHfqGNlXoyllU2sre2mmvrYjhSpZJJXtv8TepZJa+tpajyeWCCmxuvO3A+R7wBYN4CwN+wrOlThg8PKlnUpSttqki6OatUUrWS6nF2LW1QoX0EdDUc7JzrccjDHE0Sk3cXO4A8F1KsKbrKq5qyt66FVOU1TdNRd3f01PfbIouYghhvfm42svxLQAT3rzuOqcScp9WdSjDJBR6Enrim2j5hUSkTV12VGJ005Y6ITi2QY3JhDSDnnbRu8EW+h4GrThhqacl7q5o81iIydWTs93yZZUzwuxWjrbFwcWu58ki8QIxXzOFkmuQxi2YW13il4180VZJdH8mRNTFmObq7jqOd5VwsA4CTQCwysSAc9E49LxL5ocOXR/JlFVBBO5pdBWuIbbJkryc7/Sud7r8TnvU8am/6l80HB80/kfY/wCFtGIqFjWsewYnnDK0teLvcek12Yve/qIWthpKVSrJO/tL6RRY1aKR7BbpiEAQBAEBo7cbennH+W89wJVGKjmozXkyyk7TXqeIpH2lP2rHdbMbhr9Gy8ZgZJNL4GzVVpM6MrMitnEUEosmErHmZaTDKBmAy5tfrB2hK0JPLFp8zpU5Xib+zakPvbiR3ZLTrU3AwqKx2dmNs/8A0n8lp1/dszXm7xPOfxF2hJDFSmOcwB9QI5JA0OwsLHkkgjO1r+xeg7JoU60p54Z7Rul56GnnlCEbO2u5zuRe1pJX1bH1AqIo8BZMWCM3cCXgjgLap2thIU4U5Rp5JSveN7+ht4WrKTknLMlzNTk1t+eSoPPk81UiSSlBsLCJ7gWjK+bbH2DitnHYCjTorhL2oWU/ivyRg8ROVW09pbfBlNHykkjraiGckwOm5tjiABG/VrSRuIvrw9a3J4KE8JCdNe1a780Z08XKOJlGfu3svJluwtsubS1FRO7EY3y62Fw3qty7bD2qnE4WLxEKVNWukbFDEy7tOpUd7NnQ5B7XqHGWmrXEy4Y52XsCYpGi4AAHVNva4jcrO0qNONNTpbar4o5+GqVHLLU33+ZzOTPKqUzzQ1TiWvklbBIQAA+M5xXA4Ftr7z2hUdodl0+HCpRWqUcy8nzIoYqWZxn52fpyOhsblJIzY/lkzy+W0gaSBdzzI5kYs0AcN2gVOIwFOXaPApq0dPla7MYV5cDPLc3ORO0p3CopqxxNRA8YibXLJG4mHIAekO5afbGGowcK1BWhJfVblmGnJ3jPdHpgVXhUbiJuK6SLEUvK08TsZo1XLkl6PJbF5RVDpoBzotJWvgLMLcomc4ejlfRrelxuMrXPqsX2RhYYGVbL7Sinvz0OE8VUnUyt6XZ6Crr5uc+bvlnkcuzU3zt3riU8LQye99jpwlJR0Rp1tbJiNmE8MjnmberIXVlLDUsur+qJc5LZHoeStzI0nXCSRwWxhoqLdupr4l/wz11Bo8/a/IL0HYq/8dvrKX3t/g5dXc2l1ysIAgCAICmsZijkbxa4d4IWM1eLRlF2aPmzn2wO4tae4t/IleApXje3I3q69o7hOJh7Qu7/ADaTa6FL0Zz6+mvheciB7vpA/vcuJiKU6ftPZ/c26NTkaeUPTGh1tvHFautT2WbF82h3NlShzmkbwfhktLEJqOprzVjhcu6J00dO2KSFskU7JgJ3WaQ0PGYFyRcj3rt9l1lSvKcZOMo29lehqKDlFKLV076nlzsipd5VK6ekbNLB5O1sLiyPCXAue42viw4gNdRot9YvDx4dNQm4xlmu1d7aJeVy10ajzScldq2hOq5KQxNiko5hz0T2OHOy9AgdcWF8N+wdiij2pVqylCvD2JJ7R18vUy7pGNpU37S6vQ2GbHY/zg2d8ZZUPa5mFwLmlrTnnoQbK1YmUY0nTTvFWehsrDxlKoptWltqcel2A/mGUr5YsBqMcrmvzdGLWDbjUkX7LDVbM8ZDjOsou+Wy05lSwk1QVFyVs13ryO7ByZbBUUtRRSglri2VssuIuicLHBkcxmbaacFXUxbqYecKy9LLmUd3UKqcH63fIjBySLqWpp5y0PfUSTRPbc4C62AnIcCCOBXPq9rKGKhUp7KKjJPn1/0ZrC3pSjLq2iFNyQnfBQUk7mCGJ0sk3Nvdic5znmIM6I0xZk217FbPtWjGrVr008zSUbrTzvqUd3lljB7Lc39n8ljS1cc1M4mJ0bmTiV7nP3Fjm5Z5gakW9q0q/aaxOFdOsvaTTjZaed+hZToZKmaO3M9SCqcMjdRNxXSRYUvK0cSZo1XFctF6KNhbRonyBsckBkdfCGluIkAk2tmcgT7CtjFYbGQp5pxllW972NCrUoy0i1fyKZ9lHGenwGlhbTOyvjjll90ujT0vc06qhJc848zbd37/AFKyGKSS0Dp+Z2OSOyyJC7GMm+j2+tbtOrnhsaldZYnutn9T1ud/5Efku92QrYOHnd/Ns51X3jZXTKwgCAIAgMEID5hILMH2cjruJB3rwjjlrTj6nTq9Te2RPduE7sls4KtZumyqcOZuvjJuN1vetrEYdzi4ct/iVxlZ3OeIvoEdEdXwXnpqUXqbqnzRds3EKiMAdGzr+u2X5rXrWdFt7kyd4Hj+XNPSurz5blGaCQBwNnNkE3RdGPpOAc4hud88l7L/AI5J91t5/wCEcaolm18zlbXotmR89NCKaRsUUwEfOEmScvjdBhaH4nNLMYuDYZ3zC9Bdldol5pNkuNS0xU7Q1+CLBI/FI3yYy3Y8zBrXc50cTujdobqUuMsSjmdmB7mcxTFoqqSMP52S5hmjDpn5SW6Lri+g3qLi0SuPZezJBE4GJmORsT2mQ/yW075H1E2b8xLG2Jrdc3myXGWJXs+ip49r0ppHRmGS8jObcXhl4pA+Ml3SycHdYA2IWl2l/wDFn6f5Rbh0lWjY+nA5r57U9473I2GFZcjXluYcVQEGldXDbFqJOK6CMymQrRxOxmjVcVzY6PUv5HJ5N7EqB5EJRCG0zLEse9znnmZIgcJjAHzh36Beg7U7boVsO6UE7u26XJ36nFhhJ0pJysb0uzCSQX79QO2/HJcuONildR+p08l0UCPD0eBKwnPO8xmlZWPS8kx84ewD4roUdKTfkaGLeyPT0Hzbe257ySvU9mxthKa//K+xzanvM2FumAQBAEAQBAfNJh06hh3Syj2YneK8VjYuGIk/U6rV4r0Ro7OlwPc02uD7jcj3WWtUTi1NGMdHb98z08b7gLuYauqsPNGtUjZkJIstP3otfEYRNZmvX7EwnYo2e0iVg/e8H99q4OKwrVKUl0+zszZck0aHLHZ8TopZn0zJ5I2uwBwaSBrfpEZDUi98jbNbPZlepHJCNRxTtc1Ywi1JuNzzvmilw07jQRtMtm4XAEteSLXwEjDgxu1+iBqVud7xGaa47eXX1XxW97I2XRpWT4a1KJdlUoaX+SQ25sOADX4i8uwNbkT9K2gvmroYnEOWXiy3tyta17/IxVGlvkWxrOoaY2wUMZGGIuJu3m3OkcyRrgc8sDrdosbLcjVrW9qq938dLos4VG6tTWy++pVHQ0vONaaSOxMbbjFYF8r2EHhk0kHjlwU8WvluqjvrppySf+TKVGgnbhrl92v8HSpG0kTTURUscb433a52Jp5l7X4ZGh5GK4a4WF99r2spqcWcckpt3X16GranGWaMbHfO0Dz3NgsHRBAeSHyFwcegOAt8dLZ+clho5M7vu9tla25tubvYs2ltYxCK2C73lji5ws0hpJFy4C9xbVZUMKqma99FdeevoyipO1i2urnB0TYgHYi8EjpYcBAd9IaE2PC2i16OHi4ylUdrW+vwJzO6SNyFxsMQsd4C3KCV/Z2NiJYSt7kZlMhWhitiyJrErml6Onsvqla1fdGtX3RQ7VyzWyLlsjjyHM+tbq2DPUclh/LlPaPgui/Zw8n5HNxOskeloxaNn9rfgF7LDxy0ox6JfY5st2XK0gIAgCAIAgPmm0jhrKpp3vv94B35rynaUL1n6nXhrRizQq4yDjGoNjkMwcgT6lzkrppmE1+/od7Y84c3iMr2J9Yva9ssXqsVjRrOlUts9bfv5Fc1c3ZGG1uzu3L0KnGvCy3NfZkKYdJptniHgVysZRfd5u2tn+GWJ6mtX0sYLi5zxdx/xpQLnOwGO3sXJoVZukrJPTwr8GVFLNK/U5XNRf1HZmw/nyZkjEAOnrYg24FZZ63hX/Vfg32oW3+pW9sOHEJTaxN+feRYGxN8egJA9qsjKtms4a/2r8EQUOv1KmwxkOs9500lfv0+lvW/GU7apfJfg2MsbrX6s14aduIjE/8AEf8AqUupLovki2VONt382dhlG3D1pPxZP1LOVR5L2XyRzZxWYrFG2/Wk/Ek/UuROvK9rL5L8GTgrb/UsNJEwEue9ovmTK9oue0uWarVJ6JJv+1fgolFL/wBkeYhBLRI4EE3HPPBBN3G4x5bz3lYupWaTyr/qvToEo9fqSEEd7Y5NbG00mRAxZ9PLL4roYeU2tl8l+C1JdfqYIgAD+eOHJ2IzvLbXsDfHYi+XuW97e1voZLLvf6ljqphuA9ptcGzgbEWBBzy1HeuXiqc7bF0ZJvc13VTLnptyIacxk46A8D2LRVGo0vZfX4F6nHqdLZdfFg+cZmQB0hni6tvWtavhq2b3Wa1WUW1Zk3fSWC5F65HBcc1vJBnruT4tTvPafcF0ai/gNdbI5ld+2j08YsAOAXtUrKxziSkBAEAQBAEB8y5W9CukPpBh/wBgH5Lz3aMf4rOxhdaCRkZ9LiuK42dzBu2hrUMwieGFzQCYgMfQu272uAcNwBbcniqqsHJZktr+fTl9iuWjPR0s4c1p3OHHicJIz0DgDftVuFxEk7Pdfvp0MJRLIXdJvrHx8V3a7jUoTfWL+q/JSlZmrtilZJibILjFex0JA3ryWDqyp01KO+pdSinOSZwBseMZBz9W36WuEEAaZCxsbWuAtrv9R8l+/wDeupu8BWMVGy2usXPkJAw3uG9EEm3RAHDPXohZU8bJOyitdeb1+LIVFN6s1mbLADsL3jqA9U3wWwnMa9EHtXQjiHJar9s2FQV1ZlLKAFz7ucceTr2zsCG5brdnBOO0kktti2VFau++5027IZhye8DS17/T5y+YuTi3lWyxDyXsv2rHMlTWaxA7KabAudYC1hhFwSCb5ZkkNud9lypY2UZNpL6mbpK25tDZgwSMxvs8gk5XFshbLLINH+kKO9NSU8q0KZQ5FVZsVknOYnP6Ti7IjouLHMu3LLJx/wDWSxhjp08qiloreutxwk9zYlomu5wG9pCS72xiPL2BbuGquy8vzcuUEyqq2O15LnySFxAaXXaOi1weBhDcPWF72vmV0I1nFaIl0k92UnZLWghskgzefoHrua46s3FoPxuuficU1ul9fTr5mcaK6kHbPbndzj0g6/RuLFzrDLIXc48c9bZLSWLlyS2t9v8ACRfwVY6+ytlsbGLOdYEG1wBkANABqA24+yO2+pXxs5TeiKJ01GVkbD+q4+tay3Rsc0cC66K3DPZ7GbalH2ifebLq5bqEeso/dHLrfzPgelXsDQCAIAgCAIAgPBcu+hO17smuYOkeriBIIvpfTvXE7Rpy4mZLSx0MLNZLHAjrG7nj2FcxxNrQmHsORsdLXtu0RQV9g1Fl0Uwb1Tb1G2+/xThx6EZV0LxWu9P96qy7tl5GPDh0D615vd9+5ayw1KKsokqEU7ohz3andaXhLMzBk7VKw1JchdkbhWKnFcjLiS6lYY0ZpkRPGn1LfKDpdS4pqxU0m7kefPFUPDU3yJHlbuPwUd2p9DHKjBq3el8FHdaXQZUY8rd6XwVsaajsZaA1jvS+Csuxcgalx+l8FhKlGW6GZkfKPtLHu9Pwk55dS1lc4CweQPWslhKL1cEYuV9SuSuNiDIe9Zd2pLaK+QzeZquqW+kO9ZKl0RGbzOryak52eFrCXYXhxtchoab3PDRb2FpSc46cyitOOVn01d45oQBAEAQBAEBgi+qA0ajYlLJ85TQu/ujYfiFi4Re6JUmjUfyToT/2sQ/tbh/8bLDgU/CvkZZ5dSh/ImgP+B3SSj4PUd3peFDiT6lZ5CUH9J49U0/61j3Wl4SeNPqR+QdD6Ev48361HdKPhJ40+o+QdFwl/Gk/Unc6PhHHqdTHyDo/878V/io7nR8P3HHqdTHyDpOM/wCK5O5Uen1ZPHqdR8gqX0p/xSncqPT7jj1Opj5BUvpT/inwTudHwjj1Oo+QNL6U/wCKfBO50fCOPU6j5A0npT/ilO5UfD9xx6nUfIGk4zfiuTuVDw/cjjz6j5AUf+d+K/xTudHwjj1Opn5AUXCX8aT9SnudHwjjT6mfkBQ+hL+NL+tT3Sj4Rxp9SQ5BUH9J59c0361PdqXhI4s+pY3kPs8f4HfJKfi9ZcCn4URxJdS9nJGgH/axn+4Yvip4UOiIzy6mzDsCkZ1KWAdoiYD32WSjFbIi7OhHGGizQAOAFgsiCSAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCA//Z"},
-            {"id": 3, "categoryId": 2, "name": "Cera Mate", "brand": "American Crew", "description": "Cera de acabado mate para peinados con textura y control medio.", "price": 9.90, "stock": 30, "imageUrl": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wCEAAkGBxMSEhUSEhIWFhUXFRcYGBcXGB0dGhUdFxUXFhYaHRgYHSggGBonHRYWITEiJSkrLi4uFx8zODMtNygtLisBCgoKDg0OGhAQGy0mHiUuLTUvLS0tKy0wLy0tLSstLS0vLS0vKy0tLS0vLS0tLS0tLy0tNS0tLS0tLS0tLS0tLf/AABEIAOEA4QMBIgACEQEDEQH/xAAcAAEAAQUBAQAAAAAAAAAAAAAABQIDBAYHCAH/xABJEAABAwICBQgFCQcCBQUAAAABAAIDBBESIQUGMUFRBxMiMmFxgZFCUqGxwRQjYnKCkrLh8CQzQ4OiwtFT8RUWc9LiNkRjxNP/xAAaAQEAAwEBAQAAAAAAAAAAAAAAAQIDBAUG/8QAMxEAAgECBAIJAQgDAAAAAAAAAAECAxEEITFBElEFExRhkaGx0fDhIiMyQnGBwfEVM1L/2gAMAwEAAhEDEQA/AO4oiIAiIgCIiAIiIAiIgCIiAIiIAiIgCIiAIiIAiIgCIiAIiIAiIgCIiAIiIAiIgCIiAIiIAiIgCIiAIiIAiIgCIiAIiIAiIgCIiAIiIAiIgCIiAIiIAiIgCIiAIsaoro2dZ4CjptY4x1QXexUlUjHVmkaU5aImkWsTazP9FgHfmsKXTkzvSt3BYvFU1obRwdRm6KkvA3haG/SEp2yO81aL3ne4+Kz7YnpE07C95I341LPWHmqDWx+u3zWiCFxT5M5W6+o9IDstNazN6+Xx+u3zVQrI/Xb5rQjSuVJhcOKh4iotYErCU3pM6E2Zp2OHmrgK5ticN5V1lZKNkjh4qixvOJLwD2kdERaHHpudvpk99llRazTDaGnwWixlPe5m8DUWljckWtwa1t9NhHcpKm05C/Y+x7cltGvTlozGWHqR1RJIqWPBzBuqlqYhERAEREAREQBERAERRmndI8yzLrO2dnaqykoq7LRi5OyLmkdKsiyJu7gFrdbpqWTYcI4D/KjXyEkkm596pBXmVMTKemSPWpYWEM3myoknaviIue50hVMbdULLpR8VtQpqpOzMq1TghdFUcACvBqtVM+AcSdg4rHN2uDnu23J4DsC9VcMMoo83hnUzb/TvM5Fg85fpvNh6LePb2q+J/on9e5WU0ysqMkX18usSSYvOFhsB1nfAK3fPm48h6TuHjxUOotiyoPf+l3mY5gPBY8lJwSORrTgYLneeHeVW+p6WFgxHfwCznGnNfaRePWwf2dO/5kYTm22qkqQniuP1tUeV5tej1T7jvoVusR8K+EKpfFzm5epa2SM3Y4js3eS2PRuswNmyix9YbPyWrL5ZbU604aMwq0IVNVmdLY8EXBuFUtN1b0qWPEbj0Ts7CtyXq0qiqRujyK1J05cLCIi0MgiIgCIiALUNbpfnWj6I95W3rSNcSHS4SbdEWPbY/rwXJjnai2dWD/2ojQV9uoL/AIk6I2kF2+sO0A5+YUlTVzH5tcCvFjWT1Pa4TLul1RiX261uRYqurkMtu73Kyl1eE3B3RWcFJWZINY1zg/fZVTQB/WCj2yEbFkR1nEL0qeMpyVpZHn1MNVi7xd7GQ+BpIJGY2FVBoVttS3j+vFXA8bl1xlB5po5ZKospXKWQNbsCNhaDcDaq7oSrWRXim92Y1XhY0vAFz7zvVVHDhbntOZKrdM0b1YkrBuWEqlODu2bxjUnDhSf6l6VwHvPwHeo8lHyE7VRdediK/WvLQ78PQ6tZ6lSEqlfCua50FV18Llj1NYyMXc4BaxpXWi/QhzPFV41oibcyel0o1krGg9K4PdZdagddoPYF540DTukmY55zLgSezaV6Gpeo3uC9PA34WeVj7cSLqIi7jgCIiAIiIAtA1xOKQlu0D8/NbvXy4WOPYuYVNSXPmB2tkt4FrSPeuXFv7s6sGvvCJFcL2kG8XNtwLTmO5qt/8LjdZzTbqXLTxaXHxX2rAN8Q8d4/yrVNTlpBY++fceHcSvmaseHOLse2szIjjnYOjLfIGzhfaSAL5LNiq6gZOhxZ26Dht7jZfIMWQP0R905n3qQhgJth9d3tbYH2D2LkeIlAs0WBXkdaKVvew28wCF9bpKLZjaOwmx8ipGAyNDbYh0XgbcznbLjsV8aSksMWFwEZPTaDcjF2fRV4Y6X5vnoUk3sRzJ2nY4HuVeJZfOROIx0lO7o3JwAEnpbx9T2q3zVK4tvSWxAnoSvbsIGwHtC6FjYc/J/UrxPePmvoWMSXVPM05wWhlGJxH791hYX3lYknNAXDJuuGfvu22eRt4XTt0b2SLrPZ+XuZuJfLqLqSG84RHL0CL/PZm+/q7Pb2KzI0gloicSGY8539IWBysBnmNq0WLvt5oWJrEqXSgbSPNQHNOcWDm2dNpIxSTHMXyPTHqnNWGU5dzZwxND3Fp6BcQQQP4hN9qntPz5+hNiek0lE3rSNHiFiS6fhGwl31QSoltIbNJfb53AQ1rW+rswjLrK06kYM3EutMGkuJNwcO0bLZoq99/AWMqo1ptkyM/aIHs2qMqtNVL9lmjDfLhe2RO3wV0PjZYC3RkdsGdnAb+Csc8cg1uwOb4XuFZSvt4kfuYclG9xPOPJNyPMXBufdZVRQtHVH6Iv45gKp7wM3OzyyHEb1ZdM45NFvf+S2jd6mbJXR9SGyBjc3ONie87P1wXetHuvGz6oXnjR0jY38SLknc0bTnxXbdSqovhs7aMPhdtyF62D0Z5mMWaNiREXacIREQBERAWqqHG0t4rk+sFM4PM8XTIGGVg9MNJs5vFwzyXXHbF5303p+ajndIOnHjPOMvY5nJzT6Lh7b5qlSmpxcWXp1HCSkiRjqg4YmnE3hvH64e9VMa12bXYT2/HcVRRTU1cDLTSYZbXcAAHfzIb5/WavklK9ucjSP/AJI+kPEDMeIXgYnBVIZrNfNj26GKpzyeTJKEytGbSRxYR+ErOp9J2Ni4A8HgtPnsUVR49rC14+i7CfLZ7FJRVpGT7gcJIzbzFx7F41WCeq8PY7SbpdIuyOC44tIcPYspuk2bHNtnfpBQ8EcbsxAx3bE6x/pPwWfG9jdpqWfaxDye1caowvlK3j9TCcFy8DLNVC7F1buO3eNvl1j5ql5iuSA3ZYW2NzBJHkFa56E/xx9uFh/CQvjoIj6dOe+N7fcSr9nl/wBrxXf7szSitn5+xZLWDBYZMByucyRa6jp7AAWv85jO3OxuBtyUhLRMOx0Hg6QfBYktA312eEj/APtRQaeb9Pc2i495GVVQ4iQYP3hF8jkBuWPLVSlxcIwLswbDkMuJ7FIS0LfXb9+Q/wBixpKFvrR+LXn+0LqiolsiOM0wwdEDACBlsvcHae0rH56TIY2CxuBduRJvsWdJTxN9Ng7mW/E8Ky8x/wCq53c1g92JdEbbegsYjrm95Dmb5B23LO9rbh5LHmcwXvv23IF+Gy6yZObO57uwk+44QsSSRjdjGjvtf3EnzW0UVZadVD0W37h8Tl7FafzjtuQ9nmcgrr53bh42t7XX9ixpGu2udbx+Jz8lvFWKM+OY1u03PZv8SqXSOIs3ojf+ZSGLF+7YXduxo73FZZomRt5yoe3AOJwx3/FKexoXXSoTnmc9StCB80RTBxDrfNg7d8pGYa3s4ldz1LpcFM1xILpOmbbM9gHcvPE2tPOPwxAhg6IJADpN1g0fu2DhtOV+C9E6lX+RQX9RerSpqCseVWqObuTiIi1MQiIgCIiA+OXAOUaiDamTCBYm5G4hzQfiu/u2LiPKMP2g9rWfhH+FKIZyGopSx+OFxa4G9rkOafolbDojlHqoejO1s4HrdGQfbaM/tAq3X0zXbRnxCiZ9HHiCptcXsdH0frlouoPzvOU7+Lhl99m7vwrb9GUYlF6SuhmG4Fw+F/a5eeZaEjd8VZZG9pu24I2EGxHxXNWwdKr+OKZvTxM4aM9Mu0bUN/eUjHji0XPhgufaq46tjOtFPF/McP6ST7l5/wBHa66Rp7c3VzAcHOLh5OutooeWrSTBZ5jk+s21/JcEuh6P5W14P1R0dtk/xfyjr7K6F38SX7UbCPN0YVuSelORkh+1Ey/9MgXO6fltv+/oIXdzf8lSMfLBQuHTosP1XOH4WrCXRD2n4r2ZZYtcvT2NqmhpjsMPgx3weViS0cPFnk9QEvKfog9aklPc5x/EQrJ5RtCn/wBpOPL/ALlg+hJ3/GvB+5vHHxXPxRNy0cPFvk9YslNAPRb9wn3yBRLuUHQ26mm8v/NY0nKLoodWjlPn/wDsrx6HqL8/qW/yMOT8iVeYG7DbuaB73uWPJNH9I+Lf7WfFRcnKdRDqULvEj+4uWFLyqj+HQxjvLf7Ywfat49EvefkUfSS2j5ky5wdk2JzvvH2ONvYnyKbdEGfWIb7N61Sq5Uax1w1kTR3Od+N5HsUNU65V0gI+UPaDujAZ+AAroh0bTWrbMZdITeiR0STRMgGKWQMHHJo+9JYKJqtKUEG2USOG5gMpP2jaMHxK5xPK+Q4nuc48XEk+ZzVLY+89y66eGpw0RzTxNSerNu0jr0TlTwhvB8hxu7wywY0+BWt1lRLM7HNI57jsubnuA3DsC+wUruxvtKk6Ona3MbeJ2rexiZOr2j7ODnbdw9X816h1UAFJBbZzbV550VSOc0yAdFpsT7/evQWpp/Y4fqAIGTSIiEBERAEREB8cuKcpI+f+w34j4LtZXFuUhwMwI9QeYc8H3KUQzQZ271iErbdS9BNrakQOJDA0veW7cLbCw7SXAeam9YuT6B8T5tGT89zRIkixh5y24XNzxZHonbnY7jZENnM3NB2+1WzTg7lNHVur5ps7aeR0Tr2exuIGxIPVuRmDtAUQDu4ZHsUkZF6mpIT12G30TY+4rPZq/Qv2vmYe1rHD2WKw4TwKy6eY3soJsiv/AJIpXdWua368Ug9rSbeSxp9QgOpWUzv5hb+Jik2v7Fbld2ITY12p1TezbLF4Sg+4LDdoK22aIfa/JT1S8cD5rAktwPn+SEEYdEAfx4vvH4NVs6OaP4zP6z7o1Jutw9v5Km44ICPbQR75fJjz7wEFFHxkP8sD3yfBZxPYvhd3KCTDNINzT4uHuDfigpOJ/XeVlkql1hmUJsWRTtVxoA2BSFBoaonzhgkeOLWnD989Eeal9F6myvqHQTPETmRtkdazzZxsBkbX8fNLMXRrjVkxC+S2TSTdG08b44iZ5nNLRJ1g0kHO+TB9kEqI0DDjqI27i8ezM+5VCOh0VEI6cRAegb9pIzXUNTB+xw/V+JXNZJr92fjl/krpuqAtRw/U+JUJ3LOLWpMIiKSoREQBERAFwnXYfPyfW/yu7Lh+vUdp5O+/tcpRBb5L5bVj472MtPKxv1ui4exp8lp1NpKenxxxvdGS10TwMjY5OaeGY7wsmnr3wSxzRGz43Bze8bjxBzB7CVv5r9B1jXzzDmp3tONnTuHkWxNDRhe7eD4kAqSHe5Jap19SzQkUlHGJJmveMDgTcCZ4fkHA3twK1PXTXQ1VM+Cp0eYKglmGQjMYXtc794wOaCARkTtWz6jPqRoU/IxinZM8NBDRiHOguFnnCLtJ3+K1PXzWDSE8AgraIxYJA/nQx4abNc21zdp620O3bFKRDNsl1T0Qylp5qi8Bljj6YkeA5zog85HE0bCdiitMcn8bYDU0FRz8bQSQS1xIHWwuYACR6tr+47NXaFhrdF0LJqgQWZA5jjhs53yctw2cRfIk2Bv0Ve0Vo+HQtLLz1QJMZLgC3CXkMwhrWYiSeJv32AUXJschaFsOkdRKllKao4LBgeWXOMNOZNrWyBuc9xVrUrQ/yqqjjI6A6b/qstceJs37S6eNZWP0i+gc0YDFYEjJz7Fz2dowO82OUknnqa6xHlbJrnoc0lTJCeqDdh4tObT25Zd4K1pyA2iHk8r304qmMY6N0QlaA+7y0txCzbZutuWsQUz3vbGxpc97g1rRtcXGwA816I1Z0nHT6KpJpThYIIA53q4sLAT2AkX7LrDZqlS0tZNpNxAYIy5rbZROOLnXjjcWDQPXd2IQcu1o5O5qGm+USzxu6TW4GB2130jbZbgtW0TQOqJ4oGdaR7Wg8LnM9wFyewLs3KdWCfQzJwLCQ08gB2txgOtcbxit4LV+RfQ2OaWrcOjGObZ9d4u894Zl/MQbH3Xzk/hpaQz03OExuHOY3YiWHo3sAALEg5DYTwWo6oadjopXyyQc9ePC0dHouxA3u4G2QIuBfNdi1foqpwq21zG83PI5zGYw4tY9uAxnDcABobaxOZcuGad0Y6lqJIH5mNxF/WG1jvFpB8UYXI6lpfWmV2ivlsQEb3OAA64b8+Yj1gLmw4LXuTuuknqKiSZ5e8xNBceAdlsFgArlR/6dZ9f/AO25RXJ3XxQPnfNI1jTGAMR29LYBtJ7kepNshpWuoGwugo4i5zgLy2JNmuDj0n9IjLcAN6xNUB+0tNtgcfJpWfXay0scT4KKnDWvYWOkIwkgi197nnPa4juWBqi4CpYDvxD+kqki0dTdWMNib5AH2XXXdWW2pIP+m1cr0k7DG7y88viur6vj9mg/6Mf4AVWMbF6lTjdyQREVjMIiIAiIgC4pr8wiolB4/En4rta5hysaLIIqGjokYXdh3KUQzlkdPzj2sBtiNgTs7FhT0z24cTSMQJHaASCfNp8lliXC8OGdiD5FZsGlW4hJK8l4aW5Nve7m33gWwBzTnfp71jWnUg7xV1/ZtTjCSs3ZkfovT9VSm9PUSR53sHdEniWOu0nvC2Gu5S6uemlppmxPbIzCXhpa4dvROE92EKEkaxkcrSxj8ErGscRZxa8SuBxMIJuGtPSva+xYekYYmBhYJAXMDyHEOADr5BwAJsRvCmFZSdrfLXKyptLU2vS2uMdRo2noeaeJIeau44SxwjjcwnbcE4gbW8Vsei9O09bo75JWSiOaPKKRwJvhHzbi4DIjNpvtGe/LnEmjHMcG44ybgEY8OE4cQuZMItbeCR25i+a+ikZ1mEdu0bhtGW8eY4qyrQdrMh05LVHRuT2pp6OlnnkliMpxfNiRpdhjvhAF/SdfvGEq03lUlHWpmHLc8jPxBXP2FW5StNSp0XlTom1dDDpGEE4WtxccDzvt6rzY8MTjuXGXKRqXkA2Nr7bb1HPKEHZ9IuI1ZaeEEPsmYFzGu1uqZqOOhe68bH3v6TmixjY76LTcj7Pq5wj5nEWLjbhc28lZQHW9aqyP/l6mj5xnOCGkGAObj6LWg9G98t6xqrWWHR+ioqeiqY31JIxujLX4HOJfK65BabdQeHBctVbYXEhoabkXAtmRa9+62d+COXMlRJ6k11rWzxzSVMsgY8EsLyGubsc3ALNzF7ZZHNW9d9YmV87ZmQGIhmAkvxF4Bu0kBoDSLkb9o4KDjYXENaLkkADiSbBSusD2QyRxNa1zYA3HlbnXZOfiNswbAdlyspVLTUFvfwRoqd4OfIxm6VqZIW0bXudED0YmtBucZk9FuJxxEnaVkDVupEL5nR4GsDiQ8gPIYbPIYczY5Hty2rr0VHTOkYIWMilpy12FjGizZWZiwGbHC4vxZ58o0nrPVF7ozKSxk7nBpAzwyl4DjbE5uIXsStWkjJNsu6V0AKelikNzK5+GT1Y+iSGZekMr9oKwNF1HNyNftwm6z9Nay/KYI4nNJeHY3vNgLm/Raxothz2nPvvdREKqyUb3pTSzJAxkZvcgm27gOzPcu66IZaCIcImDyaF521Q0c6oqI42C5LhfsAzJPYAvSUbMIAGwADyUEsqREUkBERAEREAWNpCiZNG6KRuJrhYj9b1kogPPeumqUtDISQXRE9CQcOB4FanJsXquqpmSNLJGhzTtBFwVzHWrkoa68lG7CdvNuOXgdysmVscbxZEA5G1xuNr2y8T5lKiYuw39FoaO4En4lSOmNAVNM4tmhcLb7fEKLxDtCnhWouyUkrmPiwWfiBbhxkERAA4g1/WLTcdEiwtvUlHXATY22LXBrSDfMYGteD7fetfhA3H9eKkYWrDs8F5+dvY162T+cifD+cMzGZgMwxgcGzMItxJF3HiSSmj6bNjXsz+UwghzdzmvuCHDYbBRcYVLws3hnwuKeXzvLqtmm0X56WJ0ckmQZeIEZXhJkaHWv6NiSDwBB2Z4dXTXM8YjjZgbIWjmelgjBcHCYC5LgMiSQb9qxq0WBse9Rj6p5bgxuw+riOH7t7KOzTTyl47ae3zeevjy+Z+5maHoxOHw9ESHC6N529E2e2/DC4utxYFm1QgwvqY2tazC6BrbbH3ID7cTDZ1/WJ3rX2vLTcZFUvlJ2lWnh3Kd+LLl6+Nl58yI1ko2tn8t/JsPNxNi+SukYHluIgggtmPSaC8jCBhtGc9pJWNHVs5kRPeMbmGz9vNtJDhC4jOzrEm3VJA3uChF8uiwy3e9/wB/mxPX8ltb9iY1ckjje6eRzfm2ksaSLveQbADfv7slFipcJBKbF2PGbi4JxYsxvBO5W7KnL/ZaKmlNz3dvIo6l4KOyJjSmtFVPLzzpCyTBzd4rss0nEWjCb2vnmVEXueJK+DuWZSaPklIaxpJ4AfALQoWIwpvQeh5ql4jiYXE8Bl4ngt01R5Kp5SH1HzbOB6x8Ny7DoLQEFIzBCwDi7efFQCK1E1QZQR3NnTOHTdw+iOxbUiIQEREAREQBERAEREAREQFmppWSDC9ocOBF1p+muTKinuQ0xuO9uxbsiXBxTSfI7M25glDhwO1a5Val6Qg2wkjsXo5FNyLHmF7KhmT4XjwVh9Y4bWOH2V6elpI3dZjT3gLBm1cpXbYGeSXB5hnqgf8AZYbnDsXp2XUmidtgCsO5P6H/AEvapuLHmVMB4ez8l6aHJ/Q/6Z81dZqNRD+F7UuLHmRtPIdjXeDVeZomZ2yNxXp+LVWjbsgb45rOh0XCzqxMH2QouSeZKPUysl6sLvJbNovkhq325yzB2n4L0A1oGwAL6lwcy0PyP08djM9z+wZDz2retE6ApqYWhha3ttn5qTRQAiIgCIiAIiIAiIgCIiAIiIAiIgCIiAIiIAiIgCIiAIiIAiIgCIiAIiIAiIgCIiAIiIAiIgCIiAIiIAiIgCIiAIiIAiIgCIiAIiIAiIgCIiAIiIAiIgCIiAIiIAiIgP/Z"},
-            {"id": 4, "categoryId": 3, "name": "Aceite para Barba", "brand": "Proraso", "description": "Aceite nutritivo que suaviza y perfuma la barba, con acabado no graso.", "price": 14.00, "stock": 15, "imageUrl": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wCEAAkGBxMSEhUSERIWExEWFRkXFhMYEhYaGBUaFRUWGRUXFRcYHiggGBolGxgVIjEhJikrLy4uFx8zODMsNygtLisBCgoKDg0OGxAPGy0lHyUtLS0tLS0rKy01Ky0vLS0tLS8tLS0tNysrNzItLTcvKy0tNy0tLi0tKy0tKy0tLSstLf/AABEIAOgA2QMBIgACEQEDEQH/xAAcAAEAAgMBAQEAAAAAAAAAAAAABgcDBAUCAQj/xABQEAACAQIDAwUKCAgMBwAAAAABAgADEQQSIQUxQQYHEyJRFCMyQmFxgZGhsSQzNHJzssHRFlJTgpKTwtIXNUNUYmSDlKKz0/AVJWN0o6Th/8QAGAEBAQEBAQAAAAAAAAAAAAAAAAIBAwT/xAAkEQEBAAICAQMEAwAAAAAAAAAAAQIRAzESIUFRMkKR0XGxwf/aAAwDAQACEQMRAD8At6IicHQiIgIiICIiAiIgIiICIiAiIgIiICIiAiIgIiICIiAiIgIiICIiAiIgIiICIiAiIgIiICIiAiIgIiICIiAiIgIiICIiAiIgIiICIiAiIgIiICIiAiIgIiICIiAiIgIiICIiAiIgIiICIiAiIgIiICIiAgmJCOc/bHQpSptfo6mcsAbZsgXKp8l2uR5BNk3dCV0dq0HbIlekz/iiqhPqBm5PzLg9uBWbOl1N7W3jsIl7c3e1nxWApVahu4LIWO9sjEKT5bWvNyx0yVJJF+WHK1cEVXQsd4IubEXBFju0MlEqTnjHf6f0a+95MXi6a86S8aY9TffPv8Kafk/afulTkzobO2LWr6onV16x0BtvK8Wtxyg2l+MV6LIPOmnCl7T+7PB50l/EH+L7pBF5OOTlFeiX4oGqlx51FO49ImntDZVah8YlgDbMNRfgCR4J8jWPkjUPRYb86HYoH5p+0SY8j+UAxtA1NzK5VtLdhB9R9hn5+vLe5nPk9X56+4zLNMvSwIiJKCIiAiIgIiICIiAiIgIiICIiAlac9S9TDn6X3U5ZcrTngYMaNO9iqO5/OIA+qZWHZVLHeZf/ADPfxZT+kqfWlAMNTL15lMSG2eycaddwfzgrD3n1S8+kxP5U3PJ8dT+jX61SWzKn55R32n9EPrVJznbpiiuz9mUadb4VWpWHiXY62v17qNNN3EkA6Xmxisc1SorPiaC0VYMKSVHIsp6pNk74wsLX04AKNB2Rycq1h0tFwM2JyVFKDqLZL1ATvABvunmjyczPjqZquegUCk1wpLEOxvlAzHKh08sram/W2vhwjNuQ00UDKci9HqpV7dGxu9TRSToPRG9i12TLTbEUqtFupktXcqG8Wn3rX6M9VuwGzDrUkoJQoI2GztUw9Ot04Qs6VDUQ3Z96pc5ezcJJqdBEq1cjhr4uuxAXL0Tdy+D5ToDfTf6ZgrXa+yVRqhRsuQBjRdKyuAaipdekQXQllIuQ1jqLjWx+Z35PV+evuMjPKty1CmzG7HCMCeJy46nb1STczvyer89fc0Xpl6T+IiSgiIgIiICIiAiIgIiICIiAiIgc7lDtQYXD1K7ahALDXUswVQba2zMJSPLDlT3W3SlcjZAuUEEAAniTe9z2S1uc/wDi2v56X+fTn59xe7/f45nTD5ZWugF+sTbyZeHpkp5HctX2d0i0kDrUKk523Zb6gKBrY9siNtfSffBl31S/WtGqGVWG5gGHmIuJVfPL8bT+jH1nlkbAfNhcO3bQpH101lc88Y75T+jH1nnGduuLWxG1jRo2pEM5rOtRN/UqpQ0IHA5T6AZ36OIy1KlRKFastTEs5Ko65UNIICSwUHQvvOl/VzPwoWijUlo16jioGLUyUzXpL4bgNfeNPN2C+ji+WeIbVMCQRqC7VntoBoFCAaKvq881Tt08FVFLKaSUqq0+gDvWBU0w4ZepTDFCcq3B/FI03jPS2VWZ3qCsyGpW6bveGZrNkCNZqhsVIW1iOJ37xDMRyo2g3B6fkpUFTfvs2Qt7Zza2IrVPjUxVX59aof2Y0Jly52aVpGq9RmJoMvR5UXL32gwsq7rEajsudDe/S5nvk9X56+4yvqLsKdZOjekooGylmse/0L2B85/Slh80A+D1fnj3GL0y9J7ERJQREQEREBERAREQEREBERAREQIxzkqrYCojNkDNTGbKSBZw+oGvikemUXjtmIB8ppHyde/hE7sumnvl/wDLXZ9TEYR6VJQ9QlSFJUeCb+NpKCxmCqHMBS1U2OVLEH83SdMcpJ6mrenNo4RGOtdFF95Dnf5lmtXpBTbMG8oBt6L6zdGArj+SqW8oP2zDicBULoDTKs5AUmwBJ8u4ds2cmN95+Twy+H6R5DYnpNn4VgCLUUXUWJ6MZL27Dlv6ZCOeMd8pfR/tNJzyL2ZVw2Co0K9ulQMGsxYauzDUjXQiQnnhHXpfM/aM5+6se0do7Od8S1ZEz5DTWzU0ZOvRUAnNUU6XvpuJXtE2KWzKq9F1KQCtUZc1BBcsagYMemvYHNbXTKvYJw9s4hlrNbL4NM600Y60aR3sCeAml3c/9D9TS/dlaUkwwFYDogtO9NRi9MPTuUzlwtxV1UnxBwAE2MDsXEKaSKKd6Lsi5qNO5LUjUOYirdhlJseB80iJxbdifqaX7s+DFHsp/qaX7saHZbZpo9NmBBqYYvbKFABrUrAWY+rhp2ywOaH5NV+l/ZlabMqlhXuFHwdvBRF/lKW/KBfdLL5oh8GqeWoD7LfYZlL0ncRElzIiICIiAiIgIiICIiAiIgIiYsWxCORvCm3qgcHa+3SWajh1NRgDmyi503gASK16OIqUiRUtQvbo8qjKV3q9gGBHYZztk1npu1SjUNOo17tYN59D98522tm4/E1TUON1Nh4LJoN18p19PbPFz83FZq5a/P8Aj38fHnj9rYpbPZurcdm8zDtbY1WkF6amxTTKxXqtYDce2cSjsLG1VWoMWAGUEC9QesLpebPJvBYqomdsUCh6SkUemalhmKMVLN1T1QQRqJwk4sZbc56fz+nS5Z26mP8ASW7E5xXw9RKONUGi1lWsPCTszjiPs7Zk53yC1K2vUv57sbWkIPJKlS69R2qsPxrKt+2w++dnlLiDUwWCY6/BlHoV3UexRPdwc2PJ9N3r3eXk4rhd2a25GPwpq4oUxpmWjc2vlHc9Ms1hvsoJ9E18Rs3I9RHqIrU3ZCGzAnIbXFgdDN7EX7oIBYZqFIHLTDtZsNSDAA7rgkXGvrmZK2ZmcVKxL5QT3Klu92Vb200GlwAb9s9Lk47YJRmtWpmxAFs3WubXGnm9vp9LgV1vXpggX1zaghfB01Op0twJnWzscrE4jMvg2wyCxYWO7tXjb758TE5UIz4gIllv0SCw3BWv4OmTW/Z2iNjT2dTCmuFcOO526wvbwkPjAGWRzRfJ6v0g9x/+SAISalfNnv3O/wAYoVjbLvA9MsDmjPweqLeOPTcN93smUvSdxESXMiIgIiICIiAiIgIiICIiAmHGjvb/ADG9xmaYsX8W/wA1vcYH5q2jtCrTquiVXUB2FgT2kaTPszCYuq6uGqVMrqbNVbLdCGtcmzHTwVBM6uI2bR6d6tVwi9KwItUJbcW1UHLfMNfKbdk9bVxgdwq4mguFVlHRDpVzorbnBpgG4v1L5RfibsV48fh33lO61K2DrO9Hv1FXoeBTDVc2puSy5L6jQm1rTm7Y2RWTrMhGUm5BuBndnF9xXVyAGAvaTJdsUOhuWv3kLmsSuZSe+BiMpfOWqW8Pha+k4+w2OayVlqYctlFNaWJfJ0h6q0yaOVSb2y3ytuIImY4YzqFyt7V/XbtF/OfL5ZYmIa+zcCeHQEerE4gfZ7ZEeU+zehqsCrIcw72yjQMGIKtmN1OU24jcbkGSTDNfZuFHYr+3FYqdL05TttP8o8Et8Ho2Aq9GbnD0QDm468N0VqJK5adJqbagHuxCN4JuL24Hdb2THiQOmW/R26Cj8YCV+T0vxdbzJmT+qb9wp1OPZfgL+yFNapms+jdWxucQDlGVTawPX0vu3ZvJNlsGbglO9sWBHdS2c2ABubbjY+YjsnhQgt18MTYi3RuR1iG1I7LWFt2oMypVQa5sLe4NugqeLex3ezyjywPGF8Otpb4O+nSZ+A8bjJ/zRnvNYf0k9oeV7s62asBlIGHqKCoIDZVAza63O/Xtlg80XxVf5ye55lL0n0RElzIiICIiAiIgIiICIiAiIgJ4rjqt80+6e55qbj5j7oFR4TZj1amKp02K1VFR6dspzNlolUOYHQ3tpbW09fgxfGnDPVqMowYqFg1u+uwRcuQDq5tQNd2t5sI9RK2MakrmplIp5KbOc4Sk66KDuKjU6ajtmxSesAK5wtWpXNHCqUdXo9alUd6pz1Mo0JU2vY2m12tqLYHJTwdIVML3Q9dMV0pyB6oNJmVSjMbqFtc27CZMMOqdK5Vy1RjgS6ZLBQVcJZr9Ym7dlrCa6YJ1v3pKdmrmg7VWZlXFHNUvSoqysRn0s24jcYbZNgXr1qiB0o3YCnh1+DfFENVZmU3JPDd5r4lWnLA9SiWF7oN5I8evYzo4E/8ALqHkzD/2MSZrc4zUmcPSq9KWFPO3TdJr33c3EcNBbTzzJslr4CmOxiP/AC1z9sudMn1M+2R10+gof5FOaAkrp7LqVQrJTouBSogmoaoPxFPQZCBaBydrD+Swv6Vf742rSKT4JNPwWxOvwfDC/wBPwNtLntmE8n6x8TCjTgKsbNOJsXfV/wC3q/Uli80fxVf5yD2P98idTZr0QxcUQDRrDvYYH4snW/DSSzmkPeq/bnT1Wa32zKy9VPYiJLmREQEREBERAREQEREBERAT426fYMCq6+2Bha+KYorZ+jQhmYL16JPiAsPA4b7+QTUq7exTrno0cMEyMwbLiHISm1mIzHSxY8OJtxnvbATumr0gzJmpXAF794rAW0O42PomjXq0AuUI9sx6oCKMjZbrYsdTZrmwubaDdKdrGviK+06ma9YquYKRTvSAJACrmSmDxUb+IE5//B6pQ13RGXItQ1Gaq5KsLhtd+nqsb7pvivSNRSy1ChTvgzUyTUDUypBJ1ACm3lC+jJhnwqgA0nJsBmvl3ADTo9LG17X0Og0tYTavtp1FfNroHXdTAt1au4Bjf1id/YJvgrdlQ+9z9s5/KB1Z3KKVAAFukZ/FrAm7AW8IaeSbPJh74WoOIqr7VJ+wyvZH3J5s/ayUVVXDkmnRIyoSPiKY4cdJ0TysoC/eH3HfTbS5379Lazh09tLQCKQ5JpUSCpAtegoO/joI/CtR4KVLWsQai6gbh4Nu3hx9MnStu9V5Y0vyFQf2bcTw1/3eY15WUtPg7n+xOunHreW84j8qE62Wm4LD8ddSNQT1ddfcIHK3eclS50J6YcD1dycBYRobO0NoispAp1EtSrG7plB702433yQc0fxdf5ye55Extjpwy5WXLQq6moGB70RewUWks5pPArjyp+3F6L1U/iIkuRERAREQEREBERAREQEREBERAqTbNRFrVWqaLdPEzcKwGn2zlPjKDE5cr6EkDD1dASMx6u7KP96za5UYpKdeorrmBa1mUkdUtYjK6HxjI+u1KSMWp0ijWtdKtRDY7xqzaemXrbruOj0tAk5CGy71FCsbHNx4js18s9LjaCi5A1PV+Cm3V0azPfduO/UcJyV2sgLEU3Bfwj3Q4zWNxmsBfXWfG2opsDRUgXtmes1rm5t3ywudd03xZ5xx9s4tKhe17KLaqii+u7Xdft8k2+TeEenRrZ0KXakQCCL9Wprrw3azTxW0MIzstWjVAzaikaahrHS5YFremSrD45cRg2qqhRemyKCNStOkoGvGxLe2c/LLy1r0+WyTvbaWph1qocSjVKfc9Gyre98ia3DC2l+2auKqYTPSanTqhA/fUYglkzAnK2bQ2vp5d5teeauMouFz0ahZUVLrXUA5FABsaZtu7Z46XD/kKv8AeV/0pbWTujD9IhanmpjNny+Ne+QZbIBY29B42nrG4jCNn6Ok6Xa6HsWyWQjPYbqmuu8TH02H/m7/AN4H+nHdGH/mzf3g/uQNqm9FqlQ4dGRO5qtw173s2urNwKjfw9MmfNMOpX86ftSCpjqShslAqzIyXNYmwYWOmXWT3mpW1Oqe0r7M33zKy9J5ERJciIiAiIgIiICIiAiIgIiICIiBHeUHJCjizmclX7QBr5SJGa3NUvi1x6aZ/elkRN8qKxPNR/11/Qb758/gm/rAHmQ/fLPib5UVW3MzSOpxDE/Nt9s6uE5ueipmmtUOmlldmAWxOq5d28+uT+JnlSeiuH5uHO5qS/nVGt/hE8Dm1q/lqXqeWVEbb5VXC82tTjWp/otMq82p411/Vn75YURum6glLm4QeFWv5Oj098lGwdiphUKprc6m1t27S/nnTiZs3SIiGEREBERAREQEREBERAREQEREBERAREQEREBERAREQEREBERAREQEREBERAREQEREBERAREQEREBERAREQEREBERAREQEREBERAREQERED//Z"},
-            {"id": 5, "categoryId": 1, "name": "Champú Volumen", "brand": "Schwarzkopf", "description": "Aporta cuerpo y volumen sin apelmazar. Ideal para cabellos finos.", "price": 8.50, "stock": 10, "imageUrl": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wCEAAkGBw0QEhAQEBIQDw0PEA8OEBAQEA8QEBAQFRIWFxUSFRcYHykgGBomGxUVJTEhJiotLjouFx8zOD8uNygvLi0BCgoKDg0OGxAQGzElICY2LS0uODQtLi4uNS03NTU1Ny04LS0yLTEtMDAyLi4wLSstLTU1Ni0tLy0tLS03Ny0tLf/AABEIAOEA4QMBIgACEQEDEQH/xAAcAAEAAgMBAQEAAAAAAAAAAAAABAcDBQYIAgH/xABKEAABAwIDAggLBQUFCQEAAAABAAIDBBESITEFEwYHIkFRYXFzCBQjMjM0gZGhsrNidLHB8EJScqLRJFOCkpNDRGSEo6TC4fEV/8QAGQEBAAMBAQAAAAAAAAAAAAAAAAIDBAEF/8QALBEBAAICAAQEBQQDAAAAAAAAAAECAxEEEiExE2GR8CJxwdHxMkFRgQUUFf/aAAwDAQACEQMRAD8AvFERAREQEREBERAREQFrOE9W6GjrJmnC+KlqJGkahzY3EH3hbNaThu2+ztoD/gqr6TkHlSjqpXvJkkfISSSXvc8k9OZXxVOLnHMDNfOzfPPtXxXkhxsg+4bjPL3KfPM4NJa4tPS1xafgtVSvJIutlUeYexB6U4q62SfZVFJI5z34HxlziXOOCV7BcnM5NC6tcXxOC2yKP/mD/wBxIu0QEREBERAREQEREBERAREQEREBERAREQEREBERAWp4XNvQ1w6aOq+k5bZa3hKW+KVeLzfFqgHO2sbgg8jbN889pWPaPnFfdN5N5x8k3Oo/osdc5pNwQfeg+KPzgtnU+YVq6VwBzNvethLK1zbNNydBYoPSvFI22yaL+GU/9eRdeuT4qstlUQ0LWSNIvex3r7rrEBERAREQEREBERAREQEREBERAREQEREBERBD2vtSnpInz1DxFDGOU43OuQAAzJJ5gqy2lx50DSWwQTS2yxPtGO0DO/wUrj6efFKZt+SagkjpIidb8SvPDtSguGfjnrZMo4mxjmLWMJ/mcR8Fptp8O66oaWzOkcw5lpka1p7WtFlw1EpsuiCPtGoY4k4Q09t/yWqkN1nqNVFKD6YVsaKdrSCW39oC1gUiBB3myOG1XTC0BkjbqWtkGEnpwkWuuio+N3aDPPY2UfbbHf8AkLVWUSzILio+O6lBAqKaZnS6NzX/AMpt+KsXg9t+kr4t/SyCSO+FwsWvY618LmnMHNeS6rVXD4PzzjrG35JihJHNcOfY/EoLnREQEREBERAREQEREBERAREQEREBERBV/H36rS9+76ZXnl2pXobj79Vpe/f9MqidlbMdUPOeFjTynWub9A61OmO17ctY6oZMlaVm1p6PyiU2bRdPRcF6YfvO7XH8lKm4OU5Gh7WueD8SfwW3/m5tfs8yf8zw0Trr6K3qNVGK7LaXBlv+zdnzB2V/ebH3t7FytZTSROLXtsQbc/uzzB6ismTDfH+qG/DxGPNG6SjhSIFgB6h8VngPZ8VUvbGJZliiP6zWa6CDVaq3/B+9JV9zD87lUFVqrf8AB/8ASVfcxfM5BdKIiAiIgIiICIiAiIgIiICIiAiIgIiIKv4+/VaXv3/TKoOOvmj5MbywXJNgLk36dVfnH36rS9+/6ZXnqTX9dJUq2tWd1nSNqxaNTG282dtCsc4NbLO550a1z3E9jRqtsduVsJwvJLha7JmWdbr0cpvF7XSwU1e7c1RppNxHNWUEscdZSkEloF88Duc5DI59Gw4WNkm2fDUtqpauljqXQMNbAWVrHuYXFolLnCaOw5jkR1ZTrnyVncWn1VX4XDeNWpE/1CBR8JaWchkw3LzlcnkHsdze1fO3dngjlDHHawdblM7OkdXuzXDVOq2+weEDmWgmOKE5Nc7Mx9R+z+HYtuPi4yzyZfX7vPycB4Hx4PT7NRW0ZjPSw5tcNCF8wLpq2iBJblgfe19Gv5vYdD7DzLnTCWOLTqOnXsPWDcexZuKwTitpv4fPGWqdEsqxRLKszQhVeqt/wf8A0lX3MXzuVQVeqt/wf/SVfcxfO5BdKIiAiIgIiICIiAiIgIiICIiAiIgIiIKv4+/VaXv3fTK89Sa/rpXoXj79Vpe/d9Mrz1Jr+ukoOv4D08zm1klLUzU9dTQCpZHE5zPGIWO8s0lpuS0EHDY3upnCPxiSkpqqrqZ556l8xhhkc57WU7OSZczySX5AAZgXWr4BVD4q6kka+OLDKC98rg2IQ2O9xk5WMeMW6xzqTwu2mypqHviGCljaympY7WEdLEMMbQDmL5used5Qc7tiFrHgNFgY436g5uaCdCfdf3aLWFbXbkYa9gAI8jA5wJe7lGME5u/LIaDRaooOu4Lzidhifm5nJ6y0+afy9ij7dpzyZD54vG/+JhDSfaMB/wAygcFKjBUs6HhzD7sQ+X4rpNvRNO+H2oZB2uG7/wDIFepNvG4aJnvHT7PItvDxeo7T1+kudiWVYotFlXlvXQ6rVW/4P/pKvuYvncqgqtVb/g/+kq+5i+dyC6UREBERAREQEREBERAREQEREBERAREQVfx9+q0vfu+mV57k1/XSV6E4+/VaXv3/AEyvPcmv66Sg7HgtQ07KKr2hLE2pfTzU9NDDI6QQtdLmZpQwguboA24F/ZaZtSmgqNn+PNhjpZ4qwUcjIDJuJ2ui3gc1r3OLHttmAbWz7IvAOnqwyrqo6iOjo4GRsq5JozPG9r3EMjMAa7eZ31GV9c1K4Xmd8MEvjdPV0OJ8cLaaMUrIZLXcHU+FuAkftWPbmLhyG2C+8eMNadzFhDf3ADgJ6yLH2+wasrc8I2kPiuLHxanOgF+RroP10laYoJmxz5eHvB7uddfXnUE/7tSE9uIH+i5HYrCZW21AcR/ERhb/ADOauk228Yqgg5A09OP8F5D8A1bsE6wz8/o83iY5s9fl9YaeHRZVhiWZYXpIdVqrf8H/ANJV9zF87lUFTqrf8H/0lX3MXzuQXSiIgIiICIiAiIgIiICIiAiIgIiICIiCruPv1Wl79/0yvPkmv66SvQfH56rS9+/6ZXnyTX9dJQdhwFro4ROW102zat2ARPwGSjlZc4o52hjjfocRYXPt2vC7aVHLSsa59LVbU32J1VR0zqdgp8B5Eji1olcXG+Tcvxg8Aaylhiq3zNMUrtyyn2g+iNdT0rr3dG5lrNe4EWOZ/PYcMYZJaWKq/sFTG2YwurqJu4kcXMxNiqIMDcLucG3QMr5hw226ZsbmhtwHRRyZm5u4XPMP/ltVqypE6+qCjMjtDgBzPSdcPu1PMM12ImZ1DlpiI3LZcHmtj8s/IDl36hfD8bn/AABfW1JTZjT55xSPHOHyG+H2NAHtXxPOG2AzYw3yyxyZWA6sh7AOkqA+Yudcm5uST0k6n8uwBastorTkhlx05snPKZEsqwxLMsjWh1OquDwf/SVfcxfO5U/U6q4PB+9JV9zF87kF0oiICIiAiIgIiICIiAiIgIiICIiAiIgq7j89Vpe/f9Mrz5Jr+ukr0Hx++q0vfu+mV59fa/P7O0oN7wc27VUm8bC5u6mDRNDLHHNDKG+biY8EZX11U3bO36qpjbC8xsp2O3jYIIYoIRIRbHhYBd1srm60lG3qPu/9KXI0WzB/AfH+i7pGbaQG07XHlHK9sLc79p0H4qZNNgjIZZrfNL+YAHNrek3+Opysosk7AbnlfZF7EdDnHm6hkoFTO55u63UBk1o6AObRWRaK9lc1m89X7LPi6gMgOgfmT0r9hWALPCq5na2I0nxLMsMSyrjqLUaq3/B+9LV9zD87lT8+quDwfvS1ncw/O5BdSIiAiIgIiICIiAiIgIiICIiAiIgIiIKu4/fVaXv3/TKoKKmdI6zbecxuZIze+w+Kvzj99VpfvD/plUPSY8TsDsLw3egWBxGN2Kw69T7FOkRNtSheZiu4TabZ0gBL3NjLWOkwux3wtfhOgI1t7CFMqdkzDGBZzmNDnAB4NibXGIDFodL6L5gpnNbaWbDGyNkJGDG5pk8puQL52ABJvlopG0N81skmNvnQEOjY1hkDw57JLgAg8ntV/h1iOsT6/Nj8a821Fo9J1+3l5/y1UuxpS5rbsu98sYtvCLx48WYbb9g5a5jLNaioiLHOYcy0kHJzc+xwBHtC39SZ4zPaRt4mMqnHcx+VdKBcOyztv3a3HwtE2hsaZjqguw2hayQlrWsa7FbJrRkLcr/KVG+Pp8Me/cStx5uvxWj3+YagLNCs1dQ7q2biTbWMtb5t8nXz1Cwwqm9JpOrNFbRaNwnxLKsMSyqKSNPqrg8H70tZ3MPzuVPT6q4fB+9LWdzD87kF1IiICIiAiIgIiICIiAiIgIiICIiAiIgq3j+9VpfvD/plUXs6mkc50rHxxCmaJnPlLgwcsNa3kgklxIHRrcgZq9OP71Wl+8P+mVSGxJnskfgMzXPjdGd06Jt2F2YdvMrXw257gFdrvfTu5bWp32b6m2BtSN72SQskMkoxslxFpkL5mh40IzidmOaSO/nBbCXYdeGuMrKctm3VmPEnIcCI4mAAtAALwDYusMyMxi1UW1Z2BzTJtJjLzYgXxhhc6S8hNhYnGdek5arOa2Rzt6JKvePhMWMzUzX7jFoS7RuLQm2emdlZFsnbqpmmH9U69/hGmoK51OZv7K6PdUznvaJnTPGGJ8cElm2vhfDc5DNoxL9dszaUzpIhJSyWNcHhr5MLXgsMzM2jNplFtRmcyNcFZtB7Y3RSOrdy2FkLo3OpS1sQJY0WtkeTa+vJHUs0u1qokh0teHbyxBkpWudIWBhytd12vbc9YJzzXebL5kUw+TBV8Ga2Qgu8UbHiLfGQ+QRuwwh+ZIJALcvNGbXXtYrFFwRrN4yLyO9ccLmmQjdSXh8nISLB39oiORIzOdwQpbuEFUDjM20TYnSSncwOGJpLWgWBALhcDIdVlDZt25jO+r7xNwRkvgJa27T0Z5xszOfIaNAFC/NM7t3W15daq2EHA6tIbcwtcTG0xuM28jdIWBrX2js03kbc3sM7kL9fwUrQDcMxhhkMQLzICGxnd5Nw7w71gDL3JPQQThp9t4QLTVv7A5ToHHkYcOZacxhbnrkvtu2bNa0TVoazdloD4QQY8G7N7X5O7Zbow5c6gk123NjTU1t46J3LMbt08vwPwNeA64GrHNcCLi3QQQrP8H30tZ3MPzuVW7WrhIyKMPncyHkxtldGWsbYCzcIvezWjPmaBoArS8H30tZ3MPzuQXWiIgIiICIiAiIgIiICIiAiIgIiICIiCrOP71Wl+8P+mVRmyoyZQQyR+DleTh39s8iW83Pmrz4//VaX7w/6ZVJ7DhbI6SMtgcZGta3fYgQS/wDYIa7DfQnI5ix5jKtuWdo2rzRMNkRM8TN8XrcL5HyMxMlswk3AII0uXE9ZHRdZIoqhoZ5OpOFtreLvNsn3abtzGLBlfpUvHE0ECmoN6xr5XsjBzxSMls27SbENcGt/ccbG2uKtpIxBJhZSnE2IYgXSSNLACSHCMWOAAnMauOdwBPxrb2r/ANemuVrrVZOcVVbdgZ0z3AvycS5xaXHlF1vZ0lfsrKkg8iuuWsOdO8kyC1i4lt9Wsvb90dCn1bWB7rw7PcJHY8YifgYY6lzhECAbOc14bbMYWjXJRnUgO9aG7Pa01DJRIQMLRvMO5yYbeiH2fKnI3FuRls74FGvFHUE2MVWIyXYhuJhfkkg8luXLJ96wS7LnBZgp6m2BuO8E3pP2rZadC3lVC22EQbPbvJd0XCN5dTulsQ65bbCxww8rnyyzvmqIosGIU+zyXtlAaMYFpWyShzThFn2YA09bbBouuWvNu6UUiOzRx7Nqv7if/Rl/osn/AOdVf3E/+jL/AEW8hpo4GhsjdnuwmnixOjLS8sewkkkaljwToOQCb3N9edoQMvGKamkDWiJshBcSWhzN6DYXJFjmNRfsgm09bSzMsXxyRgmwL43sBPQCRmrb8H30tZ3MPzuVWbX2gyXJsEMJ3j34o2gPIc5xDHEAAtGKwy5h1WtLwfPS1ncw/O5BdiIiAiIgIiICIiAiIgIiICIiAiIgIiIKs4//AFWl+8P+mVR2yoKyRz20tySI8YD42X8pdg5ZF+UAcui/Mrx4/wD1Wl+8P+mV58kFyg6ijpdrA3G8Blwk2lhGOzWxNJGLola2/wBrtWZ1HtRwc0B7t4A5wMkJxh8eAE3Od2Cy5qmAUiUCyCcIdrYmxDeBzgyRrXviFwBGxhu86gOiAGouOdfstLtp4a128c0jfNaZYLZFr8QGLLNzT7VoJmjoSkZAXeWL2ssc42tLsVxbXm1QdGKbbwOW+FnOOUkIAc198rGws4ZdYy0UWeXacIY6Rz2Mvu2WdERcRtNgG6cl7T7RzjLUVcdMMO6Mjib4xI1ow6WsRrz/AAWOIINvLXzyi0kjni4dyjfMCwPu/E9JWNYYlmQRpdVcPg+elrO5h+dyp6ZXD4PnpazuYfncguxERAREQEREBERAREQEREBERAREQEREFWcf/qtJ94f9Mrz4/VekOPLZc01DHJE10ni828kDQXERuY5pfYcwOG/USeZebXPF9R7wgl06kyaKFBOwakLO+pjP7QQRZlhKySOB0WNAWSNY19scEE6NZFGZO0c6+zVM6Qg+ZlcPg+elrO5h+dypmSdp0IV4eD9s6YCqqXNLYJGxRRuIIEhBcXFvSBcZ6XNuYoLiREQEREBERAREQEREBERAREQEREBERAVL8NPSSfxFfqIOGrOdaOqREGrqFEKIg+l9tREEmJbjZ2oREHe8HtR2hXnSeYz+Bv4BEQZUREBERAREQEREBERB/9k="},
-            {"id": 6, "categoryId": 6, "name": "Gel Fijador", "brand": "Taft", "description": "Fijación fuerte y acabado brillante para peinados duraderos.", "price": 5.40, "stock": 25, "imageUrl": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wCEAAkGBxISEhIQEBAQEBAVEhYYEBUPFRAVEBAXFxIWFxYVFRYZHSkgGBolGxUVIT0iJSkrLjAuGB8zODMtNygwLisBCgoKDg0OGxAQGzAlICUuLS8rLS0tLS0tLS8tLy0vKy0tLS0tLS0tLS0tLS0tLS0tLS0vLS0tLS0tLS0tLS0tLf/AABEIAOEA4QMBEQACEQEDEQH/xAAcAAEAAQUBAQAAAAAAAAAAAAAABQEDBAYHAgj/xABIEAABAwIEAgUICAMCDwAAAAABAAIDBBEFEiExQVEGEyJhcQcUIzKBkaGxQlJTcpLB0fAVM2KC4RYkNDU2Y3N1srO0wtLi8f/EABsBAQACAwEBAAAAAAAAAAAAAAACAwEEBQYH/8QAQhEAAgEDAgMEBggEAwgDAAAAAAECAwQREiEFMUETUWFxBhQiUpGhFSMyU4GxwfAzQtHhQ3LxJDQ1NmJzkrIHFhf/2gAMAwEAAhEDEQA/AO4oAgCAIAgCAIAgNUxKdwleA9wGY7EhfP8AiNzWjdVEptLL6s7FCEXTjlGMKuTT0kn4nfqtT1y4X+JL4st7KHur4FRWyfaSbfWcpevXP3kviY7Gn7qK+fS/av2+sVJcRul/iP4mOwp+6ivn8v2j/eVn6Su/vGOwp+6P4hL9o/3rP0nd/eMer0/dKnEJftH780+k7v7xj1en7pTz+X7R+/MrH0nd/eMdhT90efS/aP8AxFYfEbr7x/EdhT91FPPZdPSyfico+v3P3kviZ7Gn7qPPncn2kn4nfqsO8uH/AIkvix2UPdR6gqH5m3e86jdzualRuazqRzN811feYnThpeyNyX0g4gQBAEAQBAEAQBAEAQBAEAQBAEAKA4z03xeqgrp4xMWx5gWdmM2DmNcfo3Nsy0p8Is6snOUMt892ey4Zb0atrGTjv1+JjTy4kxzWvqGR55RHE5/Uhkpc0ODmOy6ss5va27QUPoaw+7+bLIuykm4xbwsvnt0335+BZmqsTYHF8uRzYnyOY9sIkaxkrYiS3LpdztOdiVF8Gsfu/mzMfUpNKKzlpZ3xlrPf3cyJ/wAKqz7c/gh/8VF8Gsvc+b/qbnqFD3fmzYeiNVW1L88k56hp7XYiHWH6gOX2k/rpxeL0bK1hohD234vbxNC8p29JaYx9rzexuWReY1HNwhlTUNhlWNQwVyJqBUMWNTMDIE1MF2kivIwf1D5ras4upcQj3yX5ldV6YN+BuK+mnCCAIAgCAIAgCAIAgCAIAgCAIAgCA5H5W6I+cteGuIMTCco1NnPa74ZFnXGPN4PWcBqpUXHPV/ka5XYyJuqbLRuMcLx1LWuc3LCGgGB7st3glodm3uXc9IOrT95fE3qdo6epwqbyW78e9b7d2Cs3SMyufJPTOdJLA6Gd0TurzjrWPY4AscGloYG8bi3LWPaw7/mRjYdmlGnPZNSWd+jT6rnzMDCsHNTPkiY+OLdxkIcY26Xu4NaCSdtB8CVp31/TtqTm3l9F3s26tx2NLMmnLw/bOo0lMyJjYowGsaLNH68yea+fVqtSvN1Jbtnn5zcpOUnuXSRzVahJ8kR1IqCOYRwkug1IXHNHCXcNSPSgZCwChWQZ2CsvK3uufgf7l1+B09d7Dwy/kat5LFNmzr6CccIAgCAIAgCAIAgCAIAgCAIAgCAICIx1urD3OHyK8n6TQ/hz80b1m+aIMleTTZ00jzdZyzOAm42LbogTmPK3cr4XE4Q0LzK3TTeWOpGm4tfa3E6rKuZrL78fIOmtgaca76ix210spK7n18/nkx2aKNpmjnvsbWNwszvakljy+RhUYpl5aeC0ohkoVkEt0fZ2yeTPmR+i9D6NQzcSl3L82aF8/ZS8TYF7Y5gQBAEAQBAEAQBAEAQBAEAQBAEAQEbjg7LTyf8AMFed9JI5t4y7pfmmbVo/ba8DXpRqvE4wdaPItSPsC47AEn2C6nTjqko95mTwsnNsBoK2uZ/EmVj45zOerie54pxG0i7CBfTha2ttdTce6v7qx4fL1GdFOOneSS1ZfU5FGnWrLtVLfPLoSc+KSRYniBD3mOOgMjYy53V5mMjIOXYHU+8rSp2lKtwy3WFmVTGeuG2WSqyhcT8I5NbfHVRUUeLitndOZbuY5zjGW9Y5tiL2sSBpa1jYDRdtTtat7LhnYxUVHZ43zg1cVI0lX1POSS6SRy1GITMjqZ4AyhE7BG+QNzNa02IBFr5t1p8OlRtuHwlOmpZqOG6XJtltZTqVXiWNslavpDUz0OHRNldHPVymKSVuj8rJerLri1ibtJtbY81Gjwy2t7+4qyjmNNakumWsiVxOdGEc4ciUlwiooqTEGmqfND1WamLnP6+I5Tn14XNtjwvpcrnxv7a/vLeUaajPOJJJaWuhdKlUo0p5llY2Ng6KSufRUznuc5xhZdziS5xtuSdyuJxeEYX1WMVhamblq26MW+4lQucbBO9H2/zD90fNeq9F4fxJeS/M5d6/srzJletNAIAgCAIAgCAIAgCAIAgCAIAgCAIDBxkeiPcQfiuNx+ObKXg1+ZsWr+sRrtQF4GX2jrQZh1v8uT7jv+Eq23/ix81+Zmp9h+Ry7DcVqqXB4aimfG1rZZBKHtzOOZ4DMoItve+oX0C6tLW74xOjXTbcU1jbkt8nHp1KlO3UoPruSOM/5wxX/dcn/LiWpZ/8Ptf+7+rM1f41T/KY2J/6PRfeH/UPVtv/AMxz8n/6oS/3JFnpGyodXzClc1r/AOGgyZrXMQYzrGtuD2jpy46hX8PlbRsYO4WV2zx/my8Z8CFZVHVej3SlKWFmAZAQOvkzX+sKiPOfAuufCyzUU1O/1+6vhh4MLGKOO8l63FKl7cXpql8bhDBePq2gAB4Lm3NgScpb7brmUbO0g7O4t005y3y+7+5sTq1GqsJvkjZuh3+Q0v8AsWfJee4z/v8AW/zM3rP+DHyJuMLlsvkbBgA7Djzf8gF7X0ahi2k+9/ojlXj9tLwJRejNMIAgCAIAgCAIAgCAIAgCAIAgCAIDGxJt4n+Hy1XO4tHVZ1PItoPFRGty7BfOpckzrx5mLIwEFp2IIPt0SEtMlLuLWsrByCrpauOkkwg0c8j+vzQyxtJic24N81rWNr3vpfW1l9LpVbSrdR4mqsUtOJJvfOP3+hwmqsYOi49eZtNRhkkuJ4gMj2xy0Do2SFrhGXOZELB9rE76dxXDhd06XDKDym41MtZ3xl9DZdKUq81jnHBrTnVctFHg/mM7JhLZ0jmuEQb1jnXJtawJGt7WGm67Om0pXsuJ9tFxcdlnfOMGvmpKkqGl5ybHU0MgxOpcI5DH/DHMa/K7I52VgDQbWLtNlx6dxTlwyktSz2yeM74yzZcGq0tv5SHiweoGHYfPHDIZ6WokkdE5rmyFpnLvVIufVbpa9iSujK+t3xK4o1JrTUikpdM47yhUZ9hCSW8XyMiATVH8XqvNaiJs1OxsTZGOzuc1mUhotd23AcVTU7G29Tt+0jJwk22nthkkp1FVnpxlG5dE4nNoqZr2ua4QtDmuBDmm2xB1BXleLzjO+qyi8pyZ0rVNUYp9xNxBcuRbI2PBB6Id5J+K9/6PxxZLxbORdv61meu0awQBAEAQBAEAQBAEAQBAEAQBAEAQFqqbdjh/Sfkta8jqoTj4P8icHiSNY3avmXOn+J2P5jHKiXHlZMlUAusDAugKKS5ghIKSraxjeuZmAaHXs4HR+Z1y25dfJYk23uCu3UuLCc8uLx+8fh3mnGFZLmS9OHBrQ85nWGY2AueJsFx6zi5tw5dDbhlR3Mpg0KpIPmbLhTbRM8PmSvo3B46bKn5HHuHmqzLXTKQgCAIAgCAIAgCAIAgCAIAgCAIAgPLxcEdyhUWYteBlczV4xoQvl8I5UonZb5MxnqlFyPKySKLILmUD1r67Ab+08FeqcILNT4L9e4r1Nv2Rdp4Ob33v8LLOaMtsNeOcmcTXieHtsbH4bHvCqnBweGSjLUsnlQJFQFhmGX7dlZS9nJV/MbRRNtGwf0j5L6Xw+Om1pr/pX5HGqvM35l9bhWEAQBAEAQBAEAQBAEAQBAEAQBAEAQGsNFnuHeV8zUdNxOPi/wAzsZzBMxphqtNrEmi6D2LJUkm9kWZMOXGaaN1paiFttS1z2ZtBe2W99V1rLg17XknGjJryfQ1q11SgnmSyRU3TihDjedzzfXq2SG/gSAF16PodxavLVUgop98l/c1Z8Ut4LEXn8GXabphRSg5HODw3NlcHNuLgEZnWbm1BsDtfkp1fQ7iKytCXjqyn+vyIx4pR56s/gWMU6bQRMYSyV7jmAa0wHQZSCSHmwOY+4rYpehV9WSi5RWOu/wCHREXxajBt77kK/wApbLaUkhPC8jQPgCtxf/Htb+asvgyH01DpExHeVFwv/ibR4yk/DIFf/wDn1PrXf/j/AHI/S7fKJci8p0jsgMETGkgONySL219cADdKvoPQhSeKjbW/T+jMR4jJy5HdKM3jYTa+Rt7bbBbFOChFRXTYrby8l5TMBAEAQBAEAQBAEAQBAEAQBAEAQBAEByXpZ5RIaaqkp4YnVEzXkSa5I2HiL2JcR3C3euNaeida5rzr1JaYtvGFlv8AobM7xRgopbmnY55QK55tH1VO3+hoc73vv8AF6S09DeHReqpFyfi9vgsGlLiNXkn8DWqqtnmuZqiaW+4e9+X2N2A8F6e24ZaW6SpU4x8kvz5mjUuqkvtMtMjaOA9q30kjWlJlzrAmpEMMoZVjWgolDJ3JqySUTFme7gB7rquWehfBIxHPdt8gFRJyNiKRnugcWsaCQ5zmgc7lwAt71qyb3yWpI+t2NsAOQsvKGwekAQBAEAQBAEAQBAEAQBAEAQBAEAQBAfL/AJR48mNVjf8AWtd+OJj/AM137KcuxSRVJLJFYowgg3sunbtvma9RItMePHwutzUakomxYLfzSofHG50gnhDSyniqDYxVBLTn/lsJa27hc6DRc25mnVipcsPrjqi6kvYZfxAdVT08sccLZyYvPOzG8xXiPm12OaQ3rYi5501c0XsQqIy1zlFt430/rv4PkTawk0vMm4mRmeWN4hF8VfAxjaamLXxgOLIHOsDG06DO0Fw34LXlKSims/ZzzfPPP+xOOHnbqQONYcxuHwFpZ1sPVmoLcomIqWGQdaNxl9C0X+sVtULiTrvL2fLu27vmRlTWnZGoOcO8ro6kVpFtjLuAsd+9UVGsci+JtuHxHzihjDW9uqgBzNa7eZgO4PBcyrhxk/B9S5H00uCWhAEAQBAEAQBAEAQBAEAQBAEAQBAEAQHzl5ZocmMOdb144XePYyf9i9DYv/ZV5sql9ogsejs1ju5btuyioRtH2nsaToXNBtyLgCtmcmotoo0rJ0vGcCoopcQggjYw09FUSsMNVWula+MR5BMxxDR65NgXA8Vw6derJQlN82lul8mbemKeEj3ifR3D6emfUSRRE5qcWqamtYx5fRiVwBjzEvLrkAi3eNFGFetOain38kn1MaIpFvHMCooaM1XUCSSKnopnNZU1PWvdMQ13WtJsxh1s5hzXSlWrTnozzbXJdO7+hlwikZEuAYf1kzDStjZHQCoLpamtyFzxAbPLSXBoudgfBRVevhPVzeOSM6Y5e3Q5ZikkZlkMTWMizkMEb5JGWGl2veMzgbX7Wuq7dPUoLU9/gUSW+x5wqPPK0AX1130VFxUSRbCJ0LBMPecTw9uR1mzNc45TlGVrnanh6q5NSrHs5LKyXJPJ31comEAQBAEAQBAEAQBAEAQBAEAQBAEAQBAcB8vdORiMEn0TSsHtEst/gWru8NzKg0u/9CmbSlgg8fp70sT+5bNu8TaIzWTVIH2IINiCCDyIOi6WnKNeWxMw41Uic1baiQVLr5pARmdcAEO4EWA0ItoFU7Wm4aMbdxX2kk8mTF0rrmGRzKyYGR+eUkgl7soaCcw4NaBpoAAFVKxovGY8iUa0zGfjFQ+KcPne5rooY3g2s6ON/o2nuadlj1enBrC72T1yZ7b0orI2tnZUyNlJfEXjLcxsZAWs22GihKhQ+y47cyacs5IHEMSfNI6aV5klcQXucBdxsBrw2AWO0jCOmK2JqLbyya6GSPdOLabXADQ3lsBZaVfDjyLUdV6MCd2KQhvWdQwSdbZnoz6F4AL76HM5htbVcer2Od8aum+/wLVqx4HWFWYCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgOO+X7CJnmlqooy+ONr2zZBdzLuaWkga5fW14Ldsr+lQn2M3hy5Z8P8AUi6bl7S6GoVrg/DWG40cQfcF0YTfakMbGiRvF/WaPGy6kZY5spkiaosNmktkhqJL7ZIpXX9zSFXPidnT2nVj8UVOhVlyiSEfQ6vkIDKWRgP0pjFGB3m7r/Bcmv6VcLht2ufJM2adhXe7iTdD5MawRTNmkgjziMNsZHWyvzH6IB05Fca59L7aOZRhJ478LOe7c24WEm8ZRmx+Sy8MbH1m0sriWQg3zMhAAu7S2T4rlVfTT2dcaXPbd93+pfHh2+GzMpvJZSXvJLPILHQdVGLkb9lt9FzKnpldYxThFeO7/MuVhBc2bb0X6CUNOc0cJc760j3uPDvtw5LbtON3t3vUlheCwU1KEIcja6AemdbYDTuVFg9fEJy8CVbakiWXpTSCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgIrHx2Wnx/JeX9Jo/Vwl4m7ZP2mYkLGujs5rXeIBWjZ1Zeq7MsqRWsjjA1p7LWt+6APkuDVq1HJqUm/xNqEVjkeHFQTeclyR6cA7UEB3EHQHvB/JbMlGrunh9V3+RBNw2fIp1B7h4ltlj1ap12/FGe0j0KuIsADexJJ4a229yjVcVFQi84y8+eOXwMRy3llWBazMsmaBthdet4XDTTyc+s9z1hGr3n97q/gvtXNWRG52hFEsvTGkEAQBAEAQBAEAQBAEAQBAEAQBAEAQBARuOjsDx/IrzvpJHNsn4m1Zv2yPondkhcDh8/qnE26y9oxKk2uSubUpuVZxRbGWFkxOuBNr68v3+9lJ21SKcmtu8nGpHkeBUN5223032Vjs6q2xny8DKqxKiUfsHnZRla1Fvgz2sWVM7QbeHx/+LMLOrNJrqRlVingyKdwdYhUSpShNRkY1JrKJun0YSvW2vs0GzQnvIYF9M94/NZ9Hd3Vl4i86Ill6c0ggCAIAgCAIAgCAIAgCAIAgCAIAgCAIDBxkejPiPzXE9II5s35o2LV/WELRO3XkLGeG0dGqjHxGUN3FwTY+75qcbeVWq3F4aIOaityPNQz1msO/Hna5PHhfXuV7ta8vYnUXL9/PHxCqRW6RadUR/UN7DlYWGl9e/wCCujaXPJTXP8/w8A6tPuPTKlnBrr2J1t3nnvoq52lzj2prDx88Lu8SSqU+iLkUzXa5NSQNO+51+KhO2rU9oz5Zfwxy595hThLdoysMnD9m5dAd7935KFezlSnFylq6fv4mI1FJcsE691oyuzKWi1ZQlmoXMAHYce9X+jS+ok/EhefbRKL0hphAEAQBAEAQBAEAQBAEAQBAEAQBAEAQGJig9E72fMLlcajmyn+H5out/wCIjXqZ2q8FbSxM61RZRcmWbnmmQiR7mv8ArDbluVap0JPaL/fIylJdS12/rN9ysfY9ISMrX3o9drXtDfTw1/u9yj9XhZi/HzMvV3oNY/TtN0PJSdS3jn2Ws+JHTN9USNKDpffiqrdJ1G1y6GJcjMrXWjXYvp6bbBRSWZmbgY9H/aPyC6/o7HFpnvb/AENe7f1hIrvGqEAQBAEAQBAEAQBAEAQBAEAQBAEAQBAY9ePRv8Fo8TjqtKi8Cyl9tGsRnVfNYvDTOy+Rfk2V9fdZK48yPkkNyMhIuOfv2/d1ZChDSpa98cv2zOt5xgs9Zrbqza51seGx24q31eOjUqm+22fj16GVUecaSnWH7Pnz/RS9Xp5x2n7+JjtJe6XGTHhG4a9/t4eHx5KMrSn1qL98upjtZe6SlMFCyRioe8QdoAtviU/YUSNBbkvg49E32r1PAo4so/iaNy/rGZq65rhAEAQBAEAQBAEAQBAEAQBAEAQBAEAQFqqHYf8AdPyWteR1UJrwZOH2kapxXy9nb6F7grM6oFfUw6mG5BDi23Lirra4VOLi45yZcNT5loxH6x3/ADOnxHuU1cQWfYX7S/f4kuzfeeRTu+uf2Lc1Z65T3+rX7eSLpS94vQxEG5cT3FUVq8Jw0qCXLcKDTy2SVOFsWiwkVzLVc7UBQv55kkToo2DDR6Nvh+ZXueEx02dPyOVX/iMyl0SoIAgCAIAgCAIAgCAIAgCAIAgCAIAgCA8yDQ+B+SrqrMJeTMrmag/1l8rksNo7sfsl5izDk0QZakUIk4mA0Eh4Bscx15DTb2LqTlThKEpRytPLv7s/qQipNNJ9S3LlFgwuD7gNuX2JvxJ0I/YWzQ7ap7VVLRht7L5Jb5/bK56Y7R5/iSTFwmbDM6JdagsRNaRiVJu5aNxLVUZdTWIm0UQ9Gz7oX0ewjptoLwRxqv22XltkAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAVhrKwDT5x2l8rrLFSS8Wd6m/ZLkahDmRkW5VFcyUTCdGbOt2TmuOR149xt8V0VXp6o61qWMP+3l0I6JYeNmeZQ97SzKG3FiSQQO8cz7lOg6FCoqqnnHJYxnz6eZieucdOMfiZ8a5nNk3yM0bLrR2ia75kfUTNabvc1ovu4gD4rQjSqVJ+zFvfojZjFtbG3U3qNttlFvcvplCOmlGL6JHCn9pl1XEQgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgNSrhZ7vvH5r5hex03FReL/M7lB5gikZWotmZkUlTqZiY7lYi1HPulvSVz5Oqp5HsjYdXRuLTI7Y2I+iPjvyXtuDcJhTp9pWjmUuj6L+p2bKzSjrqLd9DPwiKR1N5551VFouxzC95PXZhYh23VZXC/EEW4hdn1K2+7j8EalecY1+w0R78+H9f9Sf8AMSRTkz1GWoexsd3HMwaZ85Ol7nS241U1b0lyivgjR7fDmtKzFPPj3Y/U5zCc1QDuc3HXgr1FRWywejeI0fwPo2JlgByAHuCgfOm8vJ7QwEAQBAEAQBAEAQBAEAQBAEAQBAEAQBAEBwrGumdVBU1ELhFI2OeRrSQ4PIbI4C5vY6W4LmXHo7bXM3Uy03z7jZp3k6axjJ5g8pLx61MD4P8A/VacvQ+D+zV+X9y31/vj8zId5S28aZ/sc0ql+hs1yqr4Mkr+Husisb8ookjdHHFJEXaOcctw3iG2O52utmy9F+xqqdSaljkvE2KHE6MZ5nFvHkah/Fo+T/cP1XpFQa6nU/8AslH3H8iYoumrowG+kc0RmMCzA0MLsxbbbV2t9763WexbNOpxe1m89m85zzXMzH+UCcm7LtcXMdc5TYsFmEC1hYaacE7DxNf6StsY7J9evfzMMYzUzyNIMbZfVjdkjblLjYGzA0E3PG6KklzMT4xLQ6dKGnPe2z6aC1jkFUAQBAEAQBAEAQBAEAQBAEAQBAEAQBAEAQHzx5UaHJiNTp6zmvH9qNpPxutui/ZIs1JjVtRMFZW6KZgjagKDBiFYB6agMmJh5lYBtfQPDusrqRtr+nYT4McHn4NKpqP2WSR9NLSJBAEAQBAEAQBAEAQBAEAQBAEAQBAEAQBAEByLy2YZaWCpA0ewxuPAOYczfaQ4/hWxQfQwzluVbkSIkGisZgjqhqgwYnVrALscSw2DMgiUMmcHTfI3huesMtuzDE435Of2Gj2gv9yorPYkjtq1jIQBAEAQBAEAQBAEAQBAEAQBAEAQBAEAQBAQ3S7AG11M6nc7I64dG+18j27G3KxI8CVKEtLyDh2NdCq6mcQ6nkkaNnwNdJG4c7tFx7QFvQqxfUi0a9URlmjwWHk8EH4q9b8jBHzW5hQaYLQA5hQwwX4GZjZtieQ1KNY5gnsM6M1cpAjpp3d4Y/L7XWsPaoOcV1M4O5+T7o0aGnyyW6+R2aW1iG6WawHjbX2krUqS1MkbQoAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCAIAgCALAIvH/AFFZAizkvSX1vat2lyISIrC/Xb4q6ZE690T29n5Lm1C1GylVkgEAQBAEAQBAEAQBAEAQBAf/2Q=="},
-            {"id": 7, "categoryId": 5, "name": "Aftershave Bálsamo Calmante", "brand": "Nivea Men", "description": "Bálsamo calmante para después del afeitado. Sin alcohol, reduce irritaciones.", "price": 7.50, "stock": 40, "imageUrl": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wCEAAkGBxMSEhUTExMWFhUWGRobFxgYGR0dGBsfGBgaGh0fHh8eHSggHR4lHSAfITEiJSktLi4uHR8zODMsNygtLisBCgoKDg0OFxAQGi0lHR4tLSsrLS0tKy0tLS0tLS0tLS0tLS0tLS0tLS0tLSstKy0tLS0tLSstLS0tLSstKy0tLf/AABEIANkA6AMBIgACEQEDEQH/xAAcAAACAgMBAQAAAAAAAAAAAAAABQQGAgMHAQj/xABMEAACAgAEAwUEBwQGBgkFAAABAgMRAAQSIQUxQQYTIlFhMnGBkQcUQlJiobEjcoLBM0OSotHwU2Nzo7LhFRYlNIOTwtLxRFR0s+L/xAAYAQEBAQEBAAAAAAAAAAAAAAAAAQIDBP/EACQRAQEAAgICAgEFAQAAAAAAAAABAhESIQMxQVFhBBMiMnGB/9oADAMBAAIRAxEAPwDuODBgwBgwYMAYMGDAGDBgwBgwYj5rNrHz3J5KOZ/5euAkYiz59F29ojoOnvPIfE4ovaPt2FdoYQJpR7Sq2mKP/ayVz/Au+KFxPic+YTXNmKg+8F0xH8MUQNyHpqYkdRfLEHUOK9u8vFYMyKbqlBka/LalB9N8Vnif0hgclkPrK+n5RxgH5kY5m+bonugUXlqO8jD38lHoMRdHqf54uhcM/wBvZ39lq9AAPzOp/wC9hNL2pzTGxM6+5m/UtiAmQerICr5udI/Pc/AY35bJI7hFkLMeQVaGwJPicgAAC7xNxrjWZ7SZz/7qb/zG/wAcb4e2PEF9nOTfEg/8QOI6ZeMxvKEcpGyqxLi/HdbBeVgi76jzxk+VXWyd2bVO8/pNtPdiTbwbnSfnhyOJ5kfpQ4lHWqRJR5SRi/mmn+eLPwr6YwTWZypUffifV80YCvgxxzg5JCIqEgM1hACrWQ2nkdNb+uNM3D6JUONSmmDWpBuv3ee3PF3DjX0LwDtlks5tBOpf/RsCkn9lgCfeLGH+PlHMZZl2dfmLB9x5fLFp7OfSDncoQO87+If1cpJ/sybsp9+oemDL6FwYrHZPtzlc/wCFGMc1bxPs23MqeTj3fEDFnwBgwYMAYMGDAGDBgwBgwYMAYMGDAGDBiPnc6kSlnYAAWbIH68h6nASMeMwHM1jn/G+34A/ZAkNspFjX+7tqfztQFr7eIHCZZp9U+YkCQKCSBsDpO+puZUddzZ23onE2aX3iXF0jRiGWgCWcnwKB1J6+7HLeK9onzqyFJGy+SXeTME1JMOR07WqHkCNzyA64h5nPNxaRt+64bCbYnbvinU/g9MK+J8XWXTMUrLxmspBy7xhylauQrl0A35kA0YZuaKOJdUWiH+oyvJpf9ZOd6XrpN+uo7YRZzMyTv3kram5AclUeSjoMeTOzszu2p25n9APIDkBiTDCEXvHUsNtK0d75Fj9lfIc2rbbC3Syba4MrY1EhU5aj19FHNj/m8M8tlgO/RSIZYVsd4BrYg+IXyQ1yrnqG+IXHcuUkppFkBVSrLsNLCwNP2CB9nEbP555m1yNqagLoclFAYmrV3r025yaFhCwDF6qcXWohtiGNkErsdq5ViHlsw0bB1NMu4I6H441McYXvi60l7TUzEj6gGY94SW32Y+1ZHI77+mLDwzsrmZtLEkLpoFmrw8qHNtNX9mt+Zw27A8CUr38ig70qmtyKNn0XavxXfsjGfa/tdmMvme7iCaE0l9YBaXVudO+1bDz3J8rzb9LpEfsNmF0Mkq3HRSydiDq2BSue++2EfEY81le/WVKOYFMxA87safDz5gWBtywx4p2ymlnVsvK8CKo/ZlV8bGvMeLfbzHuxfo176MxZhELgLrUEkeIHSy72pPzBB6Ved2ezTlcOajb6vGn7LmMwxoq1sDqo2NlvmPLGj6urxiXT3al9Ab7JYLqrTzG3MiwPLErtfwBspLtZjbdDX5H1HX4HrhR9ZYoELHSDYW9gaq692Na+YbZyRNGRexsMrA9QbDKw63uCNxjpnYb6TyumDPta7BZ+o6ASAcxf2/7XItjm/wBbApQvhIGtSbDN1YeR9RjGWAVrQ2vUfaX3+nkcXf2WT4fUqOCAQQQRYI5EHyxljhX0dduzkmEE7FsqeR5mEnqP9X5r05jqMdzikDAMpBUgEEGwQdwQeoxWWWDBgwBgwYMAYMGDAGDHjGt8UTtp2tZWGVyoDzuNhvpReXeSVvXkvNsAx7U9s48qRGg7yZhaopHIc2YnZEHV229+Oc8T4q8rBp7mlY/sYlVu6DA7aQd3o/1jDpsFw04N2Rk3knZl1HUzEgzSHoX+6fuoNkFHc8rLw/IwwEsiDvDsZDu3uB8vQbfGzjNizSv8M7Jsf2mYppX9otuAD9lR1A/FsT7sIu1HEDn8wOGZY1l4iBOy8mrbRfkOpxZe3XaH6rlrDVLOe6iPlq2L+4Df5YrWdnj4dlO5y4qbMbd5VOy/alJO+/T3rsMJC3aL2jz0dLkoSFy8X9KRybRzH7o5epxXM3mDI2sihyVfur+lnmf8AMRY21bdDufcPZHuPtfIdMTIYdbAE0Bux8gOZ/z1IxrZJtlAoVe8cWLpVPJm9fwjr5nbEvicwjLCOfvo50DMGG6t6jkHUjwkbjly57zmGhAnjaJ45E7oxHfTsW0Mh5gbHV1Y8uVoLxJN9tW66BOMCcZHGBxthgxxnlI9TgeZA+ZxiqkmgCSeQG5PoANziUuXeGULKjIw0tpYEGjuDR88Sq7TweIJBCoP2Aa9W8Z6+ZJ5YrHbXheW+sJNMzx94qR6lQtrIZjpsbI267nmLA5YtfC5A0ELA841HPqo0n7Q6g9MLu2OWy75dPrKM8YlQUuzhnOlSvL7Vcud/A8Y1YqWf7P5OPQjyZqIuRo7yO1J2AIrlXmMNOEF48yiKuksniBOssGc6bOrcDqw5EUcTxw/LiSKQkzPCwXKANRCNppXJID01tZHIkdMVvslMxzMhLNt3p0+0qvrCk0OYp1YVzIPWsPgPuLxfXMnMrKO8ithQ+7d17xY+WOW5bJswY2FVfadjSj05EljWyqCT5Y7ZwrKlYzY9sDYjetJ3J3Fm+V44wYF8TSSaUDEBV3kZtvZXkBXN22Gw8R2xvFKz7mDl37n17rb83v8rx48TxaXVlZWsBl5HzVgQCDXNSOXnjH6+g2SCIerjvH+Jbw/JQPTDDJZhikveZdO77suSEMYbSfB4lobt4QaPM+uLUQJkBGtNgPaX7vqPw/pjoP0UdtO5ZclO37JjULn7DE+wemljy8jt1FUJkCVLExKXpIb2lJB8L1sysOR2uiKBGNOYiUAMvsNtXVT1X/D0wi3vt9U4MUb6Le1pzkBhla8xCBqJ5uh2V/U9G9aO2oYvOKyMGDBgDBgxB4xn1hjLkgbHc8gBuSfQD+WArnb7tSMrFpQa5XOiNPvP6/gUbn3YVdkuB/V0aSU95mJfFNIeZJ6eg6AdAKxX+zztnMw3EJAdA8OWVvsoN9W/Vj4j8MXyOal1nrv7vL8v54g0ZzMb15c/OyLPy2HzxEjfW1efP3Dn/h8cVntB2xy2XLBn1yE7RpReydr6L7zjGXjrx8KlzjgJJKCsQB2AYlVNnz9q/QYBVnON5afOzZmSZVTKkQwjRrIq2d0B8Ia6UMeQs0TVUvtDxh807TsWuY6I7O6xgnTfwJY+8YncezEMWVhycUEUkjaVlzSx+EPzYI53Z6q2225DfCeWPVMFFaUUKPQtz/ujCBhkoQqD5/Dp+X6nE+PSqqGvxkM+nnoB8I+JtvcBjXHFqZVG1kD4dfkN/hjDNSamJHInwjyA2A+WFm+mp12wigLvpQEk3Q25CzueQAG5J2G+Np4U52RopD91JFZj7h9r+G8Z8PQnvUA8bxkKOrUysVHmWVSK68uuMOBqhmuVNcaK7SCyumlNEkbg6qAHU0MVC8g+W/lW9+XvvDqTKsgKRxwvoLKzOEd5HQXII1e/Cns+EWdNkm6HuVbW8WaYWyCQzerwoXVj6v4b82Vj1xF4XxHQEIlaGWLX3coXUpEg8YcAEg86YA+01jkQtI9yskZqVah1B4nKk6Y2kjYRyLzKqfEG32qxzoeQ5B5DUmvvUYq4JtgvdExBbsFSylbG3iSuYxtGQjESRK0jlz3mmOP9o4QFUIDGo4gCxDvu1khQoBMzh2cihpX1MV2RFmSaYAmyqiOIAC6bSz0CoIpheJVW/6PeLa4u4Y+MAOm/MMoeh71p/i/lh9x/hwny8kLHTroBhzVgwKsNhuGAOOe51gHWTLMwmQajAw0TlL1AiPnqU2QFvw7V4QGseW7WQ5qHum8DuyoxoaBvZZuiURve3QGzQ56a9o/D+J52bXBJJET3fiMahbFEO17kjayALIPK9sauy0EcMLuzeOefukUg6rUXuNIo6/EbC0oAPLDLIcIkbNNJE8co0FXdABGCy6dIAJUsBvXTVuOQx7nOBQ5X9tJKvfXqUEKg8IXwJGo9k6dNbk6ueCJk3EO5ybyMd0QqCT9oihfqDz9FJxy7KZONqbT3jncgFpNJO9d3CBX/iSL6jDTtfx5ZWECOFiBNkjWL5bhL1tpFUNtyLNnC6UM624nZOX7dly2X94QHxe5WGNYzRW3Nd0oCv3ai77slRuNr7rLhnZv35ffjDiSvKig96iLQTvisMKgX/RxsxY3fME9fPHuSikPhiOm9j9ThofGeTSfgC2MuHcNLzsncqChAkknPfPuLFDaMk/unEy8mM7t9JxtQOExFosy1jSsW9kbnWumgfaIby5DGjKTAWrew2zenkw9Rz+eGfazhs0JQu7SRnZSQAFPOtIpVvpQAOEKvjWNmeO4eqc8E4lJkc0kybtGdwDs6kbr7iu49Qp6Y+lOH51JokljbUkihlPmCLx8vk64wftR7H1Unb+ydvcRjqf0KcfsSZJz7NyQ79GP7RfSmIYfvHyxYlmnVcGDBioMci+lnjod0ygcKklmViaCwxkar8tbbeo046nxOfREzXW1A+V9fhz+GPmjtA751p5Y7uVysK+ceXrwL+I+1p6hTiB5xH6SMtCojy0bSaRQJGiP5XqPyGKl2l+kHNZvw6+6jAoJGSAdvtG7OKqsZPIXzPy5nGtxi6DLguXMkgA5kgL+87BF/M3/AA4699Iwgibh+SkDGBCC6R0GKxLQG+wGrb54pH0U5MSZ3LAj+tLn3Qpf6t+WLb2m4tCvEppZYxMYYo1jiZdVmR2Z2AOxYClF/e5HEVVeMcXizebTuDKIIozpjdUREYsQe7VCRRWjrJLE3Z5Yg8I8Tsx6l2+baVHyBxun4n9YknzJBXZVogAjuogDsuwtt6HK8e8DjpPUBF/u6v1bFiGmXNCR+VKQPe/h/TVi4dn+DJChkloNVszbBBV/Cup+HTFTipYwTyMgJ9yjl/exeeMxNJBmY09q2oDrTah8CAPnjw/q8rqTepb27Yx7nI8tmVVTThj4HXoRXsuOTC+XPflijdrMwRM8IkkMaFRpZy3iABJO++/ndYsvZaeHuBo3IppRtrViSuphW6dARdaqNXug7Q8JkfM5ll0UpR/E6qSJeRGsgHcHr0xn9Njw81w3da62Z94yo3Aivc5lXbSrdyLtRXja93ZVAqxueXnyxuhyMK3pj7xfvkGRa9ZH7nLp7qkxoyKuihYdUrM2qRoArqgQMEVXZWjDWzMW5DwgG7wTS6mAd4NXTUWzuYseVkx37tIGPfXNrzZiBkmfS3exx/VrUSRMyBI3DWdNoFNcx7DUdsbcvmFCIQRF3qliitKEOhmTUsUVFwQBsXVAQ3njcuZkS2PeDXzOelCIaFA9yPEaGwNmtqx5DnZJX8LyTOKYpAgjiIWqEjtTunQqwArYHEt0NU6HutS5eTuiQ3srBHYOzsIrlNHfU0lCrxjDrbdz37VXeww2QAObZmTu1B9Tr9+Ltl88SWUx6CpTUpYMdMoYruABtpYVvY08txit5Xg8RlzEcup1hkQRozNoRJAStC6oHw1VDbzx5sf1H9plPXfX06cPopHEXisDNKqjkqN3svxMapGT66hjbkw2aY6EkkNeJpn0RjlzEQ1Md+Ws/wA8N+0jZOOCSDZH2pUQCmHiUmqsdL9cb+yUYWCIgDdHb4944N0LOwA9wwy81/b5yLMf5aJjkMxFJEjNDAssgj1QCmN9dVd4F6btsehGJucyeVg7qeRW5sLYmRy4KkBtR3IUPzoXXLGfbGJjl4plYPok1Bg2oFW2VgR7QuhYO1+eMu1aiTKyMu41JMvuk3PyVsY555TC5feqak3o6h4iHjDRLzh1pr8xYpgPUGwD0wr7K51pw0slanl3oUBUS6aHxxo7IZjVl0v+rkZPg+lgPd4nPwxq7KsUbMw9YpA6jqQrFD87THO+OY/uYxre9VOhk+uZYh/afVG/pJHurjyJ8J95bHP4kO97Vsff5e/Y/LF64REYps3F0DJMnuLE2PnX8OK1xvLhZJgPszkn/wAQEj87Hxx6PBdZWT1dVzznW0bIyBWF+ydm9x2OJ3B+Itks1HMASYXsgc2WiGA3HtITQ8yMKFbE7Mtao/UjSfeuw+akY9N9se4+o4ZQ6hlNqwBBHIgiwcGKf9EnFO/4eisbaAmI+4bp/cKj4HHmKy1fS7xc5fISlT4iulffIdA/LVjhMWfETtA1mJAi0DTAoL1qejhyaPXkeuOn/TVnAZcrAT4Wl1N+7Eob9dWOM5DKy5lwFVmZ3okA+01tXlfM16HBXQOD8Eg0SZiaSNPrKOgkc6EZGHiarGh9VXubANcyTyvM5ZlbSem3UX6i+h547twrsUkcaCWaV3VdI8QZUH3VDq3h9BQ9OuKzxbLRZSPOQyRRK4jGl0j3MckiK1Ek1zShXhtt7F4zMuzTz6GogMwWI3TLMR6a2Yn/ANOJK8VjgnzmY76OJzm443crrlESx790tHcsKvptjH6I1qbM/hgUflFt+uEeR4nGrOFykeYzU2cdY2nNxLqYKng2BN9T54BdPMJYp5QKEplcDy7x7A+Aww4anhb1c/kFX+WI7IRlWsANpNgcr1G69MTeGD9m3+0f9caInJDqRBufaNL7RJdUAF9brFj4JxG9K3bqnI85EW12r2pE0lSB7SKrDdaNfQEd2bICo7GudBmJAvazy39+NhOqpmjlB2YPExtauvFIx1NsW0qBQ3sXtxz8c8mOq3vV2Y8b4c0T/XMtR594lWrAjxWvIgjmOo3G+KpxfiDZhwzAeFdKgcgLJok2zc+ZJOL3w/iIZdWpSdOqRVoWtkd4Bfho+0n2T4haNYrfajggjPfxf0bbsB9k/wCF8/I+/HDw5cM+Gf8AytZTc3GOWyj5kDSrSiwt5mZu6UgDYRR1Q994k5jhkqZeRhKUKx6+6hRYl5aqYru407899sSuyeavL+sMlfwy7j4BhIf4sNu7tgp+0JIm+BYr/u9OM+fzZ452fE0uOEs2rnYzKROjuyKziVVLMAxplJFWLB2N+e3liTGWi4k8Z9nNKK/e00lHp+0Wtuj1iH2JJEU6nYq8J9xHfA4Ydu8rUazofHCwII50xH6MFPwOLndeey+rFk/hswkFsZB9uHS3vjlXT8w74jfVi2dlbWgEkUaaCaLEkuCOprR0G911xPEolBK7LOokX+Kiw+BpfgcVTtRme6zmWmH2Ajf2JDf5Y5ePG3Ph9SxrLqbN+McKy0hXMzOVFAG2C6gL2qixa79nfkMaeyU4MK8x3crxkHmFkOpL+LH5YY5+FRq8IJhd9B5lQylgR69MRDxCM5s5aipeMLqNbyA6otO/3WZAT1YDphhu4XxrZJeSpf8AQUzNIqgAJI4AY0DRs6dt9qJOw5YsuRHfZJU5FopIT5h01D5gBNsMppJKcEgArYABDLIG33rdGFnfkQPMgQYZ0jM9uiBZ1Y62AALxx6x5805DreOl8lz6+u046IuxMxPfReaq49Cp0f8ADIT8MZ53PfVs+JqJV1VmA5sjgowHrtY9QMR+Gju8y8mWV8xFUgJQFR41IILMKGknmfIY947mo5tJkeGIICAsRM0pvmCQRHz6ahWPRw3nMvixy3/HS7jLqV71ShQrXe2Aui9VEk7Ub23K7irG9RzoiYmbv1IzLFHjqmjUg6ZOZ9llU7gbE4hxZfSoK5dgl+3m5NEd+kYKhj8W+OF+eNud0N8zGCE5dAVH6Yvj8Mxtu0yz3NMO6KuUcUykqR6g0fh+uGWYypjE0LUWiYXXLY6TXpRB+GHsX1WCZMxmrkkMcLJCgBNiNRrksgAEiwt2avCNcy800jObaXXfvYE+u3LrjptmdVevoPz+nMzw2aljVwOgMTEEj3hxf7o8sGKz9G2ZMfEsq10GZkb1EkbgD+3pPwwY0ylfTDmb4gP9VlpWr1fV/iMPOxeTsI7Cu4ijhQAUpfux3kgH3tJWPUd9m5XWKh9LL/8AaGZPlloh83TF04Dm/q+VhiBV3KRlFOzM0zA+I3egar1ehHljGXpuLSE2PkOZ6D1+WOcfTHEPq8U6G9VxlhyK+0Pz/TDjtC87xSLIVdFyoZiE8JlLgkKtnSREOm41X1wh43l2fgNsPZkLL+7rYD8zeMQZ/RO37bODr3f6d1hRwHjOahJjymUWWT6xIzsI9UpTUCUDb6FNVddcTfonmH1ycffgYj/yo3/ljLh3E4MuuajmzUuWCZ0yEQqS8y0KSxyAIJ323x0ZInYtlXOnSTGTp8jZNfyxJ4M1iUeUp/vKpx5Dm1nDyAUJmlIHlrdnr4csaeASeJ16skb/ACXSfzGNQOC+lY2q61qR5g8x8QT7sTuF5XXWli0Sciy0yuwNolNRoG9VHnsATiBKLi9z/wDEv/8AOLLC3dRJQHgg7yvNmUyG/wAh7gMefzZ3HHr264zdEfB44yrKoRwQUZSQwPQ7k38bB3GM3KrzA7pyA69EJB6H7B3oeQZfs2U3Bc+GikE04LMwYCQ8rNuyE7WeWkVyBAO1SMtxVJc2sS2Y5EaNi22pvbUgeQYAb70W5Xjy3weS5WW7/Lczx00cEyfc5mfLfZliJT10nV8wusfC+uGzy+Ev90xS/Bhof5Ki/PEP+sycp9pJu7Y+ayaoj+YB+eJSx+FlINVKh86LhhVmtmUL6eLDK8pMr9arUmtyFPDo+7nz6+QVx/ESbHxevhh1nMushcEHS6lZPLfYEe4X88QX0iZgzKH+rVLZCi+8iZParcjvD7ip640PxiMs0as+YtE8MA16HQv4rNDcMNxfsDFyxyzuN/CSybjT2amb6sUf28rIQ1fccm/gDrPxXCrt4vjhI6iQX02ZT/PErM58pLJIogyxkULIsjd87AEEEogIU7DmN6xCkmbM0xXMZrTdE1DCL50FuuXVlOPRj47+5M2LlOPE/Xi8CpG0k8YLRRalBDNrVQOQB399b4SdpI+/MciRvEEFGWYrEhHMUGazR6gk78sRmzfdjeeDL+mWXXJ7tYPP/wAXGJyo/pPq7n/W5yTSnvq1v3am9xxvHwzHLklzuU0Z/wDWSQqIzmDM9f8A08Vyn3yuLv1VCfXCl0KGzFBBe4bMN3sxJ5kK1nf/AGY95w74fwLMyqWknTL5RaJkQd2jDb2QApbyttji0ZbhGWyYmWBAJo4Y5u+cB2KSOVLqDtahSa92Nbk9GvuqfDwDMZkamXMTqPtysMvlxy5BrahfQL8MPMn2IzCqG7+GEVt9Wj1OQeX7V21fEHFi4nlwZp4JXUzy5JVTdiNY70OVQ7KpKo2/UYYdm5VfLgr7OpiBVALIBKoA6ALIB8MTdTpx/tBwsZbM6JGeRSA2on9owPPcg7g354YZfh+QUCY5h5EFWjIQQ3RXCXd+QKht9xviy/SFw5WEUp5RyAP+45APyNfM4quWz2omGQW7SFCNKhUTcEAiiQOYFbFQ3PHT4YePxRWd3jjAu2eSZVkkYmhstaEHJQo/tGsZ5cI5WRVVWR0DhBSMrkgELZ0sDsQNjYOE+SmC811KwphdWDR2PQggEH0wxy86LSRB/E6FmfTdKbAAHqbJ9BsMLOiV52dkKZzLkdJ4h/vVGPMHC/8AvkP/AOTF/wDvXBipfaZ9LCf9o5gHrloz/ZaM/wAsWz/oeOKdcwZDUfcuqUfCoVSxB3tRZ8NbDfYDCL6ZMtXEV/1uWkX4oG/mMOR3GbjyTSSmPvoWVLAK97GKs3uRp1A1sdhd8sZLEjj/AHo1gqBlmysutvDXfKQnMHctFpIHkFrkcJlzTy8Hzkb79wqhNqIUqr0fVWDCunLpjVwvKS5V5I5YpDemy16303rdatQCxQAAklbvdwMWLPxseH5yRkCGVLAB1AiNAmrkPaOpthyPrjF6WOe/RjmQvEMsTykRUP8AEGiP6jEHt9lNGazK/eCSV7jTYU8AzRjaGQc45CP0kX+8D+WLx9LeXH1mOZfYnRhfpINY/wCL8sdWFX7MzfsR+Fz8jR/QnEnJHRmB6l4z8w6/8dYVdl5P6SI9Rfy8J/XDHiV+GTrQY+hQ6X/I3/DjQs0K2JF81v4odX6Xh6JLSGTmrRiNvRo6Sj79vg64QZaX2JB1on9GH6jEjJ53uGeNxriY+Jdr8g63tq0nrsQaPpw8vj5TTthlrsoz3D3hJG5Ucm6V6+Ted4l9mIis8cxB0RkknoTpNAeZuth0snFky8YfeOUOvQglXHoynxfPb1bniNnZYYfFJJqYDZVOpz6Doo9Sa9+Of73k1x121PHhve+kDjV/VwhrU8igWQBe7tuaAA23Ne0MR143Ki02cBqv6KMSSUBQ/aNpU0NrtvTCri3EWmYMRpVRSKOSjrv1J6n3dAMS+z3AJM09KNhuTyAG4smjQvbYEkggDYlevj8cxw1kxnlyy3EGTORgkrCGYm9c7GQm+teFSfeGx4eIM/hmeQoOUcZVFv3AaR79JOOkR9l8nlkDTMfeSVBrnSimI/eY/oMSV4DkJvCigk/dd73F7AkqT15HGuTOnOshC+qMRRZeHWQEaYiR2JNClbUfisYHriTxPikeYTYpmSkauxaLu1IsB1UCmUrYYMtWLBFjDXtB2HaH9tl2JCnV5Otb360d7AFfdqyKhPnHbWojjRnI1lFIZ97o+IqAWo0gUEgc8amqiZm3kiELQJ3STKTGQg700xVh3lamIPIrp2K7A4tnZzsd3YXMZwGSVjUUbkt4tJZQ7G9zXXbcczthl2H7L9zpkzFtMoOhCbWENRoDlrPM1y994l8VBjzUrlidopK9ImjlA+HdTn17w4xldtz+Jhx3MRtkmkoGokzCJQLVGySCh5A0L5D0wkyeWaTMxtotDk/qrxNzI7zMJpcgkHxKosE+0TeHEOegiysqykxrGZMuzFCNegugVLH7SkrcWBdeeOf8V7ayFRBkw0aVp1E6ppNybZudkkmh1JxIa+VwjnXLHLvJIsTqsqvC1yy6JJEkEYIYi1KkAktQPIm8QMn2ljyyd1BDLJyOuZwDsoUClBoBQAB6YqPD8tpt3NueZ8vMe/1xM+tqtlmoY5ZZ96jvj4prdTe0PaJ5IXWSOIK4K14id/Ilhy536Yp5zsjDTfMab0jWRy06q1EVtV+nLDKLh2Yz0lxxto5AnZQPUnri6cH7Pw5LUW0zZtE1iOyABvuNjvsx5XStQOO2OWp+XHLHv8FXBOxw7pjmBTuNh1j63+9/LbqcVdMq0c4jb2lcA/P+fPHZ5oxVjcEWD5g7g+44572xy4XNRydSjMw/2Y8J+PL4YTL2zrtXuBePN5euZzER/wB8p/TBiV2Ai18RyaDrJf8A5aNJ+i4Mbc1x+nOEJJlJyNlkKk/her/MnFf+iziPgkyjbyRHa+ZCsTsD907gKLJs/ZBx0L6auEd/w9yBZSm+RH+P5Y4z2OlZ85pRtD5hFkjkABKPCCzXbDwkLICPVTRrEsajsOcJSM6wCrcwLFN5bNdnntZ5jxbYW9s81XDJWrd0RVHLdiNt+QoHnW2DIdsIt0zStl51A1xlWcbi7AUFqI9CPXpim/SR2ujlWOOJNcSuC1gqr1vpNboCtqBYamY0PDfPXaqbxzh/1fN5iBV0gU6LzrSA4F2bpSy3Z5YuXGqznBIJgSWyx7tq51H7P+7cH4YoXGO0k2amSaXTqjGlQihQFDFgm3MCyou9tsX76NArDNZFvYnXVGPPwFkI/ejLr7wMdma51lJ+7mV+jEX7m2P54sk4uwdwPHXmp8Lj9T8Riu8WyLRO8Te1GxB93n+h+OH8U1wRzj7Phf3geMfFace4YIYdnp7RoibMZPvobf4N/Fhhmhaq3UeE+8bj8tv4cIC3cTI49h6H66fmtr6lMWMVyJ8LgC/LqrfP8icStY/TGPLBqFJp0qTY8Tm/HpbmGXoo9NjeNK5AItOpklJ0iINpAYLqbUwNnStWAQATVmjp0EsjEbgg+IXV6TyPnib3zRlyEMkcrNoYAc5bBFlWAYg6SpHMAiueBsumjt1QxLEVFNp1G+bavEx+yfOiAMdL4QuiIQwoLUjvZGrQrEChqrcgUoC2x2NDVrxR+GxE5pUkUx6CsZWizIFZVI23Jq787Pux1LJaaDatYJOhtq3JJQCqRhe4q2u+ewzle1iv9oniy6qZnoOGUigHnCrqKk7lK2K0Swo2SzbKMvwozqMznG7mBfFFDF4SNI2NqdQIA2o7e84WfTVEe+yVraBJCAbq9cYPLSeRXkfLFmyvCn4j3cs47vKqoKIrAs/hpga9ldXn4vQc8Z0HfAeIieISKxNMy6idyFZgpNECyB8d8Uftvws5WaPNwDTbXtVKwN0N+R5jy8XQDFo4dmYvrEwywqOJxG6gUmogEqABYGqt/vN5WDu7VQLNk5gd6Gv1BXc9T9kkbbEGxYwitnZ7PiVFkHJxfrdm7/T4Yw7SiKJxmZ2HdiMx90B45WqQKoN7DTI9/A2AMVb6P84Ey8hkahE+/uYDlXM6tq8ziPxjNvmXMjbbUq3si+V9TtbHqfQDGcrxbww5Kr2p7RTZuQtISANlQeyg8h/j1xI7IRxPIUfVqYeEqQDt7Q3B5j9K640cSyN2VViQavkD8OfuO3urCzKu0bgiwVO3mCD/AI46yzKMZbmTrWV7J5Y1YkP8ZH6AY25jhmWy8gSPJxsxjZkZ2LEsoNKQ17XpBN/aXbG/sznO+iWQCgR8AftL8DfwrE7iDwCWCWSRB3Rcm5Kq1BB0g+I6gu1Hz6Y56a5ZfZVmO0XdhC2kKQsiadlYI4jmSvLQyyr13r7O+J1x94KbXlJCYjWpngJVlAAstoLIORJSxzY4W5ni2QjRUeXvtEhdBGh2AUKqlm6+FSTXMeuFXEe3z1py6CHYDVeqSlAUeI8tgBtjUn0z/qzcW4tFw2N0UKSx1RRWe8UuNTd6eiqbAHOqGwGOb5jPPJ3ssjanelv3myB5AKOXriFNMXJZiSSbJO5ONuZWgidQNTe9uXyUD541rSb+Vy+hvI95xESEWIYnYHyLUg/JmGDFo+g7humLMZg/1jrGv7sQJ/4nI/hGPcaYdB4xlBLC6NyZSD8RR/LHyfxnLPlnkjBZHy8h0sCQwVzRojybb4nH17jg300cDEGYTM0e7e45Pcw5/mD778sRY5Hw3N9zKkmhH0MG0yLqQ194bWPTHS+0PHIszwqdoPBqkiM0S2dLs9+L2V0kKtOFokFSL8WKdDwCmbv5Y10GjbfLlZNjfSvmLIxn9eysIIjjaZjszOSkdA2KjU7gHcajzAPPF9oUcM4JPPZjjJUe05pUX3s1DFm4XKmWCyrmVkzGWoqIwStB1It2oFVNja9nHQYRZrNtMqxl2Cp7CE2o9w/xxDy8rRuCRdc1P2gdmU+hBIv1wpHRPpK4ejmHiEQ/ZTKCw8tV7H3HUnwXzGGmR7ORnLxmKgZctG7py1aUQd6or2rYBq2Ng+E2MauxefTNQvwyU2rpqyzHmRVaf3qG34osJeGcelyRfJ5kF4l1IB1RSGtkqiym9RQkdaIO+IIC5axJlX2ZAWjP4OYI/cIHwB88TeCZnWhjf20sEe49PTqPQjEdJ2zUCZhP+85YjUPvUP0cfnePM1Q0ZyH2SPGPIDz9U3B/CfTFIcZiPUur7S0G9RyDfDYH4HriAGZbKkqTz0kgn0NYZQTWA6eXw9VPmOmI+dgA8S7o3L0PVT6jz6jfEnTd7HAcx3cyMehBPnsQf5Y7CIAb0kWRVkagR0DgsdY+RF7Hc3xKJtJsbHzx1XsfxcTwhL8aDl5qPLz07KfTSeuM5z5IXtwnK5yWeKRG1KEMq6g3dspOhonoN4wxu9iFr7JGMeM8LiTLR5WXOGLQ+pmVG0yI77a1B0r4iAHY7UBuDReZXILDPK555og6uvgU0hFbUCxB3ve6reXm8mkjBmXxKGCsCQwDe0tg3pO1qdjQ22xnZovy8q62Eal0bvHkavEe8qgVq3pRpF+IqCB6wOI5gRidQdUbwubBvcgjzo7kWQdjTf1j1YEhVECqCAtAbk0LG2+9friq/SJnVjhABXXLXP2wEJojy3J99HCDn3D8xRZNVKzBiLAFi9JJ9xPpvh3w3i0CZiJHAcat9/Dq+yD0I1bnyoXteFUcHeJBenSFkVQWWNdfeEhWcjawQQT5ECsLuIZHuy7BhSyKtX+0GpS4JA8qonzxcsJbtqZ2TS+9o5FnmcqgUKxQnctJptWsXQprA2JNHejWOe8TUCaSujf/AD+d4cZztPLIo8IWT7bjfUaonSRSsTzI2J6YQlcPHhcbbTPPGySMxmCBVmvK9vljDvD0GGGS4JNKV0oacMUZjpU6OdE7envw04V2ZSSRo3kNqEYaQRtIjML1CxTBVIrctjpbGO1YJJONkMRJoCyeQ6n3YtPEuG5SOCVkK6mI0LqDMhpWUCiTftBjdbiwKACzhWVcI2YjddUJDaCLJHnR2I6V15c6ttNNGWiQjxAjSSXN7aRtprzvbEaWRmZnIJJJNDck+QH5AYZ8ezpkdtQAdzqkrkDQpfXSNyepPph99FvZ85rOLIw/ZZciR9ti2/dr79Q1/wAIHXEk+Vyvw7H2R4OMnk4cv1RfH6uxLOfixOPcN8GKyMV7tzwFM7lZIm6jY+R6H4H8icWHHjKCCCLB54D484pk3S1lFSwHu5AedDZG/l8sLyOVY7J9MnZzuWGdVbG0c/4lbZWPr9knz38scjmg0MV1GqtWH2lPI/yPqCOmEVFxJScNs49x648WJfM/LGxIVBB3+X/PFZMeDTNGyhG8SsHhbkQ4rw+mqhX4gvmcXbtdlV4nlF4jAtTR+HMIOYIGo0OfXUP4h0xTez/BVnkCa2XmSa6CuXW8X/h+ejyL61XatM4JAEqnctv9q7YMOTc9mxlXN+FZ1oJBKg25Mvmp5j+Y9Ri0roiIkQ3lcxRO39G5+1XkTsR0Pvxv7edmBARm4PHlpBZr7IYmz6C+f3T6EYmdkuEh4WAIeKToehre8UJxGcpJpI/YyHw9dJ5gf+3zG3NRidI4XpqVq1C+Y6EHz6g4kPle5vLzDVC2yMeYHRSfTo38xuqngbLMEkJaJidD/nR/F5jrzHUYXtZXuZhqiDan2W/kfIjy+WMuHcReBw6EhgbHQ3v6Hz/Mg2CQdkZKXyZW5j7LDp/yIxrnyoILJuo3I+0vv8x+IfGsTfxW9fS+ZHtfHKiiQaXVlPhGx3pvDzHhLezq3rlyxYl4xlqszx/FqPyO/wCWOKm8enMtVWa9+JwibdQ4120y8SkRgyty3BVR86ZvgAD94Y5hxjiTzuXkYknr8AOQodANqGwxGYnGIXGpjpNm8FRxyL3jKRVlSLBFAnTYtdwN+dKRXLCrNSLp0LZ8WpmYbsdwBVnYWeZskn0x5JOxGktY28unKzzNdL5Y14Is/B+zkRhTMSMXQ0zKDpCqHVZLO5JAJbahSncdNvDuJwZWMhlXvlkoNH4tcepdQ1dDp1Ld37PqcVN3JABJIHIdB7hyGPKvE0uzKLjLRRpHEKEb61ZzqJuPu2Qr7Og2TVb7dd8Qs3xCaX+kkZhVUaAr3AUf/jGru8T8plUGhpv6OQOFZT7LDa2A3OkkMV6gjF6ie0OKNjQo+LltVj0vmMNs7mFJWbuwkhUaVG4sCu8qqUVsF898EuYIiiSYKxjvu1rej9/8O2wqztfLCySQsSzGydyf88hjPtr+rZk8o8sixxjXI50qvmT/AJsnpuemPovsj2fTI5ZIVNt7Uj/ec8z7ugHQAYqP0T9kjCn1yZakkH7JT9lD9r0Zx8lrkSRjpGNMDBgwYAwYMGAXce4THmoXhkFq6kH4/wCfyx8zdouy82VmOTkUllt4Hq9S8yD0AI39G/ex9VYRdrOzEGfhMc0YbyP2gfNT0P8A8Yg+XH4c66S/hDC1sEkiyNq25gjcjljdlsiSwRIXlZvZF8+uypZP9rFz4vwSXJMsGZOqINeVzOkEKw5K4O17AFTswA5EKcapuGGXMB4dUcupWkjB3UkgGSE3bxXvfNL3rkLtKk5bgLxZZRLqEjanjgy5096oUWjMLOtTZoGzZG5Axhw3stmHYORHlVPRRqlYeTM1k2NiCcTG4ouakeMgRtbEKraC7g0jwmqjnUDkTpeyKJoix8BzDvaSsGI5SVp1EbEOpNxzKeanY89t8CVt4XlBl4zENckDe2jnWwJ21pfM1sVOzDbnzrWf4NLwyT6zlf2uUfd0G+kE8166Ry8xyPLF3MJHT/PkfI+mMYpzG1Aakbd0JAH7yk8mr4EbHzEUnqHOw6kIII/yD5Yreay5jBilGuM7b/kD/IjDjO9nniJzfDWDxk/tIL68yF8j+A+9Tgz/ABvKZiIaY5BNbLoVCZVsWFYE6ZFDbFTuQQRpIstimyI0BrxPFz/Gt9fUevLzo2TuA5PG1+TDn/iPdib9WkVU7+B4C5OhJNrI5923MH0aj78L8xkmjYvEa8xpsH99Bv8AxL8sVdsm0t7Q0H7wHhPvXp/D8sRp8oyjVQK/eXdfn0+OJEc6vVjSTy3tD+6w2PuNHGt3KG1JU+nPE7+Gty+0doAzokbatWkWRQDMar542z8JmWQwlCZFFlV8Rrz2+Hzxkmb3DFFJBB1L4Gscja7X8MTMpxbRMZ1dxKwIZnVXuwBvRXoB8sTdNT4JGgaidJobE0aFeZ5DGEMTMaVSx50ASaHM7dB54c5fOiOCXLrKumUjUWV9WxHUbb8jjVw+ZIXDrIh8JUgrIQwYUb5Xz5XWww5HEuOVbQJKOgmg3S6Jr5A4nf8AROlpo5WCPFG0gHMPpXVQO3Mb/PGQzCCHuS7umrXQVRvVe0STVdKxqzHELOrSC33pCXbblz2Hy2w3aaiXkn7topolApCswYsqknUCdX4lI9jcEcsQzmVTaPc2SCfZUn7ik+VDUd6AxFlmZzbEsfX+Xljbk8i8h8I26k7KPecNfacvprJJNncn5kn9Ti/fRt2IOZdc1OtZdTaKRvMR6f6MHe/tEfd9pt2I+jgbTZsWvNYiKJvq46D8HM9fu46kigAACgNgB0xpl7gwYMAYMGDAGDBgwBgwYMAt41weLMxtHIisrimVhs3v8iOhG4/LHI+N9nMxw1g4WSfKIwZGX/vGXrluPaQDa/LY2NsduxrmiDCj/wA8TQ+euJCKUGdKOqyskf8ARsSb/aD+pk9fZJ8idn/YeXMGVkzCi1Rf2pIJZDsgJBKyrzKtZPPfFj7R/Rypdpso3cStd6RcMnU95GOV/eX5DFLzudzGVj+rTxDLobF231V728Ey7xHyHIfdOH+ppfM7no4wK8Z2CqCCxNHZSdtVWdDEdSNt8ULtN2haSMsgIWwCUPs8vb21KSOhoeTEDfQZn2D3LG1eGRlV2A3VRLZgzK3dLIA3WuuMnzUMwVi2lz4VPjWbc0AlgyMtkf6ZBXsgbCqr+V7VZnJSgjVGxHiDKdLr01o1al/EKPri85DiWQ4qVbX9UzoqnVgAx5imNa/RXphvV4reeyFlvYkIrxlELpRBABa4lO1VqTr+zPRPxjh0TOxKPFIzDSwIBtqLApoRSoG/hFm7JoXiVV84lw6aFyc3loXB2bNxZZZpN73ZGFi+ux8ycKxwvu8v3sGbOc5aI9K96BdEF1chK6ar5UB5L+z/AG0z2TfuVkjzsQbSscjVKQADqQgnSu/3iNjiy5fj/B84wdxJkJ7/AKQeAEqf9KlowvzrE7grGaiXbvVkyzyLdSAIWG4sg2j/AMXyxHlyMi+yAy/gNf3WOn+y492OizcGzxUtFmIuIwsN1aTQzA+bxeE/LFPzuQRCUlyGaySgbPl1Z1u+oDUfip9wxdmldllVfb8B/GCn/EAPkTjLTYsb+o3H5YahYyGEeeIIrbNZdwpHwVd/4TiFJwKN9+84cfxI00Tf2RGT8cNwQSh8j8sY6T5H5Yk/9WHJ8DAj/VzZhv0gOGvDewGZkP8ARED70jzaf73dn8sXcCLS1WRQ822HzNYm5PhEkm4Hh+99n+0aX88dL4B9GKIQ8jLqH+hjUf35NbfIjF24d2bhioqg1D7Rt5P7b2R7hWJscr4H2CZipcGjy2Iv3Aiz8BX4hjp3AuysOX0sVDMPZsbL7h5+u59cPIoVXkNzzPU+88zjZggwYMGKDBgwYAwYMGAMGDBgDBgwYAwYMGAMQ87w2OUEMopva2BB94IKn4g4mYMBz3iP0ZRWWyzNBfNYiO7b3wuDGfgV+GK5nex2djUoY4pougXVFX8DrJAD6rpx2XBiaHBpchKhBaDOJp5Uomj38tLyMNvuhf8AGKUs7sRtVGHMJvdlm1IdR6X5Y71N7WMRgr59bhWqqHL7iZiiT+BIK/ludsMst2Onk0lY5aGygRFVUbigsojA+Ax3UY3DEHH+CfRfOjBu9aEeauQ4r93YfPHROF9nmiWmzeZk/fdT/wCi/wA8PMGLo2hf9Gp1394U/wAserw5By2/hT/24mYMXSNK5VR5/wCfdjNYwOQGM8GGgYMGDAGDBgwBgwYMAYMGDAGDBgwH/9k="},
-            {"id": 8, "categoryId": 2, "name": "Pomada Brillo Medio", "brand": "Suavecito", "description": "Pomada soluble en agua, acabado con brillo medio y fijación duradera.", "price": 11.99, "stock": 22, "imageUrl": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wCEAAkGBwgHBhMSBxMWFhUXGBUYGBYXFyAYGRkYIBsYGSIdHxokHyggGx0mHRcXITIjJS8rLi4uGh8zOD8sNygtLisBCgoKDg0OGxAQFTclHx8rKysyKys3LjAtLS41LTIrMi8wLTItMjcwLTcuKy03LjctLTcwNy03Ny03LS0tKysxN//AABEIAOEA4QMBIgACEQEDEQH/xAAcAAEAAgMBAQEAAAAAAAAAAAAABgcEBQgDAgH/xABHEAACAQIDBQQECQkGBwAAAAAAAQIDEQQFIQYHEjFBEyJRYXFyc7ImMjZSYoGCkaEIFBYjQrGz0fAkMzWDweEVFzSSk6LS/8QAGQEBAAMBAQAAAAAAAAAAAAAAAAIDBAEF/8QAKREBAAICAAQEBgMAAAAAAAAAAAECAxEEITFBElFx8BMUgZGh0SIyYf/aAAwDAQACEQMRAD8AvEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEM2z2/wmQVJUcAlWxCV5Jy4adGPzqs/wBlfR+M/rRQm1m3mfZ3i5Kri5yp9I0k6NP6o34mvW1A6peIoKdnKN/C6v8AcepxLOV53d7+N7u/pJbspvI2k2arrsa0q1K+tGq3OLX0ZPvQfhbTyYHVoK1zjeVkucbH1XlFd08ROk+FWkpU525OSVk1ryZRdXbDaSr8bG1n9t/zOjr4Fdbks7zTNtnKsc5m5zpVFFSbu+BwjNXfXmyxTgAAAAAAAAAAAAAAAAAAAAAAAAAAAQneZtl+jOAjSwWuIqp8Fv2IrnN+HgvO/gTY523qYjFUcfipZjBOrPEqCjLVLDwhenZfNd3JtftN9UBBtoc0xeIpQpVZNrWpPxnUlJu8vFpNJX5Gk1M6koZjmUI1ZRpRbhBzabhTjpG7tq7LVl6Z7u62ZyHYlTwlONWoqmGbxE3xOalWppta8Ki4tqy0s+vMDnu7YV0i/tzezmR5rlmKlmWFoVXHEcMXOnGVoqnTdldaK7b+snGO3dbHY2k41cDRXnTj2b++FmByvhcZKOGqRT+Omn5+fpN9ku7Pa3OsFCtgcPenNKUZupBJp9bcV/wLB203IOjRlV2SnKVrt0KjV36k9Lvyl956bkNtoYC+VZ3enKMpdi5920m+9Sd+UuK7V/FrwuEy3Q7HY3Y/IqkMyce0qTU3GLvw2VufK/oJ4AAAAAAAAAAAAAAAAAAAAAAAAAAAAAhu8XYHA7ZYPi0hiYK1Op0a58E11hdvzV211vMgBx5meDr5Xj6lHHUuyqU21KHn5eKfNPwsSLAZ5jsNktGjUrdph6M6eI7OTtaUb2gpfNu+Lh5JpPQtPfXsXHOcpeNy9JV6Ee9yXaUebTfK8dZJ+lFI5ZgsBPFp4qbdOCbrRtLTuytolr3kjonv5PWPnhtoKtGTbWIo9rbopQnKOq8Wr/gX+cxbpNocryHaCGIzeThTjRnRvwubc5TlNd2Kbtwt6nSOU5ngs4wEa2WzU6cr2krrk7NNPVNNWszgzCrt7W7FbRp4vIkliku9D4qrJcteSqLkm+eifRlogCm92e9CVFrAbaOVOrB8Ea1TS76Qq31jL6T0fXXV3GmpK8SJ7cbvsl2wpXxceCslaNaHxvRJcpx8n9ViDZJS243c4pUsY1iMCr2laU4wXTWKc6XhqpR/eBcwMDIszhnOUUsRThOCqR4uCatKPSzXpXPrzM8AAAAAAAAAAAAAAAAAAAAAAAAAAAKn3+43F4fKqUcPUnGMlUclGTSlbh5258395W+DowluvlOy4+93uT0nb9xP/wAoV/2Kh6tX98Cv8LUit1kk7X738SwESyypBZdiVNXbjTt3U7d+N9ecdG+Rbn5PFaqsZWg5S4XBvhu7X4oq9uV9WVRkOFeIy7GO9lGkna9k3xx5+Olyz/yfHbNZedOa/wDZP/QC+gAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACsd7e1ua5JiYUcpqdnenxykknLVySWqdvi/iWcUbvx+UcfYQ96oBAVm+YZ7i759VqV0uSnJtL0Lkj9zSGCjQ4cPBRX9eZ6bCVatLOr0KdOrLhqNQqK8XaLl99otL0kmxe3+Ipf3WEwq/wAt/wD0BENn8pweKxCVdXi+ibRuczwkcixSqbPzq0XbnGpKL81dPl5Ew2RzTD7ZV3RxuHpU6yTlSqUo8OsdeFq7uredtH1syN7WVpVtZpJ+St5ATPddtZnGNzWFHM60qsZqSXHZtNRcr8Vr9La+JbhQm6p/CfD+mf8ADmX2AAAAAAAAAAAAAAAAAAAAAAAAAAAAAACjt+PygXsYe9ULxKP34/KBexh71QCDbvX8JIerW/hTN1htm8qxmVU6uIx1OMpLWnemnDyfHViRbZjF1sBmkamGlGMo8VnK1tYtWd9NU2tSZYjaHERm1QnQ8rUKenL6Hetd8rXsBINk8twuzuCq4jJnLE1FFxU4ypONNPnK0Kkn/tf0kR2m0pkp3arFVdofznEKMYdnU7dxio0+TtySi23aVultSM7V8LvwcunoA2e6uXwpw3rT/hzL+Oft1r+FeF9af8OZ0CAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACj9+P+Pr2MPeqF4FH78v8fj7CHvVAK22YzPE5Tmaq4O3Gr24ldaq3IluM3j7R013ZwX2EQzJcLWxOKSpLm7Xeiv6fv0N/h8oWIxce3cZQ4ktG7Sv2iXg7cVPX0llMVrzGoZ83E48UTNp6dm2we1eeZ/NU8XNyTa7kIpXfnZXfo5HrtBl9fEtJK143TfX+v5nps7QoYbMKfBFU1Tr95u8bx4FPrq4cUXa/Sx9Z/mFSlRVOn3+7JNr0VLuLtflL8PMt+FWttXln+ayZaTOKO3f69e3Y3b0+x2zw8VyU5Wb6rs5tP61Zl/lCbvO3lthhJ4ttylKb18Oznb8C+yi8atLZit4qRMzv08wAEVgAAAAAAAAAAAAAAAAAAAAAAAAAABS2+SNKe1UFWV12NPT/MmtfKzZdJSW+tcW1FNN2vSppvwTnUJU/tCGSN0nnpAqeJ7ByhiG1KNWFSnHhUdEuqXxVo/O/pPzMsZj8JQi6acIObnBuNndPiSv1Xev4as/cqyifC5OLvLt42lzUrXg2+V9Hr5ox88rdrRpKcryipRld3/abWvXRmm82iNzy8vf1efijHa0ViItz5/aekesfn/Uk2by6Dx9OGJc5w4HwzfxNI8VotO/CtdNHobvPamFoxpzhZU4ubs3qop1ErLq3xRT+yRXZbHOnGnDCrgs3KTvdyk1w35aKzaS8zYbWq1Neg58aKz/ABj3yS+TvkrrJbv+46dt799Gw3f1Kb2ywkaDvGM6ii/o2qNfg7F+nPO7FfC3C+vL3JnQxntbc7bqUilfDAACKYAAAAAAAAAAAAAAAAAAAAAAAAAABR2/G36Rx4tV2NPT7VQvEo3fj8ol7GHvVAK1w+OxWMxTTfDB91QS7tk7pLTpZanti8K5tJPmm+Un4eXmazL3P857l/GyJJisncnHhxNPW6vdq2qXXza/rlObb6qox+GNV5Q+9l6DjX1fh0fhfwN7tZhnwLXp81/yMLZzKKcK0X+c03dJu19HeKs79bO/1M9truNQXHfl1G48ktW11e27Tu7X4ZfTl7kjoY523ZP4X4X137kzokgmAAAAAAAAAAAAAAAAAAAAAAAAAAAAABRu/H5Rr2MPeqF5FGb8flGvY0/eqAVblMMVLF3wam3onwJvm7K9vF6Eixc8yko2w9ZrR/Gqu93G3X5zjbzsR7JsRPD49OM5QV9Wm9ba2dmnzX1cyRY3NafDanXmtJWkuO6bsvneV7rwQGZsziMTUrWhQm3dN9+o+ikuvzbW62sZ22dPFU4R/O1JaacV+np9JjbP5rSqYhS43d24l+sfS2rc9bJtLpY9dsa0qr+PKS6Xb8PNgfu7L5YYX137kjos5z3Yv4Y4X137kjowAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFF78X8JV7GHvTL0KK34/KZexh70wKnwi/Xaksx1XBacNOhdcSXdSV2rK/616a/VoajZ7Jcdj32uEimozS1dtVaXh4G5zTZjOMfXuoRTt87pzvy8/3FsYbzzirPfisNJ1a8RLM2ZqYOlVSgqTUdLySu7cMde/14G9NO/J9Vb62ucHL9Xa3ly+ryufWXbNZvPFucqdOPxVaDslZKPK3lf03Mva3Kcw7F1MSoxUYx0WnJKPK3PT94nDeOzkcZgnWrxzY27L5Y4X137sjo05w3ZfLHC+0fuyOjyppAAAAAAAAAAAAAAAAAAAAAAAAAAAAAApDfhha/6QxlbuyoxSfi1Kd1+K+9F3mPjsBhMwpcOOpwqR8JxUl+IHImAzvF5S3GnKUE3dpJPWyV9V4JGdPbTMF/dVpr7Mf5HSVfYPZTEP8AXYKi/sHh/wAuNjb/APQ0fuf8yyMt4jUWlTbhsNp3bHEz6Q5+wG3GIg/7TWn9UY/6I+892tjiKXBRqSmpLVdDoGO7zY+PLA0P+y59rYLZJcsDh/8AxoTlvPW0uRwuCJ3GOPtCkd1LnidssL2cXpKUn5RUZXb8jpI1+VZHlWT3/wCF0KdK/Nwgot+lrVmwK14AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAD/2Q=="},
-            {"id": 9, "categoryId": 6, "name": "Spray de Sal Marino (Texturizante)", "brand": "Batiste", "description": "Texturizante en spray para dar cuerpo y acabado despeinado natural.", "price": 9.20, "stock": 18, "imageUrl": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wCEAAkGBw0PDQ0NDRAPDw8NDQ4NDw0NDw8NDQ0NFREWFxURFRUYHSggGB8mHRUVIjEhJSkrLi4uFx8zODQsNygtLi0BCgoKDg0OGxAQGy0iICUtLS0tLSsrLystLSstLS01Ky0tLS0vLS0tLy8tKy0tLS8tLS0tLS0tLS0tLS0tLS0tLf/AABEIAOEA4QMBEQACEQEDEQH/xAAcAAEBAAIDAQEAAAAAAAAAAAAAAQMGAgUHBAj/xABCEAACAgECAwMIBgcIAgMAAAAAAQIDEQQSBSExBhNBBxQiUWFxobEyNEJzgZEkM3KDksHRI1JigrLC4fCi8RUlNf/EABoBAQACAwEAAAAAAAAAAAAAAAADBAECBQb/xAA3EQEAAgIABAIIAwcEAwAAAAAAAQIDEQQSITEFQRMiMjNRYYGRQnGhFKKxwdHh8CMkUpIVQ2L/2gAMAwEAAhEDEQA/APcQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAYpzaYHHvGA7xgO8YDvGA7xgXvGA3sBvYDewG9gN7Ab2A3sBvYDewG9gN7Ab2A3sCd4wHeMB3jAd4wHeMCxm8oDMAAAYLeoHEAAAAUAAAAUAAAAAAAABAAAABAAAABYdV7wPoAAAMFvUDiAAoAABQAAAAAAed+V7tLrdFDSU6K7zeV9euvnbGEJ2bdPSpRgt3JJt831A7byZcW1Or4dXZq7Xfa4VT72UIVyanDO1qKSeGpYeOmDA24yAAAAAAAIAAgACw6r3gfQAAAYbOoHEAAAoAAAAAAAADxry36uqet0tO706OH8QjKCUpSVt9SVUcJeOOvReOAO/wDI1rIeaR0+Wra9Lp90HGUWpQlYpdVzxuh+fvMD0cyIAAAAAAABAAABHqveB9AAABhs6gcQKAAAAAACgAAAD8++VC1y7Q6lLnsemh7v0eD/AJgbP5JZta2cX402fOL/AJAetgAAAABAAAAAAgFj1XvAzgAAGGzqwIAAAAAFAAAAABy8eSXV+CQH5k7ScVq1Oo7Ramco95ZPT16VOWJ7O/Sk4ePKEVnHgwNs8lvEK69Nwy1zipw12o0tmX6brty1u9iMD28yAAAAAAAIAAAALHqveBmAAAMVnUDiAAAUAAAAAKAA8u8p/ba/TamzhtcI91LTV2TtU3CyW9zTh0axiK/MDxzVaWu6WKkoSk8tz2zef2uTRgdzwXg/m+JWbNzX0q8bserLWfiB7T2B7QW6nOnsakqqd0ZP9ZylGOG88+vvA3IyAEAAAAACAAAFj1XvAzAAAGKfUDiBQAAAAAoAAAA8C8sj/wDurvZpNKumf7wGjU2YlnD/AIQNr01kZwg45forPJLDA37yXvGrmvXp7Ov7cH/IwPTTIAAAEAAAAACAWPVe8DMAAAYp9QOIFAAAKAAAAOF1sYRlObUYxWXJ9EgOoh2p0UuUba+X96yFb/JskrhyWjcVn7NeaHkXlpVXnNWtpnGyWoiq51xasUFXFYlujLlnPRrwMxhtM6np+fRnmh5/5zTCqFkVJ2ttShKT2peteil/5MnjgrT+Kv3hjmdpwnjVcpYtioRUc+j3rcv8K2Rl8UjFuDtX8VZ+pzPU/JpqaNstc5d19OiNNrjXJrk9+ZYb6+rwIZw3idaOaG9x7Q6TKTsjzePRlGfyHoMmt8snNHxdqmmk1zT5pro0RNgAAAAQAAAAI9UBmAAAMU+oEAAAKAAAAKB555ReL2Qt7jmq4xjLEftNrOX+Z1fDuEjL60oM2Tlec28VhLPKfP1qOPmerxcJNfg5d88S+SXCLb07IxqlD1u7TRa9jTkmvyJb5MFZ5LR+7M/yaV9J3if1dPqODVOTUlhp4e2XL4PBHfw7hcvWa/ybRxmSnR9Gl0VNeNsY5Xi/Sf5smx8HgxR6lYhBk4jJfvLv+CYssjFOnc3tirJ1Qk36luefyK/F1pWNzH6bS8PF582x2qVDr7xwXeScY7ZqWZKLlj8kzkTkpk3y+S/FLR3bz2K4lO1TqbzGEdyznKecYOHxmOtbbqt45nXVtJTSAEAAAIAAAI9UBmAAAMU+oEAAUAAAoAAB5h5VeGWStVqyozhFJxcXzisPMX/3mdnwqazOt6lXzzMRvTyW7Q2RUYuXRZxKtev2M9bjrM9Ytv6OXOSI7w5R0tm1y3x5NL6OPB+0k9aJ1tpN6fCXHubf70P4X/U31b5Neenwk7qz+9H+B/1GrfFjmp8P1fXwTTy890m6Sx5zTyUFz9Ne0rcVW3obdfKU+K9eaI03ftHTF26Dm3Kqy2csYzGuVbjl++SWPXh+pnn+Hxzy33LoWtqYbt5PNJKMbbWvRklBNvLbzn/vvORxvLFtQnx9YbiUkgAAgAABAAFj1QGUAAAxT6gQCgAAFAAAAGieVXHc0f5/X64nU8L94hz+y8fjNTU63JrbJzhJt8vBxy/Do/w9p7Cvq6mPq5No3M9H1UQsUcKWUpJ4UpJY2uPVR5dfiLcsy06vmlpp+LX8X/BPF4R8otHJ/aX4y/4MTkj5kVfbw3TOF1VjknsshPaubltnGWPhgrZ781JhNjjU7dt51KzVTjNSXod69ycW22ksexRwvzOdOOK49xPyW4tM2eq9hF+hy+9l/piea4z3i/j9lsRUbgAABAAACAWPVAZQAADHPqBAAACgAAACgaH5V/1FHvs+cDp+Ge9Q5uzxZwyrHy5SfU9jE65XMjrEvnSWPX+TJZR7SKNoYlzS/wDYau07N151mnikm3YlFcst4ZV4udYbTKTF1vDYtY88Qfs00V8U/wCZzKx/t/qtb/1Po9T7Cr9Df3sv9MTzfGe9X8fZsRVbgEAAAIAAAI9UBlAAAMc+oEAAUAAAoAABonlY+r0e+z5wOl4X71Dm7PJ+z9MbdbRVZFShZq9PXOLwlKEroxkuXrXI9VxVpphm0d9T/BzsMbtMS2PhyWrpeqso09uqqnxCrTUxprrr1NlddFldcq4JKxwjO1qPV7Unk52WZwXjHW0xWYrNp31je9zvy302mrq/rTHWNuEuHq+iuq3SVUcQ12l1c6q40rTzlbp5xnTJV4Xdd5Hv4PCSlsizb004rzat5tjpMb676Wjr189TqfkzyRaNTGpll1mljVXZ/wDG6OjV26bVQ4ba3plq2o10xzY6sdbLXcu8x0gllGtL2vaP2jJNYmOaOuu89t/KNdCYiI9Su/J2Wmpo0ut0lOmqpUNbxK6nUJxhc4RhVp1LTwm03FRsst5pp5iufIr2tfNivbJM7rWJjy7zPWY+cRB0peIr5y6CUm+IWeyqK8PVAva/28I//ZL1vsL9S/ey+UTzHGe9dHH7LYCq3AAEAAAIAALqgMoAABjn1AgACgAAFAoADRPKz9Wo98/9p0vC/eoc3svGa8f2vXovb1bPXz+FzaR0syaPULEa1T3ji1KPdu1WOUW5Sktr64XXHJRXqGTHHWZtqPnrTStp7afRvuVitnptS7YyhLvXPVRue2O1ve8tPLTz4ckR8uPk5YvGvh019m+7b3o0ls4PdVp9TGTjCE51WaiLm3tznb4S58s/a9wvWlo1a8a/KP8AOjETaO0M3DrYPUUQVTqdduMbptxeZbouMuj6L/KYy0/07Tzb3HwhrW3rRGtPtrknxC/n0Ul+TSK941ghLX3kvYewv1L97P5RPK8Z72XTx+y2EqtwCAAIAAgACrqBkAAAMcuoEAAUABQAFAAaL5WPqtP7U/8AadLwv3qHP7LzfsvwOGrdyn3vLU6WpyqX0KpwvcpPKa6whzfLn7T0PGcVbDy612mev5x/VRw05tw7Ls/2ZULuGamu2UZ6jRWaqWYxnGu19ytmOXLZqc9c8kVeK4+b0yUmsai0R9Ov84SY8MRMTEs+s17qv0sO/hLS6u65Kfmtitqvpl3DhsVvpRbwub6N/jHjwRfHaeX1qxHTfSYnr8Pg2tbVojfSXdXW3TdtMdVW5xt1Ojpzo5QT1NGncrlJq3EY7cJNJ8/BYRU5axEWmk61Ez63lM9PJvuZ6RL5tH2Ch57fOd1m6OprdbUYRjONkYycmufSUprCf2Se/i1vRVrFY7dfp/bSOvDRzTMy6DWVaePEZvTSnKudKsasw512uXpVyaWHjGfxL1LZLcPHpI67+8IfVjJ0l6t2F+or72fyiea4z3sujj9lsJVSAEAAQAAAgFXVAZAAADHLqBAKAAAUCgAAGieVr6rT+1P/AGnS8L96hz+y837L8bhpZXKzvds9RprJd3hxlVCF0Zways57yPLo9vuPQ8Zwts8VmuukT3+O40oYsnJM7bLou1/D01vlKCqcK6p93bOd1Xd0KU54zh7qVy9ST65OVfgM0x6sxO+/WOk7n+qaOIxtb4/xynUX8O1Ks9KmyxWw2yjCEI6tyrsUcbfSg03jn6PPmdTheFvix5KTHeOnX/57fSUGTLW1qzDutH2i4erNRa72u54hxPUU1qqc3q6dTTsioy+y93P0vAp5ODzzWteXvWsT17TEpYzU3PXzn67bFoO2mjlO1Jym46mc6tsJJ26duE1nOMelvWH6kUcnh2WIjt269fNLXiKTOmr8XjS9XGenTjWqFU3KMYzsnF5dkkvF5+COlhm8YdXnrtDaI59w9M7B/UV97P5I8/xnvZXsfstiKqQAAQABAAEAq6gZAAADhLqBxAoACgAKAAAaL5Wn+i0e2yfyR0vC/eoM/svGsrfZ1+z4nr6+zDlzvcu74S7Y6SzbQrYN2xcsN7XKEY56Y5LL/H358fl8Hy1vMc1eszPnHdpSl4jpG2W7Xwe/OhnmfnKTdXODsk9uMR6xbxz9XhyxDfwXjJiYrav/AG/sTMz+F91fE6u7ajobG3p6KlLuUt1kMuUs7Hzec+PTnkir4LxleWJmvTv6/wDZbplrH4f0YqZylZRu0sdKoxt5RTirHtgujiuiUfzOhw3h+TFl9JMxMRHlO+6KYm2WLa1EM2oxu/5OtHZN5vTuwT/QI/eWfM87xnvZXsfstiKqQAAAIBAAEAq6gZAAADhLqBxAoACgUAAAoGg+V1/oun+8n8kdPwr3soM/svJdHd3dkpuNdiaUXC1bo9evXk+XU9XavPWI3r8nLidTLZOB3VypmnGqv0lyVl0IyXLPRv1fE5/E0tF46zP2T45iYY5WRjPDnBbm1/8ApXxcVJZy+Xx9xtFZmO37sNJmIn+66e+GyG6yDcUlh8RtjJym08vauWN0s9cZfqFqTzTMR+7HkxzRrv8Aq+nR6iPnCgoU2PY2p+c3aiKfjzm1/ToaZMdvR73MfSI/gkpaObTjrp7p5xGOfsx+ivcYpGq6bzPV6b2B+oR+8s/Dmee4330ruP2WxlRIgAABAIAAAF1AyAAAHCXUDiBQAFAoAABQNB8rssabTv8Axz+UTpeGW1kmUOeN1eOvVw6c1z8UerplrLm2xy7zhMv7J+9vOFjoiDPPrtqR0fXqOBp2ZlN1xfJSt7uEZLP6xPOGmnlJc+T/ABhrxuq6jU/lv7E4Nz1Y9ZwHZCdtVm+uuLlJRjGc8RrblN7eSW5cufR+LXPfFxvNMVtGpn+rS2HUbiXzcDnm31ei+qXMm4n2WMXd2uq+kipTsnnu9M8n7XmL++n6+XJHneO98v4vZbKU0iAAAEAgAAAXUDIAAAcJdQIAAAUCoAAAoHnPlT1e6Vemx9CHeJv7Tk8NfA63hddW5lfPPTTyq1Qi3yw0+eIvPwR6iuohzbTMu84DQ7K5d3HdJbpPCw9qxz59SpxOSlb7lLjiZhxnZq65uEK2lCcsuyiLUZRUnL0pRxyUJeP2WZiOHvETM/af5NJ9JE6iHz6vValxlXYrIx+lNQqlCMlyabcVhrkmvAlx0wbi1Z/VHacnaWThMFG5xkpxkovMZRmn+KZrxFq2puJbYotFnb3VScova8POG1hPGM4z16roVa3rpYms7b95PtT6FtGPotW7vXnk18EcDj4nn5l3F2028opQAAAgEAAAC6gZAAADhLqBAAACgUAAAZA8n8q98Y6ytN4/sYdenWR3fCb1iJiVTiazPZqWmu03m1tds4VRU+/jao73nbtawubxiPJeE5vwwdnJN4vXJXr01/n+fBSrWJiaz0ZOD8Uorg9uqprk+azcqHKPVNb9r8CvxGXFeeqTHjvWHya3tC3JwerjKKcnh2wshukpbn4p53Sz72WcWLBreoQ39LvXV8643FR2+cR281hSilhttrl4ek+XtJuTF36I9ZO2p+ztOBarv7ZTjZ3jaw5JTtlnl4RTk/yKvE5cWOuon7JsWPJNtzDs6tRqaqrlqHKrv7ozVU3tcK4xajy6xznmnh8ua5kNvQ3mtqeUd/zSRGSNxbzbb5NblKeow8/2cef+Y4viNomY0u4ImI6t+TOYncgAACAQAAALqBkAAAOEuoHECgAKAAoEbAxysM6Hn/lK7L262K1OmadlcNs6Zfbis4cX6+fTxL3B5q0nlt90d428h230txlCT5+DTXwPS4L2rHbahkrWzZeD8VUdNtlJweZehv2/Ah4jc33ylI1XW2ta/W6d3TbpjLL+k4p5frzgsVz0rWImv6NJx3melmOu+l9NPD+Bf0JYzVn8LSaX/wCTueBaxwtWK3XDD+jmKzjlySIeItzV1FW+Oup6y7TVqepnCNMJN5xmXoLL9j5v8jm2raI3botVmvk9K7FcAloqpStlm21JOMfo1xXPHtZxeIyRe3RarGobVBldsyowKBAAEAAAC6gZAAADHLqBAKAAAUCgcJAfNbFmw+DV70vR6+BtVhpnGey3nEnZh1zk8uUNuJP1tM6fD8dfFGonp80F8Nbd3Q29h9ev1dtUvZOE638Gy/Xxj41QTwceUsK7IcYXSOlf76cfnA2/8vT/AIsfsfzfTR2Q4t9paSP76b+UDWfFqfA/Y/m7TS9i9S/1t1UfZXGc/i8EN/FY8qto4WPi2PhPAa9M1KOZTX254yvcvA52fir5e/ZZpjrXs2Gjn16lKUkPrrRqyyoCgQABAAAAuoGQAAAxy6gQCgAAFAAGgOEoAfPbRk2iWGLzY25hfNRzMaPNRzM6XzYcxpVpxzGl82McxpkrqwazLLNFGBzAAQCAAAEAq6gZAAADhJcwJhgMAXADADADAFAYAYAbQGAGAGAGAGAGAGAADAEwAwAwBMMBhgEgMgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAP/9k="},
-            {"id": 10, "categoryId": 4, "name": "Tónico Capilar Refrescante", "brand": "Reuzel", "description": "Tónico para cuero cabelludo que aporta frescor y ayuda al peinado.", "price": 13.00, "stock": 14, "imageUrl": "https://images.unsplash.com/photo-1512203492609-8f7f06f1f1c3?q=80&w=800"},
-            {"id": 11, "categoryId": 7, "name": "Kit Peine y Cepillo Profesional", "brand": "Kent", "description": "Set profesional: peine de madera y cepillo de cerdas naturales.", "price": 19.90, "stock": 10, "imageUrl": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wCEAAkGBxEREhUREBIVFRUVGBgYGBUXFRUYFxYYFhcXGhgXFhYYHSggGBonGxgXITEhJykrLi4uFx8zODMtNyktLisBCgoKBQUFDgUFDisZExkrKysrKysrKysrKysrKysrKysrKysrKysrKysrKysrKysrKysrKysrKysrKysrKysrK//AABEIAOEA4QMBIgACEQEDEQH/xAAcAAEAAgIDAQAAAAAAAAAAAAAAAQYFBwIDBAj/xABDEAABAwIEAwQGCAMIAgMBAAABAAIDBBEFEiExBkFREyJhcQcyQoGRoRQjUmJykrHBc4KyM0NjotHS4fAVUyQ08UT/xAAUAQEAAAAAAAAAAAAAAAAAAAAA/8QAFBEBAAAAAAAAAAAAAAAAAAAAAP/aAAwDAQACEQMRAD8A3iiIgIiICIiAiIgIiICIiAiIgIiICIiAiIgIiICIiAiIgIiICIiAiBEBERAREQEREBERAREQEREBERAREQEREBERAREQEREBERAREQQFKhSgIsbiePUtMbTzxxno5wv8N114fxNRVDgyGpie47NDxmPk06lBllBKlVjiPD4JXkzRRvNgLuZPe342AhBYn1MY3e0ebgFyZK13qkHyIP6LSfG+FUUVO+SKOFsgLcuSqmLhdwB+qfGL6X5+KpvCdHPWVLYIp2wuIJD3Egd0XsLa3QfUKLVmBYPxDHqytp5Gcs8jpQR5lhI+Kv2EGusBVin84nSf0ub+6DKoiq/GvG9PhjW9oHPkfq2NtgbfacTsEFoRa84d9LVHUOyTtdTuOxcQ5h83C2X3i3itgRyNcA5pBB1BBuCPAoOaIiAiIgIiICIiAiIgIiICIiAiIghSoUoPn7jkk1kubX652+ugewDfw0Vg4As2oj7rQb72F/jusBx461ZN4TOOn42n9lm+DSBUR6+0OY6hBuVV3FJQHOJcBrzlqovm0ZfgrEqxX1QBd9Y1up3qpovk5paEFA9KFfejLBKHZnt7oq+2211Y5ody3uqHwhRUUkjvp874Y8psWXvmFrXsDpvy5K4+lGp7WKKMTZ7vvYVEEwFmnXuNDxvudFWeF62ipjKaukNSMlra9w33vaw058kFy4X4Yw0kGlxmZrujXCF35XAEraWEYe+Id6qlnFtO07M+/M1oJ+K1RgWK8MyWD6N0Tvv9rI34tcfmFtDhxlCGn6Dky8wxx082k6IM0vmzjWvkxHFZewY6bK7JGxouS2LQ2HQkOd71vXjnGBR0M897EMLW/jf3W/M39y0DwTg1bJ2lVRTsjlhsWguaJHl9xZgdob6jXqgzseMYVVzZcRoTSuADM8DnANLdDnjA3vzAJWy+FOGWU4EmH18j4Xf3bi2SI+VrFp8rFUvCMarYvq8Ywt9Qz/3fRgZB5ua3K/5HzWyOF6Sgt21C0MDvWa0vbqeT4idD5hBYFUeN+OY8OdHGIzNLJr2bTYho57HUnYeBVlxGtZBE+aU5WRtLnHoAForDZZMQq5cQmHrG0bdw1o0a23ly5nwug3HwxxRTYgwvgd3m+vG4Wew9HN/caLNrWeE4RnmbJETHMNpW726O5Pbvob7aWAutlt21QSiIgIiICIiAiIgIiICIiCEREGgePBatn/in/VZXhl9p2G/tD9QsX6Qxatn/AIh/pK9+Bm0rfPr/AN+aDdrjoqpU14BsJ2NPhW2P5ZY7KzzvswkkCwJuTlA068vNVeWsJ0bMT4Mqqd/ylYEGuvSPMXSQAvc7R5u59O/oNDC0H8y6eEqnE4Y530FMJmOytfdgfqNgG3BJs7Ua7hcOO3E1TQQ4WjHrCnB1J5wd0jz1Xdw7g9bLA6Sjro6e8gaYzK6MuIAsTbz001sgueB8R4poJ8HP4o8sf+V5/dXjD6p0jbuhfEfsvyX92VxCpuCYbxBFbtKullb98PcfzNa0q6URly/Xhmb7hcW/5hcINT+n7GNKejB3JlfboLtYD8XH3BUjD8DwyoiiYyvMNUS7P2zT2OhOUNeAA0nQ3JPuU8WYi+uxSeWOJ0zQ8xsY1pddsWg0HI2J9698OJYLXTEVlK+hdo0OheDGCNO+zIMpvfUDzQbA4aoceocrHuhrYNLDtSJAPuPcNvA39y2HTOzNDiwsJGrTa48DbRU7hHhd9I1rqLEXS07tRHI1sjLfce0jL7lYOKcbjoaaSpk2YNG/acdGtHmUGvfTDjrppI8LgPrEPnI6ewz9D+VdeEUTY2NY0aAW/bl4/wC0dVXOFqaSV0lZPrLM4uJN+Z1t0GtvkPDYOA0Je8D/AKLC3Lw08NhzKCxcN0ORuc7nb9/++Fl4uP8AixuHQZhYzPuI2nrzcR0HzKzGMYnFRwOmlNmMGw3J9lrfEnRaHE8uLVbqmcXYDZrfZsNmC+mUA6301ufWsQ2XwRxjO+Jn/kA0B9ss7dG3d6rZm/3ZI1DtnK/BUPBaA6MA3uHXGhv61weXW/vudG2irr6aghaZniOMWaL3PuaNTtfyAQZRF1U1QyRrZI3BzXAFrgbgg7EFdqAiIgIiICIiAiIghFClBor0iQ3q5z98/wBBXZhOj27/AD/1Xdx7Y1U/4j/SVwoAMzTrug3NUud2RLAXOy6BpAJPgXaA+a17ivFbI3GOpbVxu6SQ0jx7swFx5FbGpj3G+Q/RdOI4dDUMyTxtkb0cL28QdwfEIPn7HqmOWd0kXqkAD6qOLYa3ZGSL35816qbC8KlgjNXWTQzF5uBGXNA1tazTpaxvfquzjDCoqWskhhJLG5TYm5aXNuW35/8AKsfDPo2irKeOeeZ4D7kMjyiwBI1c4HXRBkeE+F6QWNFjNQ8fZjnjt74yD+isnGGJGgw6aUyOe8MLWOdlBLn91vqgDnfbksfQeivCoiHdi97hzfLJ+jXAfJU707Yk2KOnoItBrK4XJsBdrAb683H3IKjwdhOJhj6rDnNzxWJFwZD2gOjWEEOuOvTTVWPDMfscmOYRn61H0QB48X90ZvMG/gVVeFeDK+uuaZwaGWu5z3NDSdWi41zc/BbV4bdj9HaOrhbWQjTM2VnatHgXWz+R18UFj4UwzD2jtsO7rHbtY9+S5A9aMnuu9wK1v6ScXOI1zaKI3gpjeQ+y6TnfwaNPMu6hXvjvidtDROmjbkmlGWNpaA4Otq5w+6Nfh1Wt+C8PDYhITd0neJJ18df35X6nQLHh9MBYAWttytbTltYfC9hqSr9glK2GIvfZulyTplaBz6C3wWB4cw/O8Ejut1PLbYW5eXLz1VU9MHGZJ/8AHUp5gSlvM8ohbcDS/U2HUIMHx1xK/FqoQQE9gw2G9iNnSO8+Q3sQN3WVo4dwlsTWta221uvnpzvc+d7Em7m4bgzABEy7h3jq49T0v031uOeobdx2fhFGyNhnls0NF7nQAAauN7W28NthYAB3RCKigdNMQ0NF3Hp0aLbnkAFpLifHZcUqcxBETSWsZfQC+xtv1ceZFuS9/HvFr8Ql7GEuEDDpyLj9oj7RGw9ka7lZDhTAgwB7hryHTp7unx5oM9wWZqFrWDM+Fx70W7oyT68Y5i5u5nvHRbICwGHUzKeM1E7gxrRe7jYNHU+Ko2MelGYyEUjGNiGzpGuLn+NgRlB5Df8ARBtlFWuDOLY69hBsyZo77PD7Tb7i/LcHfleyoCIoQSihAglERBwU3UIg0lx9/wDbn/Ef6Su3D6Z926dObVw46Zeqn/Ef0KydDB6vcby9r/hBtWk9Rv4R+iVdQ2NjpHmzWNLifAC5UUfqM/CP0VR9KuKdlSdiD3p3Bn8g7zz8gP5kGp62sdPLJM/eRxefDMdB7hYe5bj9Gc2agjH2HPb/AJyf3WkXbFbc9EM96aVh9mW/5mN/cFBfF8v8e4p9OxKV4N25+zZ+Fnd089T719CcbYr9Fop5h6wYWs8Xv7rfmV8/0nC1TBNT9tE5on0iebWc42+G/NBvD0YUHY0EZtrKXSHycbM/yBqtT3AAkmwGpPQLro6dsUbI2+qxrWjyaAB+io3pe4k+jU30eM/W1HdsNwzY/Hb4oNY+kziUVc733u3+zhb0jB1fbq46+Vui9XAWI1UmWI00skY0EjI3OygbA6EeVtuhKtvo+9GcYa2qxBvaSOsWxn1WjlmHPy//AAXnijH4MNpjK8AAd2ONthndbRrRyHU8ggrXGvErcJpBHGR9JmHdH2BzeR0GwHM+9aq4Pwt08v0iS5FzYnW59okne17m+lyL39V2Ax3GZayd9RO673m/gBya3o0DQK9+hvAKyWQztdkpL9/MLiVwFh2Y5OH2xttrsg2bw/hd7F2jG7+JGp1Plqf39Si+kjjU1DvolI76pvrPGofbnpuwEaD2j4Bez0icZDKaCjIy6tkeDo62jmi3sDmefqhVfhjAzIc775b3ud3HqemnwFrc0Ht4TwLaR405A8+ZJPPqT5clsqggihjdU1LgyJgvc6D4eegHMleXC6ONrHTTERwRAlzjoLN/b/vNa74x4rfXyCwLKdh+qitq47B7m83nk3lfqg58YcXSV77C7IGuHZxDdx5OePaeTs3l56r08PcObSzgEm2WPRwF9i4HRxOwGx1bdrwFPDOAZbTTAF5tlbYODA7QabOLtujtW3Y8BW2Nt/G/vvm7vtWzXta5sHWyuyvAcQxtRhb+0bVUrsk7Nb37sg2yyE2vf1Q82v6r7Os5X/h7GG1UWexY9pyyRnR0bxu0g6+SwVDSOe4BvPnqfAm7hc6C1yNbZXi4DlaKOkbGLNAubXNtTbbXew2FybBB6VCjML25qUBFBQIJREQcUQIUGkuPJf8A5U34z+6ydDe7e4OXtBYfjnWqn/G791laGI3F42jb2v8AlBtmi/s2fhH6Kg8VYG7E8R7DtOzZTwgk2zayHYC41OnwV8of7Nn4R+iwHC7c9VXzdZmxA+ETQD8yg1dh3C001ZLQtey8TnB0hBtlbbvW3vqNFd/RhQy009bTSkExmO5bsbhxBF/AhcuA4s2IYjL0lcz/ADn/AGBZfhlt67EXf4kTfhEP9UGP47H0qqo8PGznGaX8DNBf/P8AALnirfpGMU0I9SkidM4csz7NZ8LD4ru4UZ9IrKuuOrc30eI/cj9Yjzd+6jgRvbTVlcdppSyM/wCHF3RbwOnwQWyqqGxsdI82awFxPQAXK1FwtSOxnE5K6YfUQu7gO2mjW/LX39VmvSri8khjwumuZZyM9uTb6A9OvwVswLDIcNpGx3DWxtzPd1dzPj0A8kHrxzG6eiiM1TIGNG3Vx+y0bk+C+a+OOKpcSqDK+4Y27Yo76Mb/ALjoSf8ARbW4ywtuINd9JJjc0dpmuS2ki1ytLAbPnk+zuBboL6ZxjA6illEM0Za85SBob59WjQmzvDcIMv6OeEHYlUhpuIY7Old4cmD7x/QFbA9JPHMVJF/46gs3IMjnM0DQNOzYRz+0eWo3vbB4pxMzCaEYdQuBqXXNTM32Hkd5jHc3D1bja3XbVb3Em7iSgzGGsc7NO92XJbK7oRyA6eC3D6O2vrYg98ZiYzQvsWsfzvGT8+h81ivRl6Oe3ayrr2nst4ac7O6PkHMHkOfNZP0n8VjXDaQ5WgWnezQNHKBltiR61tgbc9AwnHfFgq3dhTm1JCdLbTPb7VhuwH1ep16Lq4TwMutUzN3t2bCAdHbOI2cXchsRcAteAFjeFsI+lSZ3D6mMgWtcPfyaAPWaLbaZrHKcwstixs8N/J18/wAA8Ot4CS3syjUJibfxv/NfNpztnzWtrbPbK7LIAT7qSlL3AAXv79DoSb+sLC1yO9bK+zgHHhS05ebAXJ/mvfQ3J0cCBubBwFnZZBdWqkp2QMLnECwu5zjoNNSSfADU6mwuSg7aKkEbbDc7nqfM6nSw11sAqjxhxu2DNFTEOkGjpN2R+A+2/wANhz6LDcY8dmQGKmcWx7GQXD5PBnNjfHc8rc6VDSF9nSCwHqs5Dz/0QeuhxWo7cVQLnOBvmcSXO6i/2baW2tst4YbWNmiZK3Z7QfLqPcdFrjhfhd85D33bGOfN3gP9Vsmlp2RMDI2hrRsAg7UUAg7KUEooUIClQpQaJ411qp/4j/1cstRRgEWZ81h+L33qp/4r/wCpyy1LGcw7pPvQbboTaNn4R+iw3Arb03a85pZpfzyOt8gF76mbs6Rz9ssJPwYo4dpuxpYI/sRMB88ov87oMB6NotKyX7dVL8A4/wCpXXHWmCPFJ2+t25azxeYo2MA/mcFkuAIstG13OR8r/wA0rrfIBdGFYX2+dxdZra6WUttfOYzlaCb6WcAfcg7ahn/jsLcG+uyIgW3dK/T4l7l30pjwzD29ptDGM33n8x5lx+a7sfo3zvpo8pMYl7SQ8gIhdjT5uI+BVY4ozYlWsw+MnsYTnncOv2fMXt5k9EHD0bYQ+aSTFaofWTF3Zg+y07kDl0HhfwWXxTEDPI0RgOaHEQtPqySM9ad/+DGdurh5L1cQ1HZMZTRtc1hAacgscvqthi++61vutDncliHRhoe14uLtZN2ftH+7oaf7o0zHxN7XNg4sscvZ9+7i6LP/AH8o9esm/wAJnsjbQW3asZjOESzwCSN+Wnjc6R85beaQ5TnqWNtq4+rGNgDf7Ns9h9C6pe/PbJo2ZzfVdk2pYv8ACZ7R9pxI6q2BoAsNB05AIPnDiXh8HM+KMROY0PfBcWp4rAR9vKTrUvJByDqo9F/CX06tAlB7KH6yQEEZrHusPmfkCtvcVcMlzmyUzAXl5c2IgCLtn71U59stbezepWA4l4mgwSF1LSuE1bJ3pZXWJD3amST72ujOWnvDKek/jttBGaamcPpLm20sRA0j1iPtW2Hv231HTwlzWguy5z3nuzHLmPee62pO56ry4fQyVEhmlLnue6+ty57idytp4V6MpZGB083Y3HqNYHOHmSbA+GqD04bRMijZFGO6BYD1r3F/Z9fNbNYWD7Z2We0g5KCEuIA1v5Ovn130Dw4C/IPAuMsjV5I+HKmhs0v+kwE2uGESRXINnMBJdGTqcpu02cALG+UxPGYcOZ3/AKyocCRFcXbm1Je4aNBI1I9Yi4FyUGWfNBQxGWd4B63zOLj7LBu5xsNhc5bnW5WsuKeLZqx2QAtj9mEHf70pG58Nh47rE4nitRWyl73ZnbX2ZGPssby/U8yvbhWGG4ZG0uc7nuT/AMIPNSUJvmd3nn4DwCvvDHCN7S1A03DOvi7osngPDkdM3tpy3MBckkZWDqSf1WNx7j5ouyjAd1meDkH4G7v89B5oLXiWJwUjA6V7WN2aObrcmMGrj4BUDiDjeWW7YiYY9tD9a/3j1B4DXxVYqKuWd5kLnPcd5Hm5t0aOngLBdlNQ633PU/8AdEGb4Gxkw1Aa4ZY5u6bn2/ZcfM6X8VtZa1wbhaScXIyMPtHf+UdfFbIjaQACbkDfr4oOShEQRdSoRBoHil4NXN4zP/rKzVHF3m/Vu3+0sLxXGWVszXA6TE9DYuuD4CxvdeyjrIA5ty3f2pm/pdBuaWjbNT9i64a9mU23sRrZewt0t4WXRSTMIyhwJaGhwv6twCAemi9AKDy4VRCCGOFpuI2htzztzXHCaLsWFhIN3yPva39pI51vcCB7l7VCDFcUYv8ARKd0oF3mzY27l0jtGgDnr+i6OD8D+iQ2frNIc8rtyXHlfmBf9V7KvCWyzxTvcSIQ7JHplD3W+sPVwGg6XWQQcZog4a762I3aSCLtPI2JVdmwN/aNjZ3YmghrgdY2Ed/LfUzSEuu/kL21JvZVBQdVNAyNrWMaGtaLBo2AC7FwlkDQXOIAAJJO1hqSfBaI9IPpPlqi6noyY4NQX7Pl/wBrPDc8+iC0ekX0ntgzU1A4Ol1D5hq1ngzq7x2HitVYThr5XdpJdxeb63JcSdSTz1XRguHZzndsPmt1ejnhcaVczf4bT4e3b9Pj0QZPgThBtO0Tzt+tPqtP92P936K6XXmrq2OBjpJXhjG7uO3/ACfALXGKY7V4q801CxzIdnvJy5h/iOHqt+4NTz6IMlxbx8GEwURD5NjLu1p6MHtv+Q8dlT3cJYjKDK6CR2Y5nFz29o+/MgnNdbI4X4MgowHn6yb/ANhGjfCNvsjx3WQx7iGno25p32J9VjRd7/wt/c2Hig1rguBSSu7ONhbbR1wRk65r81ZJ8aosMaY4vr6j2spFgej365R4C58FVuIuNaipzNj+ojO7WHvuH35Br7h5XKwGHUva87NHIaX8PJBkcYx6prXfWOzAG4jbpEzxtzPibnpZcIKC+rzmPTl8OaydFh5Nmsb5AD9lcsH4R2dP+Qb/AMx/YIKvheDSTGzGk9TyHmVeMH4Yihs6Tvu8u6PIc1m6eBrGhrGhoHICy7SghQhRARLIgIouiDx1uE08xvNBFIRzexrj8SFyhoIIRdkUcYA3axrbAeQXqVc9IOI9hQzEbvHZjwMmhPwugwtDU9s2Ac62qfO7+DDq2/hZkY9699BjMj+zLHm9VVPy31DaeIG5AOwIYPfItdUnFmXXs8ro6T6NDlIIaTbM8311/ZZmn4ggbmfFIP8A41G2GEHuufLKQHua06mxAugv9FxBn7Pu37aeSKO32Is95Dfl3D8QvfS4tFIGkO9d74239p0ZcHZeo7rtfBUb6UKbPl1FBSNjb41E+X57fmK9TKgUxtuKCkufGecfrp/nQXxjwdQQR4G6lU2mqPo2VrnHLR0naSC/rSzXIB6nuu/MshT4pJFZkzg7saYSzuI7xkdbKBbQerJpbogsSkrGR4u0aSjIWwiaTm1gPs33J0dy5L3RztdoCL2Drc7HYkbjY/BBhOO5C2iltzytP4XPaHfIr5njpC6UtOgBN/cV9XYnQsnifC/1XtLTbcX5jxG60LxFwtUUcp7Rhyk6SAHI/oQeR+6dUGQ4FwD6VM1lrRM1efAcr9Tstr8Q8RU9BGM/rWAjhb6zuQAHJvj+p0VQ4aqXwQCkw+MS1T+9NIf7KAnYPdsXAaZet/JWfh/hKOB/0ioeaipdqZX7NPSNvs+f6bIMBS8PVmKPE+IudFCNWU7dHW8fs+Z7x8FfKChigYI4WNYwbNaNP+T4rlNUNbodSdmjUn3fuuHZOf6+g+yD/U79h80HN09zZgzHr7I8z+wWIxvhaGsMbqguLmE6tOW7TuzyvY3303WcYABYCw8FN0HlosMghbkiiYxvQNHzO596xmK8K08zhI1ojfzcwAZhzDm7Hz3HyWdUIPHh2GRQC0bbHm46k+ZXtUIglQiIIspspAU2QRZFyRB02RdhaoLUHBeDHMJjq4XQS3yu5jdpGocPEFZEhRZBqHE/RXUNuaeZko6OBjd+4J+Cq2I8OVdP/bwSNH2suZv5m3C+hrIg+a4aqVgIZIQ0lri2/dc5hu0kbGxWSZxhKM4qGB4lnjnmc3Rz+zLfqwNgO6FurE+F6KouZqeMk+0Blf8AnbYqm4z6I4JAfo1RJEejwJG/HQ/MoMPRcaUtRmbK/szU1bHyF2jWQRhuVpft7NveVZIK5tUCWuB+m1eUAG/1FPqb+BDT+Za3xX0V4rT3MbI52jnE/vW8WPAPwuqxNHU0j7ubLBIOZD43e46IN8un7cPI/wD7KoRN/g057x8iGP8AzLtlm7YSlp/+1UNp2W/9UOklvyy/mWlsI44rKcxkOa8QteyNrx6ok3IIsb+JurJgnpHjZ2PaxOH0eGRrMpDs00n9469rDfruUG0hichL3Md/aVLIIhuA1lhI4D3SfAL1S4k2Vr43sux8xp2gOsXC3fdflY59vsqlYPxRSWjcyZrhSUznm+hfUS3uAHWJI1/MrFgcP19PCdfo0Blk/i1B/W2c/wAyCx0FDDTRiOFjY2N5DQeZ6nxXMvc/1e6PtEanyHLzK7nMBtcbKSUHCGBrdtzuTqT5nmuxQl0EooRBKIpQEUgKbIONlNlKlBFlKIgIiICIiCLKC1ckQdZaosu1RZB1EJZdllGVBwXXU00crcsrGvafZe0OHwOi7sqWQUzF/RfhdRciEwuPtQuLB+TVvyVJxb0KzNuaSpa8fZlaWn8zbj5BbospQfNNZwNiFOSJqWU8gYx2jSfNl7e9bf8ARTgU1LTOdUhzZJXXs43cGNFmg9OZt4q7IgIllIaghLLmApsg4WU2XKylBxspspRAREQEREBERAREQEREBERAREQEREBRZSiCLJZSiDjZLLkiCLKURAREQEREBERAREQEREBERAREQEREBERAREQEREBERAREQEREBERAREQEREBERAREQEREBERAREQf/9k="},
-            {"id": 12, "categoryId": 7, "name": "Tijeras de Corte Profesional 6\"", "brand": "Jaguar", "description": "Tijeras de acero inoxidable para barbero, corte preciso y ergonómico.", "price": 49.95, "stock": 6, "imageUrl": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wCEAAkGBxAQEBUPDxASDxAQEBAQEA8PFRUQEBUPFRUWFhURFRUYHSggGRonHhUXITEhJykrLi4uFx8zODMtNygtLisBCgoKDg0OGhAQGy0mICY1Mi0uMC0wLi0tNS03LS0vLTAtLS0tLy0tLzUtLS81NTUtNS0tLS0tLS8tNy8vKy0tLf/AABEIAOEA4AMBIgACEQEDEQH/xAAcAAACAgMBAQAAAAAAAAAAAAAAAQYHAgMFBAj/xABCEAACAgEBBgMFBQYDBwUBAAABAgADEQQFBhIhMUETUWEHIjJxgRRCUpGhIzNicoKxksHRFSRDc+Hw8VNjk6KyF//EABkBAQADAQEAAAAAAAAAAAAAAAACAwQBBf/EACwRAAICAQMDAwMDBQAAAAAAAAABAgMREiExBCJBE1GBMnHwI2GRQrHB4fH/2gAMAwEAAhEDEQA/ALoJhmBigDzDMUIA8wzFCAPMMwhADMMwhADMMwigDzDMUIA8wzMS0j++G9CbPo8TAe58pp6vxWebeSDqT8h1InUm3hHG8bneXUoXNQdTYqhmrDDjCnoxXqB6zbmfOVG0blvbVmxjqWsy9pPATaSPdZsfsyQMJ9wjC9MS69zt4vt2n8ThZWRzW3EAOIgA8Yxy5hhy7HMuspcFkrhZqeCRZhmYgxygtHmOKEAccxEeYAQhmEAICEcAwMUZhACKOEAIQhACEIQAMBCEAUIQgBMSYyZpdoB5dq7Rr09T33Nw11qWY9T6ADuScADuSBKL3h2vbrNQb7Mhn92moYJrqHMVoD7rv3IzlsnHQAd7f7eP7VYa6yfsunY4IyRbeORs5ZJReYB/mbn7pkPpQuTnGGHG2QGUpkYZlXlbX0AsTDJyyJtpr0LU+X/Yy2T1PC4NujpZyqVjLufDrCk44ScFFOeILnOanHukcuWJfG62yV0unSkfdHvHzc82P5yDezTYJdzrbQfw0hzxNge6WLHmxwOHJ58jLRQYld889pZVDG5lHFCZi4eYi8TTzXQCGb4b936HWrUlKW6dUV7Qci5w3U1NnhBGDyI5kdRJvo9Yl1a21sGrsVXRh3UjIMr/ANoWxjbX4yD9pTlhjqU6kf5/+Zl7Jtq8dFmlJ/cPxVjyqfmVHoGJ/OaHXF16lyuSvU1LDLFBjmpDNgmcsMgYRRiAYwhCAEIQgBCEIAQhCAEIQgBEYTFjAMXMgntE3hNa/YqGxdcubXU4NWnOQTnszYIHkAx7DMj3l20mjoa5vebPBVXnBsuOeFB+RJPYAntKV2rfYzN4h49RqCbLiFBZs8sIjDDqAvDwA8QUDE0dPVqeqXCKLrMdq5Zz72BOBhUqYKMkoFYchlscVLcyATlCPnOvsHY76i5dOAQS3iW5XgK9izV4wlmCQWQ8Lh1M5uir6WZwFyEdSSOuCtbsDkDI4qLRnAOOktzcDYP2enxGULZbglQMBE+7WB2AHbt07S2yzGZEK4Z2JRs3SLUi1oMKqgADyE9sSiOYjUOKBmD2BQSSAAMknkAB1JMAyaaLemTyHmekq/e72nWc02eAqHkl5ANlvPBatSCFr8mIJbtjkTANof7T1nvXAuOuLFFn62cTfrL/AEWlmWxBSz9JdW8W8Gi01bPffUMA4QOrWMfwqgOSZW3sm2kTtBjjhW7jAXyXqB+eJE12fXS3BqEKowwL1QKFb+IDqsk24GmKa9MfdIBx0/eJ/wBZorp7HJPbDKbJ4kotexe6GbhNFc3LMDNJlGIoxAERCBhACEIQAhCEAIQhAFCERgCJmi+0KCzEKACSxOAAOZJPYTYzSvd/tr+Mx2fW2K0w2udT25Mum5eYwzemBz4jidcHOSiiE5qEXJkd3l259qtOqY4oQGvSJYfDUg/8Vzj3S5A5nooUcjnMTcEluPHLDWi1cAeT31rzQ/8Av18u56T2bQ1XiOOHIBB8Hg4Sz192q5mvUIQBmo4YY5TLZGmZ2QVAFi5XT8BbhRx8TVNnjp4eQel8jDcuk3TaitMeEY4KUnqlyyRbm7D+0ajLg+HSymwtwlntXkiO6nht4fexZ1Klc9Zb1FeBORuzsdNLQtSD4R7x6ZY9TO4omGctTNsY4Q44RGQJGLtK/wDaxtc16ZNMCQNXcKrSDg/ZlBe0A+ZA4f6jJ5bKt9sFLFabAM+EbTjzyoyPnwhpZUsyRGbwj17n7pKVGq1Cg22gNw492tCPdrUdgBgfSTJdl1gY4BFsPVV3UV3VENXZWjIR0wR0+Y6fSdEmdnNyllnYpJYRF9t7tVXIyFRhgR/1kM9kuhLWcZ5+HxDPouRz/wAan+mTLfveNNHp2VWX7TajClT9wdDe/ki/qcAdZp9mejpp0qorr4tgzwE4sCKOWVPPPMn0zjtLISca3/BXNapJfJNKxNwmCibBMxaMRiKZQDEwjhAFCEIAQhCAEIRQAmDGZEzy63VJVW1trBK61Z3duQVFGSxgHD303g+xUfs8Nqbia9Mh5jjx71rD8CDmfPkO4lT7Sc01BeLJscl3d2qsssbLFhcvwWFveyeRPLvPftTa9motbX2VMQ/BXQjdKdOxbwkK97HKO5GR8JyfdGd7UJqa7K7UUhCgcBgVPGGKMuDkfA2OZ+E856nTVKMH7v8AMHndTOTknjtX5kiNY8RmXqCQ1quhAz0D6ileanP/AB6vqOUs/wBnmwzj7XYG4nAWrxCHcVDoWYfE2MDi6kKPORjd3dLNy1+Jx1D3+B1BsqrOQEW38LjOUx0CmXDoqQqgAYAGJkveHpNVKTWpHqrWbBEBMpmLxRGZRGAaLRInv1ovE0rkD3qx4i5/EvP+2R9ZLrJGt9tYlGhvtcgBaXxnuxGFHzJIEnW8NMjJZWCmN3dua7RMw0FgNDOxFFwNlPM9QMgqfPBGe8kOt3+2nw8Nj6egsOS6apnvPqPEdlHzInE0FTU1V0ovHqnQMQeicXMs3+npJLu/ukxbxLMs55s7dc/5T0Jwpgstb+xkrnZN7cHN2PsGzU2nU61mHPjrqLGx2tHw2XuebY7L26chyMT3o1Go+2msWObK2VK/CLKeNsY4OE9TkCXrTslUTAHbrKg0Gzm1esvur6vfdXUw7Vg4ssB8+Eqo/wCYe4mVfqSyzS+1bHS2Rvtq9CAlu0bdW45PUUW+pD+Hxm99yPQgfPrJfsf2w6R2CalHqJ5GxUIUHz4ck4+ufScfRez9T1XPbmTjHkB0E07V9milSayVPXrkf9/KdlOvGNJyMJJ51MuXR6uu5BbU62VsMq6HKn6z0CfP+7u892x9alFvENOzql6EkqazyW5c9HXz7qMdhw34jZlE4pccFi/c2QhCQOhFHFACEIQAmJjmDGAJjK0352q2t1Q2ZQc1UstmsYZKm0Yaug4HwrydvXhHYyZb07XXS6d7C4R2BSkkcWbiPd93uB8R8gpMrTdbZvhAGxizkmy2w4Yvaxy7Nnrk+YmzpaXN6vCMvVXquOPLN+0tE/hvSDXi1EDhwXRgrFkdSrKysCWwwPRm5HljzbJ0p01Jq91g1gfgr48vZjhVWZ2JP3sdAAznqZJNtWrkYC8h8QxknHc+XzmvdjZ5ufx2+EZFQPl96z69B6TXZOMYKxruf5nBiqjOU3Un2r8wd7dnZprTLc3Y8Tt5sev07D0Ek9SzRpqQBietRPJby8s9ZLCwhiOEJw6ExMZmuxoB4dsbTp0tTX6ixaqkHvO3TyAAHMk9gOZlR70bdu2jYreEyaVHX7JpX5WajUH4LbR91QMkL2HM8yJJ/atYti6XSnn42qDleua6lLNn6HH1ni3S2edRc2qce6rPXSO2AcWWD5kYHoomumMYwdkvj7ma2UpSVa+T3bsbsipeOz37XPFbYe7eQ/hHQfKS6nThRgDEzprAE5u3t4KdGAH4rb7P3OlqHFfYf4V7L5seQlDk5PLL0lFHN9oe3l0OiYqf94vzRpl7mxhgv8lBz88DvI/7LdCil6uWa6UA9SXbjP6V/pIdtzbJs1R1Os/3nVL7teloPFp9MnUVl+hbzPn9J6tjb1Gu5bxU2msXIJGLqHQ/ElijDqOQ5qDzAOOWDtrpSqknyzJO5ucWl2+/+uS7lqA6TG1RI3pN/NE65sfwTyyCVcf0497H8yqfSc/aftH0q+7p0fUP2ORXVn+JubD6KZk9OecYNWuOOSLe1rZgsv06IP2lpdeXXh5HPyA4jLn0vJQPIAStN2dM+u1R1lw4uHA4yOFQqnK0VLz4VzgsckseuOQFmVCLY6cRfJyEtW/g9cMQzOdt3blGiqN2ofhUA4HLiY+QB+Y59OcqSyWHRilMbR9r2pdj9loVEzyJxn82Bz/hE17O9quuDjxhWUPdwCo/wKp/X6SxVSZBzSLriJkC/wD6bTWAdXprq1IyLaCuoq4exPwsPyI5dZov9rOkblpNPqdS/qq0Vg/xO5yPoDIuuSeGtzqnFrKZYRMgu8u/nCWo2aiau5crZqHYLoqT/HZkB2H4Qfme0g28O/l2qzU+beLkNFpS1en59rrv3l38q8KnvOX/ALB12pVRqGFFanNdNaitU8gta9MevOTVaX1EHNv6TC7ad9usFuuvTVG2m+ut6mDUp911rHLh7HoMhhJluVZ4+jrtPXhKsT+JfdJ+uM/WcHRbjJywpY+ZJHP0xOnu3eKtFZWgwPtFgXh/9PxLBhfnwgD+YTd01v8ASvzgwddS5Rz5yv8AJ72pbUWipfgz77D8H4QfM/2+cn2zNGEUADGAOQ/tOTu5s7gUE/EebY/F/p2+QEk9KTH1Fzslk2dNSqoKJsRZmIgJlM5oCEIjAEZotabXMg3tP3nOj04ooJ+2ariSkLzZK+j3fTOB6n0M6llnGV/vhvGNRtVzWc16RHpqI6F196xh/UvD/TJ6+1tJsjSVJexB4AtdSAGx2UDixkgDmepIHPrKj0+y+Go4+MI5B75KEf5zYmk1Ov49RqrGubhyS5wq1joFA5KOfQDqfWemulnLEPkyK+Cbln9iaba391rAhUXZlR6M+L9a480T4Ez68Ujuj0uq1PEU46K7f31zsX1N/wDzLT7zD+EYHae/dPdA4V7gWb7qv91fugjzx2lk7P2CABxTM7IwWIrf3LFW5bzZBdBurUoA8Pj9Wzj6KOU6S7p6Zvio4f4q2ZSPpnH6SwKtmoO03DQLKfWlnOS7QvYrOzcSk/Bc6jydVs/twz27O3FoUguXt9DhE/Ic/wBZYS6FfITfXpwO0k+ose2SKqgvB4NnaBa1CqoUAYCqMAD5ToqszCx4lLZYa7rQoLMcKoLE+QHMmfP29e179r6/wqgWrVzXTXnCkrnLsenCOfPp1PeW17Rte1Oz7mQ4dsVqR1DOcKfzxIF7LdkBaW1GPesPhJ6Vr8WPm3/5EthtHUVveWD3bI3N0lABuX7Xb3LZFIPkqdx6tn5CdPVbE0di8LaOlB51KKmHrlcfrJJp9AO89R0a46SDbfJPBUdWzjRe+lJL1KBZWW6+G4biUj+mclam1L/Z9KOCpeVlw+958PkP7/rJFvpf+0dKeb6hxpq+Hr4dePEI+bNwg+slGwt2109S14HEAOMju3f6dvpNc7XGCXkywrUpuXg5m727ldC4qTDEYa1udh+vYeg/WSjS7HHUidDTaUKJltDXVaepr73FdVa8Tu3QD/M9gO8x5yasHC3v16aHRvYv71x4VC/ea5+S4HfHM/SRfd3ZRqWjSscuH47h1w4XjKH5YrHzBnK2vtLVa24agApY4I0VRwTptOeupYdPGft2UY6nGJTuFuwumPGcs7A8TEk8yQSefUkgczNEX6cXnlmeS9SSxwic6OrAAnuQTXSmJvEymkYhCEAJiTGZrcwDwbc2rVpKH1N7cFVS8THuewVR3YkgAdyRKW0GqfWax9fqiVssx4VYziukfDWD5AZJ8yWM62/O2f8AaF/AjE6HSXrSMfDdriGPET+BAr4Pchjz5Tz7I0xdWdeEeHYtbcDcXNw/CcjseBvLBHToT6HS9OpRbl52X3MnU2yhulst2ei7TjJfhUBuhGQDnmSc/X/U9Z1d293s9sVg5VfIZ93PqBNGk0x1N3AOaJjiPn/5x+Q9ZYmz9KEUAdpPqr3CKqj8lHS0627Zed0Gh2eqDkJ0FrjQTOebk9IQEeI4TgCOGIoA4QhAIpvxQLKAjfCbkzjyGSf7TiezkKdDUBj3eNWx+IO2f1kt2/ofGpasHhbqrdcODlT68x08syqtFrNRsy+wIEFdjl7NLeWRRYetlNqhuR8iPzmmC116VyihvRPL4Zbtazg717fWhfBrb9u45kf8ND94/wAR7D1z5ZjGr9oLsvCoSnPVq2a9/oSihfyb6SvN4NuEW+JWxJYEHIb1Oct1PPOeZJ5mSjTp7pnJ26u2H8kx3cqXUbVTvXpaAyjtnJ5/myn6CWeolW+zN8W2M/utZVQqA/hRBxgnzyM48p3N5t+a6V4aHAzy8fHiZ8/ArH7w/wARwg82wRK7O+bwTglCCTJFvFvNptAga98u37qiv3rrD5Kv+Z5SvNXdq9p3Ldrl8DTIxejRdhwgsbbfxEAE8/lgc88Sneqiuw3fYrr7GObNRqLQb2+vCQB/CMAeUmVO39LtDT8elDVaihbBZRZjj4HQpxAjkwyRzHmc4ltVcFLfdme+2zGywvc6O6uyuMG9x71p4jnnhPur+UnOloCjAGJ4Nj1KK14ehUEY8scp16xM1knKTbNcIqKSRmBMoCOQJBCERgGLGQj2lbeenTnTad/D1GoUjxDn9nSThnBA5OeYX6ntzl2v1SVVtbawSutWd3bkFRRkk/SfOO3d9btTq7NSrMiM2Kqzg8NS8kBHnjmfUmX9Oq3P9Tgrt16ezk6+m0jV6d9OgRqrUVWWxS6ZXJSxSpBVxlsEHoxBzOjsbSW6anwOJf2rh0pqXgUMQV8RicszEEjJPIZ8hORu1t6zUXBLAvhoGewqoB4R2+ZJA+ssLdjZzW2HUWjBPwjsF9PpyHoPWejdKmMdcOfH/Dza43zl6c3t5O5uzskU1jux5k+ZPUySVpNdFeJ6VE8mTy8s9VLCwgAmUIYkToRwhAFCOKAEIQgGt1nI2tsKnUDFiBvLIzOyZiRGQV/q9w6vuj8iZxtfuMpGMEYORnnzHQ85azLPBtnULRRZcwB8NCwB7t0VfqSBJqUuMkWlyUvq9Ia7G58a1YoWpSQtuoIx4RGcsgBHEO+cHlxT0abdt2bxLf2t7/G7dB5Ko6YHT+0km7+yA1oZ/eaqkOSeeb7nsDN8xwP/APJJdpdAq88c5bb2dq+Surv738fYgCblswyR+eJ4r9hvs+1NQowniKlq9sMeHPy54PzluJSBI7v7UDonQDL2vTVWO5sexQMfqfpIVyakmidkU4tM6e77/s+DOfDZq/6eqD/CyzvVmRXdR+JbCDlTewU9iFVUz+aGSiqct+tnKs6Fk3RxRyssCYsY8yNb9byLs/SNdyNrfs6EP3rSORI/CBlj8sdxOpZeDjK69te9vE3+zKG91Sr6th3fkyUfTkx9eHyMqcDPIcyeg9Z7/DNrtbaxIBNt1jfExZsk+rMSfnO5ubsXxLPH4cAsfBB5kYPOw/y9B/F/LLo15lghKeFkkm4+7hUBWHvEg2/zdqx6DPP1J7Ylv7O0gRQo/wCzOXu5ssVIOXbl/rJHWkjbPU9uEK4aVvyZIs2ARATISosDEI4oARRxQAhCEAIQhAEZiYzMTAMTIjv/AKz3atOP+I/iOP4EwAD9Wz/TJYxkA3kYWbQwxwlVVfEfJAHdj+Uv6aObFko6mWmtmvYuvXT6zwrjwrq1QUueS+KnF+zJ7MeI4+Qk4SUjvDvkl4alNJx1ZIzacZ59YbK361lShEF7KBhVe2u3Hyaysv8AmTLb4qUsplfTynGCUkXhbcqKXdgqqCzMxwoUdSSeglbbx7dOq1CLTn3eIaRDyJZgVbWuPuqFJCA8zkt0xngXa7ae0CFYlEznLkWEcwQQoRawR2PASOxEmu6G6a0e+2Wdjl7HJZ2bzJPMylYhv5LmnPbwSHdzQCmlKx0VQPX5/Xr9Z3qxNdNWJvEpZaOEIiYBjY+B5fOfPO/u3n2lrC1WW09J8HTgcwQTzs/rIz8gssT2uby/Z9P9jqbF2qBDkdU0/Rj/AFfD8uLylQiwFBVWON34Qq4w3iEYPz+Jv8Q8ppqg0tRXOXgNNoTdZ9nUnwkIa9l55Ycvd8yTyA8+ZHLMuHdHYYUAlQAABgdAB8KD0Akc3H3dAC8s8+Li7M+MGz+UDkvpk/exLV0OmCKAO05bLHavkjBZep/B6Ka8T0ARIJmJnLgEcIQAhCKAEUcUAIQigBAQhAMTMWmTTBoBreVnvfaa9TqjjJOnUqPlWcfqolmvK+360/Dqa7CPdupao+pU5x9QQJo6Z4mUdQswONo90cgADsMt5nHWSDZ25qDm2J29gc9Ogb40Hhv58ae6T9cZ+s7VIlMs53LlxseDQbEqr6KJ1krAjWZiROgBHCEAZnk2jrEpra1zhEUsx9B2HrPSxld+0bbHERpEPJcPdj8XVU+nX8vKX9PS7bFFFV1qrg5FYb2auzU6l9TZ1sPIdlQclQfIf5nvOjufsE2MHYdR+SHt82H/ANf5uWabP8d1TGeeTnnyHn6f+O8tPdjYwqQEjn1GeuT1Y+s29XKNT0xM/T5sjmR0tjbPFSjlzxz/ANJ2a1iqTE3ATyzaAEcI4AoRwgChCEARijigChCEAIQMQgGJmJmZmJEA1tI3vts83aYlP3lRFqY65XqPy/sJJsTW9WZKLw8nGsrBXO5O9C3ap9KysrtWr8/hLIiqSp9QM/SWDUZyNHutp6dQdRXWFsbPvZOBnrgdBO4lWJ2clJ5RyKwsG1ZmJiBMhIEhwhMWMA523tpLpqGtbmQMKv4nPJV/77Ayn9Q7OxZiXd2JPmzMZJd+Nr+Nd4Sn9lQSCext+8fp0/xecw3W2IbG8WwEDsD2H+p/T8561LXTU639T4PNtz1FuhcLk6O6OwcDjcZJ6/PyHoJOaKsTXpdOFAA5ACexRPLlJyeWejGKisIaiZxCOROhCEIAQhCAIwgYQBGKBiMAIQigBAQhAEYpkYQDHEeI4QAxFiOEAQEcIQAM5O8mrsq01j1AmwLhcc8EkAv9ASfpOqZg9QYYM7F4aZxrKwVVu7sZtQwcg+Ep90n77A/F6gHp5n5c7J0GjCKFA6T01aVV6DE3ASy66VstTIVVKuOlAqzYJiJkJUWDEcUcAIQjgCgYQMAUUcRgCihCAKEIQAigYQDIwhCAEIQgBCEIAQhCAEIQgBHCEABGI4QBwhCAAjhCABihCAExMcIBjEY4QBQhCAIwEUIB/9k="},
-            {"id": 13, "categoryId": 7, "name": "Capa de Corte Impermeable", "brand": "SalonSmart", "description": "Capa profesional resistente al agua, cierre rápido y tamaño único.", "price": 15.50, "stock": 25, "imageUrl": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wCEAAkGBxMTEhUTExMVFRUXGBgYGBgYFxcZGBgXGhcYFxgXGBsYHSggGBslHRoXIjEhJSkrLi4vFx8zODMsNygtLisBCgoKDg0OGhAQGy0lHyUtLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLy0tLS0tLS0tLS0tLS0tLS0tLf/AABEIAP8AxgMBIgACEQEDEQH/xAAcAAABBAMBAAAAAAAAAAAAAAAAAwQFBgIHCAH/xABHEAABAwIEAwYDBQQJAwIHAAABAgMRACEEEjFBBVFhBhMicYGRBzKhFEJSsfAjYnLBCBUzgpKi0eHxk7LCQ3MkRFNUY3TS/8QAGQEBAQEBAQEAAAAAAAAAAAAAAAECAwQF/8QALBEAAgIBBAACCgMBAAAAAAAAAAECESEDEjFBYfAEIkJRcZGhsdHhE4HxM//aAAwDAQACEQMRAD8A3jRRRQBRRRQBUfxzjLOFbLjyoGwtKjyApfiWOQw0t5wwhCSony2HMnQDma537ZdoXsY6XF6GcqJkIbFwB7STv9ABP9oPiniXF5WVBlBMDJBVHMrWJ9gmq+rj2MWM6cbicwvHfKn2J0qoOOEqGWcwNo1naI3rJ9xRPiOVdrg6kW8Ufe+tKyDbPZT4pYho93jm1PI2cQAHR/EkQlY6gg/xVecL8SeGL/8Amcn/ALjbrf1WgD61zg3xZ1BhUK6/8U8b4ylWoitUDpfDdrcA58mNwyvJ5ufbNS54/hP/ALrD/wDVb/1rl5zENk6Ana1N1uiTTaDqNztXgUiTjMN/1mz+Sqisb8S+FNfNjEE8kJW4f8iTXNzeLyTG/mPy6/kK9PEE6qSJ8h+hUpg3D2j+MiCkowTSyo271xNh1SgTmPnA6HSteK4zjn3JOJeCjfMt5xI6wAQE+QG1QCuLmISkUzdxCl/MfSlA2BwftrimFADHKXpZZUseX7QqtW1exvb9rFENO5UPaApMtrPIcj0v0O1c2NpOo2qU4RjMjgkxt5GspV2LOtKKqHw77T/amy04f2zQE81o0CupBsfQ71b6oCiiigCiiigCiiigCiiigCiigmgNZ/GbixCWsMND+1c8gYbT6nMf7orTWNxQWTA8tLXn00G9XDtxjDisQ46pxKUKP7MTMoFkmAbSBPmTVSxmByJKwtCh5wqeiailF4BFJcIJjex5x57UitNZmvDWyDrDushIzoUoxeVW8xF/esX04cglOdKhoNQfMnSkkYYkZiQkbE7/AMIFz56daRrO3PJRbCoknn6dZsddvrXuMXceU77m2vSDa16RzxoYrE1azYFku5R4Pmi6tx0Ty89fLdFtAJGYkDcgSfbeskNkzG1YlNWgPJw4sEqV1JIn0BtSGJLcju0qHPMQb2sOgv71iWCEhRgToNyOcbDqddpobbKjABJ6CaiilmwLtupAHO0wOvQjYfWkW3TM7zPO/rTv+qHeQnYZhJ8tvrTVbJSrKqxGu8e1ROL4YL52E7QlnENPEklJyub5m1WJ6ka+YFdEpUCJFwdK5QwKu7InUenSCDHPTWxroP4acZ+0YQJJlbUIM6lH3D7Sn+4aAttFFFAFFFFAFFFFAFFFFAFVH4k8e+zYYoSYcdBSOYR99X1CR/FO1WxxYSCokAAEknQAXJNaB+IHHE4t1Sk5yScqZgJS2k2trJuT1UaAprxLi6TxqcoipdlCGUFSoz3jXoOemu1QmMdzqJmdgfLfQa3Om9a7II4YIzp7wrCJ8WQJK4/dCiBPmasHD+EYHEENt4p5p1RASMQ0gJUToAptRAJ0EkXIqBZCblUnkkWnzOw/VtaIC1JScqASEyBASCYJM3MaySdKkrfAHXG+DP4dakvoVItnAJQeUK002MGNoqOwzuUhQCVRsQFJO1xW1fiB2ydwz/2ZltEpSklxwZyc2mUG2wlRmTPKqaO0yXlAY3DsuoNipCO7eSDqUKR+UX5iuUJylG2ikf8A1yvkkDYAQB0FMsa8FkEISj+Hc8z/ALVI9rOBHB4lTGbOmApCjqUKmMw5ghQPPLNpgMMJgi5MFIi5zKi3ONT6VqOyt64GeBRhSAkSb2Bt1P4b6DWCb+UNCrxZom83vN5vOtSP9VbB1BO2wPrTF9rKopJBjcGR771qLi+AzB0yZMknWd6VwKnfEGs5JEKCATbqB5/Wp/hfDmmsJ9tfR3uZRQ00fkKgSkqc5iUqtpbeRDZXavF6JcDaRohtCEoHkIP1NcnqOdqCusZwr+TNbUuSFezgkKzA8jII9DpWATIq58Y4iXuGpcxAHelyGlRBUEkZlgbCMwMWmOYqoN2IMTzExPS1a0NRzTbVU2vkJx2sUW4tSZMxMbwTOaPyMeVXv4Vdp/s+ISFmEK8C+gOivQx6TVIeJX4uVsugA5JGgFK8NxfdKKsiVfxC46j3rr0YOtRRVK+GXaYYpjulf2jYEdUaCP4dP8NXWslCiiigCiiigCiim/EMahltTqzCUiT/ACA6kwB50BUvihxrumO5SfE58175OX9428grnWp8LgFQXCJO3KfOpni+NViXlvOHU2GyQNB5AVVuIYtbh1KWwbXME843Nap1gg34lgnySpSCR0gwOcC9RDiYMVJnEOJ+Vak7akE8/KmCxc0ju7Bi1hyrmJ0MWN49f9qTdaIMHW3sRI+ke9PWnwExB5GORKp1sbHpr600dMkmwnYaDoKK7BNsdpErQhrG4dOKQ2Mra86m320/hDifnT+6oetWnsUOEOPoCGXEvzLYfJUJHilEKKSoQSJANrVrcithcGxP2bh6XWm2i4ljv85T4lLOOUwQpSSFKSlBAgnYeR8vpMKjUbzjDNR5Kz2hWvELefedSl8Od39myrzpSCAADGUAXm+xOpiksRwdoJZU2vEOFUd6n7MtJRNyUqulWwi+hvy2RwvjR4g0FoJwzucNwpeZtxSU94pLaZHiyGbptOqspFZYnA4gGVFEaqORKoGZJsTh/wAGe5JvlOkiuK9I21F4a68o3tvJr/jvBsMlKPspxLivlXnYcSLSS5dAMGwCRMRfq2xfB2Q62ht5zIoeN11haEoVKot8xBhO1pmTcJufD23XMxDilgKWI+zJQRGSAZws2IcBtuBMpJp+nDLadT3johSTkYSWkuuqEk5VFDUCI5aa3io/SHDDec/H7df6aULILsqW04J8YlSF4RLkIUpKgFXvlBGb5spECQrNyqvYnH4JJPcYPNE5S84tSfMthXiHQqqxI7VOYvvQllsIQypbYVmXK87aEZ7gKBz6RrVR7SNoTi30tgJQlxSQEgADKcpAAsBINTQ029SW+03mk8de7ss5VFV9hDG4t3ELClkrV8qQAAEjZKUiyUjkKQW3lMSD/DcTynfzFqG3CAQN7E7xuPI7+VeRX0oqsI4N2OWcP1ynebe8/rXzrJDJXdAJV+Ean0rNGJIAgGRBsSLje5PnpuaQZcKSCCQaKyFj7KcaODxDakqkgyq4yibFE7yJBOl7aTXRuAxqHm0utmUqEj+YPIg2I6Vy3lSsSICvoa2n8Ie0JDhwjhuoEpn8SRqPNIv5DnRoG2aKKKyUKKKKAKoPxExudaWO8CUpGZQ1JUdJHQf91X6tK8X4u084p/OIcOZN75SBl/yxSrBD8aW0hEBaiVbZY0iZM1BMIzkkTIIgACNzprsBpF7xUzji25CgMwEietNEsNxFx0mtU6qyETjItFzzmbaDqJ1veIpuhoRKlQOl1HyE28yR61OLwLZvJ9/Skv6rRsaqWARuBDCnkBxDxbJgpaUkuknTLKYUf3QBPMVI8eZw2GdLRw6FwAZGIczAHQOJIBbciJQUyJ3FzI8OdXh0kMFtClSFOd2lThB+7LmYJT0SBMXmkziMQNHoHJKG0j2SkCsNO/2CPwGGwi2cS/3LpLCWyGy+koV3jqG5lLSVgJBJNzqL1Ndl8Ql1pxteHytoTCEoOIUVJddQXkSpwyPAlcaSnabo4PiuLaWFodTmiJLTJJB1BOSYMC07U6fOK4i6y1ISoAp8BWlGUqK1LWCoxEnToANBXHUjLO7jm74NJiqMEod4hKMqQ4teGIwmJKAtEZXHcycySpKQkKSCQQDpYyDnE8X3IKXsT3+RslJw68mcrIcSD3EwlOU+atTBi1fYcLh0ZnC3EpQt5SEBbzg8OqUyALyrWxvYk1jjzanMwUyhTKEp73ChKUqbA0fZcbAK0cliwmCmK+ep/wAryseNfjvzR14QO4t5LiEIfxIb7xzMThYhsJKkKTDESpdspveY3qNbbKni65IWENw4poBeZalNrSVBuUpS2STBNjvJAcdn8L3RQplvu2VK8KVgOv4tQBECYCUjdSQlCf3jNW1vD4daRl7vITllIQrundAASCkiTaZExqlQjGrNaL4/tV9fP1NwW7s14C0y26pPcJIJUlJStJV3S8zI8DplRWlJiwiD4tKgmgy6y++tkhTa2z+zdWA4p1SgpJ73vL6qtex0qw5sRg8QtJdUpQlJC1LKFJVcKCZjkRy051hjeMPOxnKCAZALTSgDpIzJMWr3x05vMcp07v8ARzcl2VL7UyVADDMiSBK3cTbqSHkiOsU+7Q4RprI2luHIClLQpzuVJIt3XeqUXE//AJJAtEb1NJx7o+8P+m3HtlrN/HqW33TiW1JklP7NCShR1UkoA13mZ9iO22e5Pr4sxcaf4KkQlIhMKURdWoHRI5/vH0jU4tgkiZI3teOlT/dtjlXqVJ+6n6V3SMCWEaYBACFrtdRJTflANS/C3G2XW3mw4FoWkhMgpgKBMk30kRTVoQkr9qRd4koKACBB561lQ8WLOkWnApIUDIIBB5g3FZ1Vfhnxj7Vw9pzdJWjyCVHL/ly1aqhQooooBjxx/Jh3l/hbWfZJiuWVO5ENo+8UNkk6gZE5QOXP1FdK9vH8nD8Qr9yPdQH865fxzn7YT+BseyEgfQCtJAunA8KooDYEkifK4Emnz3A17EE+ShflpFVrhvEVNKSpKuk8vfY1OnGqsQfoKzJTv1WRUMXmFJsoEeYpBQO1SWNxKnTmUZOnKBTZqytctiJidQRHrp61tN1kgm+FAFV/0RE++vMU3+0mpLGRBkcgMplNyTB5208vWmCmxUi7RTD7bWxezLScLhytw5FrSFuqMy0z91I3C1HbWZ1KADV+yHBg693ik5m2iDl/G4f7Nv1IJOwSkza9Ha7jBeUWkKzNhWZShYOuaFX8AHhSOQkya82unqy/jXHZqOMiHaDtEcS5mjK2kZW0bJT6WkwJ8gNAKd8B46JbbdUUhCgWnQfE1e6DzaVcEbTPOq0lm4FSrfA1x4zlOw1971ucNNQ2PBE3dkjxzjsrcSwSc8pW6dS3PhZaH3GQIFrqi9rU27O8WLC/H4ml2cT05jqJ/OmuJ4WtIlPiTck6RAm96jVOGkdLTlp7FlF3NOy/9rcEHWQ6k5ltJBzD/wBRg3C7axcn+/a4qil6p/snxdVmF8z3U6SfmZM/dXtyUBUVx3hHdOkJnu1DO2b/ACn7pndJlJGtq4eibtJvRl8V8PPnB01Kkt6GJxJJhIJJsAKHgZygzzI+WeSefn+i4wrQSDa5EA8gdffSeU86UyhNe3s4mOCwczP6/X+tKLbg5fL8qctuEo1BtEaEXIAHPnPWkkJGZUAgAmxMketRO2B28EobEiSflB0A/EfrA6TymCWJcT/EPzqQ4g8VmT/xyjpTbC4nunm1AAwbg6EVcpWC7/0eOIyy8wToc4HqQfzTW4a5z+A/EMmOCdnAsfQkfUCujKjKFFFFQFT+KGY8OeSkElWUAASdZ/lXMvFDD/okfQV038S3smBWeV/YG/8AP0rmPiDZViAB+7r+r0jLL8ASDZlCh0qc4ViM7QPIX/nTPCMsixJGxM3HO1hSnAEBDrrQWF5VACPvA3kbW09a0tRMlEmlVekwZBgjek3FjMY0tr5Cad5+7ED+0Op/AD90fvcztpzqtgaOSd+VtrCKTINLBJJAAkmwHWnTXDHFCYA6KsTUclHkEhj+JBlhOGaMkglxYNpUBniNSoQmdkJAsVrArtOsTg1oNxzIIuCKRbQSbCYufKQL+4qQUUrQYlFLKxKzEqJgRe9vWs8Q0AJHMDr965HoPekmGsxiYGpJ0AGpNXDVsGX2leUpzGDqLXpIIFKvKTPgBAHPU9TsD0FYoSSYAknYVVSQPAmrIvFDFYcpV/bN+Ic1aBRH8QgED74QfvqiDcwbiQSUEAU2zHb9bVznCOpTXKKpNGSl1jM0o01Yzbz8pB/Ws1g8nKojkSPaulkMu8MRNvyvNqyCoEUNAJGZQlRHhB0A/GefQevKUkoUr5QSbabTz5UTQElrk017yXB0qUe4O5EykmJjxe1wBNQrTag5lIhWkHmfyqKcZcMUe/DTFhnFtrOywdL2VMDziP0a6srjXgmIKHbGCFTIPoa674Biu9wzLn4m0E+eUT9ZrJR/RRRQGt/ja7GGbTPzFZPWAn/Wud+MH9qfSt9/HF7wtI/dUfcgfyrQXFx+0NbXBCRwirA064Y+G8VeMq0xfnbfa+9MeFJzQJi0k8gNTRxIxlWPun6VfAFqxDsqmSbC51skD/b0rNp2Zk350yaczJBG4r3NvSiEkhe4sQZB608d4m4oySPSR+RqMaVNLAVlxT5LY8c4m4pBQSIJubz5STpSODT4t9JteIIMkbgRPoKQis2xTakqQsWxibbG8Zt4SkCCOVxfeDTYKMFOxIJ9NPSlVXM7m9eBE1UsASyU8wmPLaCkJBnQ7jSRpcGKRyVgRUlFSVMDtvi6gQYkTpa/P7tqZ4x/OsqgJ5AaAV4oUmaihFO0LHiLpHizEgCDY7ABJOwiAf4qjcQ4JMCBJgToJsJrJ58xE2/509zTLPJqqNAdvPTfc/l06Cwr1nGKbkpMSCD1FNVG4pJ1c2qtKqAovHLBzBUHnA/mKa4RcrlV5N5Ot7yf51i+SLHXSkWFa+RqJIEHhlw6fM/nXVHwrxnecOa5oKkH3zfkoVym0Lz1vXRHwFx+bDPNz8qkqHqCD+QqdA2lRRRUKab+N7svtpmP2addBK1XNaV4v850059B+v8Aitt/GXEg4xaSJAaCfJWXMkj1I+tag4m9KjYe3nWskFuGOwCOdvSZ/kPanzyZSQRO8c6iMCuKlmzWiExgWQWA42RkBykHUHYeUU4YbsTqDOlyI5jyn9CoHg9itPWammXQEqkc4jW432KRH1rNNIomX8qiAZEnT86mGn0pTFitQ3FkA9D94/Tz0reKclajbU6CAb7DYU1HEFSTqdTVqwW1InSnjPDnFDMAADzUBPW50qn4XtGpCgoWIMipR3tstRmcs7AmPSsz3+yFRLOsqQqFCPqOUgjWvW030kDXyneoDE9sFLQUE2Jkm87GOgkU3wnHADdSh9QTIPiH4d/SicqyC2YtsROtwCepzXI2mJpBprMYEDck6ADUnpVexHaBEaSZsqdgkAiOehmkx2nASU6AxPO23lv6DlVV0Cw4opnwAwNzqep2HkP96Zuq2qEXxsn5TXuH7RLSClSQZmDAkSACPKKO0sAeYpDgklCgBrINqTY6UYXjJKgSkG99L8xpWZdzLzRlkiybQBAt1ipFy7QdCzkJReyuXqNOVItryJzfeVOX90aFXmbgcoPQ0nxDFZiEA2ESCLiBYTy8R9qbldVK0AKcxCZAkxfSnuG4cgSFrhW4EW6XqKeVQ2s3uakk3wwQq4QtaTJgkT5H/atufAHHlOKW3stBHrZQ+iVfWtNnX1q/fC7iQZxrBmAVJBkmxmFepBNThFOoqKKKA0J8UMKp/HLS2My1LyhNgPCkXkmBZJPkK1vxHgSwpUOMrUNUoczH8ta2F2ycWviLrIPicTiMkEAStl3ICesx5kVrhvDrQ73i0KQlu5zAp/uidSdIrEpSvDNJIjcMb1ZsDgElIKnAJuIg29SL1WWbkmn+FcIURNdXb4ZglRhC27JIKViUkbxY+USBThYJsLkmwGpNR3emUmbaXvuDA5XqU74JQSD41W6pTvHVWnkDzq5SAzUkgEGo1QjNUogTA526V7ieDqA8RCTyibdYpKSjyKKupV68qQxPC1pBNikb/wCopq01Jtry3N4tRSTVoDea9zGnGIQBprbyiJ19qxabF1K+UfU7JFLxYECaKUWqToB0Ggp7w/hq3SMosdzprFLSVsDVgGRT/Fo0pV/ALSrQEDUgg+saxWT4mKJp8AMANKfOmAfKsOHtRZUAgmZ6fz29BRi3oE8o9z8o/M/3Y3pYG7AMmdatPZrHtuOt4ZzDMlDkIKglXeZogOFRUZM3IiOURVWw+lS/ZTGoaxjDjhyoCiCo6DMhSAo9AVA+lSa9Vgfca7OMNuFpOMb7yYCFBWuyVLAypPQ386rTzKm1qQsFKkkhQOxH61qYPZLGKX3amiCT4nFEFBnVeb74Otrmax41xEHGOLbAWAAidc+RsJUr/KTPJM6VzjPNJ2WikvIKVEEQeX1p7wvEFC0GdDP+9I8QaX3hCwQohKo3hSQtJ/wkGk2q6Jg7Q4PjO+YadH320K90gmiqt8HuI99wxq8lsqbPocw+ihRWQad4pnd4upIy5kuLAzzYtvT4YvmAFtdDtJFd7dh0vrUs+AKypAJsLwSDzhV76EbVvD4j9m2GVniaEr76ClSUAnvFFMJWAPvgCNCCNRaa0XjcOpKHm3CZDigla7BcqBzAq1+Um0/2h1ri/wDpfuVG/ZogsMf1Apy2fGmN4EDmbR70kW0oIzeMkA2JCYOl4k/Sl8WA24MgNgDrIkp1Sd0zoek16Is5j3FIiQCDG40kcudO8/hBpm2LA7EUrgzKI5SPatkFgaQ4liVm5UTte9qzAIMGkcakkWuamGCPW+spylRiZjafSkmVgG8RHKfbkdp61mgUksUpcFFMQ7NgTqbbbCR9fpSM15WQTVqkDGpThT60pIBsbkdR+VRhRHlUlgBao6YF2uKrS4DrGxJivcU6VkqJub1Hq+enm1ZUUnaFkk0oAEA7HwqvE2EEakSTUZxBfipfC00fGZZ6XqpUB2jSlFICRe6joPwjmeZPLbflSaVRB5VipU3m5186MFm7GOP5woOwwghK0KWrKQqQAlNwCDF7ajnB9wvDlMryB9TfdJU2CllvMULJ+bItSjN4KkTa1R+DZUvAvJQhSyVxCUlU+PCkaDQBDntVn4UlC20h7MhxtKE94sKlX7NMqM2JCitPinTrXk1XtbZuJrvjDSA6pKSpWUJgr1hKQAPEhJAAEAQLAWNMnCLgX94iOtSHahKRiIS4HfCnMpOSM15SO7ASIttrNRzeo3vp/wAV6IK1Zlm7P6OXFJTicMT8uRxI6GUqP/ZRUX8C+CYl117EJUWWAgthSUxncKkqgRGYJCTJJtmHWiqwbD+LxT9kaCkZ5eGUAoBCg07ChnWmYvIBmCa0DxTKkSpAbCglKjCFKUSmFKGSQL5j82wsdK358W0rLLAbICg6VSBKwAghXdTbvCFFIzW8Z6VofifaBpxSkOICkzGYQpJO5AsQJmCNReBXCV7sI0qogH8QgEBtMhIgKUAokSTYERqTqJ8qyefWtACiCE6eFII3I8IFt/1fN7AIVKmFZt8m/pME+o968wtxGmxjXlodTr712i1VoyxXAuymORp/w9PiWIJsFSPu3AmN9vemfCMMFEjPCp0On60+tPChTTiSoEG4+liDvpatuSeCHuI1GkSQCNTEC42/5r19eVvw/MoGT+FOmXoTv0jmaRfckz533NyZPW9eKNqiWARjQqVXgGkDxqCibgg2jpBqMa1NepRKopKLfYQq/hmiCpKssfd1k9LyKbsNgkgzpttcSTvET9Kev4dMWFxTZC8qpE/l+hMWok0uQYYofmL7zBMRyv8ASpHhgSElSrxonmevJI+unOm2LZm+9zO5Fon2+prPB0SxQEMY4S5J+gAHoBpUnhOHrcFhAiZMx6RrUZjhCqkWMcvIEz4Rp0pK69UD1vhLgEiDAvqI631FQrI1MGZiZttb2n3p+MUsBQzGCIO0jlUXg7rPSpFSrIHylAcoHPT1ipvHuKDpQy0gIyoKmxhmnFNEiVNuKU2pS1DmozcTBBAiMNiS2tKwElSTIzCQFbGNCQbibSBIOlKYzieIVdbzhm8ZyAJ3CUkBPOwFWSsE/i2HA9iEvpSvvFOdyFuNqyoHeHwJJUUgJUk2TYJHSkkYJLYUpeHbSnKhJUSAkBOcJMrRZRSpAnUlGbXRPg6DlTi8Y4oob/sc5KiTJOa9yAR4U7kbBM0ujiisafAcpTmlCxnSUH5i4n5VggCDbKsAaKBT5ZN34dm0V7tSytTiHMqIUhGUNkkEEkpIlIJmdhV77AfB158pex+ZlmxDOjqxrC//AKSf82vy61bvg7wzC4hLmMKe9dZdUw24s5oASlxS0jQKKnV+KNIjKDFbUrvC1GmZfIhgsI2y2lppCUIQAlKUiAANgK9paiqDUvx+WrJhEpWUXeJIMGMiEEWOhCzWhMQyhM+Ik7DrW5f6Rzx7zBJBjwPn3Uz/APzWkFm9VJgEKIMgwRuNach1SiSTJOvWm6GidATSzaYMG0a1pUQycJSQoWIqVU+pwJJMkAATtGgpliGxH6jn61nhDAynYD6gH+dXDyB1j8qT4TmHOIny6UklVqwcEpHS369Kf4DEMpQMyZXoZuCL3FiOVZk6XvBEaKNL4ISZp06rDqN/D5anpG9Y8HRKhCc0yAOpkD2Me1IyvoUOHWoUfIGOlM2mvHAEmbefKpTFiCYIjw6iFfeiPQCfSm+FUEqUR88QnpOqvOLD+KdqJ4BhjmMqssgmLxoDyneOlMsOqFRTt35o6Uqw2wAlajKpgpJ01vtIiKOW1ZFEXjhelWDan/EMAlcFo35EmD5cvrTRhIJgmBME6+tIzUhRm/ZBPSm2AHhmnXFTlaixmBrcan+X5Vg2mABVTtAUbIFzeNBzPXoNeulK8LwgecPeKhtIK3VmbIGt/wASjYb3m8U0WaRcxKspQD4VEFQG5TOWeYEkxzqNAece4scQ4DGRtNm0aBCbCSBvAHkAALCkGsKBYrg7xyO3WmaqTBpsxSFnQf8AR8ATg8SgGYxGb/E03/pW1K01/RtelrGo5ONK/wASVD/xrctZKFFFFAc//wBIrEA41hvdOHCvLM4sfXIPatRNgT4tPzrZHx8xObiqk/gZaT75l/8AnWtK1WCCofM2MUAmZm+s9aSTSwTpVWAO04iQB+uXvpWeDSO9SlSsqVWk3AMWnptSCAImbyAAI9Sen+vSlHUyLVa6BL8TwSURkVmBteJCh/qPyqMSms8O9KY5Xj9dJpxh8GVqATedP1sN5qLCyBl9mk1K4VsJi0gRb+VYLZCSQFZgN4gHy6UqiqD3HvypM3PM66XHlNNvvV7jD4k+tJg+IUqgeunxjypvikSKcPJhYO14616W80AAybAc6lgilOGLEil8CuCDMEEH2pPFMFKimQY3FxWWGQZqgc8QczrSkAQLzEH1rNy1ecOQFLUomLwPKDP8ves8S5K9BAj5ff3rK5oCa0eGSbn5RzvcnkNup8qbsYdSzawG50/3pXFLm/6AFgPSm6XlRE2mQOXWrmsAUfwSkiZBG/SmiBJ/lWTizoSTXgWAD+vrTKWQbj/o4ujvcanmhlXsp0f+Q963nXOv9HfEn+snkzZWGVbqlxrL7AmuiqyyhRRRUByf8V8aHeLYxQMgOBHq2hDRHug1Vm8MSYvPIXPrsPWuoeIfCjhbzjjrjKyt1anFEOuDxLUVKIAVAuTUW78FcDfunsS1OwU2pP8AnQT9atg5/wAPwwaqPoP9al+DcBXiXQzhmS4s8hISPxKJshP7x+ptW4MD8FGEuZncW84j8AQhsnoVCbeQB61sbg3BcPhW+6w7SWkbhIuTpKlG6j1JJq2Qg+zPYTC4bBpwzrLT5PicUttKgtw6mFAwBYDoBvTLHfCjhizKGVMq2U04oR5JUSj/AC1eKKyU5W+IfZVfDcapAzqaVCmnFAeNJAKgSkBOZKpkAC0GL0y4diAAUjVW/wC5+EeuvQDrXVHGeEM4ppTOIbS42rUHY7FJF0qGxFxWge23wwxOBUXGMz2GmQoAqca/9xKRKk/vJEcwmtXeGCCXhgaeYbAshIUo5swiL+EgXFjOtRfCeJpWINjT7E4aRIpKLfZBHivDEnxtqACQcwM8rRI1MERUQwElXiMWt1NoB5Cvces2EmOW1qwwk5gRbUExNiCDbyNRJpZYHeO1EidPECSBrb9cqVwCfCVDU+EdEx4j6yB/ippi3QTYRJBgfLET7ifqak+HsEJBolgDHiXCzGZIpFvBhDXeLIMiEgTdRGh8j+RqRxvEQn/SolKy4c5EJ+6NvPzqtN9gyYe7pJ5RGgMmRrSDQtJ1NzXrhClBJmBcxvGgpLFKtA9TV7Ak85Jj9E164IA5k1YeB9h8ZioOHYdWDEOEBtmOi3Izf3Z8qunC/gdi1n/4jEMtDbuwp1XXUIA85NLQo1M6mLGkyifW/pzNdD4b4G4AQXHsU4d/G2kewRP1p+n4NcK/A8Sdy8ufpU3CjWvwAajiZ/8A1nf+9qujKqPZP4d4Ph7yn8P3uZSSiFuZkhJKSYEa+EXq3VGUKKKKgCiiigCiiigCiiigCiiigNCfFv4brYW5j8GCppRK3mxq0SZU4nm3NyPuyfu/LRuGcX2VXWhFaz7bfCLD4nM9g8uGf1Kbhlw7ykA92eqRGsg61pMGpsXwtC1Bd46aE6X9aWThgNI9qlXPhlxdpJhtCzzQ8jSQdHMoi3nTI9m+JJMLZkdFtTHQ56WShhieFNjK4tMAyQcxAMWNtxTHivGUgQjyFS6ux3En13ZKjEAd40AALBIldhUtwr4L49xQU93TKd0rXnUPRsFJP96l+8Ua1ZaKzmWfDr5+VT/CcG/iVdzhWVuq/cFhP41HwoHVRFbn4N8GsGghWJWvEqEeH+ybtp4UHMR0Ko6VsPAYBphAbZbQ2gaJQkJSPQVGwal7IfBJtKM/EFlbh/8ATaWUpT/EsAFR8oA661feCdguHYU5mcK2FgyFrzOqB0lKnSop9Iqy0VChRRRQBRRRQBRRRQBRRRQH/9k="},
-            {"id": 14, "categoryId": 5, "name": "Crema de Afeitar Rica", "brand": "Taylor of Old Bond Street", "description": "Espuma rica que protege la piel y facilita el deslizamiento de la navaja.", "price": 16.00, "stock": 12, "imageUrl": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wCEAAkGBxITEhUSEhMVFRUVGBUXFhgXFhcVFxoaGBYWGxcVFxoYHiggGB4nHRcWITEiJSorLi4uGCAzODUtNyotLisBCgoKDg0OFQ8QFSsdFRktLS0tKysrKy0rKy0tLTctKystLS0tLS0tLS0rLSstLS03Kzc3Ny0rLS0tLSstKystK//AABEIAN0A5QMBIgACEQEDEQH/xAAcAAABBAMBAAAAAAAAAAAAAAAABAUGBwECAwj/xABOEAACAQMCAwUEBgcFBQMNAAABAgMABBESIQUxQQYTIlFhBzJxgRQjUpGhsUJicoLB0fAVM1OSohZDssLhJNLxJTQ1VGNzg5OUs8PT4v/EABcBAQEBAQAAAAAAAAAAAAAAAAABAgP/xAAcEQEBAQADAQEBAAAAAAAAAAAAARESITFBYQL/2gAMAwEAAhEDEQA/ALxooooCiiigKKKKAops452gtrRNdxKqeQ5sf2VG5qq+0ntkkOVs4xGv+JLgt8VXkPnmmC47idEUs7KqjmWIUD4k1EeMe03h0GQJTM3lEur/AFHCn5E15+4v2iuLlwZpZJWJ8IJOMnoq/wAAKdOH9heJzL3hhFvHz7y4YQKB5kN4/wDTV6RPOJ+2l9xb2qjyaRif9K4/Oovf+1PicnK4SIeUcafmwJpJD2RsFbTPxaOR/wDDtIZLlvky5H4U7W3ZDh492y45cephSFPkWCn8aaYjNx2yvn96+uPlK6D7kIFJf9oLj/1uc/GaX/vVO/8AZexA/wDQnFD8JQx+4SU13/CODKMzW/GLHHWWLK/MsrGmmI9F2iuh7t3OPhPKP+enK07d8Sj927lP7REn/wBwGj/Yy1n/APMOIxTHG0co7uT8N/8ATUe4rwq5tWxPGyAnAb3kPwYbfLnV0xYfDPbDeocTRxTD4GNvvUkfhU54H7V7GYhZddux+2NSf51/iBXnuO4B2O35UoDkAjpTJU2x61t50kUOjK6ncMpDA/AiuleZuzfHbq0HfWspwD9ZEd19CVOxB8+dXN2I9oMF8BG2Ip/sE7N6oT+XP41LFlTOiiiooooooCiiigKKKKAooooCiiigKKKZe1Haa3sYu8mbc50IMa3I8h5eZOwoHS7uUjQySMqIoyzMQAB6k1U3bL2ue9FYDzBmYfiinl8W+4VAu2Xbe4vnzI2mMHwRrnSP+8f1j+A2pr4D2flu9UhZYbePPezvsi46Dlrb0+/G2biek11fTXMvN5pXP6zsT6dTT7adlI42X6fK3eNulpbATXLehxlY/wCtxSo3kNvEPouq3hcf37LqvLrf/cIcd2n65wBnbfam25t78KyxwNaxt72uRIZZPWaWdld+u2y78qLiSf7QRWQKwLBw88iIlW+4gw8pJGPdQ7dGYkZ5U13d3cTYmSxafKl1nv5jckrtkqjskKDxLgBTz2zUY/scKPHdWieglMp+QgR81NNMzwkJHIU7hIC8HD7hvqUHu95cyquCDk7YJ3AzvUDBx7jHE4CIZblovCH7u3dIUUHOAVt9K8hnHkRSiTsVLJ45LgOxMK+IO7apJEQp4jkaRIjbjJDbhcHDlxXspMZPpE9vcapJEBeS5s7UaiQo+rRJCoGBncYAzXftDwxoAJLmSyBd48CS5vbqQgsqtKQXVGCKxJ25DA50EQ4/wGG3ihcSK7SmU42GEViEJGkYJGk5ydywwNO/LhXF71T/ANmnuf2Y3kYfAoMg/Aip9x/s49lCl0syCMSRCUwcPgiZYnOCyM2py2SAAftUr452dd7qHh0M9+ZpFE0jy3A0RwDUGxHGFGosABkEb0EHvb1jp/tGyPjziVYvos504y3ILJjI95evOn+w4zLbxa2b+0eHMdD6hmaLPJJVbkfLVlTtgrkU4WMfBVuriCaCCP6NsZrieSQzODpddLNhiCOg89hUB7Ocee1m74KGR/DPDjwSRt78RXlyJx5HHrmqknbDsbGIBxHh7d5aPu6jJMW+Cd99IOxB3U+nuw+2m6H5fyq1+xMqWHEzYA95YcRjEtvq8QxIhKZz5hWjPnhM1XPbLgn0K9nthnTG+YyefdsAyb9cAgE+ammpXOGTSc9CCD8DzHrTnxZO7MU8bYLAe70ZcZII9eR8sGmdWyPuNKXlJgAPRxj/ACn+GP8ALW2F5ezLt19LUW85+vUbN/iAf835jerArydwm+eGRZEYqykEEeYO1enOzHGVu7aOcbFh4h5MNmH3/gRWLMalOtFFFRRRRRQFFFFAUUUUBRRTX2k45FZ273EvJdlUc2Y+6i+p/AZPSgQ9s+1cVhFqbDStkRR5xkj9Jj+io6mvOnaXj8t1K00zlmbryGOiqP0VHQfM71v2l49LdzPNK2Wby91QOSL5KP8Arzrj2S7PycRvI7ZMgHxSNz0RrjU/x3AHqwrXiel3ZDswtwsl5eP3NjB/eSci5/wYvMk4BI8wBudnbtNxlQkbSwqkYUGx4fjwIn6N1eAe8TzWPrv0yWce0HF4GBZEH9m8NYQ2kOfDdXYB8b/bRN3J6jz1kVWV9eSTSPNKxeSRizseZJ/IdAOQAArKrI4Nwy0uOHT8UntpLmaHV3xluHQOyhSQqx4CoA4AHQDkK59qe54fY2qGxs1uriLU+qESNGmnBclzkOSRjoCreVPfsclU8Mu0kXMSz65CcBQixws4bPTCn76hUwueOcTZ0jLB2TIyAIrdXVcnJHIHJA3JY4oJh7ROKXFpwuzUOsUt2n1yRokYEfdfWRgAbbyKMjfbnUrTszJcW3D4J55NWhZ7nEhDyBEGYQARhS8i56AJ0OKi3tR4U11xC2Sa5tIoEiOS8oQBVkTvtvMhkCg89J6CnHiXaOy/tOG4HE1eKO3kjMcUckzNqYEgGLIG4Vs4OO69dqK4vbxuJ8UiVk0I88cKRbfVxCQB1P62kMWPn6AVJ/akVuuN29quNCfR42xjHjk1yf6Cv3Upso+HLetxOC24lOhYyJphVINcmtHOqTSSMsCMHm3pSjuWXiL3w4bGjERaPpN9GmiViyatEZfOpSiKuNtO2Sagla8dhurviNg26otsU2yDhVZsD0YoKS9neKLLxric2hiYYraBMDfTh2cenjX8KjqWt2OJfTY5bK3mkY2rRxRzzqZGQykPlU1Pp0nOdgF8qb7Gxls7ibiBvZwstwbdmhijjea4eVtcapMXTQhB3IPJgMY3oxwqC1XhVxf3nD1EzNOI5JiSZZJGYoyo2wwz6dh/uyaq4VeUvZFry5uYuIzSzmF41gkaXQiiaPKju4lVdYIOT1yu1QTtzwuOzs7OI28CTzLI0zjW8gMTKvhZ2ONRyTgY6DFQd0kJteAzZ8cd1LEPMqt3EVHwHL5139vKgcUGOttCT8dcw/IClnBuFF7zgvD8b2sbXk/6rSyd/ob1GmEfvioz7T+KfSuKXDJuqsIE/wDhDSf9eugZI+Q+Arqp+rYfrIR90ma5MPLl0oz0rrHOsrVu+w/jGGktmOzjvE+K7MPmCD+7VRqKeey3GGtJ47hRkxsDjOMqfC656ZUsM9M1LFleoqKrzhXtgsJDpmEtu2cHUutc/FMn7wKm/DOKwXC64Jo5V80YNj445fOubZZRRRQFFFFAUUUUGC1eevav2r+l3Pdxt9TDlUxyJ5PJ65xgeg9TVse07j/0OxYqcSTHuo8cxkEs3phQd/MivNkjZ/KrErlO2BjzqxuBg8O4BNeKP+0cQbuYSPeCeJRp9cCVxjzXyqtLtufoKuLtxCIx2dtf93rh1Dz0tarn7nf76X0iG9qLHN1a8IidEFqixFnJCNcSqJJnOkMcsxVAME5AHrXLiPYRo4rp0uY5XswpuIxHKgTUCR43ADHAOwHTG1P3Y/hUs/aCecxu8cF1dyO2CVDK8gjTVyDZKkDnhaeO0iSX9pbkGCzSW5m+nxtLHBqKTaS8uTlmXuz1OSQegxFNp4ZaWMYtZru8jiu4fpDoTFErAqAqOER31NjGkH9E5rtwzsnZGOxm+jKIZ4Zrm5eWeZxHHCqZBClVbLSLjYe7XX2iRm9SeVLgXQQwiygtNcyr7qzSSaEIzjVjekXGLi5/sa2sUV0fSUn71o7cJGGLBAZWUtqIQnGdlIoHWx4bDHNwzura3jl4ixdl7lT3dqilwg15xIUYam55z0AxtxyB4bCS3sXcNdcQmgt0RxGFRWfvVzkDSXjlGT0cDlTRYdrvpRha1s5XvYrcQCR5VFtEGwDMOuTjYHHl4usogt7ju4DbxcMQ25buu9kup2XXs76tK623O5zz9aojV9wrRY8K4dIQ0s94TMA2sCJJWBUH7IVlO32aVcG4pLdceljjBNqtyZXVYxzt4u7jJbGVGtMgZA5mnKaC5SBYf7R8caEJMlnHqVGxkI5bVpAIBYENjHM1FOyfCbu3kkhKyFJCD3kUsyq2A2CTFNGev6WSCfd5mgeOwf0yfjE9xIsvcQS3UmiRiiJLJlUBVtg/dt5ZxSlrqKe3sDNc2sQtLqae7jMoaXvlkkYqkaZMhLl8ac5ByM1FOKw3BvfokEdoZJAZE1wRa2bLjSWuDITIShxvvkHbOyOK7vu5klnvJLVI2MYRV7qWSUDeKOOPRjTtqY4C1BOOL8Vnkt3nt2ma5lu4btYktrjGiNY1jheUoEUhYwWGojOob5ph7Q8WtuIXwvSZDY2cSGTvAFZ31uywKOpkYqPgGJ6VDOH2U965DyEog1zSzOzpEv22LHn0CjdjsPSW8L4fC8azygxcLtSWjD+/dS8jI466jsFHTwjbVVDxYcVexs7nitxtf8SJEC9UQ7qcdABhvgsY5mqvs4v0t/JfU9Tn+ufpTn2i43Lf3Bmk8KKMIvMRpnZR0LHr5n0G3EKAMnbGwHkPs/E9f+tWRLXOTy/r+v51tawF2wPmfIedaojMQAMsx2A9akK2YhQg8xux6FvIeg3rbBpvwoOleQ/rP51xUeA+orL5d8KMliFUfHYUv43bCKWSMckCL/oUk/fmoNe0duFlDAeGWOOVf3l3/wBQam62keNg8TtG45MjFWHwI3HyqV2vAZL2zheIjvINcZU7al1ZXB6EZP30yz9nbtDhreT90a/+HNRpLuzftZvYMLcgXMf2tklA/aAw3zHzq3ezHa20vlzbyeIDLRt4ZF+K9R6jI9a84zcMnjGqSGVF82RlX7yMVi1DI6yRMyOpyrKSpB8wRy/rOamK9WUVXHs59on0lhaXhC3HKN8aVl9COSyeg2PTyqx6yoooooKM9u3E9d1HADtCmSP1pNz+AT8aq9unxqT+0ifvOJ3jZ5S6f8iKn/KajDjatzxiuFyu/wARVn9srprrg/D72PBktNAY/ZICox+UkUZ+FVpKMjIqWezvtDFEz2l3j6NcZBLe6jEaTq8lYYBPQgHzNS+tRw7XXLrOLyEn6Pe/XhG8UXeFdMySRnwswbJOR19KQcO4/PrVO/8Ao6McE29vFG3oAIEViScDbzqV8V4K3DddteI8/C521JKm8kDn3ZFPIOORB8LjlzKmPXvZq4th9KtHF1b+LRcQDVoyMHvE3aBwDzPLoc1lXPtLBcQgx3lxPLM2Sg75pYwgcrqcsTkkq/hG648WDlRZHY3sdGbBXiDL3qxsWXMTvlVY4YeIYYsMbbcvM05aXmkwlh3kUThxGT4SNStIg8g2nBr0Nwzi0IAnR+/B79wSCoHiVtjy8IljQkA47twOTAhp2f7JRqxQoEXOWGosxY8y2M+I75ZmJx5VLk4RAgzgAbeQ+Apph4woRlSNCVLKuDgO4OCTjJ06huST7pG+Kzd8Wk7tkXQGC+FiMjUchRg9OW/xq9qVcSs42QiJHJQg5jOlvULnAOx5ddxzpsuIVtsiOEu5jZgxKqyt4QFIAXBYts2cHDAkdUd/xlioCKfo+lkYbKqYMcZLMceFVZmznPgXHrCu1vFLp0ZGuFsraQOHlnlBadGWMHuoFUykfV5DDAPeP0NEV32wnie9uHhbVEZCVbOQcAAlSf0AQdPkoWnFuHSzaLviUzxRFVSPUC9zMFGAltEx1Nn/ABGwuWzk8qk3Z7smwXvba3EaLub/AIkoRFA5vb2pyByBDSFvlXO87VWVlIz2mriF83vX1zlkU7/3CfljA394jaoFD8IiigSbiSfRLJTqt+Hqcz3DgbSXB2Luds5xgYHgHOH9pe0M1/ICwEUEe0US+5GMYHlqfH9AZpFe3M1zK091I8kh5ltjgdPKNR5D8OdbxKFUHOfs/wD8g8v2j8h1rUiWtYogvmBz33x6nzb0rWQ5PL4Dnz6nzJrdgxIGMt0Ubgf9ae+D8MGcndvPmAeuPM8/nv0Gdxiu3A+H919Ywy+MKB0zz+Hln4j4pePyY8JOp+Z+yueij4dTv+VPPEblYo85x9kdWwPeJ8hyAFQ2eUsST1oiQ9ieG65e9I2TZfVvP5D864drVK3U4Pn+BVcfhUw7K23dwxg89IJ+J3P51Fu3zj6Sx9FB+6p9a+J17JYD9CJ+1K+PkFH55qfQ8OUbnc0h7I8H+iWMEJXD6NTnrqfxMPvOPlTshrFahNxK2VkKMoZSCCCMgg9CKpftVwH6JKCo+qcnTn9E/Zz+VXlMPSoz2n4Us0bIw2I+YPQj1Boqnri21JrTIdPECCQdt8g9COYNXt7OO0ZvrJJHI71CY5cdWUDDfvKVPxJHSqYWFomeNxhkyP5H4Eb1LfYPfASXMBPvhHUfsFg34OlPifVxUUUVFeXPaBHp4jeA8+/cj4MdX8aYAanXtq4b3XEXkxtMiOPiBpP4rUGhmxjGxByD8q3Ga0Gx9DWskPUf18KWa0f3vCftAbfvKOXxH3Gk8sTLyII9DkH4VcRKuyHtEns0+jTxrdWpGkwyYyqnmqEggr+owI8sVI7G34PO/fcM4hJwq5OMxudCE9FwzBWGf0Vcj0qr9YPvCgwqeR/jWMa1bnEOx/Emy01jw3iIP+9jP0Wd/wBZnQoM/fTVw/gvEradmj4RIsDqqtCZxcDwh8YctspZlyMclIzvVeWryxf3Urx/+7d4/wDhxTlF2k4ko8N7c/8A1Eh/NqZTVyHviQU4XdZx9qKMfVyFkUhpOThVUnfAY7HfPWXhV1HHlURXXRokvJ0WNANJAKRl8lTHGefvBuh3pOfjnEG969uT6fSJfyBxTdPEXOZHLnzYlj97HNMpq1e0d3YMvd3fFVMQGgW3D0LjQCpWJpPEpA0LvheuajydtLK1P/kvhqCQcp7r66bljKqCdO3kw+FQsKg6Z+Jz+WK37w8gMD7vwFXinIv43xm8vX1Xc7yY3C5GgfsxrhVPrjPxpDGAvu/fkf8AF0+VYUef9fKu0MLOcAZ+PIfyrU/lLWEHw23390fLr86VWds0hODgfpOf4etKLfhmo6OZG7HkqD+fx/8AB0M8MY0ltIXGw3Y/hnPy2G/PAqssWNiAdKA+R2yzH1xyHnyA5ZyTh1nKxIS7aFHMLgyMfsjovy2HnTWe00UYxDESTzLHQPkBk4+Jz896ZOJ8VknOWwAOSrsooOF7ca2LeZ6ksfQZO5rnHjIzyyM/CtQK2oqxrfjcWnUGwAPupq7NcLPE+IqCD3KnvJT+op5fvHC/M+VRWCSQ4SPUS5UBRuWJOFAHU5O3xr0T7Oeyn0C2Afe4lw8zZzvjaMHqFzj1OT1rN6anaUjGMdPKuWhfsj7qyyYORy8q3Vwaw01YKR0pnv4Qeu1Oc8JI8Jque2nb6C3BigKzTbjY5jQ/rMPeI+yvzIqwRr2igI66CDLICmkc9P2j5dR8/Q0ydkuMrYXUU27quRJjqrjSxXzxzA64HLNNQnluJc5Mksp8THb90fZUD8PIbFZ2qghiMcMe8iJ9a/QsTqC49B+BUdK0z+vSttOsiK6MGVwGUjkQRkEfKsVX/sS4uZbSSBjk274X9iQFlH3hx8AKKw0z7auAd/aCdR44Dk/sNgH7jpPwzVA6QOYznPXG/nXr64gV1ZHGVYFWB6gjBFeYu1/Bja3EsPRXOPh0PzGDViWI4DWwNakUVuMt9vKte6WsisiqNe6/WP41nu/1j+NZrOaYNe79TQIxW2azmiMAVmjNFEFLrfiAjTSq+I82J69MD09aQ0qS/YEkLHuMe4MY9BV1ccjdORp1HHPAOB8Tjn865Urn4g77HSPgoFJAKhgFZorNACs1gUs4TfiGRZQqsyHKh01qD0bGtckdM7UVbPsn7F9zi9ukxKR9Qh5oCP7xh0Yg4A5gE9Tta4rznc+0ziDbCbT+wkS/8Sufxpk4h2ou5v7y4mYeRlfHzUEL+FYs1dekeLdprO22nuYoz9kuC5+CDLH5CoJx32vWqZFrFJMfNvqo/jv4/wABVJA+W3w2/KjFXE5JL2g7cXt3lZJdEZ/3ceUQ+jb5f4MSPSo8K5kgc6Fc52FVEy4FLFEox77Z1McZwNzjoABueg65OAWPjd8ssxMa6UGSuebasfWNnfcBcfqhaUWoVULzbqRgj9KTHKMeQ+Gw57mmvLyyE7anOfJQB+SgD7hUaWT7E9Wbwr1+j/8A5/51inr2GxLpu2X3cwoD56RISx+Ouis2rItOqr9s3BMlLlV2Yd3IfUboT8RkfIValJuJWEc8TwyjUjjBH8R5Ec81FeUJY8ZpKV8ql/bnstLYzFHBaNs93JjZh5ejDqP4VEyP6/P+vWtRlzINGa2NaVTGc0ZooIq6gzWc1rQKaNs1spFaYrYCmjckVjNYrNNQVmisVVZrpFEzHCjJrh3q9SR8Bn+IrRih5u3+Qf8AfqaHFeFSHqB8c/yrqODY96aIfvrn7iRTYoi+0/8A8sf/ALK37yEfoSH5qv5hqBabWAHDzjGOgz8vDqrWV7YDwB39SNvvyPypGt2o5RD95j/yaay3EJG90KP2VBP3tk/jQxkTH9FceuM/jXF3PVh8t61YM3vEn4mhYaHTXV5D766wKc53+/H49K2VKyWAohXJKW5nO2M9APsr5D86XcHsWuJO5hwo96aVtljQHd28lHQdTjJ8mFpyeW1WF7M9YglxpKmXIjyVaR40VgZCPdgTUGbzJx+q2bWpFrezrhUdvDKsQIVpNQ1e9gounV66NOR0OaK29nN0slvI8ZLR986Ix5sqKid4fVirP+9RWWkqooooEfF+Fw3MTQzoHRuYPn0II3UjoRvVJdsfZRcwFpLTNxDz0D++T0x/vB+zv6davmig8gSKQSpBBGxBBBBHQg7g1zNeq+Pdl7O8GLmBJDyDY0uPg64YffUB4x7E4Gyba5kiP2ZFEy/AYKsPmTWtTFJCg1LeJez65iuHtxJC7J3eTllH1gJTmNskFRvzwOoqMXls8TtHIpV0OGU8wf669c1dRwrNbGFtHeaT3erTrwdOrAOnVyzgjauWsedNTHQVsKdOyXAmv5zBHIiEIXy+cYDKMADmfEKkPaX2dy2ls0/e97pK6tKEBVLAM5GSSANydqaYhVZUf1y/E1PbPhNklvO11Zl1hUSJPDNKFmUqSGQliBuMYyRmkcfAeFS273KzXtuI2KujiOUqRjoBkjxA881NXiin0Z+gz8MN+VZNu3WJvuf/AMKkkfYuCQoIeKRsZEMiB7aRCVGcnZjjGD60ki7Hs7BYeJcNkJwABOysc9MaTV2HGmFrX/2bfj/Ktfon6jfj/KpTL7Pb9WCmezDHGAbggnJwMArk70N7OuIaghltNR5Kbg6j8Bpz0NNhxqNC1P8AhMfk38K3Fs3+Dj5P/E1ID7P73LKZ7IFQSwNwcqBzLDTkD41qvYZ9KyPxCwVGbQGWR5AW+wuFGT6U5QymERsOkY+Pd7ffvWX396QH0Go/mMfjT3cdmrKIsJ+KjCHS/c2ksgU5xpLg6VOfOlV3wXhUDzLi+uzAqtLhooo1DDUMnZjt5ZqcjiiTyIOv5D8N61WUsCyIzKObKpKj4nfFT4dxGzLZcOt1KWgu9dyHuH0n9EBmwD65+VT7s69zcWsErMsYkiRyI10jxKCcDoKcqvGPPLXBNYFPXbqzSHiFzEmNKsvLllo0ZvxY0yisq3WpJwfijrayWsCHXL3jzyDmYERWKZ6KNLsSfPHU1HzCyhWZSA4JUkYDAHBK55jO2asr2f2qi0aRE8chdWZsgSlWOi3Tb3MDU7DOwI3OQoWl7M7Aw8OgQ7MdTt0wWYkg56jOPlRTl2SuRLaRyA5D62DfaBdsP8xg/Oigd6KKKAooooCiiigpv2p8T+i8Uil0alaBRMh92VC8gKfEYyD546Zqte18yPdPJHKZVcRsHO7bxr4X/WXGk5323q1vbzwwlLe5A90tE/72GU/erffVJyUE17IcXli4fL3axyolxGbmKVQy9zKAutgeS5HPpp32pP2n4FZdzd3MBaMxTIscakNGyyJAds8sNI3I4wBtWnY26W1QXZUyK8ptZ4zgxyQyquoMCOYJyPPl1qSWfA+Hx8P4hBPO0caXa6JQhd1VktmjBUbtgkKfPBO1BBxZXPDmt7shDHMuqMq48aMoJUjZlOCvTAOOdTeTtUtzEEhvRbyho3CzMYiCpB0knAIIyNicg0we0azWG2sUSZZlWMqrIykMNEeHVc6lBA6gY5b86fu2VhInCxbNGveWkdsxbSCQucHORyOGOOW1Aiv7C+NveRJFGI7uSAhYHzFGq7yuoOMaiASFHWtOI3MixcWikh098IpYjGrlNXhVwpYb8lOB6009rI4Y4bS5sY3tzOuZRHJImX0oVC4bA/T5CpHxOOSC5tbWHiUzG4zkyxxTCPA21EgE5OR05UCHgSRR8UjhIAgWCZ4jv7syh9P7r94B6U1WiwHhnDfEve/TlDjI1BO8k3Pp7v4VKUj4g11LaJLYzSRIjs0kTxgq/QFCd9xkY60x8H4hLNdtajh1n9IjL7ZMZzGfFpYgjbnz36UCftq0D3N9IjHXbfR0tiFdgSjapSWAKrjLcyKk0q28vFrB1cd3LaySE55akcgZ6c6R2QuXkuLaLhUTMhH0gLcoE1NnZiVwzHfPP1rvP2du2ADcEibSMKDdRHA3OlcjYUCHt53FtdyyRuGW4spUUqQfrlYKBt6aaRcFtIUuYOHO2oQ3jTMendrArrnHm2R86b7jtZCuIm4ZCDCzAKz50Nq8YA0bHUN/hUr4PHf3Ma3kVpYRCQHTJNI2ogeHJK7426+VBG768t/oXFLdSDPJfMYkGS5QSocgc8YBp64lM3f8WSO2mb6XFBHCQnhysIViWPhG58+lON3Z8SREka5sFV5I42MCGUgySCMN9Zs2GYZ35Z+FaXltDHKltd8ZuWlcrhLeEQDxNhcsgYAfOg4XNreKxcLDGjWEdk7SyaQuN2Ybb/eK0n7Xw2trHAtwLh4o0RViJKHSoALMPCBt5k1nhfBrJeIXSPE12kccTxmdjIwLA6gTyI26iof2h7ZvdQdytvbwQKyuEhTBBAYDLZwdiegoOF/wS7aA8RmUCKVxhtQJcuTgqqk4UYI8WOQHOltxwCH+zIrqIyGd5NMinBULreMBQAObBDvn3qnHFeAt/Z09o7HVaWVtOF9cyMR8R3P+qlvs9vrWPhlqkqhmkM7EddUVyXT/AIc/KghftNtZI5raNxp0W0aqPJVZlH5URccEPD4reNy0siyaznaGN5ZC0a+TOMEnnhum1c/aLxhruW3mIxqt1I+DO7fxpk4PYtPLHCnvSMqD01HGflnNB6e7HqBY2oA0juIdvii0U5wRBFVF2CgKPgBgUUHSiiigKKKKAooooGntTwlbq2kgbkw2PkRuG+RxXl7jXDXglaKQYKkg163qvPaR2JW5XvIwBIBsehH2W/n0oKK4Pxye2J7phpb343GpG+I6H1BBpy4h2gintrlWBjllkjkVcFkwoiBUNzziMncDnimniXDXicoylSOYPP5edNzCgn1/HJKnB42IdV07Ahl8CxM65XbkhFSm67QwSzX6ySqzXMCwSRZCGPQrhWUsQG3lYnljNU3aXckTa4naNvNGKn545/Ol/Cu0EkNwbkhZJGDBtWQDqxk+DG+1BY/YqG3u+G2sExXvLS8UsfNFkLkZ6grJj5U2cTlhn7RxRptEkiRDB22jYsf8zEfKmDsz2qht5JzJFJomYOqoVcqfFqHi05G4x8Kauz94v02OaVwg7xpHY5wM6ieQzzNBbnC+Bo3HLyJXIC28BBz56K7/AOxGq/t763kykqSJIw5giM6WP+UofIgDrUV4RxOP+0p5kuYtDxRKr98g1EYyu5ztg1y7AdpZklmszIR9ZK8W4xuxLqD651D96gfuztg4vOJoJfF3yj341JxH7xDsDjxcxnrTb2X7H8WthJJE9vcvpAKLeFiOuPd0gnHVhXfs3dzC64kobxPIjEHG4KMA2/T1pv8AZ32fvbCWR2CrrjC5Vg3Jgd/Kgra+ZjLIXUq5kcup5qxY6lPwORVlcY4WR2bgmL5B7nw9N5iKrrismq4mbOcyynPnmRjmrAhja54RDbi4iQDTtJIFA0SEkEc80Ea7K8YdpLWxJQQm4hzt4951Y758/SrZ4r2Y4a18ZNUrTwJE+lZI0QYLlCA6nWSQc525VCEkt7e2iha6t3kWWIlkZT4VmDknTvsoxvzx6028S7QxLxFbmKQyRaAkmlWBIGrIAcKCclSDnG3Sgl/YTtVDLe3k5hKfUxIA+GclGf3woCqemAB8zUGue0V7xOSBJyrRiWPwRxqkalmwc6RkkLqAyTtn1rePtXBDPNPb27N3wXKysqgEZywCZzknOMjrSS+7ZXUgAUxwqpyoiQLg4IyC2SDgkbY50Ez4l2lWW+uI5NEPgxLOzYyFCgR4O2PFsDnfO29Q2fi6pbQQxO3exNKWdRhMOZBhdXiPhbngUxSzM7FnZmY82YlmPxJ3NbRRk8qBTPeSSaA7EhFCIOiqOSqBy/j1q1/Yv2YJk+mSDZciPPnyZh8Nx8z5VGewnYl7pwzAiIczyLei+Q9a9B8LsFhjVEAAAAAHIY6UCyiiigKK110a6Daitdda6qDpRWmqs6qDasMAdjWM0UEP7XdiIbpScYboRzFUr2k7FT25OULr9oDf5ivTNJruySQYZQaaPIktoR/1rg0ZHMV6N4/7ObebJUaT5jb8qrvjfs1niyUbI9R/Efyq9IrM089jI1a9hV40lU95mNyoVvqZCB4wVJzggHmQBXa77OXC849X7Jz+HOmuexI2dGHxBH50w1MpuzYF9MGtO8h7mNshJYo4WaO3Z2aOBtUjIJQGjQ5y4OAKTxdmrPvuKiVSkdm6LErzFAoaYph3RJCTjGNj0zUTgUocxuyHzUlT94xQzSHWO8ciTHeAs3jwcjXv48HffrTDUkHZa2W7uIj3pit7EXYCuquW7iGQprKEBcyN+j5Vy7WdkPo5uHilHcQtAgWVm71mmhjkCLiMI5GpjschVyR5tFvxK6STvknkWUqEL6jqKABQhJ5jCqMegrrecavJUaOW5kdHIZ1Y5DEacE7fqL/lFMprnJw1Y7NZ5M97O5ECAgDuo8iSZxjJBfCKNvdc74qdWnYmyaKPTG7SzQwOjy98YwXs2ncEwlQGyCQCcYFV5OZH063LaVVFySdKLsqDyA8qUreXAXSLmYLhV0iWQLpUaVXGrGANgOQG1MNWNxDsJbOpRYTb6JAUdS5knUWSSlVMzlSTIzbgYGnGKrXjtkILq4gUkrDNNECcZIjkZQTjbJArrZzyxvrjlkR9JXUrkNpPNQRuBXWPh8srFtDuzEsWbUxJJyWJPMk75NMNNAFdUgJ9Kl/DOw93LyTSP68qnPAvZRyMxJ9OQ/CnQqjh3CHkYKiFz8NvnVo9j/ZmWIe4Geunp8/OrL4P2WggACoNvSnxVA5U1SXh3DkhUKoAxSyiioCiiigQlzWveGtO8FYLCg6d9We+rgTWpNAq7+thNSEtWO8oHDvqyJ6bu9rHe0DqJa2BprWalEc1AsIpPcWwYYNbrLW3eUDFccARuag/Km2fsjC36GPhUw11nIoK7ufZ5bt+j/pH8qb5fZbAeWB94/I1am1GkUFRt7J4+h/4v51geyVPtfif51cAQVnuxQVLH7JYup/Fv50vtvZXbjmM/j+dWZpFZoIXZ+z61T9D8MflT3a9nIE5Rr91PNFBwitVXkBXYCs0UBRRRQFFFFAUUUUEUW8rcXdMBkI60C4NBIRdVn6TTAtwa6LKaB776tTLTYHPnWwmNA4a6yGpAJjWe+NA4hq6LLTYJTWwc0DstxWwuaaNRoDmge1uK3E9MqyGu8UpoHYS1uJKQpXVCaBfGa7VwgNd6AooooCiiigKKKKAooooCiiigKKKKD//2Q=="},
-            {"id": 15, "categoryId": 5, "name": "Aceite Pre-Afeitado", "brand": "Proraso", "description": "Aceite ligero que prepara la piel y suaviza la barba antes del afeitado.", "price": 10.75, "stock": 20, "imageUrl": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wCEAAkGBxMTEhUSExMWFhUWFRcYFRgYFxgbFRgVGBcZGBcXGBsYHSggGRolGxYVITEhJSkrLi4uFx8zODMsNyktLisBCgoKDg0OGxAQGismICAwLy0tLiszLS0uLy0tLS4rNy0vLS8tNS0tLS4tNy0tLTUtLS0tLS81LTYtLS0tKzUtLf/AABEIAOEA4QMBIgACEQEDEQH/xAAcAAEAAgMBAQEAAAAAAAAAAAAABQYDBAcCAQj/xABPEAABAwIDAgkGCAsGBgMAAAABAAIRAwQSITEFQQYTIjJRYXGBkQdSobHB0SNCYnKSorLwFBUkMzRDU3PC0uFkdIKzw9NEVGOD4vGTlKP/xAAaAQEBAQADAQAAAAAAAAAAAAAAAQIDBAUG/8QAMREBAAECBAQEBAUFAAAAAAAAAAECEQMSITEEE0FhBaHR8CIjUXEygbHh8RQVQpHB/9oADAMBAAIRAxEAPwDuKIiAiIgIiICIiAiIgIiICIiAiIgIiICIiAiIgIiICIiAiIgIiICIiAiIgIiICLXub6nT57wPX4BRN1wvtGavefm0arvUxBPIquOHlmf2/wD9av7WLet+E9B/Nx97C0+DoSwmkUV+Pqfm1Po/1Xz8fU/NqfRHvVsJZFFfj1nmVPAe9evx0zzKngPelpEmijRtlvmP8B71uW1y14kT3iCpYZkREBERAREQEREBERAREQEREBERAREQEREFW2ntcMqvbxVR0GJAZB7JctT8dt/YVfoM/mUHt6lXqXlcMrBgFQABz3ASWtMCAQo+pbXTRiNdoA3l5A+sBKfM6W81+FbPx4z9jV/+Me9R+3NvM4ip8HWHJP6s+xQXE3kAiq0g6EVKcGNcyovhPUvKVvUL3QII1puzg5ECTuKXxe3mWp7rHZcJ2FjDxdc8kfq+rtWccI2/sa/0B/MubbCubyrTHF1MmgDN1Nu75USpR1rfjnVAJEj4SnpMTkenJZvi9vNq1HddxwjH/L1/os/nX0cIv7NX/wDy/wBxUetb3jIx3LGTpirNB8F7ZY3bm4hdNLeltV7unzGmND4K/N7eaWo7ruOEJ/5at40v9xWXglfmqKk0304w84tMzOmElcnfsm7ABddtE4omrWk4TBgYJOYKvXknxgXTKjy5zKjWyXEiRiBjFnGSfM/ysTl6L+iIqyIiICIiAiIgIiICIiAiIgIiICIiAiIg5xtYfld3EEh7DB0PwPnEgNzw9eeSq+0bzjqrWScGICCByc4MYdRGhU9wrq4Lm8dIBDqGEGYLjTaYIGuTTqqW0kGRu0W+idUzsq/4uoaeMYC86NJkkhvJjNpgZH+i+cLWzY1XYYBwnOcRcQ8mQRnzhnpmVCOyUpt+q5+z3vjKCBI0wwIDt46umVRC8CGE27yADhfTJBMEth4MCDJz0y8JBlrnaQpNcyXU3NJwY2VC05YuQHc2XGc+qZhQvAVrjRfh+KWukNBIgO5pPNOZzUZfXhqODjIOFodnq4AAujdMKK93d26q81HnlGJ7gB6gtrZO0XUiQHlrXEY4aHHIOAyOR5x8VGAr2Cgv9tX47E8ANaQ2ahwkiQ0uxNa7FvJ5O8knQK3eTI/CX/8AePa9cx4MXXLFIuDAcRBxFpxkNaMxOcCN3OOei6Z5Ledff3g+tyk7C+rHUrAdPcFkWlfW7XyHYgYyI+/Ssj67aLB0+B9y+DabOvwPuVavrchzsGLU5Yo3vP8AqO8AsdlaVXPlzd+55PxmO835HpKC4UrgOyz7wQsyjrCywQYMgRJPj6SVIoCIiAiIgIiICIiAiIgIiICIiDkvDkA3lwDpioHUD9SRvVY4gHQmewH1FWjh6/De1jMSKPT+zcNxHQq64nfoen/yZ1rcI13Wx6T3tcOnqXm6JFpcNkGWtdAOkSDlu5wWcOG6Pq/wuHUsO0ifwerM/mvleezpy8FRWdl3BbZvaPjVKQPYG1D7lgBXmw/Rj+8p/ZqIFlWYFewVhaVkBQZ6VTCQ4aggjtGa7R5LDLr4/wBpPrcuJyu1+Sn/AI3+8n2pIvy1qs5kOaO0f1C2VxXyl3dahcVsFavjMPBp16lNrWu0BYHBpgACc/SubhuHqx8SKKR0q4p1yTFdnjHsWtR4zFyq3hJ9Zhfnulwzvc8V3X6ocDn1yvA4a7Qn9Lq+In1L0p8C4i9rx5+jj5kP1FRqNEHGXHrz9AW8uE8BNpXFzcUWur3AcXyHVKrywhvKI4sOwmWtcMwNV3ZebxPDVcPXkqcgiIuuCIiAiIgIiICIiAiIgIiIOTeUNgN5UkTyaPT5r+gFVUUvNc4HqIPtBVq8pLg28eTpxdE/5gVUFyCOd4z7cQW4R9dj8+fnA9fnCPStWu0ijXkj83uIPx2dC2p1iDluj+Ej1LFtI/BVtfzW+f2jPOHtKCp2H6Mf3lP7NVfAlifyZ37yn9mqvIUVlBWRpXm2ZJno07enu9fYvT2YTG46e0ffd3rszw0xhZ+v07D2Cu2eSf8A43+9O9q4i0rr3ALarLa3v6zzk25d3ldaR0La21KVvTNSq4AAd57FwDhLwmoXjq9V7oc6oQwGIwNDWjr0HpK2OFt1eX5Lnk06Z0bniI6x8UdS59fbOqUjyxluO7+i+k8I4TDiOZNUZp6X2cdVc07Nd4zK+N1XyUX0t3XXrYe2qdq2jc03YnUqzSW7sJJa4Hta53oX6E2HtqjdUxVouBBGY3jqK/J+ybF1V0AEt+N2e9XTg4LuxeKtu8uYDLqZ50b4Gh++S+f8V4GiqmcSatfejs01zVu/RqKK4M7cZeUG1mb8nDocpVfKNiIiAiIgIiICIiAiIgIiIOccL34dptMgE24gujDiiu1szlqQtHhHZMNu57qbAcNPlhoDpL2h3KGWhOS8+VSkXXcASTbMy7KzveqC9z2gtOJoOrcwD2jetxsiz7L4P0atN7jxkiphGEjIYQcxhPStPb+xRQt6j21HOa5hbhc0BzYfTOcEhR+zttVaLS1uEtLsRDhPKiJkEHcN62NrbedcW9Sm5gGBkghxOr6YgA6DvSNid1Lsv0d37yn9mqjKZOm8xmR7dexLAfAO/eUvs1lKbOe+iwuDSXCoxxYBJwctrjA3xMTv7Fz8NhcyvtCs1vbBrd8AGSASB0yQOk+lZK9jiOCOV0ZAjMAakb3NHf2rVftCrLWNpuxYHEDE0gNcxmZa0E80CJMmRqt0NrvqYoYwOcGSHOMF5GhAjIsaT1Ar1pwJic1VX6GdE1qJYQDva0/SAcPQQrpZ81zTzTdV6pG4mmWtbP8AidP+FV6vbY2iq4uJDKU5DMFrm4jJG+kTABIxaGFI3wNS1bUpuLTx9d7Tvwl8x4ELycfB5dfYSO0dpcjBpvJXPL3bDnVJ+IDp0jpK2am3aruS8A5ROhUE9sGFinRFvp31txcuDZ3Zie8Qq3tWu2o/ktAaNIWkSvkrk5lX1lLJrYe0cBFN3NJgHzT7l0PZ+0QGYCASDIdvXJWa5KdtdoVzkHgbuaMleZMxaqSzs/k2rFt1XpjJlRoqAbg7PF6ie9dJXJ/JLRw1dS4lrpcd56yusLq1btCIiyCIiAiIgIiICIiAiIg5V5V2/lTOu3b6K496pZeTlJPViB+rUzV28rjCa9ONTQIHbxzPeqCHPA+EDogRIxD0rVx6qUm7wPSz1yOhYq1NradYCZ4rfBy4ynoR3r2bgAZHfuJ9LXZblhqPBZVI/ZZ8kN/WU+jJVFb2aSQGzyZDj2jFh9bvvCuVUOLqjRIOOphJjkk1MRdnvykdg7VTLNhDDUBza5ojpDg8/wAHq6FZNk3YcAR9/BdvmTTgZsLeN26IiZtLNbWzhcscaj8TWUmDl8kS5lHoHJJD5EEE5a65tn02vJq0y1gc1r2lkggzUa4gfE5YqERIgheH3TW1muc5oBbbglxAEtu3VHa6QwYu8dInHsW4IoUgTJFPATnyYfUcADEEQ5mh3hdnHqxP6bPTOukf9SiIz2lk2hVa1rsXySCI+LxkCANPhCpzg9VDbFoe1sGpV5LsgOVpJG7SCqXf3GOoANAR4/f75K7Uf0Y/v7j/ADXdR9IXSxq6ssUTOu8rVa+iGvNm2jiXGi9vW2SPqOI9ChbzY9tMh7x25faapG2t2kPe5oPLMkyIyBiWwR8ZaW0nU2efO4B748SSCuvepnRGv2Tbj9cfFvuX1myLf9s7uLfco6+vC7IYgN8un2BZLK9OjsR7HkZeC7E8PjRhc22iXi9k9abJtRvqO7nexqmbKnbU9KA7ahbH1nE+hRdk6k4TDshJDnvidYmc8upe9oW7QKZDWiS7MACcm9+s6rrfF9V0dY4BXRfVGQDQ0xAOHTpMT3BdAXNfJtVc6tLjPJOmn9V0pQEREBERAREQEREBERAREQcv8rxIq0XDXiXR2itS96orL14ZhLQWgDqIALdZ10Hir/5Xm8u362VR9eiVzsW+Jpe4OImGtbGLt0MDKNEmmJ3ImYe6lxSeDIAdI1EZTnmOqVr1qLQyqWkZsiJk5Gkd2WpO/cvTqMNLmh2HLE1wGIDcevwHgsOCBUjQ0jH0mlSKLbSs1XQFn+Yf+8peqqvtrX4t2Ldv9/v/AKJaD4Cp8+l6qqxLmwsSaKr/AO/si27Org5uLY+V5wIIAzz0Pgo7aF7AyAa4gCBpIGGesmJ8VFWtYjkeH8vb0dWW4Ly9+Iz0ae0/foC9GclGFmjbp7/X7NZur3bjlN7R610K1P5L/wB+v/mE9I9a59b85vaPWr7bF34K6BPw9ft5/RvXmTMzN5ZQXHinTqOnPGAOl0wTuJGQKq9w/ecyVNX7uQZ8/TuWlUsWOOsEhpgnQEs5WuQ5Z+iu9wXDRi13q/DHuzMyr1WZXu3Bn7/eFJmzaQ2DLnMxgDpOQbrvOUr7Ut2saXTMAbtZax2s/wDU9C+lmumYyW7WcURq+2tWCHDUH/2PD1qwXFUVGUXTJJcHdTobO7rCjGWLATnpxgic5aHFnccD1ns3DC3o4wmOqG+5fMcZw3KrvT+GdvRzRLrHkzaBVy8w9Pt9wXSlzfyaj4UjTkHLw7/FdIXRlRERQEREBERAREQEREBERBzbywD9HPya/oDD7FUrGkGszIzLR0w0BuLsP8yuXlfblb9lx/lg+xVSxph9GQQ10s5RzDWkbwDnEFahJZ6lI1aLqpaMYLpI0fTJkyDrAM9iqdSlhFVu4MdGsxyXD0H1roNpcktim2RyMiI5IOZOerpJjoE71R9sWxp1arDupPHdMt+rCoqtp+YqfPp+qqsSzWn5mp8+n/qLCsqFoIgr0F8C+hXNNrDPa89vzh61drd35I7p/CK0eIVJtOez5zfWFdbcfkbj/aK38Kgr5ph+PEJgtz351GtcfBxWjcWpJY4PLZ4tk5AOHGPbkOkYGuWyawbjaRzhGumYP8MLGxgdE/FgjIHmuLhu6SfEr6nBy4WFGXZiYujH0nOqcU18w0+bPJkhoPTIHRBKy/g5xcW6pBAaSCGgA4hTw6Z8kCDHmrPxLBUeSAC0Uy7Kfzjmuy7Zwn5y2ntD3OEn4J+AkgZzUxNAO4NwaR1aLnqxba9Pt77MxDFa2ebTmSalSmCd7SXZnLUgVB4LbIaGsLQBjGLQzznQZJ6I3LDUGEyCZJmdDMuM8kCDLneK9NrghrMIkCAROkknKY3+ldbGy4uHM17fy3EWdT8lTfhCfkH2Lpq535MGR9CfGD7V0RfMS0IiKAiIgIiICIiAiIgIiIKN5T2j8lkSMdUEZ6OpGdM9FzvYNfA9zXc2MLhqS0mWOG46nujpXSPKaYbbOiYrOyOh+CfkuWbYa6nUFUFskxAOsAaiezQ5HoVhHQbQAhuEyA0b9eTAPYVz/b91xtxVcNBRd2xGU9cELHR2+5jXBmIYxBbIwz506zGWUe1Y7Rg4mtUcZe+mQ3MaGS7KOlm4+1UVy0b8DV6nUyfFw9ZC11M8F6LHisyoYa5rQSC0EEOLgZcCPiqMuaBYYIiZIzBMSQJjsKisQX0L4vdNhJgAknQASfAIJPg5acZXZmAGEPdJzLWkEgdJVs2YybM9dxW/h9sKO4PWjWgB0tdIaThcB8IGvZighzsxHRJ8ZHZv6CT/AGit6mdHrQVLadGMRG4gdxBPsWpQqyNdehStehibViOSWO1yiHTBOuqgHEtPUV7fhuPFUcmr8vRmW9c1wHVnSBjbQA0GYLA4EbhkdcvFZbaqC+5hzSHVWuaMQg8pxkZxvae7qXrZBxTIBaRmT25Adufgvl/WaJGEB2IknMZQABBPQB4TvXpTrei3vT0ZjdjuKy92bMsW8uiOqJ9qjgcR6gp2hRLadNxiXPLhvyhoE94OS8vxHHimOTT+fo3Drvk2IMkeZ68MK+rnfku5zx8jXqkLoi8WVEREBERAREQEREBERAREQUryqUXOt6Ja4Nc2uC3FoTgeIzyXM7jaPJ4q4pYAQQHMaMMmeUGzEydQeqF3LbezhXpGmY1mHCWnqI71zfanBws5I5E/EqDFTPzTqO4kdSk5ui6dVGsdklxLg6m5jRMzIOYyLcnNynUKXvmYaNVkmAx8aCMgQDIBeOeQesLXvtjcWcXKoO3OBJpz1PGbe+Oxat/dXDabm1WB4LS0VBrBEZluo15wSMSL2nSSaZ3R/BAgceYMhjS2MM4i7C3nZRLlJXuyhULjDThwhjWwwADEIcTJAzGQ6W5AyBAbDvTTL4pmpiAEAkaGdwJhTP4TeVGhrKLKbQSRyRkSQ4n4QkzIGcbkmumneSKZnZB3OyazHYTTcTAMtaSM2gxIGualNmbLZTGO4cGOkYW8YA6IcDiAOIZ4ctV9q2lR3JrXf+BpLsugNEDwC27Pg2082jWf1uim362E+grHNidomVyT1Zrjbtu0gio9xykNYC2Qdzn4TENYNDzd5grbsHEbOa6ImtWOfXg0WzacHnjMNoUuwGo7xOHPxUztGi2laUxUc5wdUqcqB0MygCI8Vuma5nZJiI6qLs04jVxSZDQd2uIGe6VEbUsi0k5Q6TAMxPYIhWk7M1fSLTOuEt9LXgt9IWvWpVsw5oIIgg03GR/23EeC3Fc0zdLKM9zm5d/9fevdNxMej3qevNjEjksgjMRxngA5vtXzZ+x3RLmSTuIqCOqGj2r3f7vTyL2+Pb92Io1YNmWJfpo0Tvz1jOCNQpvaLQRTAgZu3yIDQdfELPQt6wAa0YQNA1hEZz+sd05rP+BAQ6s9ojTE4HwaAG+teFNc1TfWZlyWXzyWAS+JjAM+8LoaoXk0rtc6oGThDRmdTn6Ar6s2mN0kREQEREBERAREQEREBERAWOvQa9pa9ocDqCJCyIgrW0OC0yaL4+Q+Sw9Qdzm+kdSp9/wcNM811u4mModRceoc3wwnpXVV8c0EQRI60m0xaYI01hxpmw3jn1wB/wBOmGnxeXepb9rwTa/SlVq9by4t8CQz0Lp1CwpMMtptB6Yz8dVsrMUUU7Qs1TO8qTYcEagEBtOkOgAT4NEelS1vwVpjnvc7sho9p9KsCLV0aNvsigzm0mz0nlHxdJWHhFsRl3RNJ+W9jhq1249nUpRFbj8+cIOBl7auJ4p7mjSpSlwjpOHNveAoBm1q7cuNdluME/WC/US0b/Y9vX/PUKVT59NrvWFua77j85jb9x54+i33L47b1x54H+FvuXda3k/2a7W0YPml7fsuC8UvJ3sxulq09r6jvtPKZqRwWrtSs7Wq7uOH7MKV4PcGLm6cDTpOInN7hDB2ud7M13qw4O2lHOlbUWHpbTaD4xKlFYxLbCE4J8Hm2dHADie7N7uk7gOoKbRFxzNwREUBERAREQEREBERAREQEREBERAREQEREBERAREQEREBERAREQEREBERAREQEREBERAREQEREBERAREQEREBERAREQEREBERAREQEREBERAREQf/2Q=="},
-            {"id": 16, "categoryId": 3, "name": "Bálsamo para Barba", "brand": "Beardbrand", "description": "Acondicionador para barba que aporta brillo moderado y control.", "price": 12.80, "stock": 17, "imageUrl": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wCEAAkGBxISEhUTExMVFRUXGBcXFxcVFhUVFhcYFxUWGBcYGRoYHSggGBolGxUVIjEhJSkrLi4uFx8zODMtNygtLisBCgoKDg0OGhAQGi0lICYtLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLy0tLS0tKysrLS0tLS0tLS0tLS0tLf/AABEIANQA7gMBEQACEQEDEQH/xAAcAAABBQEBAQAAAAAAAAAAAAAAAQIDBAUGBwj/xABMEAACAQIEAgcEBgcFBAoDAAABAgMAEQQSITEFQQYTIlFhcYEUMpGhByMzQlJyYoKSorHB0RZTc7LhFWOD0gg0Q0RUk7PC8PFklKP/xAAYAQEBAQEBAAAAAAAAAAAAAAAAAQIDBP/EADkRAAIBAgMECgIBAwQBBQAAAAABAgMREiExQVFhkQQTMnGBobHB0fAi4RQjQlIzYqLx4iRyksLS/9oADAMBAAIRAxEAPwD3GgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgCgI58QiC7sqjvYhR8TQGZJ0nwa/wDeIz+Vs3+W9AQjpfgf/EL8HH8qWBag6Q4R9FxMN+4uoPwJvQGijgi4II7xqKAdQBQBQBQBQCMQN9KAgOOi26xP21/rQEySBtiD5EGgHUAUAUAUAUAUAUAUAUAUAUAUAUAUAUBynSPp7hMISgbrpR9yPWx/Sbl6XqpNg8+4r9IeOxF+q+qT9De3i97A+TDyrWElzkMfxUliZcSC3M5mkb1yW1/WNbUeBHJbzPPFMP8AikbyRR/nJq4WZxoReJ4ful/Zh/5aYWTrEW48TEfvuPzIh/y2NXAx1kd5o4DiMkesOJynvVnhby1zX0G17Vlx4G1JPRnXcN+krGQW9oQSJ3tZDbbSRbp+1qaxh3Fueh9H+l+FxnZjfLJa/VSdl/McmHiL1lqxTU4pxOHDIZJ5EjQaXcgXPIDvJ5AamoDlMR00ml/6phsqHafF3jU+KQj62QeeShbGbiPa5ftsXO17dmArg4x4AreW3m1C2KL9GIWN3hikPfN1uJb9qV6FBuisH/hsJ/8Aqxf0oQrP0VgvcYXDg98ayQt6GNxagJYUngP1WJxsPh1q4uP9jELcDyarcWRs8O6YY1DaSOLFr34cmDEW/wACY5XP5X9KmRLHVcD6SYbF3EMn1i+/E4aOaP8APG4DDztbxoQ16AKAKAKAKAKAKAKAKAKAqcV4lDhommnkWONd2Y2HgB3knQAamiVwePdK+n8+LDLCThsNqCzHLI427R+7+UXOutdFEjZ55iOLotxEmY/jkGnmEvr5sSdK6KO85OpuKMr4jEasWceOiDyGij0qOcIaljTqVM0svIZ7Ei+/Io8FBY1McnpHnkXqoLtTXhmL1cI36z1yr8t6f1eHmL0F/k+Q8CH8D+eYD4XGtLVd65DFQ/xfM2sEmCZRmbEq3NrRMnzymr/WX+L5k/8ASvbJcn+yccGjf7HFRPytIGgYnuGe4J9addJdqD8My/x4S/06ifB3i/Mgnw+Jwp7SyR357ofUXVvnW4yp1Oy7mJwrUe2mvTnoNTGKSLjqze4aIdm+upjGxub5kKtUcNxY1U9Tc4Z0qWPELJjc02YZExJZ5uqAtoqtoARYkBQ19e1e9cnTvodlKx6lhQjqJEYOHAIcHMGB2IPMVz0NFnqx3UKAWoBQtAIY6AgmwwPKqQysTgAdMoPmL2oUpY7CXKh/rcnuMGZJ4vGGde2nlcjvoQ3OC9K3iFsQxmhG8+ULNCP/AMmNdCn++QW/Eqi7UJY7iNwwDKQQQCCDcEHYg8xQg6gCgCgCgCgCgCgKHHOMQ4OB8RO4SNBcnme5VHNidAKA+bulPTGfimIEr3WGNrwwA6KLHtuebHTXuY5SLV6I07HOU0itBgpsUxCi+UXJJyxxr3knRRYeZtzqylGms/2zEITrSsv0u8ouscZsLSN3nVfRRv61i0565LzN46VPs/k9708FtK80zN7zE+BNh+ytbjCMdEcqlWdTtMj28P3fkLsa2cwtbw/d+Z1NCigc/nt+82tCFvCn/wC/9WrSIy0Bfx/e+JOlUyXMBxSaHSNzl5ofrEI7ip7NvnXOdKE9Vnv2nal0ipSyi8t2zky3kw2I0GXCzHaxJw7nx3MPzArn/Up/7l5/s7Lqa3+yX/F/HoY/E+GyRMUkXK1udirC4IPc63A+FdYTjNXic5RnRlhkvvAv9DOl8nD5MjhnwzHtJuYyfvpffxHPz1rE6d9DrCZ7fhMWkqLJGwdHAKsNQQdq8x1JTUKKKoHGoBKoInSoQp4jCA1QZeJhKkOpKuuzD+fePCpcpa6O8aOHJyr9TvLAuvVDnPhwPuc3iG2rLrdWpGj0KKQMAykMpAIIIIIIuCCNxahkdQBQBQBQBQCE2oD5r+k7pc3FMV1cTH2SAkR22kbZpj331C+HdmNemlC2bOVSdilwTg4kBZj1cEfvva5vyRB96Q93Lc8gbUqYckrt6L3fAxTp47yk7RWr9lxJeKcT6xRDGojgU3EanMWP45CPffzNhy7zIUsLxSzlv+BVr4lgirR3e73swphy+X+i10OJCdPD5fELrUKN28P3f6saALW8P3fgTqaAUDn89v3moCaA63+e/wAS2lVEZeXXx/et8dK0ZHb+Phq5HkBZaACOXy3+S6CgNHA8TXJ1GIBkh5bdZEfxRd35Tof48Z0nfHDKXk+89NKusPV1M4+a4p+xn8f4OYiNQ6MM0Uq+64/kw5qdqtOoprc1qhVpOk007p6Pebf0XdKDhpvZJT9TK1kJOkcp232Vzp52PM1mrDajrTlc9mrzHUL3oAtQCCgENACrQFXEQjUUBhYzDMjBlJVlN1I3B/pQG/0R4uFIQ6Ru1gvKGY3JUd0UmpX8LXX7yAUy0dnQgUAUAUAUB5t9NvSc4fCjCxNaXE3UkbrCNH9WuE8i3dXSnG7JJ2R4/wBH+EdYwQEIoBeWQ7Ii+8x9NAPKu9Spgjfkt7OFODqztotW9yL/ABXHiUqka5YY9I0ALEd7tyLtuSb/ANZSp4c3nJ6/dxmvWxtKOUVovd8WZ7C+m/hv8AugrqcSpOvL5f6LzqFK1tbDfu29Mq6mss0s3ZE8XD5D93KBuT2LeY1a1c3Wgj0Q6LVlqrd/xr5D4sIl7Zyx7ohc+ebW49RWHUnqlbv+/J1jQpXs5OT3R+29CX2aIgdkFtL5HzPsdgWtcGw531NhUxT1vzWXp8G3Cja1lfg7vbor2uvG+4aMEpPZlGba0gsR4XIuT5LW1UktVy++5xlQpvKE89zy+vuRO2FkX3lPmO3b05DzFdI1YPacZ9Hqw1jy++thquD4+GrfACwrocB/h8r7/qpsfM1SDW08POy/FV1qFNDhWNQKcPP9hIddgYn5Spz0594v5Vwq0324dpefA9NCqkurqdl+T3r3+3w+OcMeCVo395diNmU6qynuIsRWoTU43QlGVGbjL7xPZ+gXHzjcIjMbyx/Vy95ZQLN+spVvMkcq8042dj0p3OqQVkohoBhFUDagH5dKEIs16FK+Nw4ZTVIc8p6p7tfI3ZcA2OUncHkwIDA8iAaFPR+CYwyxdoguhyORoCQAQ4HIMrK4HIOByoYNCgCgCgCgPmHprxr27iOInveNG6qLuyR3AI8Ccz/8SvXTjZHnrS2FvHj2eBcMNJJAsuINrkXF4oj3WBzEd7CudP8AqTc9iyXuzdb+lTVJavOXsvcy40LbAtbuu9vhZQPOu7klqzyxjKXZVyyOHtoGIW+wJvf8qrZT5Xrk68dmZ6Y9EnliaXm/DY+ZCyw6jtSGxNvcU5QSdrEGwPfUbqPh5/fI1GNBO2cnnwWWfevMbgsRmvZci6aoOXPM2UqTbvA8xz5VIW1d3x/7v69x3oVsV7Ky4ed3a3NLv30gxBvJIraEWt1tr91+wO/eujV8oq3l+/I4KbTvUknlp2v/AB8xksyli2S5JucxNr+Cra3qTWowkla/L78GKlWEpOWHN55/Ct6sb7SeYUjuyLb5AEelawLjzZjrpbUrbrL2XoT4TEopvlKki3ZJI3B0Fww2/FWZQlJWvf7y8jdOrCDulbLY36XT/wCRcwDjPfrBkJJyqcoBN7dl9ND3X2rFRPDpnv18172OtBpVO3lnksteDy5XJuuLPlkjW2tmkvGbC+pYjy90DU1MNo3g+Wfl83NOo5Tw1Irbm8nbvt6JDTHCSVWRl301ZDbe1jtYblq2p1ErtX+/dEcnToSdoys+a8PlsGwEgF1yuvfGwA8uWY+AJrSrR0eRiXRZ2vGzXD76XKbqVNiCp7iMp+etdE080cJJp2a5l3Et7RhgD9phx2Tr2ob6rrvkOvkbV52urqX2S9f2exPrqNv7oacY7vD0Lv0U8U6jHGEnsYhcv/EQFk+WceorVVZXJRlfI9rQ15juJn1oB5WqCMioB8dCMhli1oBjHlvQHP8AEk1NUpt9CsdZgp/wz6BniPhoJl/YFCM7WhkKAKAwOnvFvZOHYqcGzLEwQ9zv2E/eZa1FXdgfPHQnAq0qBhdIwZZB3hNberFR612rywwdtXkc+jx6yrd6LN+H7sX5MdFJKzMt3csxaW1s2py5WbLbSw1XkKzgnGCSeS3fb+prrKUqjbWbvnL0s3b0GzzShxmIEYb/AArrzyknPa34SRSMYYctef65ic6qn+TtG/8A7cuG3k2UInVDmzszEa5RYG+4LPqfIrXWScla1l93fJ54SUHixNvht72//wAgoY+5GAPxEZ9u8v2R6AVHb+6Xt6Z+pY4n2IeNr+by8kVcWGOrNm7u2HI+BNhWo2WUV5WMzxPObv43+SPFRoAuU3uoLeDcx5VIOTvff5FqxglHA9mfBiymPrbqPq7rprtYX313vWUp4M9TcnSVa8ezdb/HXMYrKGY2uvbtcd4OX52rTTwrfl+zClFTbtlnbzt7BCUyPm97s5N+/tbabd9HixK2m0RwYJYtcre/1k6KnVXzdvNbL+iRv8QfiKXljtbK3mMMOqvf8r6cPt+aJcPnAsjCx+7nW3qjHX4GksLea8vcQxpWg/C69H8EhkK+/FlJBF1BjJB0O4K7dyipZPsy9/35mnJx7ULbN3yuSJsJLGoOU2Y3sWzIwOWy2ZL6Ak3Byg6dwqTUnr8+T/ZqnKnFO2vG6fDNXy33tfwJlxUyxkuBItxoVDpazZiWTsk3y+8Tuazgg5ZZeT8zSq1VC8ldc1tvmst2tx2GxECZJ8uS5IsrXuLWbMCAMtj91bX51icJyvC9/v3VnWlUpQw1bW7vPw7kYfE0bC4jMm8MiyRnwBDp8rV1hLrKd95xnDqqzjs9th9DYDECZEkQ9l1V1PerAEfIivKegttGLUAitfQ70A1qoGqdagJW1F6oIStgSaEMDGLfWhSDg+IMcptzW4He0ZEij1KZf1qEPUAb6ihkWgCgPNvp7xeXhyRj/tcRGp8lDyH5xrXSn2jM3aJ5RwXFCLCztu0jxRDUrYLmkY3Ug7hRoa1OOOpFbk37GaUuroyltbS99hY4PA+IaQLIIiqlyVTUgHW75s5OvMmlaUaaV1fZr7aGujU513JRlhsr5L3vfm2Z0mHsgYk53N1TL2ip2Ym+l+Qtr5a12Us7bFt9jyunaKlfN6K2ffrt2b+7Ms43hTLIUiWRwFDG8bKwvfcHYaVzp1044ptLO2p3q9EkqmCmm8r6WfIqz4KRModGGb3QQdfAeOu3jXSNSEr2a4nGdCpCynF56foZPw+VQWKEAbk20NwLeeu29ZVaDaSZuXRqsYuUo2S+8+GpVhiLsFXVibAVqUlFNvQ504SqSUI6smxOERC6GUZ1vplOUsN1DX35agVyjVlJKSjk+Offb9noqdHhTlKDn+S4ZN7k7+qRWgiLsFUXYkADzrrKSim3oeeEJTkoR1ZaxGCRC6GUZ0B0yHKWAuVDX35agVyhVlJKSjk+Offb9noqdHhTcoSn+S4ZX3J/pFzCcIVmgXM6mUMTeMgAqL9m5GYW5+VYl0hxU3ZZcTrT6HGUqUbtYr3y0tu3946fharC8ucnLKYrEADQnW99eXdWoV26ihbVXMVOixjRlUvpJx+/UVmwMqgXjYAkDUW1I0B/CSLb2rqqsG8med0KkVnFr75eJd/s9iOsWLKMzAH3hZbi+vkN7X9a5/yqeFyvkdv4NfGoWzfHQqx4KYOQitmUXJU2sL2uWB0B8TXR1IOOehxVGop2indbvkZiZXDFZUBYaEOpVwfFlsxPmTRJNXi+WnwJSkm1NZ8VnzVnzF48BJHBIBbNG0Z1v9k2Ua89CK5UvxlKPG/M9HSGpQp1FtVv/iz1r6L8YZeGYYndA0Z/4bsq/uha5Tykzos0dgDe9QFR9DUKP3oBrUA+LWgGYw6WFUhj45LCoUycPJkmjbudD6ZhemwHp3DPsox3KFPmosfmKpgtUAUB5J/0hJD1ODXkZZD8I7D/ADGutLU51eyeY4Kd44QVUEHrAxZA6i9hfUEA6b1bRlUd3u2msUoUIuK1xXyvwNLoxxCOJpWkcLnjKiytqSQdkWwGlTpNOU1FRWj+6mug14U5Sc3a6tp8IXjGLixESOXC4gDK4yvlcDQNcLa/P1tyFKMJ0puKX46rTLzJ0qrT6RTjJu09Hk7PjoaMnFoDinl6zstD1YOWS+a45ZdtN686oVOpULZ4r6r5PY+mUP5UquLJwto9b9xVwGIVkwsaNd43YsAraKSxO4APZ/0rdWDUqk5LJrLy9zHRqilChTg/yi23k9M96Wz9DOJZGhlEUqEZzLIMrgkkjQFtteW9ZpYo1I44vSyzRuvgnRmqU1a+KWT14N6d2ph4fiBSSJyAerAWwABK6g37zYnWvTUoqUJRW08FHpThVhNrs5ZZZfOY3HLEzyOJRYlmUZXzEnXKdLDU73qU3OMYxceGqt3mq6ozqTmp5O7Ss73edtLa7bjMDxExtEbAiNidAAxze9c89NqtSipqS3+xmh0p0pQdlaLb4565+hoDE4fNiHJVs4Zow0ZLK7XOt1sNT3kVwwVbQisra55W5nr63o2KrNtPFdxvHNN96trxsWsLxSENgyZB9Srh+zJoWUAW7OutZlRqNVMu1a2nydIdJoqVBuXYTvk9q7h68TiERGbM3tPXBcr6pmB3K2vYbGt9TNzva3422anN9JpKk1e76zFazzV+6wcZ4irdb1UqlJcpZOqIa4t7zEW07wa1QpNYccc1tvkc+l9IjPH1claVrrDn4to0DxfD+3JiesumXKRkfMvYYXOmuttr1yVCp1Dp2z70dpdKo/y1XxZWto7rJ8PS5VwOMgWLEQNIv1jB1kMbshs18rLlzct7fePdr1nCo5xmlpla6ueelVpRp1Kblq7p2bXda1/LaZXE+IO8vWM6yNYLmMahTbbssPmQDXenTUY4UreJ5q1aUqmNtPjZej/7JuKO74QO65WGIYWCBBZ482gAGlxXGCUatk/7e/aemtKU+jKUlZ43stqrnefQxKfYmHITyj5If51KvaJDso79W1rmbIZKASI0A9l0NAMifSgELUBn8VGlAc7if51Qj1Thv2f6z/8AqNQwWqAKA8o/6QcN8PhX7p2X9qJz/wCyutLU51Oyeb8BtkQ9ktaRVBYq1y17pl1J0G1tCda51O3Lw9D00bdXB7fyWvHYLHh5LkTINBcsVUm45F0ZdfztXbFG34P73NPyR5+rnf8AqLxt7przZXEUbNlUuNTbZwfG4sQPQ10vJK7+PvkcVGEpWjf1+PcaMMx90h/ym5/ZNm+VXGtuXf8AOnmZ6qT7Ofd8a+Qi5RoQwYcwRp+qRf50d3pa337oI4U7O6f3Zb3G4l7j32bwa+njuRUirbEu76izliWcm+//ALZA+EOdUvqwB10Auua2l6z1iwuRvqHjUNrt5q/EqZOyWuNCBzvre1tPA1u+djko/i5d3nf4EyHLm5Xt43tel87FwvDi42J0wTF1S63YAg3uLFc3d3CsOolFy3HRUJOahdXeflcijjurG/u208CSCfQ2+NbbzSOajeLe6xYhCaXY+Srf5kj+BpeWxFShtfJftE6qGNkVyfPOfgqi1L2zk16EspO0E/X0Q/2a3vMi+uZvgl7HztTHfRX+8S9XbtNLzfJX87FnF4MQ5cysxa9sxCjluqEk7jZhWITc72en3b8HSrSVK2JXv4eSv6k/USlV6pGiNjn2Qi1rEG3WFfVqxiim8Tvu2/r0OihUaXVrDv2f+VvFj+IQZeHjtKx9qAJQ3BPUuTc8z2hvY7VmDvWvb+33RuosPRsN0/y2dzO7+iGHLgA34pZm/fy/+2pUf5Eh2Udqp1rmbI5KoGxb1ASM9qpCDIRrUKPkFhehChxH3PWqDACZnVfxMo+Jt/OpsKeo8M+yU/i7X7RLfzqmC1QBQHCfTVget4XIwFzFJFJ6ZsjH0WRj6V0pv8jE1eLPBBrAP0ZCPRlv/EVtZVe9ehl/l0dcJeqJ8HjpEtlcgDYHtAeQa4FdHCMtUco1Zx7L++JfHEQ32kak69pSVbUWNzudCdLga1nqmuy/v3gdf5Cl24p8Vk/l80ibCNACSp3Fsso0+OyjTvJtWJqo1Z+X34OlJ0E7p+EvtlzbGdRKBqc62OW1nBNtAoYXt5DamODeWT5enuTqqyWbxLZtz4X9kQRQByRkKkb2Lc727LX7tyQK1Kbhne/3f+mzFOkqjaw2a3X9Hf1SKLRc0cepyN89P3q23skvf9+RzjHbCX/1fx5laSNk3BW/mAd9uR0J+NE4y0JKM6eqaIr/AA+VaMXysSxxOe0AbfiJygW0HaNgPjWHKKyfL9HSMJv8lz0XNksGEBYLnBJ0ASx17szFV+BNSU2le3P62ahRTko4s+Hy7LzZaw6KJMnVk2azHtSMBe2YKABa2uqmo28N7+33mbjGKqYMLyeerffa1uaZflwznXN1celg7KBoBfsr2L3vobViM4rZd8P3mdJ0pvO+GPFr0X46j8biIGbM13NrWQFU8iCbjzDGrThUSssu/X74ErVKMpYpZvhkvX0ZD/tUr9mix8r+83kTpmHmDW+pT7Tucv5LXYSXm+fymU58Q7+8xI7r9keQ2HpXRRUdEcZTlLtP73Glxf6vh+FXbO88x8lKxqfUKa4wzqye6y9ztPKjBb237HqnQXB9TgMMhFj1Ydh+lJeRvm5rjN3kz0JWRuA1koxjrQCxVSDJDUBIuooUZiNqAzeLvZQvrVBmcNQmdLalbt6qCVHqwA9agPUIIgqqo2UADyAtVMD6AKAo8d4cMThpoDtLG8flnUi/pe9VOzuD5Y4fG31kLCzEHsncSRm+Xz0YeldquTjPc/JnOir46e9Zd6IoWrseUsrVA+gHRyFfdJHkSP4VGk9Sxk45xdif25iLMFceIGnlyv42rn1K1jkd10mTVppNcV9XkIs0V7gFCRY/eW2lwdyb22AGlxWJQqWtr5P7zOtOrRTuk4+a93ySyyIlw7ZiyPmBJJCMFOp5jUW8Cay5qyUlbvz/AHyNwpScnKnK6ebSdvLNW4NiJEdCLakAZY41Y3BNsx7KkWOq35X1qOWqfq3++ZYweTW3S0Yp7duitbZfjmPgBicu8qg2Is15GAvsdjy3AtSVpxwxj7IsE6M8c5q+md2/Z+KViD2iBTdYyx11Y2Av3DYjwKit4aj1dvv3acOsoQd4xv3/AHTwBuJyEWBCDkEFgPK9yvpatKjFZvPvMy6TUasslw+5eBGHJNyST3nU/E11Stkjzttu7HiqQWgFSMsQqi7MQqjvJNgPiRRtLNhJvJG90hwgnxsOCQ3VOqwlx3JrM3mLyfs156OVNze27+D1VM6iitIpLkeyyAKLDQcq4HcajUAGqQSI61ADUKOja1Ugj6m1AYHEn7RvQGh0MwmeUuRpew/UIY/vdV8TQM72hkKAKAKA+ePpY4McFxIzILJP9enIZ72mX9ohj/i13jacMLOMm4TU0crj4Qr5l9xxnXyO48wbj4VaMm42eqyY6RBRnijo8194CIa7HnNPgHDPacQkGfJnDnMEzkZInkNluMxOS243qSdlcqV3Y2+G9FS2MfD5g4SDrhnRo8xeJOqR0zZkbPNGCt76Vlz/ABuaUPysYE+By4eCfMD1zTKFItl6rqtS19b9b3C2XnfTd82jFskzV4p0U6vFQ4RZs8kknVvmhaMxWYAvZm+sjILMGBFwh2rCndXNuFnYqHohMzY5UOd8GVsoXWZWkKhl7XZ7Iz210NqOay4jA7vgX/7Fye0z4aTGFerkw0AbI7iSXEx50S2fsqLEFteRtrYc/wAUk1E7Nzd05Pmzn+jfA/apZIy7RiOJ5XKxmZ7IyKVWNSC7Xcc9gTyrpKVkcYQuXsB0VEoJTEKV6/EwqyoSGGHwpxIkF2GjgZbcr3udqjlY0qd9ocP6LF4cFM0wRcXP1HuZjFd2RHPaGYM0cndbJueVcs2txFDJMu4Togc4SWYo3s0mKcJCZWVUn6lUChxnLWzcrbWO9MeVxg2HPyABiASQCQCRlJAOhIubHwvpWzmNoDe6LII+sxri6YcdgHZ530iXxtfMe6wNcK7vamtvptO9BYb1HovXYbf0VcMMk8uLfUJdEJ+9K+sjeYUgf8Q0quywo3Rj/cz0uY15zsMWgEc0AsY1oB0m9APjSqCpi8Rl0oDn8YS7BVF2YgAeJoU9A6N4ERQi2oIFj3jU5v1iWbyYDlQy2a1CBQBQBQHK/SR0X/2hg2RQOuj+shO3bAN0J7mBK+ZB5VuEsLMyjiVj594b9Ypw79lrkx5rgrJs0bX2vtbka3U/B9YvHu3+BKP9SPUy1/t793iV1BBIIsQbEHcEbiu6aeaPLJNOzNfo3xIYbExzMGYKJAQhCt24njupOxGe/pSSurCLs7nQ4DpcVxDvFhmlkkOERBJeaRlw1tWKgF5mZEa9tCuxtWHDLN7zannpuKPFJFeP2c4XEpLFJiJY0IsFjmaNyJUKZ7KkY1BUc9q0t9yPS1jQPHbCGeHB4gw4ZMUI2lLzxJJiFCKhkygdVHyUtmObcVnDqm9S4tHZ5FRumUsTS4qKFopJ0w6iSx6nrMMoWUqDupUgZbki+u9MGwuPakOwfSNusmxbYLEyQ58JKrrcIk2DhES9ZJkK5GJN9QRp31HHZcuPbY5ngMnVypLNFiGEgYQvh2eGXrc6jPA1iHYG6FdR2++1aemRiOTvY6eLjcwlxCNw/E+0STYnFQxKjhl9pgbDt1kZjzugU3zLa7X2rOFZZnTE9LFHGdInbDHCLhWVsPHhsr5G62J8Kx6ySbuTNLJbQZTJrvRRzvcy55WsWH6aq+OxGKKTRpNAYEEMipLED1RzK9rA5kc7ffq4PxSGP8rnLSuCzEXsSSMxu1r6ZiNzbc10OZLgMJJPIkUa5nc2A5eJJ5AC5J7hWZSUVdmoQc2orU1+Myda8PD8H21RiqtsJp2+0mP6AANu5VPI1yppq9Ser8luO07NqnHReb3nrXA+GJhYI4E2QWJ5sx1Zj4liT61xbu7ndKysXmrJRl6EEAvQEwWwoUiVrmhCWR7CqDnuLYvWgL/RbhJkfO43Fzf7qG+n5n1HguY6XWgZ3tDIUAUAUAUAUB419MfQgqzcQw69k64hF+6f74eH4v2vxGu1Of8AazlUhfNHD4SP20WFhigNBoBiFA5f70Aev8J/ov8A2+n6Ort0mP8AvX/JfK8/TNsQSCCCCQQRYgjQgg7GvSeE2+hMgXH4VmIAEqkkkAAa7k1mfZZqHaR03RPjcDzHESHqEihw2DQSsZ3ZHmzSZiFUliiupawC5xWJxaVu9m4STd3wRHg3jhwEuHzgyqnEkU9YAhUNhle6j3mZA7Ib7od76HnK/cFlG3eU+PJD/sqKFZkMmHGHmaO3aBxJlMozbN9tDcDVer13or4rhr8B/BsSi8He5UHquIJmMyqVaTqMkfVXvIZMrAG3Zy351l9s1DsFjF+ziLhsSyxmTBYnBdYBoEGJyyTEOdJB1qqSRtztRN3fG5qyyW4stjI5MWOrs8ZwONRFacI7StiJesiMpIyXa2U6WVgRWWrRLfMkwU+FbF8ReTEx5MXMuDU+/mV8O4cBl2UM0Q6w6Xj31qu9kTK7d9TykAjQ7jQ+Y3ruecnw0TyMqIpZmNlUakmo5KKuzUYuTUYrM2cZiVwaNBE2fEOMk0ia5QT9hFbck6MRudPLhFOq8ctFovd+x65NUU6cM5PV7uC939XffR90U9lTrplHtDi1t+qTfJ+Y6ZvQcrmVJ4mSnDCjsL1zOghaoQbloCVbCgEmaqCKI2uaFKHEscFB1oQo8J4e88g7IJPaVW90Le3Wyc+r0Nl0LkWFgCwDQ9GwGDWJAoJJ3ZmtmdjuzW5nuGgFgAAAKGSzQBQBQBQBQBQCML6HUUB4n9If0avh2bFYFSYvfeFL54SDfNEBqU55RqttLj3e8Kl8pHKcNqOZi4nBjQBiWEU9gFxQF0k7hiFHPYdYPXQazBKn2M1u+PgjlGplPJ7/AJ+TP4twqbDECVLBtUcENG470caMLeveBXWFSM+ycp05Q7SM8vWzFhpegNTg/CBiVciZEZWjGQq5JEkscQa40HblUW30PdWXKxuMbkc/RyY4p8LEpkkUA6gQkgqpvaUiw7YtrrcW3qYla4wO9irxDgskEYaQBT1hjyAq3/YwzBsykqVZJktY1VK4cLLMzbCqZFtUBpcK4NLOCwskS+/NIcsS/rH3j4C5rnOrGGW3dtO1KhOpmslvehebiKRDqMCGZ37DT5SJZb/ciXeNPmee1YwOTxVOWzx3nbrYwWCh4y2vu3I7roL0IXD2nxFmn+4gsVh/5n8dhy76TnfJEhBRO2ridQ0oQaDQEkz2FqoKYm76FJg9hmPpQGTiuI6hUBZjsqi5PoKAfwjg0mIfMcrWOpPahjIPMj7aQH7inKLHMdgRG7HecO4ekKkLckm7u2ru1rZmPfYAWFgAAAAABQyW6AKAKAKAKAKAKAS9AF6A816e/RemJZsRgykU5uXjPZilJ3OgPVv4gWPMXOaukajRmUFI8qmnxvD2OHnjZFN7wzrnhfmSuuVt9Sh8zW5RhUz271qSE6lLJZrc81y+BhkwU395hW8AZ4fho6/MCp/Vjul5P4L/AOnqb4PmvkT+zkzfYvDiB/upVzeqvYjyp/Iiu0mu9D+HN9hqXc/ZjVweNhVo/ZpArPG7XhZwxizlVOhUpdySvOy91aVWm/7lzOboVo5OD5FjD8UxiYk4lIMr5EjCiGTq1SNY1RVXcACJBuedLwta/mTBUvfC+TFxMPEMUoQ4ZyMyMD1TpYpBHB7zaWKRR38VvprU62lH+5GuorzywvkQf2bZP+sTwYfvDSCSS3hHHcn41OvT7Cb9ObNfxXH/AFJKPjd8kHtWBg9yNsU4+/P9XCD3iJTmYeDGparLV4Vw15/BVKjDspyfHTl8mlgOC4/ibK0jCKEe60gyRqP91Ets2nPT81VYKfZ1JN1KvbeW7ZyO+wvQrAYeNeonljxC3+vJDZr7q8Z7OTTYWPjvXOU3LU1FKOhEeJzwG0qCRf73D9pf1oTZlP5bgVk3kaOB6QRSe5IjHYgMAwPcVaxv4C9Cl98aLXII8wV/iKArNxFd7j4ihCI8VBOl20+6C38KFIcRiivaYZAOcpWFf/6EfKgIW4j1xAUlxt9V2Y/MzSAAj8isaEujZ4Vw+AD611IO8Udwh/xHbtzc9CVUg6rQlzqIeJxABVsAAAALAADYADYUITLxFDzFASDGL30BIsoPOgJKAKAKAjkktQFKbFNyFAU5ce45UBRm4vIORoDOn6QTD7poDF4vxt5kMcsKyod1dQy+djz8aA884xwCJiTFHJCe4EunwbUeQNq2ptGXFM5nFcLnT7uYd9iPkf61rrWZdJEC8WxUegklXwWRh/Bqw3F6pcjac46SfNj/AO0uN26/Ef8Amyf1qWh/iuRrHV/zfNjhicXNozSuP0nZh/E1pSS0RiWKXak34l7B8DkPv5gO5V/mf6VXVZlU4nS8L4ckRBWC7fiftH0voPQVlybNpJaG2JsQ3JqyUX2fEH8VAQYnCSqLu2Xuud/Ic6AzcTwuaTYMe5mAUehOtCkUfA+IL9niHj/Kzn/ShbsnGC4wP+/TfAfzoS7EbhfFH9/GzsO67j/IwoBcL0dnVsxszfiJ7fxkF/nS4NzD8MluAzMpO2e638idD6GhDYh4DiPGgL0HBZx30BoQcKmHfQF+Hh8g76AvQ4VxQGnh0YbmgJ6AKAaVoBphFANOGXuoBjYJDyoCNuGRn7ooDmeNcXwcN1VeufuS2Ueb7fC5q2BxvEOJzTGyKsYOwjW7H9Y3PwtVsjN76GfJ0WkftSC36Uzgf5jes447Dp1VTV5d+Q3+ysI96aIflDv/AAWmN7IsdWlrNebD+zOF/v1/8qT+lMUv8fMYIf5+TAdFIj7s0J/MWQ/vLTHviydXukvQuQ8GxUPaTMV/RKyr8NbfCmODDpzWw2OF8fVTaeBWH4oxlYeanQ/EVrCZudhgpcDJGZFZMq+9fssvmp1/ryrJSjMzS6Qp1Uf42UGRvyqdFHiflQomG4BGpzWux3Zjmc/rH+VqAvJwyMchf50ApwKdwoAXAKeVAMkwa91AEODXmARQpDNw3L7mg7t1Pmp0PwoBuExDRaWyjuALR/sbp+qbeBoSx0GCxiPYWAY7C9w3eVbZh8+8ChC5kFALloAtQC0AUAUAUAUAUBFicQsalnICjn/83NAcPxvikuKPVoGWM6BB7z/mtv5bedatbUl9xntwhIvtTdv7tDqPzNsPIXNS7fZKlFdrkNMrAWjAjH6GhPm25p1a25mnWekcu75Kb4W5udT3nU1s5PPUT2SgE9koA9koB0cBU3UlT3g2PyqNX1CbWhc68tpKqyjvPZceTDX43rGC3ZyOnWX7SuA4SG7UDEka5WsJB5cm9KYrdoYU84vwNvhHGfuTCx2z7a/pDl51bETOjyVCiZKAClACpQA0d6ABDQDWjoBkmGBFAUWwxTbUHUrsPMW91vEa0BrYDGXADG/IMd7/AIW8e47HzoQv0AUAUAUAUAUAUBHPMEUsdh8/AUBzGLD4h7nQDYfdUd58fGroTUQoEBWLS+7/AHm8vwilr6i9tCLCYI51scpva/detGS5BHM1/rCCCuhsN9L6+mnjUyKL1Uti3WtYZuX4bW+OagEkilC5utNrKRtcluXhax152oBI0lKFutYHtEC2nZAJ15b91AOaCYWPXGxKAbX7QvqL6W+dCh1MoNjMw7LMezewBNtL8wL0Aq4aYkjrjowB2GhF767nQ6VAZTYYk5tb3vfnfvqkLJgEmj6Nyfv8G7/Os2tobupalnh8rwnI1yv+Xy8PCrqTTJm4BeoBctAIVoAy0AoFAIyUAoWgGSQ3oCqYbHT1HIjuNCmhhpLi38d/I+NCE1AFAFAFAFAFAZuLUyHwG39aoIzBpYbfxot4b2IaML4VSD4sPlYG2xoCYKQb2Ogy6+BuL+tQDUjsuWx5+Wtv6UAx4bqFtt/rb+JoByR2UrY8/LW2pHhagE6u4UW9038+75UA8jW9joCL311JO/rQDchuxt7w+F+fzPxoCH2PwoBPZKoJRh7ix9D/AC8qyXUkwoK6Hb+FUF3LUAmWgDLQBloAy0AZaAW1AMaOgGqtjQE4oBaAKAKAKAa9AM6ugE6ugFVKAcBQDSlAOy0AZaAMv8qAaEoB2X+dAJl0oBctAM6ugDq6AUpegHoKAW1AFqALUAWoAtQBagC1AIRQCigFoAoAoAoAoAoAoAoAoAoAoAoAoAoAoAoAoAoAoAoAoAoAoAoAoAoAoAoAoAoAoAoD/9k="},
-            {"id": 17, "categoryId": 3, "name": "Cera para Bigote", "brand": "Captain Fawcett", "description": "Cera moldeadora para bigote con fijación duradera.", "price": 8.40, "stock": 9, "imageUrl": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wCEAAkGBxMSEhUSEhIVFhUXFhYXFxgXGBgXFRYXFhUXGBUVFRgYHyggGBolHRgVIjEhJiorLi4uGB8zODMtNygtLisBCgoKDg0OGxAQGi0lHyUtLS8tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLf/AABEIAOEA4QMBIgACEQEDEQH/xAAbAAEAAgMBAQAAAAAAAAAAAAAABAUCAwYBB//EAD8QAAEDAgMFBgIHCAICAwAAAAEAAhEDIQQSMQUiQVFhBhMycYGRwfAjQlKhsdHhBxRicoKSovEzshXiFiRT/8QAGAEBAQEBAQAAAAAAAAAAAAAAAAECAwT/xAAiEQEBAQEAAwACAQUAAAAAAAAAARECEiExA0FREyJhgaH/2gAMAwEAAhEDEQA/APuKIiAiIgIiICIiAiIgIiICIiAiIgIiICIiAiIgIiICIiAiIgIiICIiAiIgIiICIiAiIgItGJxjKYl7gPxPkNSqHG9rqbZDWk9XHKPQCTz5IOlRcBiO2VY+GAOjZP8AkTPsq6r2qrzesR602/BTVx9QRfLGdqavDEn+6mfLh82Uyl2sxIiKgd/Mwaf0x8lNMfR0XF4PtudKlGRzYb/2u/MroNnbfoVrNfDvsu3Xex1VTFoiAogIiICIiAiIgIiICIiAiIgIiICIiAiKJi8WGg/Onzqg3V8Q1gkmFy22u1GWWssfTN+TfnRVO19uuqOyUz0npxy8uN1RPokSBrEnyi5B5+caeqx13OW+edbMTtN7zd17SB4v6iTPEj0VRtM1Q0lkCNZEk89Ryv8AGys8NhukEHqNRExMRr6qM/HU++DMriarnNBt3WemLsNy4WtJbBt0XnvfXXx1nMn1QYwHK0vOsCHOm5vEnX25qTs7BjfFNpJAO+CCBIMFvrb09Vjnq1nUqjhTY01qbQ3xkS97H3IABiwIFwTpNlGhWpmpWHejumYt9RuWKZNMg4VgJYQ8OZJOU+ccZ42/tfJcv2MHUiHNAeGHjYHWdbiRPoVzVBrWvAzEOfOW2XwiXDM3jAnop9YPii9tSu1tSvTyTUJqFncvLy8CWw8tzBt8oFsskNwwNORh5eSO8xbXl5G82k57WF83BGUE8yZS84TpIp1KrQMri7QEOE8TedYtrJUuhtFpjN/6ybyHcOBHmFUjEGphMZTeGuIw3eh7aT6bXGoKsBoeJc0FjYfAnXgrbEYENqljqgLS7daYOUBoaG3Ft4SOG/HKNS9cpkrpdkdpKtEgZu8Z9lxlw/lPH1913OyNs0sQ2WG/Fp1B5FfLcPgy2wIjlADgfQx7ALdTqOpvBa4hw0cOINwHA/gf1XXj8krn1xj66i57s32jbXGR8NqDUcD1bzHyevQrq5iIiAiIgIiICIiAiIgIiICItdeqGtJKDViq0brdT9y4btHtXOTSpndHiI0ceX8oVt2l2iaVPKP+SoLn7LfhPwXKYNl9NeJ5Hlz1v5hY76yN887XmFpcI1AJNudonT8ZjyB0d5BJvpMx5Hhpz5qTSaQwNNxAv04AcZAi69p0ozEizoMHWYh3z0Xlt13np5g3Zcoib+Y9Z4KBT2WKLGh76f0TszXuAbUqZWubS70k3LQ4cbloNtDaQ24dBDhBnQzq2/SViXMBythrr2bA6iw4xeOQKsuJXNDCYemxtN9Yvax3eAmqGuDyS9pIplnHOQOh5WhbOwGav3zWVadTPUqPJc59GqHBwc2lTaScsvpm4GWAF14oCYuLk8QLi4vfr6KJUwVFrm1WblRrS0ENcA5j3MlrmEXBdkMiHSNbFWVLEfAYXANawNbSyh7XtfG53jnZRkOmaQAANA5vMTFxezaIqMbRptyUw+Wl9RgYXglzYJAIdJzTzmDEH0bEwrGMaA002PbUosyVC0Vc53gc0kSQMskAzOsCRgKdIVXVyS+rVcxsuDgN0EtAZEAASQYm5JJVtiSKuhsyk6m4MqO+mpCk8NxFKoWNpucGBuZrybEt3bQeJMm6xOyatd1KtAYWlpIOoy1gXndBDw9rBDXRlORwhwV41+pEAk3vrIAv6Nb7DkoWJyHxMaZ/hBcOJaTw1BCl6WRryFrnaFt7Dr15SD8kKAWSTMnmdNNIHwEqwqVhFuvA8PPjP4qLmudD+McNLfPVctdGsFzC1wJa4GQRw5+Y1X0PsxtsYhkOtUbZw69OY/Xkvn1R4mDzWeCxrqNQVW8PFHFs3jqNV6vx97HDvjH1pFHwGKFVjXtMggGykLs5CIiAiIgIiICIiAiIgKvxdQF+U+Fgzu5W4Ke50CeS5Tb2Ly4ZxHirPIH8o1/A+6lHNY/FGvWe9x3SbfygiB18gg1OWCDeeZMiIvH1fdY4ejuZuZHUkAxH/b3SmIN7ieOvG5tF15fydbXo4npjSeSAOmoFtToQbn9VvqO0a03JidYGUuJjjZpgeXBeMZkbqBy83GVhimGWhph13BxE5cpAJjjOYN8nHoDmNVtp0HEiKma877WnTlky363XjqbgYeGNZOaWkuMh4fBloy70mbiLa3XjaYsX97Nrh1Qg+QpkR/a3yW9rnAwyTP8A+jjHuZqA+cjy1VZeigAc+YkHTkR0tda3YanaGibG9yMulydB7JiMOCDLTmPEQGk+QdJ9ZPVZtcG2Lt6LtDnOPo2ZPsiqLaG28PTHd5Kj6hOWnSpg53tEfSAF0NoyTvuDQ7KXAOEFWX/jKdMS5xGli91yPNxBiw46e2OJwFCpJfQY9sy4Onuy7WXs0nq5nqpGKxzoOXiDECZ55X3YfIgK3EmvO8BbOQmJ1bDdJguIuLDwyeipdogEwTuyDEB9NtjYMbMRbWY4RMKQxxiHTBnxb5kc2E5fZw9LLDG4qi17W1qgEyGAvAu37BBzNtFidIlZ1tsp4trWNaG6ADO9zRMRxEt9CQtLKdQzAd/SIN5gHMTPm0+yi7V2xSwroyOzOGYGPELhzS4SS62kXt1VfX7Q1XYdxYwMc+qynTOoILS5xGaxNiOUnoU8bfZuLXuTmkn/ACzSbcXCR5SVMaOXryVL2axdWqyp3hLnsqObe1hugcLy1x6zw0XT4BjTTMiDFyfMx8NEm89J175XvYfH5S6gTbVvkeHoT/ku0XyvA1u6qsfpDsp8nWPtr6L6jRfmaDzC9keas0RFUEREBERAREQEREEPatbLSceJsPM6Lje2T4dSpX3KYnzOpPsus23drW/acPxH5ri+1JLsW8cLD0gT96lWMDTAaGmbCPXj9600vERyg8hci3++a9fMzJ4jW3MT6Ar2s3K1xaLgOIHWLBeO+69MMZiWhsmBpc26TJWDarKgBaWkcCDpwJBboddCvl/aDtJiHZqTnboLyHMzNJYHwGlrgCHhzYm0cBMESdk7UqYTFGjUe5zQ9jXSS/xltN+8QC7K9wgm4awj6xXT+nWfKPpFKrcgB5I11MRzDjmjqAdV5Sxbncr/AGQX3m+8PCdPE1amY7DtIbUezMSYaTndMjwtuWiSNLKP2h7Sfu72Um0S5z2ywk5WSHZcswdB/wBhzWJF1PrUnkXB5bxHputljvYLPuA1sPIDRwENZ6BxOU+RC57tti8RSqUKbHhlOv8ARGPE2pqSXC4EFosZ1iFT1MRUxOyqxql+fDkua+YcSxv1jxs53LUclvx/aa7EbRoCk+u0io2nMlpzuEcGlxnnxhc9R7YMxNUsa1zczXCk9+j3NbNxwufgq/sU8U8YKUwyrhGZmnV1XLLiGm7j9HV0sJi1gqPsoQa+Ga6IpuqEa7zosyYiZa0zcEOjWyvhPZqQdr162Wahph1ZtCG8DMF2UCLSCOsi8So+26OTFVmAm4ZUZcwKj3ybC329eQ4gFZU2OBeIpjLjgTMugl1cEjSIyCNevJZ9rqQOLdqJw5drxpsrGfMQPv0Vnqp+lt2mw5GAouf46XdFwPAPbBYY1MGD1IWVfA06uApND8sBjw823yM0mYsS533LDFYk1NmDO4FxYKYnxFzX7s9YGvqjsL3+zqbGyS00mwNczHNEPGoGVwcTwF+Cx7/60kdk8c53eUarA2qx2aoRG+XXzGNXRlE8o5LrKLfswJg8b8wfQey5rsvgKgfUq1Rlc7IwAm+6MpMm5mG6gGQTEEFdhQECDu6gx9byOsrHU/uWX0q69OA5vIR8br6P2bxPeYdjug/AE/fK4Ks2D1jjfnqQuu7DP+gjkSPZzv0Xq4vqOHX10aIi2wIiICIiAiIgIiIK3a53qX8xPsWrhe0RjFVD/H7WHz6rvNrts09T8/cuE7UM/wDsP/igg9CB+qzVjyrRNoOhv1HzxXrxMWm9+kGYW9pzQeesA2toVhWpmRGl/nqvJXpj5H29BONqQJzUW8Nd12h9PuW11MYjaG5cVKwuQRuMq99VdfSMrW+ZIWXbl9Wlji9rg1zaUsIky1tOoTmBtmhzmyOABF5WODqfuGIjXLRY9wAgED/lygmWl1NoPIuAP1QF6J8c79bv/DB+MqUqdQteKre6D80QGNqvILbBzS9rxPI2JN7j9qNQOfRALhla4uygmA6oy86fUNiRPNV22cX+7Y+vWYxtRwbTdTkugF5otc4CdSC73UztK6ljKjiZzU8JDOI76oS+nTJjg1xJ0jdWZ9ipf7QcYamFwlcNiamYSbgvoOdO7yvfmBYhaNk1C/Z+0MOQA6l3wJFsxDXAOOkumlfQWFgLDbtGi/FYPD0KdJ7slXK6MpyhlMwJzZG7lQCXOAkECTY54PYOJjEmpkpMrhznw4uLKjnteAQ2AGCazT9IZzXsn6w/ao7E0W/vdKrYFtBznHqH1WOc484y3PNV2DYXVaLGgz++VKjTBgsLmOJH9DM1uS7fYex6OFzljnvLt0F+UjKNWscA1gBPCeDRoApGFw1OllFKkxpALRuzVMukgiznSb2cbypezxcziNjVm4h8AGlVqtql03aAXEgjgd94tM23YkqxrdmBiKzq1StkZutGkxcuaC45YNxcGcxkFXTWuqFpuRprAJmDcRUbGnESFm+tRw//ACVqdLNpJa19rHeMZxY6tMcVjbrWRWUti0abTSyOqtLw4teBcw1oNw0FsN+rbXnCnUazWd4xjWgSZDGl2uYyWgAtMcYK17SxtAUm1O+pEOdDSare7eNTDQYPWBwXuBxMsLmNziCMzHUy06kx5SeCzbVjbs6q9xMyATEuiZkExEac3Dj6K3pXnNpPva653CMeCcrWsMWJ3ojg5oixteTHnCu8CxzYMyCLzB3iR4S1rSR4pzXmOqRaxrMh3zpf4LqOwo+iP8z/APsuZr6u00+C6zsXTigDzE/3OcV6uPkefr66FERbYEREBERAREQEREEXaTZZPIg/D4rie1lHeY7mI9l3tVkgjmIXK7fwueiebTPwKlWKXAuJYI4EgzyFxHoQFJqm35qt2a/K7LzA943b+4Vg9txym/qvN3Mrtzdj5X+0lhONblGuHeQImT3dWBHtbqom3fp62amQc+Hw1O2meu4Ni3DKXH25q3xGycRisXUD6bj3ZM1amaiG5b0hhntLiXE7xeARAG63jM7PdnH063f4h7N0kU2te6oXPdGarVqPAL32ESIsLCAumyRM2t9fspRqVX1qlV7pqSAywDWz9G5wkjlYtgC0GSrinhqLHB4oMzEAZnwXRlyw0mQ4FpIgOEydZVlRoNmzifW4vpLYJHmSs20gDugCTeABPsuXlW/TQ6u87xJA47uUAakuzkOHm1xWgMMS+WETDiHOmOJeIcwdHqfXaHNDXEcQRJuNDEHqtLqLyRmkxmFolxP2gYA9DfkNFBFwrO9BLZIhpMOBG9Nn5YGYRcXiRdQO3jn0tn1e6lhOVpywMrH1GtfEaSDB/mKu6Oc8mm5P1p82C03FwZWzuiWllQNcHNhzSLFpEEFtwRBvfirPul+PnNLt/TZRZTGHLKjGNbFhSaQIlgaZcOhy668Vy+K2yXvNR8uc4iS7jB4Ro0XgCwmBou52l+zWi500az6Y+wfpGjkGkkOA8yVowfYGhTd9JUfUN8rYDGnTxQZNyLAhdPLie2M6rlsXVeyk2q5pyVgTSkACKRyOgRuz4uR8ls2P2iOGcHs0PibJyOjymDECdRBkHRfUK2y6demMPXog0wN3Lu5HAQC3L4XAcrXI0JC5TF/s1ZJyYh7RycwG3C4LQT6DVJ3zZ7LzZfSj7RdrmVqYGHp1G1Gva8PIaMpbIAZBJJMwdJBdY2j6zTqQ2IggX5aXv88FxnZ7sbh6Dm1DUNd7XbhIy02uF8wZeXDmSQCOcFdSx0ixt/q/zzWLlsnLXuba8qg5TrLrepP+19A2HQyUwOQDfYD4yuN2XQzVWjg2HO5W8I97rvsMzK0D38zcr0xwraiIqgiIgIiICIiAiIgKsxtKHHk4f7HzzVmtOKpZmxx1Hmg+bbXwhpVC3hqD5nUe630sUHNkgSNfOSCfVdBtnAd8y3jbp8WlcfSlp5cx+M9R86rl3zsdOesqc/E35z1trZanYQFwdYESDIkEEtNr2MtHzEasId4kzYcRrPJZ1MVHEdJ6fJXn3HZoGB7prX95HdMsS1xiGObmMvJJhx8vKyYfBy1oz7rXucyQSWmTlBuPC4Gx+zFoK2MqCq0sJkODmkaEg2PC3G6iinhzSDnNIDoeLeLV8tgkgEXy2AjQcdS6mNzqLQ4BtQSycoc2cuYPid4A+N0RGg9dWJwnd0203VTlHePkiS1sXcTIAa3PMmwGW1imWkby7xMqECLF5cWmwuJJPSRytg59CkSGmwY8GIIAe4A3NgSWNEaH1vUTTgg8u+kBLage4ROWpk0O9utyup7usDW8jX+5FrXO7wNE5yQ3dDmOc4F0uu0EmRIkNGl5j020H5GtJGcZwBM3pZZuCfC1xknXqQthoUH5hn8diJbB1G6I5k31ka6y0bNoYNn0suDe9aWXBMOc0tcdYk7ki05Aop2WXSQ5rpDh4AWiX1nTGaLd9bo087astGXhrwQ7KTcAS3NlhzRaC0xyi0LPCto5mw6DIyNltzTm4BuRGb0J5Wit9LZuYuDojOHCW6htbOS/mYls8A4k6wp1LB5A64guc6wAIzOcY9M0f7gbQDMiTpryi8AeQt52WVZ3Dn8OKzqtFHDWOkSSDECCJmBxXojXQD/Yj8uZTvCTYW/L/YU3ZWFzuDiN1v8AkfyC7/j5z25d9auuzeAgAkXdvO6Dg356rplHwVDK2+pufgFIXZyEREBERAREQEREBERAREQQcbQjfHqPiuY29sjP9LTF9XAceo6rtVW4zDZd5unEcvLopR82PLSx/Ieth5rRWZYbo/WDN/NdbtTZTahzsgO4j6rvyOq5yrSLTlcIPI/D54eS5d/jnTpz3jHB1CPvuP10WIrUSS0hsiARAtnAa0dJzAeqjVKDs2ZptyPlwPPRYuxBb4xAkOk2lzS2HTFzZt7+ELjZefrrsvxKYGS6zNQDMGYDS0OtwGWPRYupUy2O7ZBuRAiOEjpy6rn8S9rnDecYdmEwZJAGYgiTaRPInVZbPa4CxjxXAuSRDXGNXcfdTf8AKrllZjXXiQJHMRPM2sTfqtlQ0xcCNR0GrvS5VE8Ob3Z7yA1z8zbuDmkyG3+yIAJ4Dqva1EOdmDiJplkARMzcH10jlfRP9i1qU6N91g3Zgx4WgXI5C3QWWOFq0y7KLuy55BgEOcbGb6ydOfNVOBDQ9uY7wGUj6rm3mwG9c6dB62uEwABGVoAa3KCQSQ0DSSZJjn+qvu/C3FhQxIM6Ty8Qtp5qQ0SZ0nX54WK00KDWDgNbnX7lNpUeLjlbHk4/kLfiuvH4891z6734zoYcvdGjbSRzHALr9i4IAB0Q0eEc+vkomxNlFwDnjKz6rdC4dRwH4/j0gC7SOQiIqgiIgIiICIiAiIgIiICIiAi8JWDqzRqUFftHZmbepwHcjofLkVy+NN8lZlxzs4dQ7iPddm7H0x9ZRcbXoVBlqAOHUaeR4KYODq7PBux0/wAJgO5eqiVaRb4gR0It+RtHsr3aey6Yk0apH8LxI/uF/cFUNfaL6dnXHoQo1qJW2bSfG4JjgSJ5QBYFaTsZtwH1BNjBHD+nyJ8ltdt6l9Zg8wS0rWe0OF5uHq0/FZ8ZWvKvWbIaWgZnW4w2dbcImenFZUNj0mGQHHkXO6chHVaXdpcIPrPPq32Wr/5Rh9GMc4zxPwCnjz/B5X+VxQosZGVoHk3eP3XUoUd37I5m1ug1VRhdpV6lqdNtMczaPe59iui2ZsmgSHYmu+ofssBazqJJzEeWVbxm1rwbDUdlotNR/Pg3ryb6rrdkdnwyH1iHv1A+o09PtHqfZb8FjsPTaG025W8gAPfmVKG0qfM+yuJqYiijHs5/cVkMaz7X3FVEhFpGKZ9oLIV28wg2IsQ8c1lKAiIgIiICIiAiIgIiINb5UOuxynpCCiqUn8lFqU38lf4ms1gv6DiVS4vEPqW0HIfEoKXG1w2xN+QuVQY2s51hTHrddQ7DtHVazSHAAKDgMTsZ1TVo9GgKBU7Ig6hfSzhhxWJw7eiK+ZjsYBwU3DbBczRoI9vwXfjDM6LIYNvBEcxgabW+Jjh5GQugwNBjvCZ9b+ylDCD/AGshgW6xB5hBup4aOCksp9FlhapbZwzDnx/VW+HYx4lv6jzVFUG9FsA6K2/dgshhwgq2jotjZViKAWQohBCY4qQxxW7uwvQwIMWuWYKQvYQEREBERAREQEREBR8TiMthr+CzrVI01UCqY80EeueLjJUOoSegUh7ZWBYpauIbgFiWEqa2igon0ss7VxVPomblKdIcvkKzOFHLjKybhgOCiqw0xbrovW0QD1VgMOPZZOww+CYINEHnZSWjmtowwHtC9p0I8ohVHjWrdSJBkWKMprMNWtRZYXE5rGx/HyUlVLFY0Ks66qo2oiICIiAiIgIiICIiAiIgLxxherXUQaHniojmypdQLEU0EYU1iaSlZEyrKozaax7kxqpTmrHuggj9yefL9V4aJ5qSaYXndjgitDaPVeih1W/ugndhERu56lZNo9VvNIIGBFYhiZFtCyhEaMq20isg1A1WIltMr1aqRW1UEREBERAREQEREBERAWt2q8RBqKyKIg8WCIoMW8PJBoF6iDwcPX4rzgvUVA/FB8V6iKO4rwL1FEB8+6yaiIr1ehESIzYtyIqCIiAiIgIiIP/Z"},
-            {"id": 18, "categoryId": 7, "name": "Toallas Profesionales (Pack 3)", "brand": "BarberPro", "description": "Toallas de microfibra de alta absorción para uso en barbería.", "price": 11.00, "stock": 30, "imageUrl": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wCEAAkGBxMTEhQTExIWFRUXGBoaGRgYGBoYGRsdGhsYFxsbGxcZHiggHR0lHRkaIjIiJSkrLi4uGiAzODMtNygtLisBCgoKDg0OGhAQGi0lICUtLS0vLS0tLS0tLSstLS0tLS0vNy0vLS0tLS0tLS0tLTUtLS0rLSsrLS0tLy0rLS0uLf/AABEIAOEA4AMBIgACEQEDEQH/xAAcAAABBQEBAQAAAAAAAAAAAAAAAgMEBQYHAQj/xAA9EAABAgQEAgcHAwQCAgMBAAABAhEAAyExBBJBUQVhBhMicYGR8AcyQqGxwdFSYuEUI4LxM3JDkiRT8hX/xAAaAQEBAAMBAQAAAAAAAAAAAAAAAQIDBAUG/8QANhEAAgEDAQUDCwMFAQAAAAAAAAECAwQRIQUSMUFRImGhExQyQlJxgZGx0eFiwfAVFjNDoiP/2gAMAwEAAhEDEQA/AO4wQQQAQQQQAQQQQAQQQQAQQQQAQQQQAQR4pQAJJYC5NoyvFOn+ElkolE4iZtKqkd80sjwBJ5QBq4z/AEg6ZYTCEpmTCuaA/VSgZkzU1Sn3Xa6iBzjBcX6UYvEPmmCTL/8Arkkgt++dRStfdCQxqDFHh5SUBkpCR5Pc+OsZKJMmi4r7QcZNcSEIwqa1UOtncixaWmuhzxl8SqetYmTcTPmkF+1OWE+EtDIA7hEpCOXidocEoGLgmSy4T0oxUlQPWKWmxRMUVAjvNU8iD4GOl8C47KxSXQWUB2kFsyfyOY+RpHHpoq34h7DrVLUFJUpKk1BBZvHWDQydvgjIdGOmaJrS55CZlguyVd/6VfI6bRr4wMgggggAggggAggggAggggAggggAggggAgiJxLiknDpzz5yJSd1qCX7nueQjJzfaZhlKy4WViMWXZ5MpWQH9yiHbmAYA28eEtUxzHF9O8atRSmVJkByD781dLMSEpB5FJigx3E8RMLTZkyaT+ogJ3fIkBA2sIqiTJ1TiPSnCyXeaFEfCjtHzFB4kRl+Ie0CaoESJIRsqZ2lf+iSAP/Y90Y3LQPc+P+4WHfl9+cZboyO8Txc3EVnTFTjTsKbqw2olpGUF9WeGUpNH8hDtdo9FqxcEyILbfKBgRSFpO7VhKiCptBXl4xSAn5wtw14SUg6QhfMV3gB2hhCkMDtDEsMw7RrvTzN4dm0uH5aQAlCKd+j+Uabo30tXh2lzXmSgwFXWjuJuOR8LNGcyFqs3fDa0tc/XWzRGhk7bhMUiagLlqCkmxHqh5Q9HG+C8Wm4VZVLXSmZJ91XeN+Yr9I6bwDpBKxSewcqx7yDccxuOY+UYNYMslvBBBEKEEEEAEEZL2g9NpfD5NClWIWP7cs1H/dYFco8HNKVI4/iPaTxVRf8Aqih7BMmT5DNLJ+ZgD6NhmfikI99aU/8AZQH1j5m4l0j4jP8A+XEziBvM6tO1Uy8qSe8RXSMLiQp0KSFGtFKCj/kkwaeNAfRPEemslGYS0TJqklj2ShALOxWsB+9IVGUTx3iWPnCSifKwSFFgZaesWQASe2tq2bKEmMFwzpZjsOCmYgT0AXJUohm+IsTf4ibxpeE9PsMsDrEKlK3bOl3IukZh4huccNW4uKSf/lve5/tjJtUIS9bHwN3wj2eYOUoTJqVYqdrNxCjNUf8AFXZ+RPOL7BYtGUBKCgV7JSU5QP2sPIbxmMNiBMQFpWFy1ChSpwrXS3dvEhCQQDu5+2n07/Dznt15/wAfj+DY7T9RZ8W4HJxQKspQtqTAGP8AkDcd9e6Oc8RwglLKetlzGuZa8zNoaUPKNmGsDcActWp5wlaAaWJ/i3dE/r+P9f8A1+B5p3+BhQQ9NtoUoa9weNojDpo6EvrQetDHhwqHLy0nYZRU7WjP+4Yc6b+Y80fUxhF9tA33jxUwDX51jYzeHygA0pBJr7o8rWjw4eUKCUhgbZU6DZvlGX9wU/YfzJ5pLqY1YAd6AVfbeE1AcOX2FeXNo2UvAynYy0HbsJ8W8PtDyOGSGpJlnUdkDc/Rov8AX6XsPwDtWuZhkZnAbR38bMIcIq8a6bgZYqEJpcZRt/Ih7+ilgVlof/qPxB7fpr1H80PNH1MW2/kIRMqAA9xoe+NscNLAbq0D/ECh8LWjxOElmhlov+kfjeKtuw9h/Mnmr6mPDmjQiYoVDt4faNrM4fKNOqR4JAPOoiIngOHNSgh7MpTbWJpaM47co+tFr5MjtZdTKqDbH7feG5OIUlQUglKgxSQ4bS/j9Y1q+i8k6rFdwW8xEDEdG0ucsw31S7eREb47XtZc2vgYebzNF0Y6ZpmNKxLS5lGVZKu/RKvkeVo2Mcmm9GFM4mgnTskfNzz84u+A8VxWFIlzh10qwKSCpApZ2Kk8tNNo2xvrab7M18dPqPJTXFG+ghuTOSsBSS4OsOR0p54GBw72irlzsbMmBAWoFKEk2aWCCQ3PMefZ2DZfEyMQtRYAG7uAa2TajkeNI2HTPhy5OMXRJQs5mJUzKzG1XIYju8GqcFhiRnUq5cAaPqXdzrprGaIUg6Pz79YlNHpVtCB3Of4iPL4TO0mgsQwI7PjV+fqupThlAVV73Kt6Achv+IRLwC8zqUnkwNO+3lW0ZYJkyOL4RiaqM4OLt2ac2pERUiYgAzEPSihfupyBjoGQZiCXp5DR++sJMlKhVmiYGTE8H6QTJC3lTFIJNRoW/Un3VbPQx1Do105kzwEzSJM00qf7ajSyiaF/hLGusZDG8AlqBLJFDUctIzuI4UtCiEVSLi+p0jhu9n0rhdpYfVcfybadZxO9rcZtHH5NfW/gA76FvP8A1fvjk3Rjp1NkZZc15ksUY/8AIgftPxDka846bwvicqejPJWFJ3Fwdik1BtQ1j5a6sats+0srquB3wqKa04kqUbg2+n+rPyh9Iq+9tgPQhiUXL6N5trDwLeOnzjzZPXQ2tA1xo30NfXOI6k9r1uNPVjEsEE7EnXT0QPOGlhj69aDzjZF5MVoNEMR69fxD0pdPWl4aCacv4MCRVtNfxGeCcQXLq+h9P8oclzdDez+tYWovy9WhiclvXr1WJgZHZwF9qwwgsTy9faHMOqla+qQhYo41/mKmB0pc91+fKBatoUgNT1/swxNL/OEXlgkSldnlCCih74Xpy9CGVpIB0JFoyQEZtT69fmGcVQw+qvKMl076Tf0yBLlsZ6xT9g/UR9B9hXbRoyrVFCC1LKSissuJvS6Vg1jrJ6Uk3RVRI0JSlyO9o23RzpDh8bK63DzAsAsoVCkq2UlQBHiKisfLIQqYpSiokqclZqVEh3JjW+x/GLwvF0SAf7eISpCg9KJVMSW3CkEDko7x9ZZ2nm8N3eb+nwPPq1N95wdi6ecBTNl9el+tlBw2oLBTjVhUd3c3NEgIYBIGwAPO2tfGOle0ziq5GDIQSDMUJeYOCkEEqLi1Az845FgOJhxKmnWim7L/AA5q3diD3R2pmll/LPughvH4n15/mHJiWT60t/vlEfBlt6nQEjZ3Ba3qzy09okFtfyPH+IzMWMoQG7686jeCZKcv69U+cSVCorevrxhvLUN65+tooIy8MO6/jppDE3CprS+uun4iemVuX28ISoOT9a+LfLygDKcT4FmBKbkg/LfvAiq4djZ+EmlaVFKhQqZ0qH6VpF/rG7mjmMo1NBu0R/8A+ckoZYzFVSWF/KMJwjNYksoyUsaosuj3T+TNyoxCRIUbLd5Sv8vh8ac42hU4DMxao2NRHHOIdHWLyjl/UCxSWGo+4rDfCeP4rBKCAexV5MwkoOh6td0HlatjHz95sOL7VHTu5fA66dz7R2JJenqn8w5MeuvI+rRnejnSqRizkSSiaAXlTKK/x0UH2rvGkKc1rfU1tHgVKUqUt2awzp3k9UMylhgfr3MT5mHEo29c4aJrX1yhYURbkPrURiyiq/P8v9o8mEH5/b15x6iYDWElH2+0QDUm7b/SFzALd3+4Q+U7189IeWNYvMrPZSt/OG1oqO78wqTUfKE2YXEOAHtPXnCcjwp3tEbi/EZeGkqmzSyUjxJNgBqTaLFOTUY8WTONSn6V8fRhJRWrtLNEItmP2SNT+RHHJk6ZPmqmTDmUo1J1pQAaCjCLXjWOXjJq8QoMPdlpJsBQaV1PeTpErh+CSJbEXu/r5x9hs+yVvDX0nx+xwVqu++4j4bBhLBha9SSe+3++db/odw8L4hg1h80uY45gpUDzoxvzivUjKK20PeHsAw73jceyrgalTji1BpaAUyz+tRooj9qQ47zyIjvZpPPa50mKZsvCJklSUlK5q9goKACWNCwJJOzavHPOIyAplCti9NWtqY03TKcufiZwLjtmgoWS6QNrJA74y6U9STLzOgmhV8J1LbGn1i4BY8H4jmVlmqD2sBmBoByVSwv33vJC2Cz2dHqXDP8AFZqbb7RjsVhtUg0Yu2XcV1NniTwnjagUpWgFuz1gLFiW7XgLgvTWCYwbILG4INQXGopX194ZXiAOyTRiSXDD8XMR04MZnUsqIcgVT5B6gEbtUtEyWoZQQEkU1FqbeMZZIJkzAqoNPlR7c2aFMmwawpqBCP6Ue7lQE7DyoB3CE9UlDqc95Y6MG+XlAgoh1WDfTa2tXhxDOS1fTQ1LcBTBRc6liaDUkfWsMz8cZb55ZBBYEVd7Wtq0APJKaD1Ynv0+URp2GQsEEODcKDjb6R7/AFiGzEsopolg9BoTuSGaG87WDvfLYMNBepHfApQcQ6OqDKQSpqgOyknTJM0bQHzEaDov06XLHVYx1pDDrWZaNAJqLt+4fO8eomguCS1TSvqnoxF4twxEwZgcqwOypN9AxHxDcc457i1p3Ed2a+6M4TcXodKCkrSFoIUlXaSQXBFLEQle3g0co4Jx3EcPWEzAMi/hf+2TRyk/+NTmuh+nS+FcXk4hOeUq3vJNFJOxH3sdI+UvNn1LZ54x6/c7qdVTJeVqj1WnhpEtAuNfrDCruaUpyDj5tDkpVI86Sybhqam8evQeuUeTgRzHrWFy1Ap9PBsDMktDoGniYFS2rrDK8SmWlS5iglKalRLACKteAY7NnolIMxaglKQ6ibaRyTpLxlfEJoIBGHQWQnc2KjzO+goNSV9Juky8fM6uUSjDINdCvRz9hpc1hmXL+FLijMzsNmehPyj6fZuz1RXlanpfT8nDWq7zwhuVLdQSE9kVo5Hr1rFpL2H3ifw7o7MUBTID6taNFL4RLkh70cqOmpjdcbUpUtI9p93AlO3lLV6Ebov0WTiFf3z2b9XYqFDU7chXmI6ph5CUJShCQlKQwADAAWAAtHB+J+0VKFkYaXnCT/yElKT/ANAkORzpagasb32Ye0NPEQuTMSJeIlh20WmgKg9QQSARzBepA32lWvOOa0cfzpyMakYJ9l5KP2icKTLxgWMw62urFQfNVm/Trr3RnMLhElDFBc+84L+Ll66co7H0xw0teEm9YUpCU5gpVgQx2Jr7rAOQW1jkZJyhSWI0NSa6hrgPvpaO1GplWZPVnIqo+Atzs/rQRXz8ErI7B1aas/J41C5AmDKSaUqGO7je/nFVOlFP9tVxQau5u4POK0Bzg3GM2WXMLK0W9VGzMdSDd6/KLtU4AMVMKB1UD0ZiQxfk4eMXjZRTXVw5LFtiNbm/0i84NxUzEiWtTrDB1FswLeaht9ySImC1Vi8qi4BDE6F2YU3q8JxSSrKOyXuTUsz28R5GIkxXaEtUtkuSC2ZIF6EWFi0SOH+6VGqiSCbsHdh6MUhJVM0ZmelhQ+tYb/qD2anVxbQ/z5x5iJz+6Ho/I+hu0Rc5IDPVww0TYE+topB3ETUuKAh9tXr5Cvge6Ihw6QGSSnmCpzU6nwrzj2Yp6MNi7klz2gTzDa6kw2hDaivPzblS4+cCjM6aoe8BRzRlPewZmq19LViVInAgkn6nu/MeZ3HlQ11ezC1POIaZeiaWq53egudfOICVOSlYUlSXSb5hcUZwagu/lFDM67BTBMlKVkGuqQfgUD7yeREWcqYUgZsoJNgQbAvZP4t4Fxa8wJNRrtW7722/ESSUlhlTwbLoz0rlYwBLhM0/C9DZyl/PLpzZ40Mkt63EcFx2DUhfWSwUVdLE+B5Wca10jbdE/aCaS8SHGsz4k81Bu0nncavePm73ZDWZ0eHT7HZTuOUjo69IRKLF+dPzC5TLAUkghgxDEHWm4q8MYucmUlUyYoJSkOVGjR4TT9HB1IlYialCStSgEJDqKiwAFSSTaOT9LOPK4jMEjDg/06C5LEFZ3I22B7zyl8Qxc/i84IkhSMJLVVR+IjVtVbCw1rSNlwbgMjDoSmWkcyakk3JJ1j1KSp2WJz1qdOUff3mh5qaLh9TL8D6EqyjMcqdEi/eVannSNbg+CypQZCXO5i1anP1SAJDRz176tW9N6dDOFOMeBHJakcw9oXSXrVf0slX9tP8AyqT8R/QOQ1500rde0HpMZQOGklpqh2lA+4kh2GyiNdBXZuc4HAkgrZwKUalNuV49XZVhwrVF7l+/2NNet6qEYTBFVSHHdS2h79ecaL2fSzI41g1J92aVpPjLWGI/9S3KEypIYFLGm7nvf7f6jSdBJHWY/DhvdVn7sqVE23p5x77OM2Hta4kOql4ZK2mLPWFNaoQ4v/2Kaco5RJxisOsUBQVVS3K4OhDxtfadjVLxSurSM8oJQknkcxpzJI/xjGzCJqQrUMCmlDQl6P8AmANFhZgFBZns9DW4IcVb5R7isKJoJDjLUGtCa39fOMvwziPUKAUnsk0oHD3I1Zrj6GNPhZ4UCQ/aTmSpyHAem7+HfGSZDP4qS9LKTQ/pFxroX74gTMOxJANxyYguNWfV40nFsi1BnEzYb0cEgA7VEQyjMm1dQxLHZw5tEaKOrxqp0lMxu0gsog1SWZ/EDZriJCJiUAITTKAS5Ls7ktZ3I9NFIiYJKirQUIDVBIo9wXrTaLLHLQyZmYpTMAU5UQpw96M4P2ggWYWFJzWsO/8Ab9n8IZXMdq9k0ZPlTLetIrZWLYCuZ/iJAAoWJfUjQ8ofTi3+ICtK18Ae/XnFIeqOQFzXvJIPjz5HSEqmHUFLmtXc7eVD4w9iJ4aga3yap5N9YhGYxepc0FBbmz8/EbwBJM0DkNXZw2rEbeNTaIkqcKk5nqxIajMaPS48IWpXZoAasAC1qanuLtHkpwBQA7WOpOul4hRxIABHm7FyedjpfaGVpKWKQFB/dJNHo4c39d6zMOtN9fmFW3Ne+HZEhc05ZaSfCh0r/H8xhOcYLMngqTfAr5gChYBT1AJ+TD5RDTwaZNI6tJzixFgdnv8AWN5w/ocCoKnNmvQANXl3xscBgZcsMlIAs7R411tmENKSy/A6IW7erOV9HekuJwDy5mHmKGstiA5o8tVQOYFItRIxnFVg4lBw+FSX6pJIKzzJYkXqw5DWN9NlJNWBhaZbJDR5lXaMZPfjTSm+f27+83xo8m9CPwnDIlICJaQlIoAAwA7ofYu4o3zhCQRQX+kOor9PKPObcm2zdwFyw7Rn+m/SYYOUyWVOXRCdtM5Gw0Gp8Wl9JOPy8HJzqYrL5EfqI+wuT+Y5UrrJ0w4iep1qrvlTsObW9P6mzbB15eUn6K8fwaK1Xd0XEjmQteaZNKlTJhqTe4J9WsNIuMJIypA8b08m+cR5EglWcuA2tfn5/OLfCYJaz2U03qI+onUhSjmTwjhScnoQJ0k/CCokjsipOnZTuSdLx1P2d9FDhknETg06YGCb9Wmhb/sSAT3Abxgp3GcNgFjMtS5wrllh1JfdyEimhLxv+gXtAw/ECqUl0TkB8qsozJdsycpIpRxp3Rpo3Plm8RaXJvgzOVPd5mc9p3C8mJROSsDrGowNRlSQGINRXwOwbCTcH70xKnJJSpFgWJowF7mu8d86S8HRiZCkKSFKAKpZ2WAcp8449MOV3qBcgpoOejUvHUjWzPzMPnS4IYgUDDe715RCwU6ZKLhaghJBKAXBrZrv3bxe4iQUOpLMffArlJsr/RiHOwierFS5q4b01INA02HCAMyAkJIuOYo+7je0QsfhS3WJ95u0NLd1/wAxR8L4gZKsvvI1DuE1fMAdqkj7xqTO7IUClaSAzFnFNS4d+4QBkOJoJCWqFMC7NchmOtyws0T8Oc8rIsZcqX35h0l7HKXBFqFod4hJKT1iUkpL5gACpJoPPcWhzByQVggukpa9C9/E18tIgKnDlKy5AKWLFjlqXICcx218okJt2XJqGJublg5ANHtRq7Q1iFJCpgA6tLjMSQlySQxaxdg/INqYJYGUK7OcuxS5CavUvUkwBNBoc1W2JDUtuTag590NpWP18zU0HcfdZoazqBFQQ7EiwNyLGrg1I3j2ZiArso7e7VHdmIqK6DyeAFSVgqzMsBmBNBrYXHl+I9WpyyXUeQAA7yG9fNJ4csi4LiiRQbV3/wBxKweISlJDN3uP51ataiLgFdxHDzwApBdKalCaKvcP7x5eEbDof0skzEpQsJQuyVAMlR2P6V8rbbRTInE3IbSzOWZqmlG5uYqeM8KzKMyUWXqGotmuPL1WOa6tIXEN2XzM4VHBnZJlO/XvoYVIU4+X3jmHRTp4ZZEnFhWUUzFypNvEppapFL6dJwc1K0hctQUg2Ukgg+PlHyN3Z1LeWJcOvU74VFNDk5NaX/Dx7IWT2Tf1f1pAs2hCaHxrHI+BsQ+qVt62+8UfSPjiMFJ6xbqUSyEaqP2AuTD/AEl6RScJLC5lVqPYQGdRFak2SKOfqaRzvDcOxXFJv9TPDIshNQkB9Afh563tHfZ2ikvK1dILx7kap1GuzHiVC8TNxU04nEGp9xOgD0YaJG2t4vsDwSbOPu9nci538NI2nCOi8iUM2UKXudTvF3LlhqBo9CrthRW7QjhI1Rt8vMmZrh3RpCWMztH5eUVvTjpGMLLEmS3XLFNkJtmbfQfwxuOlvH0YOVmPaWpxLR+o7lvhFz5XaOOrVMnzVTZhKiS6z8raACw27oWNvUup+WrPK5d/4LVmqa3YkaVJKlVJLmpc5i5qSbn+Ys+jmbC8TwM5NAZ0tJPJZEtYoblC1fzE7C4bKkEVBuwFz9fXjY8NwaZk+QgionS1J3zBaW+vpo+iwcWTtHT3FLl4CeqX7xCUvyUpKVeLE+McLkcRMgsoEy3BItlcj3Q1daax9A9I8J1uHmIZ3SaRwXi+F94ZQMpL3vVgwNPGCBcyCk/uzVFg4YNQio7vtWtxcrIpndCqjXK9/D1rEDh3EeqXlWSUi1ScujUuC9tLjno0FCyUuO0GAABB1vuH5DyMZAy/EECnmAW8iabH5Q7wjinVOhYOTMk0DFJ1NrGrjbvh/Fy8rJV7pFHBBLaEkuOWpiLPwRqWbuDHdyw8KxAX2MTkUkleaWXNai1O1tVvHuiukJMtOeWCUKJJS3P3ht65Q3gsR1krqlE50+65BdI0N6gaajuaJ2JxVVBVkhLGrE9zMUipO20AVmNn5yCZvZIS4NK6hgHD8vpdCVF+wO1cntAH9zPfvEXUoSymwUdw1B+rSt/KFJDMzA6vpe4YaVhgmSqw2Czh1qcBrUSNRanPXeJ6EJTawI3+pp40qYVPlkCgvvW/e7UMME1YnNa/PXmTU6M8UD4USD4fmvifpd4jguWJcaMaUqbGrEDvpCpk0s7WrWgrUP8AnxiPICmqwerZcocfPe5fnACpQIHZc1JJUqpalA1e8/iPUrcc9i451N28a1pDm78hZm+QOu1H1hmehw7lJe4Zzo1QQ38M0QFRxPA53VXMS5pStaNbyLs7mHOj/SGfhFjtkpeoJ7CuShcG7KHzETCFE9WUqJdgf/yTWLbh3Qlc7/k7KD3PWxffujkuq1CEWqrWOhthGTfZN90f41KxaMyCyh7yDRSe8ajmKRE6WcflYGXmV2piqS5Y95RtYVZ/VYxqehePwyv/AI2ISAKJXVKgHqDQhXdTQsIuujnQzq5n9TiZip8/RSyVZaaZiS+jnSzR85VoWkJeUU8x5R5+7uXidkZVGsYIXAujs3GTv6vHlzTJK0A0BGw/TbdzbciWE0SGAuNIE9knTaHRt598cde4lWeuiXBckjZGCiKzPEbjPEZeGkrmzCyU7XUTZI3Jh6fiUSkKmLISlNSfx5s0ck6RcYmcQm5iCmQgnq0GmbcltftTd99jZSuZ/pXF/sYVaigu8hcU4gvGTVYiYMoAaWgVAu3zLvqTtEnheEyp92p13+bwhMslQCWyjkwLU8bRayJSicqElR2Af6d8fYQjGEVGK0R57bbyyKuTkcgMALNbuewA0aNR7M+DidiROV7kqqRuvQ9wv3tE7gvQWbNYzewnbX+I6FwXg0rDIyS0sIyyQsY5t7RuixriZAr/AORIFxuBuI6TCVpBBBDgxCnzRPkZ00Dizq3/ADU3tDGC4hOldgMUgksoW3KTp3d8dC6ddFzhZhnyw8hZ7QZ8p3bbf0+Jm4IlKlOAVOA1R58/xFIXysBKm5VEFWYApJtuGa1Cz3szxXdWfcWKixYuQDd6VpEThnEzJ7EwvLL/AAnMOaf2vpW/nf4/DhaHAZg4UntPe2pb6RQZnFzihylnDEVBN+6lAdYs8biFdVLmkOopDhyASDlolVDerc4rsVI6wJH6CHoBa962owF38ZfDwwVLfN2CQC+XUWFncszcogGevIYZV6kpRq1GdqAE6/LV+XiL9l7mpoAGehDavvELDOl1LGVqEad4NSqu/wBodCn7JzJv2gAkAA3omldOZeLkFhiZ5IqT4V2LNdojPsQDcmzeO2jOLQpCglwKeNaaqO1T3vbSEKJAzEWtVV9k5mvvXxeGQe537IJCjU1csdy92Oh56iAAJptt4mwe/mRDKZ5FVEE7AWuaevHWFyVmYbZB3DMfq3dVngAnTUoGZRNBrVQHcmv+7RJ6OZMWvKZgR+l/iH7TvyuIMPJSDQd5dzRxcUqaNyis4twlST1kihoVIsDqCALK5g+Ua6sHKDUXh9SxaT1OqcP4HKlJBCQ+j6U+rxayF329NHPOinT1KmlYo5VUAWrTQBZ1H7tKPvG/lUqKi9LM9G84+MvKFalPFTXv6no05RktBc5LWLH1+YJEy4NI9WfXrwhtNC/lHI8YNiHTJ18Ii4nFJkoXNmKCUJDknRvQiTjMWiWhUyYsISBVSiwr9zoLxy3pBxqdxWaJGHQtMhKq0qo6FQ05JNrmtI7bGzncyxy5v+czXUqqCIfSPpIviE3Kh0YZBcDUnQn92w074VhMIpZCJaSSzdnQeV/p3xs+jnszUQDOUUp/QPzd46NwrgUjDpAloA8I+vo0oUoKEFhI8+UnJ5Zz3gHQCasAzT1adh73npHQOEdH5GHDIQH3uT4xawRsIAggggAggggBnF4ZMxBQsOkhiI4t0s6PKwUwpYmSokoUGoT8JfTby1p2+IPGeFy8TKVKmAEEeUAfOuNkMDlZ3vVzWzW2FeUO8H4qJYMtSuwzhSqhJO6diD4Po9LPpFwVeGm9TMDiuRe45U97uvFHPwuraM5LP/tjFIXfGcMvMFJbtEMaBxoC9CCwFIRw3EJWoq1TRQ1H5A+8R8BijMkqlEjMj3QQGUkVo4qR9O6PcThwyQn+2sIzOz3q6n0PjeukUDHEHStalFK6hhmSDUntBhqK/gPCJIpkCWBNSSVZtiFaJ+p5Av6Za1MpUrtJAZidKil3taFjh61DtUAPupflRzpXuiAZUpIIZ3B90EF6UJcEA6sftEoyVrNewNnJVU6n7tvvD8rBJlPlSH1YeYeuvdAolgCBUaO9qB/Jy7uYuAe4eShNh3HmaDU8/MWjyYlyQwGa5apdwNL1NYWZzO1PPxqLa2rXwiLKmEqUcmtHU6gRV7U2ZqeMUgsEjMMz2o1hepdmbXvhQm5g7+J0Nrd0Kl00O+pL8x4NYQ1Nlm6WCw1w4u/ao5J8/pEBTcWwWdRWGB0AvSjn5/XWJ/RjpdPwhEsspD+6qxGuVXwq+Ret3gmTgXSspzG3Zv5nTl948w3ApmIORCMzmrAsPt4xqq04VI7s1lGcW1qjrnCOJSsSjrJSnGoPvA/pUNCD6ML4hPTJQqZMVlQkOSfV+Uc8wXRTjGBWFyZHW0opCkkKGiFoUUq/GhjR8L6F4/HzUzOLKEuQguMMggZzpnyEsn/IqNuzHgz2I3V0l2fH3HUrnC7yswfD8TxyYCnNh8BLNF/FMIcHKLE3D+6mty4jqnAujuHwksS5MoJA8SdySaknc1iykSUoSlCEhKUgBKUgAACgAAoAIcj3aVKFKChBYSOWUnJ5YQQQRsIEEEEAEEEEAEEEEAEEEEAUvSno/LxkkoUO18KtQY4vi8GuStUmaCFp2oCLApDgR9BRl+m3RcYuXmR2ZyKpV9jAHEcQOrJULioIcW7neukT14hK5KJ2UJvmAGZmrmpUAgW5RA4rhlgFBGWckkKBd70YC7+AAiVw1JpKVVLkgVelWCgxBIFX0pURSDUnFBKQU9kE/GDRNyw1NH3H1ky8U9XJDUZPJ3cd3fypFbhlus37F3CM40BZgGZ61d9IkZ0vRgp6F3Llmqa05FgPKKCymznSAAAGbwrr3v6MRFE33tdt3a3Nv9x7KS3vVYB+yWGrAV+pvXaEJFfdIJvQW5qD0rvtesAOFZYnWwBps7Ml768xCEJIDEhxsHD0uG20fWGZcwKObKMotVlNp2bDu5xYYPAzcQoCTLUvR65B4m/hS8TIIxcjdPL6Fw3i/c8P4PCTZ5CJUtSuYoPNvlp843XAfZxZWJVm/aKD+fGN9gOGSpICUIAA5RCmA4F7OiWViVPbs6Ut/oUjfcP4VKkpCZaAG5RNggAggggAggggAggggAggggAggggAggggAggggAggggDD+0Don1w6+SGmpFR+sbGOZYaWkqSWYooQ1Ukmrh6l28I+hYwnS/oQZijPwrJmfEmwWLt3wBy7igUFqdBSgC6czlm902IIYN37kxFkEMQO0dmCQkEUYM7kUD7HxncV4VMzALlzkrAIIyqJu7UofHTlEzh/RbFTqJw60h6KUlKAHY2Ukvt3CKQp+qUGykum7jzyigcPUghu6LPA8PnYjsSZZL3LMj6l/VaxvuBezlIZWIVnNDlsmnL8xusHgZcoMhIA5CIUwHAPZqkMvEqzm+XQeH5jfYLh8uUAlCAB3RKggAggggAggggAggggAggggAggggAggggAggggAggggAggggAggggAggggBBvC4IIAIIIIAIIIIAIIIIAIIIIAIIIIAIIIIAIIIIAIIIIAIIIIA//Z"},
-        ],
-        "barbershop": {
-            "id": 1,
-            "name": "Barbería Central",
-            "phone": "+34 910 123 456",
-            "email": "contacto@barberiacentral.local",
-            "address": "Calle Mayor 12",
-            "city": "Madrid",
-            "country": "España",
-            "latitude": 40.416775,
-            "longitude": -3.70379,
-            "isActive": True,
-            "timezone": "Europe/Madrid",
-            "openingHours": {
-                "monday": {"open": "09:00", "close": "20:00"},
-                "tuesday": {"open": "09:00", "close": "20:00"},
-                "wednesday": {"open": "09:00", "close": "20:00"},
-                "thursday": {"open": "09:00", "close": "20:00"},
-                "friday": {"open": "09:00", "close": "20:00"},
-                "saturday": {"open": "10:00", "close": "16:00"},
-                "sunday": None,
-            },
-            "images": [
-                "data:https://heyjoe.es/wp-content/uploads/barberia-destacada-does-barbershop.jpg",
-            ],
-            "about": "Barbería familiar con más de 15 años de experiencia. Especializados en cortes masculinos y arreglo de barba.",
-            "social": {
-                "instagram": "https://instagram.com/barberiacentral",
-                "facebook": "https://facebook.com/barberiacentral",
-            },
-        },
-        "services": [
-            {"id": 1, "barbershopId": 1, "categoryId": 1, "name": "Corte Premium", "description": "Corte profesional con lavado y peinado. Incluye consulta de estilo.", "price": 18.00, "durationMinutes": 30, "isActive": True},
-            {"id": 2, "barbershopId": 1, "categoryId": 2, "name": "Barba", "description": "Perfilado y arreglo de barba con navaja o máquina, toalla caliente opcional.", "price": 12.00, "durationMinutes": 20, "isActive": True},
-            {"id": 3, "barbershopId": 1, "categoryId": 1, "name": "Corte + Barba", "description": "Pack que incluye corte y arreglo de barba en la misma sesión.", "price": 27.00, "durationMinutes": 50, "isActive": True},
-            {"id": 4, "barbershopId": 1, "categoryId": 3, "name": "Color (retoque)", "description": "Retoque de color y asesoría. Servicio orientado a caballeros.", "price": 35.00, "durationMinutes": 60, "isActive": True},
-            {"id": 5, "barbershopId": 1, "categoryId": 4, "name": "Niños", "description": "Corte infantil adaptado a los más pequeños.", "price": 12.00, "durationMinutes": 25, "isActive": True},
-        ],
-        "serviceCategories": [
-            {"id": 1, "name": "Corte", "order": 1},
-            {"id": 2, "name": "Barba", "order": 2},
-            {"id": 3, "name": "Color", "order": 3},
-            {"id": 4, "name": "Niños", "order": 4},
-        ],
-        
-        "productCategories": [
-            {"id": 1, "name": "Champús", "order": 1},
-            {"id": 2, "name": "Ceras y Pomadas", "order": 2},
-            {"id": 3, "name": "Cuidado de Barba", "order": 3},
-            {"id": 4, "name": "Tratamientos", "order": 4},
-            {"id": 5, "name": "Afeitado", "order": 5},
-            {"id": 6, "name": "Polvos y Sprays", "order": 6},
-            {"id": 7, "name": "Accesorios y Herramientas", "order": 7},
-        ],
-        "gallery": [
-            {"id": 1, "barbershopId": 1, "title": "Corte Fade moderno", "description": "Diseño de línea y degradado limpio.", "imageUrl": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wCEAAkGBxISEhUSEhIVFRUXGBUXFxgXFRcVFxgYFRUWFxcVFxUYHSggGBolGxUVITEhJSkrLi4uFx8zODMtNygtLisBCgoKDg0OFxAQGi0dHR0tLS0tLS0tKystLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tKy0tLf/AABEIAPsAyQMBIgACEQEDEQH/xAAcAAABBQEBAQAAAAAAAAAAAAAAAQIDBAUGBwj/xABBEAABAwIDBAcGAwYEBwAAAAABAAIRAyEEBTESQVFhBnGBkaGx8BMiMkLB0QdS4RQjYpKy8TNyc4IVFiRDU2PC/8QAGQEBAQEBAQEAAAAAAAAAAAAAAAECAwQF/8QAIhEBAQACAgICAwEBAAAAAAAAAAECEQMSITETQQQyUYEi/9oADAMBAAIRAxEAPwD19CEKBEIQgRCEIGlCUpECIQhAiEIVCIQhAJEqECIQhAiEIQIkSoQIUiUpEAhCEFxCEKKRCEIEQhCBCkSlIiEQlSIEQs7M8+w2H/xqzGnhMu/lF1ymZ/ifhmAiix9V38UU2zukkl3gmx3iReP4v8VMZPu06DBuDg8nvLhPcsfFfiNmTnbTazGATZtFuwRw9/aJ8E2unvCF4lg/xVxrILxTqDeC0sP+1zdO0Fa1D8Xrtc+hDRZ7QZcb3c1xgDkDY8QiPV0i53ol0woY8O2Pce2PdcRJB3t43t/ddEgEiVIqEQlSIEKRKkQCEJEF1CEKKRCEIEQmVaobdxAHEmFgZz0ywuGOy9xLokBo2p7UHQlQ4iuym0ve5rGi5c4hrR1k2C8vzf8AE6q8FuHpeyJsHkh7v5S3ZB53XD5pmuIre7VfUq3k7TiWzxjSexTa6etZp+JmApSGPdWd/wCtvu9r3QO6Vx2edPsXXBFL9ww6Bp/eHrdaOoQuKFN3y7PWdybVaSbuPfsjvF02uktSrB2nulx33J8FC9zvmdsjc0AbXdu64Q12z8zB1Xd3lMIZq5xPKLdwhRUI2r7Ia0bz8Tu9IAAJc6Tzue7QeKKmKc87LBsjy7lH+ytBlzxOvvSe5sa9aqEH5rgbifoN/km2PloFI+qD8Jn+I69hOiY9w4yd159daC7lebOwtVtVhAc0EN3kEgiQON969HyL8VgTsVqQDQB7xeS6QLzDTJkHgvJy4AwGgnwHagOPHS/LcY56Ks6fUmBxjK1NtWm4OY4AggyIPUp14n+GnSw4aqKFV37qp3MdcAxuB0PevawZRCpEIVCJEqRAJEIQXUiEKKFyPTbpg3BFlMCXPBJINwBaw3m/JU/xP6XV8BTpig0B1Rx99wloDRoBoXGRrpBtcLxTMs1q137daoaj4u42+Ik27ypVkb2Z55UrH97Uc86Al7p6iJgjsWbVryNTI0B0VX2zYDS2RFjoeOqVtRvyieLXC/eo0lbiZ334fWFCcVeJSvw4N9ORVarSA1k8/d8wUEtSqdbd6ex86Hs/UKsJixDhpzTXuIMtkcrILn7QYsSOVtfqoyGn4to9h+guqpvfQnj9k9pjTa6wYQW3OOg2gOBlVqtJo+XaPUNerVSbDokvJ5THiAqz5kkwBynz3qlNvv2WjgBf9EjyN1h67+tNLRrH0SC5vpuREjKhA3euHPmkLbbx2I2eCkBMX3+vqggcSL9UciOpe2/hF0lOIoOw9R01KXwneaZ07jbqheMuk2I/RdH+HWZfs2NpuOjj7N3U8geBhEsfQaEIWmQkSpEDUIKEFxCELKvNvx0wJdg6VYf9us3a/wArwW/1bPevEJv12X0/0wypuKwdWg6wcBfgQ4EHsIlfNWIwbqbnMeCHNJB5EGEaiuKkGDcbuSm2yNL+uCgcJ9eClpevXginivPFXGukfr5hU9lNFTYtr5qCzUotBke9v1HmqtTGQfvdMqgk2Jg+XUnU8A7U6II3vJvEcP7Jabr384U7aN4j16CGUj3ps0aHk2E9n6pmz3bt6ujC25fcKVmAPq3JNmqzadCTvU76d9Fq4fL9394mPXUrVbLZdIFoB8P0U7NTFi0aUuiPX2upG4ebQtqnl3zDeI5bhftjuVtmWwCSDIHo+Cz2WYuVdhr7/X0UtJmyeYut5+XmLx64FZ9TDX7/AAWpWbH0Rham0xjvzNa7vAKlWZ0Zq7eEw7uNKn4NA+i01tyCRKkKBqEIQXEIQopro0K836cdBhVd7SnZ+6YAfwG1uqACL2cIOsr0ohMdSBEESEJXzBmmT1aDi2qxzT/E0t7p113Eqi5sDiF7R+IuXU3VKbA3Rhdb+J0f/K4puRsJ+G3WVyucl0748dym3EAHT160UlLCPO4+v0Xct6PM4LWy7JWDUSsXm06Y8Frj8syEmJGnrRX8R0eqvIDGmOfJeiYPAtaLCFpU8OFy+W12nDI80wvQusS4kAcJO5Z2IyM06hpu1BnlvXsppALl84y4Orl/YewW81qZ1m8c+nGUMr0BGlytP/g9hA3R3+p7V0FPL/IjwEK1h8JAI5fb7K92ejncFlcCefDUR4KxTy0WjWD2TNu4rdZhLd27z8FNTw0dw9eJU7U6sIZYLiIBjxEFFXA66rofYDu7N2ihfheNtP1U7L1ctWwmoMwsytl4u6J2jstHEk37APMLs62FF4CzK2GGo1AIbynU+K3jkzli6/oK8nBUgfl22/yvcB4LeWD0JpluFA/jf5/3W8vTPTx32EhSppVQiEFCC4hCFFCEIQcJ05H/AFDf9Nv9T1z1Fq6jpqyazf8ATb/W9c7TZdePk/avfxfrAwLSwgVSjSlaNGnC45PRgvUVaYVVotU8wpGqlL5VStTlxPFTMcpYaVuVixUFMcEooq+KQSFo3Ba259VIMtClDU8tTg2fXkqwh2FG/sVt7FQzCuGCVLWsZtXxAhVXUt6MJ7aqZDHFvHQdhOqs1qLm2IhIZTToOjzIw7Oe2e97vpC0VTyf/Ap/5fqVcXunqPnX2EhQhVDUIKEFtKhCihCEIOO6Yf47f9Nv9T1jMaqHSLPiMxr0avukOaKc727Df1ParFPEWleTkn/Ve/hu8Y0KFO4V0tWPTzFjfiICjxXSjDs1eDym659bXftMZ5dHTspGslcT/wA7UyYbpuv5q63pizh9VfjsT5ZXWbClbTWJl2fsqWu13A27ltUMQDrCmo1u6SCmpIskDk5XTKEtQQnuCY4quV9mxKrVaDSZIB679ytMVXEvIBA18li1348TKeYOdIZ7oFtLnnyVGpjne09lUMhw90xo7cJFu9R4PMYqmjUaAflI0dP1U2JwpfXpAbi4+GyPEpHfKT/HU4CmW0mAxIaJjRToAgRwshfRfBpEIQiGoQhBcQlhEKKRCWEQg5rpn0cwWKp7eK9wsFqrTsvaPyz8wn5SDra68r/4i7CbHt2VPYVXVBRqPYWlzGOhrnN1EtLT1Fe8OpzquW6d9FRjKGyIDqYLmSDFmmWmNAYF+IHUs5Yyzy3hncb4efZhkwxIBpVYBva4g8FiYzoeaQLjULuyO+912nRjA+zpMbGjR5K5nWE22Fq8XfLG6l8Pp/FjlN2eXlGFNJrvfa3teW9pXYZNXokxT2DAvFUOtzgWF1i5pkuw/wCGx0T8kynYcXNc4bQIMWsddF0tlntxxxyxupHaUsZTNhsugwdkmx4fDC18HUaTYLKy3DAAQ2FtYakvP9+Hq+vLSpOU4KgpKWV0jnTyoXBPJUblLU0WmLrKz/EAbBaQD71t5iNy1JXOY3McLh6+3VkvcYuC4ADhGgH1U83w3jZPNQUMqr1KoqVG7IBBkxu5Lp8saHVtrkSOoWntJ8EzEPDhrIjdoZ+iMsxOxUcYn3Yt1/ot8U3nGPyOW/HXQbKNlUTmDtzCj9sqfkXvfJ2u7CNlUXYmr+VNNSqUF4hJCzKlOsd4Ci/Zq/50HVBoTgwKuiVRaDGpwa3kqcolBesm1ajQ0kxABJ6gLqmSsvOa+ywtGr5HZ8x+nas5XU21jj2sjn8Dh4AT69NW6FOyjrL5+UfYxrCxuFa6xAWa3BbJ93Ra2LqQ4TodPshjAViOmoTCDRa1HRUabOSt0rKlkXWFPBUNMqQlXblTw5NJTCkCm00e51l5ThMuxWKzAtxNNwZckwdgMadGu0kzHH3idy9ScZUNJl1rHkuPpm8cynk5wgAAKbJD+9dO9p8wmPCXAGKje0d4KvFdZRz5pvGt6RwRtBNSL6L5geUNKQpAgcXJu0gpqKuoQhQCVIlQC5zpI9zHsdHuEbM7g6Zv1jyXRqKowEQQCDqCJB7FnPHtNN8efTKVzYxjQLlOpYykfmb3rJ6fA0XU/Y+4CwkwLEhxnwhYWWtNRhBPxG/2Xiylxr6fHyY5zemrjq4q1Nll2tNzuk7geX1U2HaRYpMJhwwAAQByV+mwFcrHftAymrDGprGRZTBEtOaEqjBUgRzKmuRtKKrUUCSntaomKdikaDwommCDwIPcp3qJwW5dOVm28hQYWtLGnlfsspNtfTl3NvlWauilIEbSRzlQFIml6TaQaEolRlpStYVA+USm+zKX2SBdpMKd7JL7JBz3TfBe1w2227qUuI4sPxjrAAd/t5rh8tx7GjZaJ37u9esOwwIIO+3evFswy5mHrOpVg0OaYkiJG5wJ3EQe1cOXCXy934ec8410Dc8pgXt3FPyzPKdRxaCZHEET36qng8A0wbAcoWg/CU7bIiNCvHl1np7rj/G7TghSALMwlYixKvNqLMrNPISOqKOpXAFyqNbFBS1Fx9VQvqjRZ1XFRN0Ua8lZq6a1FWQVRouVjbVhU21KQhRB6mBWpWbFrLXtBLXGJNp48Fp+yC53HNlp42jrm3jC1cLjgQATB8+1e7h5NzVfP/Iw1lufa7sBGyE2UhXoec4gJICakQXXFMaUpTQoJNpEpAke8ASTAQPBVXM8xZQbtO13DeVnYzPQJFMTzP0C5PMsa6o+XGTu5di5Z8snpZivYrN6j3F+05p4AkDuXPdJWPxDNt4ktsCbnZJ+581r06Rj7qLEuDmmmLyIJ4dS8+66Y+K5zI6D2iAbDcuiwzXFZGHcaRM7jBHNbGGxQiRdcs5uvo4ZSRbAhD8TbqWdmeYNa0uJAG+8LmHdJmVXFlI7RAkx8Oo+bf4pjh4TLkdViMcDosnF5y0GBfq7bLmcVjKrzBdA4CySir0TvtuNxjqhutzAiAuewDVv4crnlHTGtai+VZa5Z2HergcstVYYVLtRdZ9XEhuqqYnGk8vW9XGWsZ5zGeV3FYkl0iI3daWrWLqbtxIhvXrM9fks6kSY2h1A7+vvFuanGGe/47N4aF3L+FvLU8l3k08GeXa7re6L5i6tQY5wIJaDfXn4rYWFldTYIO7SBw5Lba8ESF7OLLccMpqlKRBck2l0RcKYE+UxQPXJ53mZqPLQfdFhzjetXP8AMvZs2Qfed4DiuPpGSuHLn9RrGJa1XZbKp4LUvdqdAkx1WTA0TvbCm2TquDa1VfHxHr+y53OekjaQLaeunorOznO3OlrFVy3JDUPtKtmBWT+iHKmVqjjVfUc1nzGfi5QbFX/214MMJaHWaDew+J5ncB4qzUIdaNmmwach9VnVn/uqmII1GxTHBgP1I8FpZa5vM31cXXNNpJEwASYEb4XUYDIm4anGrnXcfp1KHobgA0GodT6K6PGNlTLL6j0YYfd9ubq0yikFpPopaOE3ws2tyJsFZalCoqtKgrdKmQuN8usulymYuh+N3BVqlTmnsoEiTYet33VmH9cs+eT0QSTxPrT7q9Swobd2vklwlIC+nmpHrp6ebLK5XdNLQ6xEhSUqmz7r5O5rrkEHQOtZ26TrbelphStYDIOhEFVlapDQA6K5RqELNZLNG7Q5EB3Kxse8dSt0KwcJE9oiIsQea1jdJWrRh2+/BSewWax0Kb9qdxXecv8AWLi2BTUeKqNpsL3aBSbS5rpZjrimNANp30W8rqbZc/nGNLiXHf6AVegYb1qpmNSY4FwTsTVj3RrovJXQB7SS5xs1c9mmYPrP2WTCs51itkCk3U8N5KuZNluwJPxnwRUGVZGG3fc6nkrOMeXkU2fCFbxLvlb2lNe0UWE/MUGFnJ+GgzUkSmZ3S/c1GN0Y2nbk2bq1lmH2nmqexOx9Jwdts14HQjeCtEM6PNikFqVxZZmBx9FggEtjVhF28uYUtbNaZ0krFl29U5MdHhsq3SAAush2OcfhAHiVYpYeo67jHXr3J1ZvNPpfOLA0HapAXOEusPWgVaiGsvrwm5nq3K5Rafjdr8o4czzTUjllncvaahRiIEnnu/VW9gcVC0QOafKMrDHbkTNgoLlTsEWUE7GqdjUxjVYCoVjUj8M03ktPFriD2gWOm+U8JwCqIhXcz44c38/wkcNoadojqVna5eSbCg/YaX/iZ/IPsqOplee59i9urUcNJgdQsu6x7opvI/KV5liT9V25b6jnFCvWnZ5OB9dyMPWHvPcY4KkDfsKR4lsboJ81jHHda9EynDmrVdVcDsgw3gSumdYQNSo+izQKTQBa/PertWmA4wNw8Uzw15JltFRoga9ZKycdUNV0DTRaWYOIpW3qpgWiQualdSDGtam9idiPiTgLIKWKwNKp8TATxiD3i6iZldIaM8z5q4NVYIsiqlOiG7gBwAhB2nHkoqrpcFewzRZAUMPoTu0CuU2700qZAoCSN/chDvsoHttffuVija5VduvYpXHyCCwKqnY71vVKjvUdR5LmNJMEmRxhpMINE4vc0T5DrP2lNJcdXRyaI8TJ7oTTaw0QCqJW0m7xPWS7zR7Bn5W9wTQU+UH/2Q==", "date": "2025-10-01", "isVisible": True, "order": 1, "serviceId": 1, "barberId": 1},
-            {"id": 2, "barbershopId": 1, "title": "Arreglo de barba clásico", "description": "Afeitado y perfilado con toalla caliente.", "imageUrl": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wCEAAkGBxMSEhUSExIVFRUVFRUXFRUVFRUVFRUVFRcWFhUVFRUYHSggGBolGxUVITEhJSkrLi4uFx8zODMtNygtLisBCgoKDg0OGhAQGi0dHR0rLS0tKy0tLS0tLSsrLS0rLSstLS0tLS0tLS0tLS0tLS0rLS0tLS0tLS0tLS0tLS0tK//AABEIAPsAyQMBIgACEQEDEQH/xAAcAAACAwEBAQEAAAAAAAAAAAAEBQIDBgEHAAj/xAA9EAABAwIEAwUGBQMEAQUAAAABAAIRAwQFEiExBkFREyJhcYEUMpGhsfAVI0LB0QdS4SRicvHCY3OCkqL/xAAbAQACAwEBAQAAAAAAAAAAAAACAwEEBQAGB//EACoRAAICAgMAAgEDAwUAAAAAAAABAhEDIQQSMQVBURMiQmFxkRQygcHR/9oADAMBAAIRAxEAPwDyABaPhf3lnG7rRcOO74Uz8Iiem2Le6i6dND4aO6mNFiqNjRJfUTmR9lU7qliNPVV2TdFocDZU5fgdTciaJQjDCKtjqtGSKCF/EA/LKV4Hsn2L0pYUlwbQx4qnl9LWHwbZVHLqrZCCxDFKNETUqNb0Ey4+TRqVXLJr7Cn3QiXUVmuG+MLWuIbUgjk4FvlqdPnK0dO8Y+crgY0MEH6JsWU5rZw0VTc0NEYCqbv3UYCPDv6gD/UDyWbatFx8f9T6LOtKS/S5DxDjh5kvK9C4btQao8lhOFmy4r0vhln5noEqT2OXhsaVPRV12o6mzRUXDVBwjvGzKX2TNSm9y3dCWtOEaX7QL2cqUtEJ2KaVG6IbKq9jD81A6p5gFX8wJE7dMsEMVB5qxLwCJ7FhBloTRhSXBH90JxT1VGXo9A99qUVZWBhRuKMlvWVobWkA2TpAk+AGpKdx8koeCs0FJGUv/wAs94wOp0Cot8XptMudAEzIOkb8vBZbHcYN7WfUk07akSKYkgvIJBeY13n4eayOM35dGQu7OToSdht8lpS5DaKqwI3XEX9QKUGnQaXuOznd1vKYG5+WyxreJa9PSdSZIkOPXUEaf4ScXJ90TEEwesH+FRUrQAeuYfEZT66qtKTk9jowjHwdHievs2o9vOQNPmI+CWVMULtXEk8y4yT6oNtWNYE8jH3OwXey5jLrv5+WiEMOoYi9hzNgempG61OHce3TR3nlwI7ru5oT/cMknx1H85Wo3vDoZ25CNlU1jhBJG4Pn+y5So5xv6PYOHv6ktltO5AE7VGkjfkWnprrOw589ze3QyyCCIkGdCPBfnGi1w70aaQfHb47r0DAsceaRpnLADi3KHDLBbLdTEd8RH7o45BU8H2tGe43q5rifBIQUwx9+apKWgqGwkqQ94euAwlbjh3G2tqhpPvQB5rzW1qQmWDOz3FIf7gkyey3hxqUW2foy0fmaCuXLVXhDe4PJX3KJFdiS7G6HtgjbtohDW1NO/gK/kWVG6IXKmD26IbKqTY8/L1Yd4+ZTLCzDh6IO/bFR3mVfh7tQrUvBa9PWeH3S0J/R3WT4eugGhaAXoVGa2WENqm7T4qziHGRbWr3/AK3ltGn/AO5W7jSfATPolFzf90arFf1Kxhz6VKk2dXlxjbujQEebp/8Aj8DxIGRir6oS008xmmXDQwC0GREePVBBziWtnnqBt1OnOIXLy7L3F0QTuBtPNDioZzGR0jqrSFhQEOnNOmhGvTY+iq9o0ILZ1OxgT5HZDGqSfPrCsIcNdlxxdSrR0HgRPzX1MsJG2/n8FQZcdR8ApstyY0HzXMlDZlNp1J0P+46+nIIith74blbOaC0bmOUDkmnDWEMeAXyXTyJjRbyzw9rAIb6qpPN1ei7jwdlbMdhnDtY5A8BrWmYmST+wWwtsFptaREEtLc3Tn8JR1NGtYq7zSuy2uPCqr08f4gtn06rmVBBHzB2IPMFKwV61xhgQuaDi0fnUwXUyN3AaupnrImPGOpXkcq/iyKcbMrPheOVfQRTKccLj/U0z0cktNO+GnxVHVdL0sYXWNn6DwuuMg8l28uQEiwq6IYPJTuKxcn9Sg5bL3XErtB4lK+3IU2PJ1TGv2i/5Dt7tEPlQXtJG657YqEo7LVH52xunlquCHtnwQjeI2EVJPilbDqFaYo3uC3MAJ2258VlMGkgQn9Kg4pTjENSYcbjlKwfGNcmsROjQD6EQI/8A1/8AZbqhaLAcdEi4IH6Q0fEZv3Uqvo7ZnnVjt9lQzE6SuDVfBqIgmyjP3zVlOj8lda0Z8k1oWJP0/dQ2Eo2B2lPMI5gevRN7DDS4SYRFnh50MdE7tKEa/fmkymWMeMJwa07MeWv381qbGroNUjodEewERHJVZuy7DQzrNjZFUXIWhV0AKuBVaTLEdhrHrybjrBfZ7guaPyqpLmRsDu9nhBMjwIXqTXpZxhZNrWVUEasaajeocwE6eYkeqbxsjjKvyJ5WJThf4PNMKw7tBKf4NgeWoHKrhJssC04fkhaf2ZKbSo09m3K0eSvbqs4/GIAXzMahPU0I6Mf1KKlTpwkH44vvxtQ5qiYwdj2sNEPlSZ+Myq/xVIY88140ojNmHVZmiNUbimImsZ5IKlumibNfgDhotXTqCFh8GqbLUUnyoUL9Ic6GTbmFhOOLVznmqPdIE+BEDVa5h3Qte0FUFh2cCPjoj6KgVNtnlzAiKNGVZfWL6NR1J4hzTB8ehHUEa+qMsbaY6pT0PSsMw+3hO7e3+ZQ9lQiJTe3hJkyxCJfbUNNPTREtpxou2rhMckUQJlV2yxBUXWrRt9+CLYOvog6dREtdKVIdEva+ES2ohabZQ+IjSC4tHONz6pTotLSK8V4jFPu04c7nH0CU2t5e1xcBzCGGhWgHckscGtA5mSvm3VCm09k3M8yGndxPi7Zg1HjqnNhRewNd7sjUTMeqNS6+IQ4Ob2xHwU3uN8losTAAldpWTQTUYI1lzeXi4dPEIXG6ndPktKGRTjaMnLhljnTOW9EP2RX4YknDN7mME84W3psBCamKEX4euGwTt9IKk011k2J3WcKHs6Z3DdEAuOs8VAXWbqLSphELHODnZauhMLJ4Fq4BegYfbgtRRAkBMaddFbh47+qattVXaUB2iIFC7+oOAirbi5a38yjAdA96lPP/AIkz5ErFWbYhe/2Vo19Mtc0FrmlrgdiCIIPovHcdwM2ld9EyQNWOP6mH3T58j4gpOVFjE/o5h1HtHtbsOfktJSc4DJRawAby2Z8zus9hFUNqtnY6HwnSVocEBFSoDyn6ws/O2bHEjHrf2Rw+tTrFwLOze0wSNAfEBcuWmmYHujadSha9ZzKziQGh2VrGjm6TvPnurK1QuBDt/olRWxmRJr+oRbvBR9FJLSpt99U1oPnVTNAYvRpRIkLuI2ge2I3QHaQQjqdeQq7iWlsBo4YG6BrYkE90T8UZf3DQQ0DUxPgi6D9dVk+KcSbRuZzfpaC2JMjn8CpjG3QUusFbNDZOIOoQPEdGBpsRIQdjeVq4a8PDWdMpLj6giPmqceuCGwTMCFcwY5Rlb8M3l5cU4pRdszvDtzlrOb4r0y0uRlC8Zt7rJcE9Vu8Lv3OCurwzWa91dqqdXal9PMQuODlIJdc1gge1C5cMcg8jlJx5W63LVWVoLqwgJDXp5SuTshoYYM+Hhei4ZV7q8uw6pDlu8MutEcQJGoZUVNF35iCZcoqzZLgUxRbYBvcKf3Vnv6lYV2tBtdo71E97xpu3+Bg+pTnDKsNR9TK9rmOEtcC0jqCIKOeO40dGdSs8MptWlwS7lwcdwId1IHuu8YjVI7m3NOo+md2Oc3zykifkp0nEEEGCOax8sb0bPHy9XY8vrF9Zxc3KXh0tAPTxKjcB0AvblfHeG+vgVLDcVy++NesfVSxG8pujKZPNV+zWi7KmrQnoOjUmIOo+P8Jk26gCI15rM3Nye1InSVe66BcYMeOwB5Hz0TWrKynRoPbo32/iUda3bXag/f2FjfxDKA2ZB0PrquNxqCANIOnqheNhrNR6JTumtkkwGguPkNT9CsV+A1bw1Ll5FMOzPZm8paCOTdAJQL8aLg5pO4yz56H5J9jz3PogUn93KNp2iNUMVKDRMpxyJ2GcNNHZNjYADyjkhuIqaScI412NQ0qhlr9ieTo/fZPMXrZpWgnZktUzCXdp+YCPVbnAS0NCzdSn3kda1i3bRGgGbllyI2UKlwOipwelnA1TN+H+KPq6AsU1rgRshvaR0ReJ2kDdIuzPVBYVC2+aCFk8RtiXSFp3vkIN1oXIEw2tmZp0i1wWpwpxgLlPBZIlaDD8KgbKzjEzRfZW/VO7SmAhKNLKiaZVmC2KkOKVZFU65SqgF3Er0UKT6p1yjQdTyHxT3JRVsUottJGN4kj2qqR/d88on5oEKdxUc57nP1cTJPUqTWLAyyTbZtY4tJIIoHRfOpaypUQixTlVmyykYfiSrlqCND9ZSuldzufRP+MLTTMPVY7NCs4kpRK2S1IZvup5n73UG3Gv3pO6Azr7NqmdRTkHe06xyRzMVeBAJjmAUjD1IVP8qeqIUmhq2pJzLU2t+HtE7wsZbVZO339wtDgtEOMTsJUEPYRePjVfUqdQiYTVuHNJGbVaCxs6cJz0hS2JsHxks0MghN6nEB8UUzBqczCtqYQ2NESnoFxFNzfZwdSk/bOWip2UuiEb+DDogbCoyNvh5KZ0ML8FoLTD9kwbZhclRLdmbpWUckXTZCZ1beEJUYmxkKZAMVtOmoNar2NT4yFtBFBiUcQ1Mzuz3AGvmf8AEfFNhUygk8ln7iS7Mdc2p/wsv5rl9MSxxe3/ANFvg4e0+z8Qlq2v/f8AK+bTTs0ZHioC06fBYuD5BSVZPfya7w/gW0mo1okLrqEGIhdpghWnJSVonrQsxG0Dw5pB6a/ULCYpgpYSWmRK9Pq05CWXeFNd8Z80WPK4MCeJT9PKnUyFEr04cHU6tN+kPjunpl/lKcDwGhWJpv7r2GHdYn3gfl8FafLhGPZlT/STb0YdqupBek4p/TYNbNFxfJEAxsZkzz5JFiHBVakB3ZjcjUakBDj52HL/ALZAT484+ozluwkj/panhmkS+egP+EKzh+qP06jyharB7Hs2x+o7q5GLbEt0hbjeIuotLgJSS14weNwtnfYOag1GiyWJ8LATAg+CbJCkHUuNCn2E8RdqN1gaXDzupWgwnDTTGiU2Mo3NlWEymntCyNtWLUb7d4ofTjbNogLuRfZlNqOxQLWpIR9JM6hCCrBSmdQIaamxq6BJRwtA1he/YCUxTpWDV6FF+/UNHmf2QbaWZkj3mE/VTLszp6/cKdjpUc07OXivkOU82WUv8f2NrjY+kUitjBo4DQjUeIkFE9mPkuMYWuLehn9kZ2Ic0fULMnOi/AXVqcof2YcpH30R9Rpb72o6xsuBkiRqmwzyh4xnVP0XOokePkuMt5KY5Pv73VVRkf4V7Fz71P8AyDLDr9pKhSAaV58avZX5d+lzoPk7RbwhxEBwS204VYava1HF5BBDYhum09VbfMwRi7dio45p+GgwSvLC07sMJjUpB7S07FLMJYA+sRsah+W6aNXnMsnjy9o68Y2cbVMyd3aGm4tPJE4XbhxkpljdsXAOA2BkpXa1cu3NfQfjeWuThU/v7POcvH+nNr6HF0GNasziMOKMu6jnc9Esqu1V3ImkV8bs5Tswdgr22pA2RNg8FMalMQq1FizO16RQ2QpzcMCBgLqIN89yqdVXHFVFEKR01VB71wqDGkkBSibGGHUf1H0Q3ENzAFMc9T5Db5/RNWNAEbQsnfXBe9zt9YHkNAqXymf9LA0vZa/9GcaHfJf4Is3H/S+qy0hw5br6nrsrSJbH2F42T3s2ooOME5uoH38lNrC06bFU2Y0+/BElvQqrPTosxJBsoKpb5TLduYRbZ6qe6CMmhiYDuvi1XPpQVGEfYOysN8F14J7o06n+FOAuBh5H0U2dZbQpBsACEQEIyrrroUQxKlfrAZOo2QQeizl3bGm7/advA8wtIgsQoZhEb6z0K1/hec+Pmp+Mo83jrJD+oiva4a3xSD2qTqj8Ta7UHdZ+tbuXu55VNGDDH1ZpcPrBM33IjdYFleo0og4m7mlDDT3FYIPMUkbiRlXfiY8VBx6OayqdXVb3qouQtgJF/aIqnXbSb2j/ACaOZQVPYuOw3SW4ug5zq1d2SlT0aJ3PRo5lT2UV2Z1W6HFTiPtA6mGFro18GkwPjr8CgAq7a67VjamXKHCWt6M/RPpr6lWsXlvkuTLLk2qo0+NiUIkgNZCIa+QeRVLVY1ZTLsQ612HkrwUMxsBXMqToVWmtj0WqQKrCmClMIm4Sh300QCuLk6JTBQ1TaFa5qjCKwiDmSq2uLPJWlSjRdf5Osk2rpK64yEPkhWsUVW0Q1oQ41b/q013jqkj2Ba/EreWu08fVZx1Be3+L5H62BX6tGHysfTJ/cVVbcFUPs05NAKt1BaFlYQvs1H2RO30FX2C6yaNRmRFvbF3gPHf4I7DrNjRL5LugGjf5KF4nx5trSMQHOG+ktb1HjyHr0TlBFZyA8fxWhb0w2oC8tMimwwSeWd2kDz+C89u7t99cMblDGEw1jfdY39R8TAmUKyvWv62WmCQJjoJOrnn9+fitpheAtthvmquGro0A6N6Dx5qrzOXjwxq/3fQ7DhlN2GsA2GgA2/ZXZR1Q+cAwDJ5lSAXj8jbk2a8FSLJVtEyYUKVLmVdTIzJEh0UFzC6FVUfqpNKQ0ORe0q1pVDVa0pbDRc1fOZKg0qwFLZJU5pCj2nVXGVEgFEmcV7rqg5kL4PRUcTXQuAr4lQcfXJ7h8lmqrCCtC/UEJfXttOo+i3/huTDHcH9spcvB3Vr6FjAuvQl3fCkYdoh/xql1XqujatGK3TphrmqGVBPxql/cFV+N0+o+KjoyeyPRqbvvp5rxHibGX3tw8z+XmIpgbZBo0+o19SvS+KMQ7K0rOa4yWZGnbvPOUH0mfReScMvaavf25ft+ysNiEj0bhagy1oNbHedDnnqT/A0Rt7iGcw3QfVR7APA5KTLVrNSZXjc2TvOUn62bGNUkiFBpOwRjAG+J+9lXLiNIAXWsHNU5OywiwvKstyqS4AK61dpKW1oYvS0uVjXIUv1VjHJbiMQYCrWlCNcrWuSXEagkOVjXBDtcoVmkahB1skOa5dygpbRvZ0OhRLayh42gaLnNVL2qxtx1UjB2UK0dYMuhy7UaqiUa2TZNjtVAOgwotOoUap1RrTAYBjeDsrMI58j0Xm99w7VZMOnXQL1btEsxCzaTm26r0XxvynT9mV/8mdyuN23FbPIK9N7DDpCqly3XEeD5mEgeRCxXsFXr8ivSRyRkri7MtxadNG+/qPcxaAf3VG/IOP7LzTDaha9v/Nv1C2/9Rq00aQ/9T/xKwjdO90M/BHWiF6eui+ytk+g6lLX4q4mUJdXEgdI+uqhZ082vJeaniirbNSL0aSxvS5uqI7ZKaLoV7XlUJ41Y+LDXVVfbugeaXZkbSdoPJKlGkMiy8uVjShsytaUloYmFMcrmuQjakK6mQUqURqYW1dD4QRe5mo1CIoXTX+BQODq/UTZG7tw4S3QoClelpyuCYVAQUDiFMOE803G09PaIYeKkjRDuuSzVLbG7LDlOyY1gHCQpePq6fh1hVK9DlN5nZIKhLSrKF8ueD7iCxtm1UarkKLoFdNZB0aAbLM6pqPnRRe9D1KiZGIDkA3ZLD1BQs0/7AjrmHCClvspWjinS9oB0/UIePXzRp6zFT6tKxLqmkLWcWmaI/wCY+hWPK9emYTNia8sZ4hv0Cc29TK0BZ2y1ZQ82/fyThp1WJyIJaNBPSGlCoi2vSy3cUU0rOnEfF6CS5HU36eiVPOyMpO2SZx0MiwvOOSta9BndW00hocmFiou0a2u6qah6m6FRTDTHQrDmqK9v+pqAuXQBCtw+qZ3QfpuKtE2HUbiRlO6ouCQNVy7EO0Ubo91DFK0/yTYK2mHA9V22uS3QqqgdVyr7ys1emDYXcOBCXvKIYUI8ooIhk21Fay4IQbCpPROKYLDjWlVPehWFdc5R0oVI7VqqHboes4yoZimqGgLP/9k=", "date": "2025-09-15", "isVisible": True, "order": 2, "serviceId": 2, "barberId": 4},
-            {"id": 3, "barbershopId": 1, "title": "Pack corte + barba", "description": "Combinación de servicio express.", "imageUrl": "data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wCEAAkGBxISEhUSEhIVFRUWFRUVFRUYFRUVFRcVFRUXFxUVFRUYHSggGBolHRUVITEhJSkrLi4uFx8zODMtNygtLisBCgoKDg0OFxAQFy0fHh0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLf/AABEIAPsAyQMBIgACEQEDEQH/xAAcAAABBQEBAQAAAAAAAAAAAAACAQMEBQYABwj/xAA/EAABAwIDBQYDBgUCBwEAAAABAAIRAyEEMUEFBhJRYRMicYGRoTLR8AdCUrHB4RQjM2LxFXJTVIKSlMLSJP/EABkBAAMBAQEAAAAAAAAAAAAAAAABAgMEBf/EACIRAQEAAgEEAwADAAAAAAAAAAABAhEDEhMhMQRBUSIycf/aAAwDAQACEQMRAD8A16UJAlCwSIIgkCIJAoCNqQIggxhGEARhKwCARABAEQKm4w9igJYCCUsqOiHsULoCGUkpdEPqouEJC0JJScSntw+qlLAhLAllCSp7WP4fXSGmEBphGShJSvDj+H102aaE0+qcJQkqexj+H3Kb7PqUhaeaLiScSXYxHcoYdzSd7mi4l3El2IO5TQShCEQXoOcYRhAEYQBBGEIRBAEEQSBKgypZSLkAspJSEoWVA64II5gyPVIDXSklIkZZXSkSJaBZSSuSI0HEoSlKEpaBChKUoSjRhKGUpQlLQdK6UJSSloFCIIQiAWyBtTgQBGEwMIghCIIAkqQLkgVUu395KGEB7R3ejusaJcfkOpR7xbZbh6ZiTUcO40DXmeQsfReE4rFvNRziXF03znzPzR7VI9B2rv8AOqYepTbTdTe4RxTMMI7zmmM+vU6hUGyN48TRDezqnhE8Te6WkkTYRIHt0VGxj7d51xOYI4dfiyUN003XmOKeVre/7Kulb1nBfaRRLR21J7Xa8MObEm9yDoLXzVljd+8ExssqGq4iQxjXT4EkAN814xUq5FpE9M8o+vmnqJIbkG8rXJyzU60OmV6jh/tIoH+pRqsHOWO9gVb7N3wwdYw2pwnk8cPocvdeLtIBPFJ6zbw5pamIzEgDkD7xzGSWr9Dpj2928mED+A4imD/uEeuSsqNZrxLXBw5gyF88duBa5Mj4vlzKt9ibwV8K7ipmxMEEd0mYEifcJXcHT+PcikKy+72+lLEcLH9yoZt9y3IlaSjWa8AtIIN5GSJdps0IoSjKEoI2UBThTZSASkSlCloxhGEARtWiDgRhAEYTAgiCEIggFXOMJQm6ztOanLKYzdVjjcrqPL97MU7E1iB8LbAyJIHh4myz9bYtRp42guz0K9jZsilc8OeZupOH2UxvwtHouecuV9O3tYyeXhVbC1Mi0+A09fJPVdi4hrQ51JzgR94WiDn6L3KvsmgR3mNnwv7Kp3gptpUHOb92SZ08stfdadeSejB4q7BmHEMjhJnPPX8ikpVGH4h90RFsnG/gpWPx/G4kAhsk21ygnmqrE4mTJNwIHlkPMrabvthdfSdiaYIPDYHL0PzamnU2C7run1I/cqEMWcgCTlbMrg+HS7IaW5zCrRJeJIJOl/29UzSqmQOWpvHVNvryQI4RbPTqu7Zo+GbTHO2U/WiNA+3EEGbm0DxkhaXdreqrhi1pcalM24CTaNWuzWXbUkXtnMBdReQT7AiJHL2UXE9vftm7QZXYKlMgtPUWOoPIqSV5puDtYUajqT8qhtcEBwMTbQzmvS1MRZoBQFGUBQQSkXFIgDCcCbCcCpIwjCAIwmBBEEIRBAc50CVELzmnMS8ZJkXXHz5W3U+nf8bDpx6r9pNJ5Ug4gBQHuhR6tU5rOZab3Hae6rOayW/+KBw5bJEuAMa9D6Kzr48ASeXP1WW2zjO0PDFpm/ODf0WmHmss/wAYLFcWegEAdPD9FXdlxG82zPzhX2LwpkxlP+Y6qvq4c3gR9aldkyctiC+G5R4prtOf14clJdSOfLJA2keXn9ZKtloBdN8usXSFgAiTb85S1KQHUoQJTJzXkHPPMeH0VIY4u1i2f1mo3DrndLSdHh+vgglnhHFjg4HKL30P17r17dXb4xFMNef5rQARztmF4vSqh2t9B1W2+z2r/wDrA/Exx9NVnlNHfMeoFAUZQFSgBSJXIUA4E4E2E4FSRhGEARBMDCR7w0EnICfRcEGJALHA5FpHqEqcYTa++lKnUc2S5wMEDIHlKf2LvcHvAcAGk5zN9Fh9t7F4cQS4mHOn1Kt27NbSu2/ODceIXNvDX+vQmOb0l1UOEi6YLpWc2LtmIa7Ln+q0ArB2SxzjbFVbQoEEmZF7afUErP4hkGJ59foZLZlnEIKotqYPhcY1y8zBT48/ouTD7Z+thRex1vY5CP3VbUojUTPPyifdXtVp8NPKc1XVqMnUfmdYC6Jk57FPXo+mpuR5KDWw56z6+FtPNXldkcraXPl1TIw41zOvlJMaK5kixnq9OPqddVEcYVxi6Of7X8VWVWRZa41nlDQeRaPr6KBpzn60SOMShgK0JWHde41vp5LSbt1+HE0nCfiDZBixIBIWXpHXqVod2/61GB99pjwIKjOHHt9OYuZSlJTMgJSs0G3IUTkCAdajam2pwKkjCMIAlCAcCGsLJWrnjmVhyZ78R2cHF6yrBb1bNqg9qzg7pDrjleeSzTtvvqA9pTBIsHNs7T1Xp212CoxwIm0Kq2fu22ZgG85LCZYya1t1WZb3tkcA7iixE5SIK1WzGui/kr0bKYPui3QJ1uFaNFF2qWGKLLBV+1ANclbvaOSqNoCfb2Tnii+lFiaWs+UXPVQHtiZt7KzxVSBKiPPFkJ8lrtlpS4hl/wBNPBNPpwYsdDy6+Suf9Ke+wY48oFz5Jam6uKaC7sXGPAnyAM+yrrie3Wbr0gZJufT0VRXoiSRmSY6C+XzWhxLIMEQRIIiCDbTTJVmKo8v8W5rXGssozdYXTKsMRQUNrLrplYWEpOIt9XW4+znBdpiA45M73np+qxRpwV6z9mOx3Mp9u4EceWlhIlTmTdsbAXFKUJWaQOQonIEgcajCbaUYKpJwLn1OESUgTeKoCowsJIkZjMHQhF9eFY63N+h0agcfihRNrBze818wMuaxe3qmKwLmvNRj6bncOocT4aZdUdTbr60UwHcbiABnnrItC48sbJqx6uFxy8ytlhnh7A7ndTKdcBVmHPBTa2fhAE+ATFWvKynhWtrd+LBTXbqrpuKdNZK1UxiXUxFrqnxuIEFBtLGgA3Cz+K2gTkc/YA6+oVY42pysiTjHTYDoOnipdBgaAqzZLe0qeF/8rR1Nntc0gmLSjkuvB8f6h7T2wabf5Le+RA69T0UXZeLxxZxioerXAR5aqofiqhLMRQ74Zxse3mJEiP8ApmVuMHVZUw/aMESJ/ZTrU8tZl9Mxt6MTR7dzA2tTdw1I1abCeeY91kXWt0P1+a2u1nBmHqk/fsB7D9fRYiu/VdHF6cvyJJkr8WwfXRVlQQpuLqKJRpOe4NaCXEgAASSToBzXZj6cOS33U2McXiG0r8PxPI0aPnkvdMLhm02BjBDWiAOQVHuRu5/BUIdBqvh1QjIcmA8h+a0Sm3bK0JQlEUBSIDkKJyBBiaUYTTSnAmk4ESAIkB5x9rDXcdDPh4akDTilt4GuSg7hV2tq9434YHNbne/Zgr4c5SzvCcjaOHpM+sLyauamHfxcLm9D89VGc6p0uni8Tq/Hrr3iIUcgSqvYO0e1pNcc4M+qLaO0OEQDfLzXD03enoTKa2sq2IDR9fWiqsRtLl19dFS19o8UgHkAcpt+4VPiMYe8Qc5n1+vVaY8SLyaS9rbTJJgyDl1jTzURuMgDiNrx5f4VbUNx0A/Qn81FrVjAAJiCunHCenPlnXoG61YEOd9QrF2GxVcgUCwMIPG9zoIPKPBZfdHExTf6r0Ddyj3STkTPqAuTkx/nXZx3+EVuzdgVKDw1oDmnMi4nr+6nP4KY7BjpuXOOjQbkeSkbUZTAM1uAe5WOx2PbdlKQ3Vxzcp81rNTyY3t2iHHhZ8LbDrCy1Z8zeFP2voFWkLq4pqOHmy3kg12yeq9U+z7dAYdoxFZv85wlrSP6TT/7kZ8sucx/s/3VAjF1m3N6LD90f8QjmdOQvrbfLfbiyrly5ckgJQIigKAFyBE5Ag3NKcBTLU41MjgKIFCEQQSv3jdGGqOMw0cToz4W3Pz8ljKtKjWpmDxSJnMrcbYqtbQql/w9m6dbcJXnOx8L2VOSQGuBIE3AhY80+3Z8bL3jfSBsLGmizs5vP17J7GYw1KkAW08hdUdSQ/im+fS0qTSrWBGftzv6JXHztpMvGklzbZa20nP/AAotV2d8yR7SP1R18QbTpPjmoOLqAyJGX5GxCchWmq5uImCfNR5PuUTqgJ6JvjC1kZVo93mHgc38X6rYYXalVjBTgWAE+AWR3YqC4kzZasUpuuPlusq7+H1ELE8TiXOMlRBTVrUoqNUpQspWlUe1qORUrc/d/wDiq/8AMH8qnDn/AN1+6zwMGegPNScTh+MQt9uzs4UMOxoF3Djd1c75CB5Lq4rvw4PkeFoGroRJF0OIKRKkSASgKJyAoAHIUrkKRhajBTTSnAVRHQUoQApQglfvPhjVwtZjcywwOZF49l49/qjyQ0zaBHpaPJe6LD7z7his91XDu4HmJb908z0sjUvtphlp5/VxAzHiPl6EphuKgdJ/z+X5q12huXj6eVLtBBPccDYZktJ/KVnq9J9N3C9rmn8LgRlYpzGNOtN/iDaevomazwozXFPMpE5CSlqRW7TRb5KThsG+oYAnry6qxwGzZu+Y5aLQYamBl9BZZ82vTXDh37N7C2X2U3mYWmpCAoWHpqaxcWeVyu67cMZjNRzwmX05UvhXdks9q0rRRuvRGiAB0CxDqV1s8NU4mNdzAXZ8e+3B8ya0dlcVxSErqcJChKUoSkCFNlGU2SgwOQInFBKABpRgplpRgpkfBRApppTgKCHKJNgopQBKv2rsWhiW8NWm13IxcHmHZjJT5SSg2B2x9nNNrS/DFxIv2TjII/tOc9DMrMYfDNFgIXpG8+87MI3hbDqxHdbo0fif06arBYTFms5znxxlxcYETxHOAs+SXW3T8fLzqjYzopuGpQhp01LothcmVd+MSqQUumFEpKTTcVjW0SAE5CGk1SqbFFCM2gcyjftZ2FaHkcVIECoPvMaTHaN5gHMcrjK8qFS734ptPC1Ac3jgaOZd8hJ8lXFnlM5plzYzLC7bdtQEAgyDcEZEHIhdK833F3s4eHDVz3cqT/wzkx3TkdMl6KvWePopKQpEhSJxKbJROTbigwOKCUrkKQR2lOAphrkYKokhpTgKjtcnA5APAogUyCjBQRyVQ727xDCUwGwaz54G8ub3dB7lW2LxTabHVHmGtaXOPQBeH7a2tUxVZ9T8R8mtHwtHQD1MpybOQmN2gXOLi4ve4yXG90WysQadQPcbHunqHED84TFGgAmsW8kW0y8lVks0uXV239NqlU2JjB1mva1w1AKmUwvLyr1caNtNSqbUDBzVbjt6cNRsHdo78LIPq7IfmomOWV1JtVzxx91o6LEGO2jSoN4qtRrB1Nz/ALQLnyXnG0N88TUkUyKLf7bu83n9AFQVHlx4nuLnHMuJcT4k3XTh8O3+1c2fy5P6x6Dit/6AkU6dR8ZEwxp9ZIHksftrbtXEvDnwA2eFomBPOTc9VWhoRNXVhwYYXcjmz5s8/Fp5pnJev7k7Z/iMOA4zUpw1/Mj7r/MD1BXjZmVd7u7WdhazajZIye38TD8Q8dR1AV2MXtMpCUFCs17WvaZa4BzTzBEgopUJIUBREpsoMLkEpXIUggtKdBTDU4CqI80pwFMNTrUA6CiaU2F1SqGtLnEBoBJJsABmSgMJ9p21nEswbDHEBUqkfhnuN9QT5BYulTAED1VxvTi2VsVUqsdxNPA1pgizWga9eJUxfPgrnpRXusoVZyequTDkwewe161IQx8DkQCPdSnbzYnSpHg1v6hVfZrhSSuGN9xUzyn2fxW0KtX+pUe/oXGP+3JNtC4U+ZCIOGiqST0Vo2hJxE2HqlbTJzTzWoI2ynzTgaiASwgBITiFGlQ1u6289Wi0UjD2jJp5ZkA6are7M2vSrjumHasNnDw5heNUnEEEZq7w+IkB7SQRyMEFZZeD1t6sUBKy+xN6Zhlfyqf/AF81piZuEk2aC4oJROQICCEbUARtVEdaU4E21OBAGFmvtA2p2VAUgO9WkTyY2C7zuB5laZq8w312t2+ILQRwUpY2NT98z4iPJOQRmy5c6yWIugKtRpyGE7wrmhMAFNEKCcBRgoBrsAja0DRGEqAEhLCIBcQgEAXAJYXIBClC4JWhKgQKl4HEcJg5Gx/RQXFEClZs188K02JvA6h3Hy6ny1b1b8lQ4OvIg5hWGCpUnHhqcQJIhwIA6gyFhfC/b0TD4htRoexwc05EfWaNZ/ZuyHYd5NKsS0m7XNs4c7Gx6q84+icylZ2aQwiDk2ETFaT7XJxpTIRtQFPvntQ0MOQ0w+oeBvMD7x9LeYXl5K0v2hVXHEhpNm02wOXETPrA9FlSVeMOCJSQlCVMwpEq5MOStSAIggCCMFAEQQBLpSLigOXJAuQCpQUISFIBOaMoWrigH8PVLSrOjVDhIVKVKwLzxHw/VRljvyqVrdl7XAb2VaXUzab8TfAi8e40Uz/TcN/ztX/yCsyEqx6fxT//2Q==", "date": "2025-08-20", "isVisible": True, "order": 3, "serviceId": 3, "barberId": 3},
-        ],
-        "reviews": [
-            {"id": 1, "barberId": 1, "serviceId": 1, "rating": 5, "comment": "Excelente corte y atención.", "userName": "Alberto", "createdAt": "2025-11-01T10:15:00Z"},
-            {"id": 2, "barberId": 2, "serviceId": 5, "rating": 5, "comment": "Mi hijo quedó encantado.", "userName": "Lucía", "createdAt": "2025-11-02T12:45:00Z"},
-            {"id": 3, "barberId": 3, "serviceId": 2, "rating": 4, "comment": "Afeitado rápido y limpio.", "userName": "Pedro", "createdAt": "2025-11-03T09:30:00Z"},
-            {"id": 4, "barberId": 4, "serviceId": 3, "rating": 5, "comment": "Pack muy completo, gran resultado.", "userName": "Sergio", "createdAt": "2025-11-03T16:20:00Z"},
-            {"id": 5, "barberId": 1, "serviceId": 2, "rating": 4, "comment": "Buen perfilado de barba.", "userName": "Raúl", "createdAt": "2025-11-04T08:05:00Z"},
-        ],
-        "bookings": []
-}
\ No newline at end of file
+from __future__ import annotations
+
+import json
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+FIXTURE_PATH = Path(__file__).with_name("db_memory.json")
+
+
+class MemoryRepository:
+    """Colecciones del fixture con búsqueda por id e índices secundarios."""
+
+    def __init__(self, data: dict[str, Any]):
+        self.data = data
+        self._by_id: dict[str, dict[Any, dict]] = {}
+        self._indexes: dict[tuple[str, str], dict[Any, list[dict]]] = {}
+        self._lock = threading.Lock()
+
+    def all(self, collection: str) -> list[dict]:
+        value = self.data.get(collection)
+        return value if isinstance(value, list) else []
+
+    def document(self, name: str) -> Optional[dict]:
+        """Entrada que no es una colección (p. ej. `barbershop`)."""
+        value = self.data.get(name)
+        return value if isinstance(value, dict) else None
+
+    def get(self, collection: str, item_id: Any) -> Optional[dict]:
+        by_id = self._by_id.get(collection)
+        if by_id is None:
+            with self._lock:
+                by_id = self._by_id.setdefault(collection, {x.get("id"): x for x in self.all(collection)})
+        return by_id.get(item_id)
+
+    def _index(self, collection: str, name: str, key: Callable[[dict], Any]) -> dict[Any, list[dict]]:
+        index = self._indexes.get((collection, name))
+        if index is None:
+            built: dict[Any, list[dict]] = {}
+            for x in self.all(collection):
+                built.setdefault(key(x), []).append(x)
+            with self._lock:
+                index = self._indexes.setdefault((collection, name), built)
+        return index
+
+    def find(self, collection: str, field: str, value: Any) -> list[dict]:
+        """Elementos con `field == value` (índice por campo, en orden del fixture)."""
+        return self._index(collection, field, lambda x: x.get(field)).get(value, [])
+
+    def on_date(self, collection: str, date: str, field: str = "start") -> list[dict]:
+        """Elementos cuyo `field` ("YYYY-MM-DDTHH:MM") cae en `date` ("YYYY-MM-DD")."""
+        return self._index(collection, f"{field}:date", lambda x: str(x.get(field) or "")[:10]).get(date, [])
+
+
+_repo: Optional[MemoryRepository] = None
+_load_lock = threading.Lock()
+
+
+def memory_repo() -> MemoryRepository:
+    """Repositorio en memoria; lee el fixture la primera vez."""
+    global _repo
+    if _repo is None:
+        with _load_lock:
+            if _repo is None:
+                with FIXTURE_PATH.open(encoding="utf-8") as f:
+                    _repo = MemoryRepository(json.load(f))
+    return _repo
+
+
+def memory_loaded() -> bool:
+    return _repo is not None
+
+
+class _LazyDB(Mapping):
+    """Vista de solo lectura del fixture con la interfaz del antiguo `DB`."""
+
+    def __getitem__(self, key: str) -> Any:
+        return memory_repo().data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(memory_repo().data)
+
+    def __len__(self) -> int:
+        return len(memory_repo().data)
+
+
+DB: Mapping[str, Any] = _LazyDB()
+
+__all__ = ["DB", "FIXTURE_PATH", "MemoryRepository", "memory_repo", "memory_loaded"]
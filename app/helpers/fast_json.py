@@ -0,0 +1,73 @@
+"""Modo de respuesta JSON rápido (opcional, `FAST_JSON=1`).
+
+En el modo normal cada fila se convierte en un modelo Pydantic y FastAPI lo
+vuelve a validar y serializar con `response_model`. En modo rápido los
+listados proyectan las filas directamente a `dict` y se codifican una sola vez
+(con `orjson` si está instalado, si no con `json`). El esquema de respuesta es
+el mismo; `scripts/bench_fast_json.py` valida ambas salidas y compara.
+"""
+from __future__ import annotations
+
+import json
+import os
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Iterable
+
+from fastapi.responses import Response
+from pydantic import BaseModel
+from sqlalchemy import select
+
+try:  # dependencia opcional
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
+
+FAST_JSON_ENABLED = os.getenv("FAST_JSON", "0").lower() in {"1", "true", "yes"}
+
+
+def fast_json_enabled() -> bool:
+    return FAST_JSON_ENABLED
+
+
+def _default(obj: Any) -> Any:
+    # Mismo formato que Pydantic en modo JSON (Decimal como cadena)
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json", by_alias=True)
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    raise TypeError(f"Tipo no serializable: {type(obj).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content, default=_default)
+    return json.dumps(
+        content, default=_default, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class FastJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def select_columns(model: Any):
+    """SELECT de todas las columnas de la tabla como tuplas (sin instanciar objetos ORM).
+
+    Las filas resultantes exponen las columnas como atributos (`row.start`).
+    """
+    return select(*model.__table__.columns)
+
+
+def project(rows: Iterable[Any], model: type[BaseModel]) -> list[dict]:
+    """Filas ORM -> dicts con los campos del modelo de respuesta (sin validar)."""
+    fields = tuple(model.model_fields)
+    return [{f: getattr(row, f, None) for f in fields} for row in rows]
+
+
+__all__ = ["fast_json_enabled", "dumps", "FastJSONResponse", "select_columns", "project"]
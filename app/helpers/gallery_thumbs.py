@@ -0,0 +1,71 @@
+"""Miniaturas de las imágenes de la galería.
+
+Se generan en el pool de procesos de imágenes al crear/actualizar un item y,
+al arrancar, para los que aún no la tengan. Solo para imágenes que el
+servidor puede leer (`data:` en base64 o ficheros bajo `static/`); para URLs
+externas `thumbnailUrl` es `None` y la app usa `imageUrl`.
+
+El nombre depende del hash del origen (la URL `data:`, o la URL más tamaño y
+fecha de modificación del fichero de `static/`), así que se sirven con caché
+`immutable` (ver `CachedStaticFiles`): si se reemplaza el fichero de origen,
+la miniatura nueva tiene otro nombre.
+"""
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import Iterable, Optional
+
+from app.helpers.cache import catalog_cache
+from app.helpers.images import gallery_thumb_filename, get_image_pool, store_gallery_thumbnail
+
+STATIC_ROOT = Path(__file__).resolve().parents[2] / "static"
+THUMBS_DIR = STATIC_ROOT / "gallery-thumbs"
+THUMBS_URL_PREFIX = "/static/gallery-thumbs/"
+
+log = logging.getLogger(__name__)
+
+# URLs de origen con generación en curso (evita encolar la misma dos veces)
+_pending: set[str] = set()
+
+
+def _supported(image_url: Optional[str]) -> bool:
+    return bool(image_url) and (image_url.startswith("data:image/") or "static/" in image_url) \
+        and THUMBS_URL_PREFIX.lstrip("/") not in image_url
+
+
+def thumbnail_url(image_url: Optional[str]) -> Optional[str]:
+    """Ruta pública (relativa al host) de la miniatura, si ya está generada."""
+    if not _supported(image_url):
+        return None
+    filename = gallery_thumb_filename(image_url, str(STATIC_ROOT))
+    if filename is None or not (THUMBS_DIR / filename).exists():
+        return None
+    return THUMBS_URL_PREFIX + filename
+
+
+def _on_done(image_url: str, future) -> None:
+    _pending.discard(image_url)
+    if future.cancelled():  # apagado del pool: se reintentará en el próximo arranque
+        return
+    try:
+        if future.result():
+            catalog_cache.invalidate_shops("gallery")  # los listados cacheados ya pueden incluirla
+    except Exception:
+        log.exception("Error generando miniatura de galería")
+
+
+def schedule_thumbnails(image_urls: Iterable[Optional[str]]) -> int:
+    """Encola la generación de las miniaturas que faltan. Devuelve cuántas se encolaron."""
+    queued = 0
+    for url in image_urls:
+        if not _supported(url) or url in _pending or thumbnail_url(url):
+            continue
+        _pending.add(url)
+        future = get_image_pool().submit(store_gallery_thumbnail, url, str(STATIC_ROOT), str(THUMBS_DIR))
+        future.add_done_callback(lambda f, u=url: _on_done(u, f))
+        queued += 1
+    return queued
+
+
+__all__ = ["THUMBS_DIR", "thumbnail_url", "schedule_thumbnails"]
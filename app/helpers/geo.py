@@ -0,0 +1,180 @@
+"""Búsqueda geográfica de barberías: geohash + distancia haversine.
+
+Cada barbería guarda su geohash (`barbershops.geohash`, indexado). Una
+búsqueda por radio calcula las celdas de geohash que cubren el rectángulo
+que contiene el círculo y pide a la BD solo las filas cuyo geohash empieza
+por alguna de ellas (rangos `>= celda AND < celda + '{'`, que usan el
+índice). Sobre esos candidatos se calcula la distancia exacta.
+"""
+from __future__ import annotations
+
+import math
+from datetime import datetime, time
+from typing import Iterable, Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+GEOHASH_PRECISION = 9          # ~5 m: precisión guardada en la columna
+MAX_COVER_CELLS = 16           # celdas (rangos del índice) por búsqueda
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE_LAT = 111.32
+
+_WEEKDAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+
+
+def geohash_encode(lat: float, lng: float, precision: int = GEOHASH_PRECISION) -> str:
+    lat_lo, lat_hi = -90.0, 90.0
+    lng_lo, lng_hi = -180.0, 180.0
+    out: list[str] = []
+    value, bits, even = 0, 0, True
+    while len(out) < precision:
+        if even:  # bits pares: longitud
+            mid = (lng_lo + lng_hi) / 2
+            if lng >= mid:
+                value, lng_lo = value * 2 + 1, mid
+            else:
+                value, lng_hi = value * 2, mid
+        else:
+            mid = (lat_lo + lat_hi) / 2
+            if lat >= mid:
+                value, lat_lo = value * 2 + 1, mid
+            else:
+                value, lat_hi = value * 2, mid
+        even = not even
+        bits += 1
+        if bits == 5:
+            out.append(_BASE32[value])
+            value, bits = 0, 0
+    return "".join(out)
+
+
+def _cell_size(precision: int) -> tuple[float, float]:
+    """(alto, ancho) en grados de una celda de geohash."""
+    total = 5 * precision
+    lng_bits = (total + 1) // 2
+    lat_bits = total // 2
+    return 180.0 / (1 << lat_bits), 360.0 / (1 << lng_bits)
+
+
+def _bbox(lat: float, lng: float, radius_km: float) -> tuple[float, float, float, float]:
+    dlat = radius_km / KM_PER_DEGREE_LAT
+    dlng = radius_km / (KM_PER_DEGREE_LAT * max(math.cos(math.radians(lat)), 0.01))
+    return max(lat - dlat, -90.0), min(lat + dlat, 90.0), lng - dlng, lng + dlng
+
+
+def _steps(lo: float, hi: float, step: float) -> list[float]:
+    values = []
+    v = lo
+    while v < hi:
+        values.append(v)
+        v += step
+    values.append(hi)
+    return values
+
+
+def _wrap_lng(lng: float) -> float:
+    return ((lng + 180.0) % 360.0) - 180.0
+
+
+def covering_cells(lat: float, lng: float, radius_km: float) -> list[str]:
+    """Prefijos de geohash que cubren el círculo (a la mayor precisión con <= MAX_COVER_CELLS)."""
+    min_lat, max_lat, min_lng, max_lng = _bbox(lat, lng, radius_km)
+    if max_lng - min_lng >= 360.0:
+        return [""]  # el radio da la vuelta al mundo: sin poda
+    precision = 1
+    for p in range(GEOHASH_PRECISION, 0, -1):
+        h, w = _cell_size(p)
+        count = (math.ceil((max_lat - min_lat) / h) + 1) * (math.ceil((max_lng - min_lng) / w) + 1)
+        if count <= MAX_COVER_CELLS:
+            precision = p
+            break
+    h, w = _cell_size(precision)
+    return sorted({
+        geohash_encode(la, _wrap_lng(ln), precision)
+        for la in _steps(min_lat, max_lat, h)
+        for ln in _steps(min_lng, max_lng, w)
+    })
+
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    p1, p2 = math.radians(lat1), math.radians(lat2)
+    dp = p2 - p1
+    dl = math.radians(lng2 - lng1)
+    a = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def set_geohash(row):
+    """Rellena `row.geohash` a partir de sus coordenadas. Devuelve la fila."""
+    if row.latitude is None or row.longitude is None:
+        row.geohash = None
+    else:
+        row.geohash = geohash_encode(row.latitude, row.longitude)
+    return row
+
+
+def _parse_hhmm(value: Optional[str]) -> Optional[time]:
+    try:
+        return time.fromisoformat(value) if value else None
+    except ValueError:
+        return None
+
+
+def _day_hours(opening_hours: dict, weekday: int) -> tuple[Optional[time], Optional[time]]:
+    day = opening_hours.get(_WEEKDAYS[weekday]) or {}
+    return _parse_hhmm(day.get("open")), _parse_hhmm(day.get("close"))
+
+
+def is_open_at(opening_hours: Optional[dict], tz_name: Optional[str], now: Optional[datetime] = None) -> bool:
+    """¿Está abierta según `openingHours` en la zona horaria de la barbería?
+
+    Admite horarios que cruzan la medianoche (`close` <= `open`).
+    """
+    if not opening_hours:
+        return False
+    try:
+        tz = ZoneInfo(tz_name or "UTC")
+    except (ZoneInfoNotFoundError, ValueError):
+        tz = ZoneInfo("UTC")
+    local = (now or datetime.now(tz)).astimezone(tz)
+    t, weekday = local.time(), local.weekday()
+    open_at, close_at = _day_hours(opening_hours, weekday)
+    if open_at is not None and close_at is not None:
+        if open_at < close_at and open_at <= t < close_at:
+            return True
+        if close_at <= open_at and t >= open_at:
+            return True
+    # Tramo del día anterior que continúa pasada la medianoche
+    prev_open, prev_close = _day_hours(opening_hours, (weekday - 1) % 7)
+    return prev_open is not None and prev_close is not None and prev_close <= prev_open and t < prev_close
+
+
+def nearest(
+    candidates: Iterable,
+    lat: float,
+    lng: float,
+    radius_km: float,
+    coords=lambda c: (c.latitude, c.longitude),
+) -> list[tuple[float, object]]:
+    """(distancia_km, candidato) dentro del radio, ordenados por distancia."""
+    found = []
+    for c in candidates:
+        c_lat, c_lng = coords(c)
+        if c_lat is None or c_lng is None:
+            continue
+        d = haversine_km(lat, lng, c_lat, c_lng)
+        if d <= radius_km:
+            found.append((d, c))
+    found.sort(key=lambda x: x[0])
+    return found
+
+
+__all__ = [
+    "GEOHASH_PRECISION",
+    "geohash_encode",
+    "covering_cells",
+    "set_geohash",
+    "haversine_km",
+    "is_open_at",
+    "nearest",
+]
@@ -0,0 +1,322 @@
+"""Procesado de imágenes de usuario fuera del event loop.
+
+El decodificado/recodificado con Pillow es CPU intensivo, así que se ejecuta en
+un `ProcessPoolExecutor` (no bloquea el loop ni compite por el GIL). Este
+módulo se importa también en los procesos hijos: evita dependencias pesadas a
+nivel de módulo (Pillow se importa dentro de las funciones).
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import multiprocessing
+import os
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+MAX_PHOTO_BYTES = 5 * 1024 * 1024
+# Protección frente a "bombas de descompresión" (imágenes pequeñas en bytes pero enormes en píxeles)
+MAX_PHOTO_PIXELS = int(os.getenv("MAX_PHOTO_PIXELS", str(40_000_000)))
+
+# Bytes de cabecera necesarios para reconocer el formato
+SNIFF_BYTES = 12
+
+# Variantes cuadradas generadas para cada foto (lado en px) y formatos de salida
+PHOTO_VARIANT_SIZES = (64, 128, 512)
+PHOTO_VARIANT_FORMATS = ("webp", "jpg")
+PHOTO_URL_MARKER = "static/user-photos/"
+
+_VARIANT_RE = re.compile(r"_w\d+\.(?:webp|jpg)$")
+
+# Miniaturas de la galería: ancho máximo (se conserva la proporción)
+GALLERY_THUMB_WIDTH = int(os.getenv("GALLERY_THUMB_WIDTH", "480"))
+
+
+class InvalidImageError(ValueError):
+    """El contenido no es una imagen válida/soportada."""
+
+
+def sniff_image_format(header: bytes) -> Optional[str]:
+    """Detecta el formato por "magic numbers" y devuelve la extensión (o None)."""
+    if header.startswith(b"\xff\xd8\xff"):
+        return ".jpg"
+    if header.startswith(b"\x89PNG\r\n\x1a\n"):
+        return ".png"
+    if len(header) >= 12 and header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return ".webp"
+    return None
+
+
+def _write_atomic(dest: str, payload: bytes) -> None:
+    tmp = f"{dest}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as fh:
+        fh.write(payload)
+    os.replace(tmp, dest)
+
+
+def encode_photo(data: bytes, ext: str) -> bytes:
+    """Valida y recodifica la imagen; devuelve los bytes normalizados."""
+    from io import BytesIO
+    from PIL import Image, UnidentifiedImageError  # type: ignore
+
+    try:
+        img = Image.open(BytesIO(data))
+        if img.width * img.height > MAX_PHOTO_PIXELS:
+            raise InvalidImageError("Imagen demasiado grande en píxeles")
+        img.verify()  # valida integridad
+        img = Image.open(BytesIO(data))
+        img.load()
+    except InvalidImageError:
+        raise
+    except (UnidentifiedImageError, OSError, SyntaxError, ValueError) as e:
+        raise InvalidImageError(str(e)) from e
+
+    save_params = {}
+    if ext == ".jpg":
+        if img.mode not in ("RGB", "L"):
+            img = img.convert("RGB")
+        save_params = {"quality": 90, "optimize": True}
+    out = BytesIO()
+    img.save(out, format={".jpg": "JPEG", ".png": "PNG", ".webp": "WEBP"}[ext], **save_params)
+    return out.getvalue()
+
+
+def content_path(digest: str, ext: str) -> str:
+    """Ruta relativa por contenido con 2 niveles de shard: `ab/cd/abcd....ext`."""
+    return f"{digest[:2]}/{digest[2:4]}/{digest}{ext}"
+
+
+def is_variant_filename(filename: str) -> bool:
+    return bool(_VARIANT_RE.search(filename))
+
+
+def variant_filename(filename: str, size: int, fmt: str) -> str:
+    """`user-1-123.png` -> `user-1-123_w64.webp`."""
+    stem = filename.rsplit(".", 1)[0]
+    return f"{stem}_w{size}.{fmt}"
+
+
+def generate_variants(src: str) -> list[str]:
+    """Genera las variantes de `src` junto al original. Devuelve las rutas creadas."""
+    from PIL import Image, ImageOps  # type: ignore
+
+    folder, filename = os.path.split(src)
+    created: list[str] = []
+    with Image.open(src) as img:
+        img = ImageOps.exif_transpose(img)
+        if img.mode in ("RGBA", "LA", "P"):
+            rgba = img.convert("RGBA")
+            img = Image.new("RGB", rgba.size, (255, 255, 255))
+            img.paste(rgba, mask=rgba.split()[-1])
+        elif img.mode != "RGB":
+            img = img.convert("RGB")
+        for size in PHOTO_VARIANT_SIZES:
+            # Recorte centrado a cuadrado (avatares); nunca se amplía por encima del original
+            side = min(size, img.width, img.height)
+            thumb = ImageOps.fit(img, (side, side), method=Image.Resampling.LANCZOS)
+            for fmt in PHOTO_VARIANT_FORMATS:
+                dest = os.path.join(folder, variant_filename(filename, size, fmt))
+                tmp = f"{dest}.{os.getpid()}.tmp"
+                if fmt == "webp":
+                    thumb.save(tmp, format="WEBP", quality=80, method=4)
+                else:
+                    thumb.save(tmp, format="JPEG", quality=82, optimize=True, progressive=True)
+                os.replace(tmp, dest)
+                created.append(dest)
+    return created
+
+
+def _variants_missing(path: str) -> bool:
+    folder, filename = os.path.split(path)
+    return any(
+        not os.path.exists(os.path.join(folder, variant_filename(filename, size, fmt)))
+        for size in PHOTO_VARIANT_SIZES
+        for fmt in PHOTO_VARIANT_FORMATS
+    )
+
+
+def store_user_photo(data: bytes, folder: str, ext: str) -> str:
+    """Normaliza la foto, la guarda por hash de contenido y genera sus variantes.
+
+    Se ejecuta en un proceso hijo. Si ya existe un fichero con el mismo
+    contenido no se reescribe (deduplicación); solo se refresca su mtime para
+    que el GC de huérfanos no lo borre mientras se guarda la nueva referencia.
+    Devuelve la ruta relativa a `folder`.
+    """
+    encoded = encode_photo(data, ext)
+    rel = content_path(hashlib.sha256(encoded).hexdigest(), ext)
+    dest = os.path.join(folder, rel)
+    if os.path.exists(dest):
+        folder_, filename = os.path.split(dest)
+        for name in [filename] + [
+            variant_filename(filename, size, fmt)
+            for size in PHOTO_VARIANT_SIZES
+            for fmt in PHOTO_VARIANT_FORMATS
+        ]:
+            try:
+                os.utime(os.path.join(folder_, name))
+            except FileNotFoundError:
+                pass
+    else:
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        _write_atomic(dest, encoded)
+    if _variants_missing(dest):
+        generate_variants(dest)
+    return rel
+
+
+def photo_variant_urls(photo_url: Optional[str]) -> Optional[list[dict]]:
+    """URLs de variantes derivadas de la URL de la foto (solo fotos locales)."""
+    if not photo_url or PHOTO_URL_MARKER not in photo_url:
+        return None
+    prefix, filename = photo_url.rsplit("/", 1)
+    if not filename or is_variant_filename(filename):
+        return None
+    return [
+        {"size": size, "format": fmt, "url": f"{prefix}/{variant_filename(filename, size, fmt)}"}
+        for size in PHOTO_VARIANT_SIZES
+        for fmt in PHOTO_VARIANT_FORMATS
+    ]
+
+
+def _static_source_path(image_url: str, static_root: str) -> Optional[str]:
+    """Ruta del fichero bajo `static/` al que apunta la URL (None si no existe o se sale)."""
+    if "static/" not in image_url:
+        return None
+    rel = image_url.split("static/", 1)[1].split("?", 1)[0]
+    root = os.path.realpath(static_root)
+    path = os.path.realpath(os.path.join(root, rel))
+    if not path.startswith(root + os.sep) or not os.path.isfile(path):
+        return None  # fuera de static/ (path traversal) o inexistente
+    return path
+
+
+def gallery_thumb_filename(image_url: str, static_root: str) -> Optional[str]:
+    """Nombre de la miniatura: hash del origen + ancho (`<sha256>_w480.webp`).
+
+    En `data:` la URL es el contenido. En ficheros de `static/` se añaden su
+    tamaño y fecha de modificación: si se reemplaza el fichero cambia el nombre
+    (se sirven como `immutable`). None si el fichero no existe.
+    """
+    source = image_url
+    if not image_url.startswith("data:image/"):
+        path = _static_source_path(image_url, static_root)
+        if path is None:
+            return None
+        st = os.stat(path)
+        source = f"{image_url}\0{st.st_size}:{st.st_mtime_ns}"
+    digest = hashlib.sha256(source.encode("utf-8")).hexdigest()
+    return f"{digest}_w{GALLERY_THUMB_WIDTH}.webp"
+
+
+def _read_image_source(image_url: str, static_root: str) -> Optional[bytes]:
+    """Bytes de la imagen si es `data:` en base64 o un fichero bajo `static/` (si no, None)."""
+    if image_url.startswith("data:image/"):
+        import base64
+        import binascii
+
+        header, _, payload = image_url.partition(",")
+        if not header.endswith(";base64"):
+            return None
+        try:
+            return base64.b64decode(payload, validate=False)
+        except (binascii.Error, ValueError):
+            return None
+    path = _static_source_path(image_url, static_root)
+    if path is None:
+        return None
+    with open(path, "rb") as fh:
+        return fh.read(MAX_PHOTO_BYTES + 1)
+
+
+def store_gallery_thumbnail(image_url: str, static_root: str, dest_folder: str) -> Optional[str]:
+    """Genera la miniatura WebP de una imagen de galería. Devuelve el nombre o None.
+
+    Se ejecuta en un proceso hijo. Si la miniatura ya existe no se regenera.
+    """
+    from io import BytesIO
+    from PIL import Image, ImageOps, UnidentifiedImageError  # type: ignore
+
+    filename = gallery_thumb_filename(image_url, static_root)
+    if filename is None:
+        return None
+    dest = os.path.join(dest_folder, filename)
+    if os.path.exists(dest):
+        return filename
+    data = _read_image_source(image_url, static_root)
+    if not data or len(data) > MAX_PHOTO_BYTES:
+        return None
+    if gallery_thumb_filename(image_url, static_root) != filename:
+        return None  # el fichero cambió mientras se leía: se generará con el nombre nuevo
+    try:
+        with Image.open(BytesIO(data)) as img:
+            if img.width * img.height > MAX_PHOTO_PIXELS:
+                return None
+            img = ImageOps.exif_transpose(img)
+            if img.mode not in ("RGB", "RGBA"):
+                img = img.convert("RGBA" if "A" in img.getbands() else "RGB")
+            # Nunca se amplía: `thumbnail` solo reduce
+            img.thumbnail((GALLERY_THUMB_WIDTH, GALLERY_THUMB_WIDTH * 4), Image.Resampling.LANCZOS)
+            out = BytesIO()
+            img.save(out, format="WEBP", quality=80, method=4)
+    except (UnidentifiedImageError, OSError, SyntaxError, ValueError):
+        return None
+    os.makedirs(dest_folder, exist_ok=True)
+    _write_atomic(dest, out.getvalue())
+    return filename
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def get_image_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                workers = int(os.getenv("IMAGE_WORKERS", str(min(2, os.cpu_count() or 1))))
+                # "spawn": no heredar hilos/loop del worker web al hacer fork
+                _pool = ProcessPoolExecutor(
+                    max_workers=max(1, workers),
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+    return _pool
+
+
+def shutdown_image_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+async def run_in_image_pool(fn, *args):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_image_pool(), fn, *args)
+
+
+__all__ = [
+    "MAX_PHOTO_BYTES",
+    "SNIFF_BYTES",
+    "InvalidImageError",
+    "sniff_image_format",
+    "encode_photo",
+    "content_path",
+    "PHOTO_VARIANT_SIZES",
+    "PHOTO_VARIANT_FORMATS",
+    "is_variant_filename",
+    "variant_filename",
+    "generate_variants",
+    "store_user_photo",
+    "photo_variant_urls",
+    "GALLERY_THUMB_WIDTH",
+    "gallery_thumb_filename",
+    "store_gallery_thumbnail",
+    "get_image_pool",
+    "shutdown_image_pool",
+    "run_in_image_pool",
+]
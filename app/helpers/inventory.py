@@ -0,0 +1,193 @@
+"""Inventario por barbería (`inventory`) con cambios de stock atómicos.
+
+Nunca se hace lectura-modificación-escritura del stock en Python:
+- Las compras descuentan con un UPDATE condicional
+  (`SET stock = stock - n WHERE stock >= n`); si no afecta a ninguna fila no
+  hay stock suficiente y se deshace toda la compra. Dos compras simultáneas
+  no pueden vender la misma unidad: la segunda reevalúa la condición sobre
+  el valor ya descontado (bloqueo de fila en PostgreSQL, escritor único en SQLite).
+- Los recuentos (valor absoluto) usan compare-and-set sobre el valor leído.
+
+`products.stock` se mantiene como la suma del stock de todas las barberías,
+aplicando en la misma transacción el mismo incremento relativo.
+"""
+from __future__ import annotations
+
+from typing import Iterable, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import delete, func, update
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, select
+
+from app.models.barbershop import BarbershopTable
+from app.models.product import InventoryTable, ProductTable, StockAdjustmentLine, StockLine
+
+
+def default_barbershop_id(session: Session) -> Optional[int]:
+    return session.exec(select(func.min(BarbershopTable.id))).first()
+
+
+def _shift_product_stock(session: Session, product_id: int, delta: int) -> None:
+    if delta:
+        session.exec(
+            update(ProductTable)
+            .where(ProductTable.id == product_id)
+            .values(stock=func.coalesce(ProductTable.stock, 0) + delta)
+            .execution_options(synchronize_session=False)
+        )
+
+
+def _records(session: Session, barbershop_id: int, product_ids: Iterable[int]) -> list[InventoryTable]:
+    return list(session.exec(
+        select(InventoryTable)
+        .where(InventoryTable.barbershopId == barbershop_id, InventoryTable.productId.in_(list(product_ids)))
+        .order_by(InventoryTable.productId)
+        .execution_options(populate_existing=True)
+    ).all())
+
+
+def reserve_stock(session: Session, barbershop_id: int, lines: Iterable[StockLine]) -> list[InventoryTable]:
+    """Descuenta todas las líneas en una transacción, o ninguna (409). Hace commit."""
+    wanted: dict[int, int] = {}
+    for line in lines:
+        wanted[line.productId] = wanted.get(line.productId, 0) + line.quantity
+    # Orden fijo de productos: dos compras nunca se bloquean en orden inverso
+    for product_id, quantity in sorted(wanted.items()):
+        result = session.exec(
+            update(InventoryTable)
+            .where(
+                InventoryTable.barbershopId == barbershop_id,
+                InventoryTable.productId == product_id,
+                InventoryTable.stock >= quantity,
+            )
+            .values(stock=InventoryTable.stock - quantity)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount != 1:
+            session.rollback()
+            exists = session.get(InventoryTable, (barbershop_id, product_id)) is not None
+            if not exists:
+                raise HTTPException(status_code=404, detail=f"El producto {product_id} no está en el inventario de la barbería")
+            raise HTTPException(status_code=409, detail=f"Stock insuficiente para el producto {product_id}")
+        _shift_product_stock(session, product_id, -quantity)
+    session.commit()
+    return _records(session, barbershop_id, wanted)
+
+
+def adjust_stock(session: Session, barbershop_id: int, lines: Iterable[StockAdjustmentLine]) -> list[InventoryTable]:
+    """Aplica un recuento/ajuste de inventario en una transacción. Hace commit.
+
+    `stock` fija el valor contado (crea el registro si no existe); `delta` suma
+    o resta sin bajar de 0. Si otra operación cambia el stock entre la lectura
+    y la escritura de un recuento (o crea a la vez el mismo registro) se
+    responde 409 y no se aplica nada. Cualquier error deshace también los
+    cambios pendientes de la sesión (p. ej. el producto recién creado).
+    """
+    by_product: dict[int, StockAdjustmentLine] = {}
+    for line in lines:
+        if line.productId in by_product:
+            session.rollback()
+            raise HTTPException(status_code=400, detail=f"Producto {line.productId} repetido en el ajuste")
+        by_product[line.productId] = line
+    if session.get(BarbershopTable, barbershop_id) is None:
+        session.rollback()
+        raise HTTPException(status_code=404, detail="No existe la barbería")
+    found = set(session.exec(select(ProductTable.id).where(ProductTable.id.in_(list(by_product)))).all())
+    missing = sorted(set(by_product) - found)
+    if missing:
+        session.rollback()
+        raise HTTPException(status_code=404, detail=f"No existen los productos {missing}")
+
+    for product_id, line in sorted(by_product.items()):
+        row = session.get(InventoryTable, (barbershop_id, product_id))
+        delta = 0
+        if row is None:
+            if line.delta is not None and line.delta < 0:
+                session.rollback()
+                raise HTTPException(status_code=409, detail=f"Stock insuficiente para el producto {product_id}")
+            stock = line.stock if line.stock is not None else (line.delta or 0)
+            tracked = session.exec(
+                select(InventoryTable.productId).where(InventoryTable.productId == product_id).limit(1)
+            ).first() is not None
+            if tracked:
+                delta = stock
+            else:
+                # Primer registro del producto: su stock pasa a ser la suma del inventario
+                session.exec(
+                    update(ProductTable).where(ProductTable.id == product_id).values(stock=stock)
+                    .execution_options(synchronize_session=False)
+                )
+            session.add(InventoryTable(
+                barbershopId=barbershop_id,
+                productId=product_id,
+                stock=stock,
+                isVisible=True if line.isVisible is None else line.isVisible,
+                order=line.order or 0,
+            ))
+            try:
+                session.flush()
+            except IntegrityError:
+                # Otro recuento creó el mismo registro entre la lectura y el INSERT
+                session.rollback()
+                raise HTTPException(status_code=409, detail=f"El stock del producto {product_id} cambió durante el ajuste; vuelve a intentarlo")
+        else:
+            values: dict = {}
+            stmt = update(InventoryTable).where(
+                InventoryTable.barbershopId == barbershop_id,
+                InventoryTable.productId == product_id,
+            )
+            if line.stock is not None:
+                delta = line.stock - row.stock
+                stmt = stmt.where(InventoryTable.stock == row.stock)  # compare-and-set
+                values["stock"] = line.stock
+            elif line.delta:
+                delta = line.delta
+                stmt = stmt.where(InventoryTable.stock + delta >= 0)
+                values["stock"] = InventoryTable.stock + delta
+            if line.isVisible is not None:
+                values["isVisible"] = line.isVisible
+            if line.order is not None:
+                values["order"] = line.order
+            if values:
+                result = session.exec(stmt.values(**values).execution_options(synchronize_session=False))
+                if result.rowcount != 1:
+                    session.rollback()
+                    if line.stock is not None:
+                        raise HTTPException(status_code=409, detail=f"El stock del producto {product_id} cambió durante el ajuste; vuelve a intentarlo")
+                    raise HTTPException(status_code=409, detail=f"Stock insuficiente para el producto {product_id}")
+        _shift_product_stock(session, product_id, delta)
+    session.commit()
+    return _records(session, barbershop_id, by_product)
+
+
+def backfill_inventory(session: Session) -> int:
+    """Crea el inventario de la barbería principal desde `products.stock` si está vacío.
+
+    Devuelve el número de registros creados.
+    """
+    if session.exec(select(InventoryTable).limit(1)).first() is not None:
+        return 0
+    shop_id = default_barbershop_id(session)
+    if shop_id is None:
+        return 0
+    products = session.exec(select(ProductTable.id, ProductTable.stock, ProductTable.isActive)).all()
+    for product_id, stock, is_active in products:
+        session.add(InventoryTable(
+            barbershopId=shop_id,
+            productId=product_id,
+            stock=max(stock or 0, 0),
+            isVisible=bool(is_active),
+            order=product_id,
+        ))
+    if products:
+        session.commit()
+    return len(products)
+
+
+def delete_product_inventory(session: Session, product_id: int) -> None:
+    """Borra el inventario de un producto en todas las barberías (sin commit)."""
+    session.exec(delete(InventoryTable).where(InventoryTable.productId == product_id))
+
+
+__all__ = ["default_barbershop_id", "reserve_stock", "adjust_stock", "backfill_inventory", "delete_product_inventory"]
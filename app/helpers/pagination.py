@@ -0,0 +1,47 @@
+"""Cursores opacos para paginación por clave (keyset).
+
+El cursor es JSON compacto codificado en base64 url-safe (sin `=`). El
+cliente no debe interpretarlo: solo reenviar el `nextCursor` recibido.
+"""
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from typing import Any
+
+from fastapi import HTTPException
+
+
+def encode_cursor(payload: dict[str, Any]) -> str:
+    raw = json.dumps(payload, separators=(",", ":"), default=str).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict[str, Any]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        data = json.loads(raw)
+    except (binascii.Error, ValueError):
+        raise HTTPException(status_code=400, detail="Cursor de paginación no válido")
+    if not isinstance(data, dict):
+        raise HTTPException(status_code=400, detail="Cursor de paginación no válido")
+    return data
+
+
+def is_after(value: Any, item_id: int, after: tuple[Any, int], descending: bool) -> bool:
+    """¿Va (value, item_id) después del cursor `after` en orden (columna, id) con NULLs al final?
+
+    Es la misma condición que se aplica en SQL, para el modo en memoria.
+    """
+    after_value, after_id = after
+    if after_value is None:
+        return value is None and (item_id < after_id if descending else item_id > after_id)
+    if value is None:
+        return True
+    if value == after_value:
+        return item_id < after_id if descending else item_id > after_id
+    return value < after_value if descending else value > after_value
+
+
+__all__ = ["encode_cursor", "decode_cursor", "is_after"]
@@ -0,0 +1,160 @@
+"""Almacenamiento de fotos de usuario y recolección de huérfanos.
+
+Las fotos se guardan por hash de contenido en `static/user-photos/ab/cd/<sha256>.ext`
+(ver `app.helpers.images.store_user_photo`). Un fichero es huérfano cuando ni
+`user.photo_url` ni `reviews.userPhotoUrl` lo referencian; sus variantes
+(`<stem>_w<size>.<fmt>`) siguen la suerte del original.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator, Optional
+
+from sqlmodel import Session, select
+
+from app.helpers.images import PHOTO_URL_MARKER
+from app.models.review import ReviewTable
+from app.models.user import UserTable
+
+PHOTOS_DIR = Path(__file__).resolve().parents[2] / "static" / "user-photos"
+
+# Un fichero recién escrito puede no estar referenciado todavía (subida en curso)
+DEFAULT_GRACE_SECONDS = 3600
+
+_VARIANT_SUFFIX_RE = re.compile(r"_w\d+$")
+_TMP_RE = re.compile(r"\.\d+\.tmp$|\.tmp$")
+
+logger = logging.getLogger(__name__)
+
+
+def photo_stem_from_url(url: Optional[str]) -> Optional[str]:
+    """`http://h/static/user-photos/ab/cd/x.png` -> `ab/cd/x` (None si no es local)."""
+    if not url or PHOTO_URL_MARKER not in url:
+        return None
+    rel = url.split(PHOTO_URL_MARKER, 1)[1].split("?", 1)[0]
+    return rel.rsplit(".", 1)[0] if rel else None
+
+
+def _file_stem(rel: str) -> str:
+    stem = rel.rsplit(".", 1)[0]
+    return _VARIANT_SUFFIX_RE.sub("", stem)
+
+
+def referenced_stems(session: Session, batch_size: int = 1000) -> set[str]:
+    """Stems de todas las fotos referenciadas en BD (lectura por lotes)."""
+    stems: set[str] = set()
+    for column in (UserTable.photo_url, ReviewTable.userPhotoUrl):
+        result = session.exec(
+            select(column).where(column.is_not(None)).execution_options(yield_per=batch_size)
+        )
+        for url in result:
+            stem = photo_stem_from_url(url)
+            if stem:
+                stems.add(stem)
+    return stems
+
+
+def _walk(root: Path) -> Iterator[os.DirEntry]:
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry
+        except FileNotFoundError:
+            continue
+
+
+@dataclass
+class GCStats:
+    scanned: int = 0
+    orphans: int = 0
+    deleted: int = 0
+    freed_bytes: int = 0
+    errors: list[str] = field(default_factory=list)
+
+
+def gc_orphan_photos(
+    session: Session,
+    root: Path = PHOTOS_DIR,
+    grace_seconds: int = DEFAULT_GRACE_SECONDS,
+    batch_size: int = 500,
+    pause_seconds: float = 0.0,
+    dry_run: bool = False,
+) -> GCStats:
+    """Borra por lotes las fotos (y variantes) no referenciadas desde hace `grace_seconds`.
+
+    Primero se listan los candidatos y después se consultan las referencias:
+    así una subida que termine durante el escaneo queda protegida por el
+    periodo de gracia (la deduplicación refresca el mtime).
+    """
+    stats = GCStats()
+    if not root.is_dir():
+        return stats
+    cutoff = time.time() - grace_seconds
+
+    candidates: list[tuple[str, str]] = []
+    for entry in _walk(root):
+        stats.scanned += 1
+        try:
+            if entry.stat().st_mtime > cutoff:
+                continue
+        except FileNotFoundError:
+            continue
+        rel = os.path.relpath(entry.path, root).replace(os.sep, "/")
+        candidates.append((rel, entry.path))
+
+    referenced = referenced_stems(session)
+    orphans = [
+        path for rel, path in candidates
+        if _TMP_RE.search(rel) or _file_stem(rel) not in referenced
+    ]
+    stats.orphans = len(orphans)
+    if dry_run:
+        return stats
+
+    for i in range(0, len(orphans), max(1, batch_size)):
+        for path in orphans[i:i + batch_size]:
+            try:
+                st = os.stat(path)
+                if st.st_mtime > cutoff:  # reutilizado (dedup) mientras tanto
+                    continue
+                os.unlink(path)
+                stats.deleted += 1
+                stats.freed_bytes += st.st_size
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                stats.errors.append(f"{path}: {e}")
+        logger.info("GC fotos: %s/%s huérfanos borrados", stats.deleted, stats.orphans)
+        if pause_seconds:
+            time.sleep(pause_seconds)
+
+    _remove_empty_dirs(root)
+    return stats
+
+
+def _remove_empty_dirs(root: Path) -> None:
+    for dirpath, _, _ in os.walk(root, topdown=False):
+        if Path(dirpath) != root:
+            try:
+                os.rmdir(dirpath)  # solo tiene éxito si está vacío
+            except OSError:
+                pass
+
+
+__all__ = [
+    "PHOTOS_DIR",
+    "GCStats",
+    "photo_stem_from_url",
+    "referenced_stems",
+    "gc_orphan_photos",
+]
@@ -0,0 +1,205 @@
+"""Consultas SQL por petición: contador, tiempo y detector de N+1.
+
+Los eventos `before/after_cursor_execute` de cada engine (ver `app/db.py`)
+acumulan en la petición en curso (un `ContextVar` que fija
+`QueryStatsMiddleware`) el número de sentencias y su tiempo. Al responder:
+
+- Cabecera `Server-Timing: db;dur=<ms>;desc="<n> consultas"` (visible en las
+  herramientas de desarrollo del navegador).
+- Log `INFO` por petición y `WARNING` si una misma sentencia se repite más de
+  `QUERY_N_PLUS_ONE_THRESHOLD` veces (típico N+1: un `session.get` por fila).
+
+Las sentencias se agrupan por `fingerprint()`: sin literales ni longitudes de
+`IN (...)`, de modo que un bucle cuenta como la misma forma aunque cada vuelta
+cambie los valores incrustados o el tamaño de la lista.
+
+Para pruebas, `capture_queries()` / `assert_max_queries(n)` recogen todas las
+sentencias ejecutadas mientras están activos, en cualquier hilo (también las
+de `TestClient`):
+
+    with assert_max_queries(3):
+        client.get("/bookings")
+"""
+from __future__ import annotations
+
+import logging
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+log = logging.getLogger(__name__)
+
+QUERY_STATS_ENABLED = os.getenv("QUERY_STATS_ENABLED", "1").lower() not in {"0", "false", "no"}
+QUERY_N_PLUS_ONE_THRESHOLD = int(os.getenv("QUERY_N_PLUS_ONE_THRESHOLD", "10"))  # 0 desactiva
+
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w.\"])-?\d+(?:\.\d+)?\b")
+_PARAM = re.compile(r"%\(\w+\)s|%s|\$\d+|(?<!:):\w+")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_SPACES = re.compile(r"\s+")
+
+
+def fingerprint(statement: str) -> str:
+    """Forma normalizada de la sentencia: literales y parámetros -> `?`, `IN (?, ?, ...)` -> `IN (?)`."""
+    sql = _STRING.sub("?", statement)
+    sql = _PARAM.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = _IN_LIST.sub("(?)", sql)
+    return _SPACES.sub(" ", sql).strip()
+
+
+class QueryLog:
+    """Sentencias ejecutadas (fingerprint -> [veces, ms]) con totales."""
+
+    def __init__(self, route: str = "") -> None:
+        self.route = route  # "GET /bookings" (vacío fuera de una petición)
+        self.count = 0
+        self.total_ms = 0.0
+        self.statements: dict[str, list[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, statement: str, ms: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.total_ms += ms
+            key = fingerprint(statement)
+            entry = self.statements.get(key)
+            if entry is None:
+                self.statements[key] = [1, ms]
+            else:
+                entry[0] += 1
+                entry[1] += ms
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Formas (fingerprint) ejecutadas más de `threshold` veces, de más a menos repetida."""
+        with self._lock:
+            found = [(s, int(e[0])) for s, e in self.statements.items() if e[0] > threshold]
+        return sorted(found, key=lambda item: -item[1])
+
+    def summary(self) -> str:
+        with self._lock:
+            lines = [f"{int(e[0])}x {e[1]:.1f} ms  {s}" for s, e in
+                     sorted(self.statements.items(), key=lambda item: -item[1][0])]
+        return "\n".join(lines)
+
+
+_current: ContextVar[Optional[QueryLog]] = ContextVar("query_stats", default=None)
+_captures: list[QueryLog] = []
+_captures_lock = threading.Lock()
+
+
+def current_queries() -> Optional[QueryLog]:
+    """Consultas de la petición en curso (None fuera de `QueryStatsMiddleware`)."""
+    return _current.get()
+
+
+def _before_execute(_conn, _cursor, _statement, _parameters, context, _executemany) -> None:
+    context._query_started = time.perf_counter()
+
+
+def _after_execute(_conn, _cursor, statement, _parameters, context, _executemany) -> None:
+    started = getattr(context, "_query_started", None)
+    if started is None:
+        return
+    ms = (time.perf_counter() - started) * 1000
+    current = _current.get()
+    if current is not None:
+        current.record(statement, ms)
+    if _captures:
+        with _captures_lock:
+            targets = list(_captures)
+        for capture in targets:
+            capture.record(statement, ms)
+
+
+def attach_query_stats(target: Engine) -> None:
+    """Registra los eventos de conteo en el engine (en los asíncronos, su `sync_engine`)."""
+    event.listen(target, "before_cursor_execute", _before_execute)
+    event.listen(target, "after_cursor_execute", _after_execute)
+
+
+@contextmanager
+def capture_queries() -> Iterator[QueryLog]:
+    """Recoge las sentencias ejecutadas en cualquier hilo mientras está activo."""
+    capture = QueryLog()
+    with _captures_lock:
+        _captures.append(capture)
+    try:
+        yield capture
+    finally:
+        with _captures_lock:
+            _captures.remove(capture)
+
+
+@contextmanager
+def assert_max_queries(limit: int) -> Iterator[QueryLog]:
+    """Presupuesto de consultas: AssertionError (con el detalle) si se ejecutan más de `limit`."""
+    with capture_queries() as capture:
+        yield capture
+    if capture.count > limit:
+        raise AssertionError(f"{capture.count} consultas (máximo {limit}):\n{capture.summary()}")
+
+
+def server_timing(queries: QueryLog) -> str:
+    return f'db;dur={queries.total_ms:.1f};desc="{queries.count} consultas"'
+
+
+class QueryStatsMiddleware:
+    """Abre un `QueryLog` por petición, añade `Server-Timing` y registra el resultado."""
+
+    def __init__(self, app: ASGIApp, n_plus_one_threshold: int = QUERY_N_PLUS_ONE_THRESHOLD) -> None:
+        self.app = app
+        self.n_plus_one_threshold = n_plus_one_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not QUERY_STATS_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        queries = QueryLog(f"{scope.get('method', '')} {scope.get('path', '')}")
+        token = _current.set(queries)
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", server_timing(queries).encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current.reset(token)
+            self._report(scope, status, queries)
+
+    def _report(self, scope: Scope, status: int, queries: QueryLog) -> None:
+        if queries.count == 0:
+            return
+        method, path = scope.get("method", ""), scope.get("path", "")
+        log.info("%s %s -> %s: %d consultas, %.1f ms", method, path, status, queries.count, queries.total_ms)
+        if self.n_plus_one_threshold > 0:
+            for statement, times in queries.repeated(self.n_plus_one_threshold):
+                log.warning("Posible N+1 en %s %s: %d veces %s", method, path, times, statement)
+
+
+__all__ = [
+    "QueryLog",
+    "QueryStatsMiddleware",
+    "assert_max_queries",
+    "attach_query_stats",
+    "capture_queries",
+    "current_queries",
+    "fingerprint",
+]
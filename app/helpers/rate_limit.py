@@ -0,0 +1,265 @@
+"""Limitación de peticiones por token bucket (por IP y por usuario).
+
+- Estado en memoria repartido en shards, cada uno con su propio lock, para que
+  peticiones concurrentes de claves distintas no compitan por el mismo lock.
+- Recarga perezosa: cada bucket guarda (tokens, último instante) y se recarga al
+  consultarlo; no hay temporizadores por petición.
+- Backend intercambiable (`set_backend`): en despliegues con varios workers se
+  puede usar Redis (`RATE_LIMIT_BACKEND=redis`) para compartir los contadores.
+
+Los límites se configuran por router en `app.endpoints.register_routers` con la
+dependencia `rate_limit(...)`; cada límite se puede sobreescribir por entorno.
+"""
+from __future__ import annotations
+
+import math
+import os
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Iterable, Optional, Protocol
+
+from fastapi import HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    capacity: float          # ráfaga máxima (tokens)
+    refill_per_second: float  # tokens recuperados por segundo
+
+
+_PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+
+def parse_rate(value: Optional[str]) -> Optional[RateLimit]:
+    """Convierte "10/minute" (o "10/minute/20" con ráfaga 20) en `RateLimit`.
+
+    Devuelve None para "", "0" u "off" (límite desactivado).
+    """
+    if not value or value.strip().lower() in {"0", "off", "none"}:
+        return None
+    parts = value.strip().split("/")
+    if len(parts) not in (2, 3) or parts[1] not in _PERIODS:
+        raise ValueError(f"Límite inválido: {value!r} (usa p.ej. '10/minute')")
+    amount = float(parts[0])
+    burst = float(parts[2]) if len(parts) == 3 else amount
+    return RateLimit(capacity=burst, refill_per_second=amount / _PERIODS[parts[1]])
+
+
+def limit_from_env(name: str, default: Optional[str]) -> Optional[RateLimit]:
+    return parse_rate(os.getenv(name, default))
+
+
+class RateLimitBackend(Protocol):
+    blocking: bool  # True si `consume` hace E/S (se ejecuta en el threadpool)
+
+    def consume(self, key: str, limit: RateLimit, cost: float = 1.0) -> tuple[bool, float]:
+        """Intenta consumir `cost` tokens. Devuelve (permitido, segundos hasta reintentar)."""
+        ...
+
+
+class _Shard:
+    __slots__ = ("lock", "buckets")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.buckets: dict[str, list[float]] = {}
+
+
+class MemoryBackend:
+    """Backend en proceso; cada worker mantiene sus propios buckets."""
+
+    blocking = False  # solo un lock por shard: se puede llamar desde el event loop
+
+    def __init__(self, shards: int = 32, max_keys_per_shard: int = 10_000) -> None:
+        self._shards = [_Shard() for _ in range(max(1, shards))]
+        self._max_keys = max_keys_per_shard
+
+    def _shard(self, key: str) -> _Shard:
+        return self._shards[zlib.crc32(key.encode()) % len(self._shards)]
+
+    def consume(self, key: str, limit: RateLimit, cost: float = 1.0) -> tuple[bool, float]:
+        now = time.monotonic()
+        shard = self._shard(key)
+        with shard.lock:
+            bucket = shard.buckets.get(key)
+            if bucket is None:
+                if len(shard.buckets) >= self._max_keys:
+                    self._evict(shard, now, limit)
+                bucket = shard.buckets[key] = [limit.capacity, now]
+            else:
+                tokens = bucket[0] + (now - bucket[1]) * limit.refill_per_second
+                bucket[0] = min(limit.capacity, tokens)
+                bucket[1] = now
+            if bucket[0] >= cost:
+                bucket[0] -= cost
+                return True, 0.0
+            return False, (cost - bucket[0]) / limit.refill_per_second
+
+    @staticmethod
+    def _evict(shard: _Shard, now: float, limit: RateLimit) -> None:
+        # Un bucket que ya se habría rellenado del todo equivale a uno nuevo: se puede olvidar
+        full_after = limit.capacity / limit.refill_per_second
+        idle = [k for k, (_, ts) in shard.buckets.items() if now - ts >= full_after]
+        for k in idle:
+            del shard.buckets[k]
+        if not idle and shard.buckets:
+            # Sin candidatos: descartar el más antiguo para mantener la memoria acotada
+            oldest = min(shard.buckets, key=lambda k: shard.buckets[k][1])
+            del shard.buckets[oldest]
+
+    def reset(self) -> None:
+        for shard in self._shards:
+            with shard.lock:
+                shard.buckets.clear()
+
+
+_REDIS_SCRIPT = """
+local cap = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local b = redis.call('HMGET', KEYS[1], 't', 'ts')
+local tokens = tonumber(b[1]) or cap
+local ts = tonumber(b[2]) or now
+tokens = math.min(cap, tokens + (now - ts) * rate)
+local allowed = 0
+local retry = 0
+if tokens >= cost then
+  tokens = tokens - cost
+  allowed = 1
+else
+  retry = (cost - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 't', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(cap / rate) + 1)
+return {allowed, tostring(retry)}
+"""
+
+
+class RedisBackend:
+    """Backend compartido entre workers (requiere el paquete `redis`)."""
+
+    blocking = True
+
+    def __init__(self, url: str, prefix: str = "rl:") -> None:
+        try:
+            import redis  # type: ignore
+        except Exception as e:  # pragma: no cover - dependencia opcional
+            raise RuntimeError("RATE_LIMIT_BACKEND=redis requiere `pip install redis`") from e
+        self._client = redis.Redis.from_url(url)
+        self._script = self._client.register_script(_REDIS_SCRIPT)
+        self._prefix = prefix
+
+    def consume(self, key: str, limit: RateLimit, cost: float = 1.0) -> tuple[bool, float]:
+        allowed, retry = self._script(
+            keys=[self._prefix + key],
+            args=[limit.capacity, limit.refill_per_second, cost],
+        )
+        return bool(int(allowed)), float(retry)
+
+
+def _backend_from_env() -> RateLimitBackend:
+    kind = os.getenv("RATE_LIMIT_BACKEND", "memory").lower()
+    if kind == "redis":
+        return RedisBackend(os.getenv("RATE_LIMIT_REDIS_URL", "redis://localhost:6379/0"))
+    return MemoryBackend(shards=int(os.getenv("RATE_LIMIT_SHARDS", "32")))
+
+
+_backend: Optional[RateLimitBackend] = None
+_backend_lock = threading.Lock()
+
+
+def get_backend() -> RateLimitBackend:
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = _backend_from_env()
+    return _backend
+
+
+def set_backend(backend: RateLimitBackend) -> None:
+    global _backend
+    _backend = backend
+
+
+def rate_limit_enabled() -> bool:
+    return os.getenv("RATE_LIMIT_ENABLED", "1").lower() not in {"0", "false", "no"}
+
+
+def client_ip(request: Request) -> str:
+    if os.getenv("RATE_LIMIT_TRUST_FORWARDED", "0") == "1":
+        fwd = request.headers.get("x-forwarded-for")
+        if fwd:
+            return fwd.split(",")[0].strip()
+    return request.client.host if request.client else "unknown"
+
+
+def _username_from_request(request: Request) -> Optional[str]:
+    auth = request.headers.get("authorization") or ""
+    if not auth.lower().startswith("bearer "):
+        return None
+    from app.endpoints.auth import decode_token  # import tardío: evita ciclos
+
+    try:
+        return decode_token(auth[7:].strip()).get("sub")
+    except HTTPException:
+        return None
+
+
+def rate_limit(
+    scope: str,
+    per_ip: Optional[RateLimit] = None,
+    per_user: Optional[RateLimit] = None,
+    methods: Optional[Iterable[str]] = None,
+) -> Callable[[Request], Awaitable[None]]:
+    """Crea una dependencia FastAPI que aplica los límites de `scope`.
+
+    `methods` restringe los métodos HTTP afectados (p. ej. solo POST). La
+    dependencia es `async def`: con el backend en memoria no ocupa un hilo del
+    threadpool (las rutas asíncronas no esperan turno detrás de escrituras
+    lentas); solo un backend con E/S (`blocking`, p. ej. Redis) se llama allí.
+    """
+    only = {m.upper() for m in methods} if methods else None
+
+    async def dependency(request: Request) -> None:
+        if not rate_limit_enabled() or (only is not None and request.method not in only):
+            return
+        backend = get_backend()
+        checks: list[tuple[str, RateLimit]] = []
+        if per_ip is not None:
+            checks.append((f"{scope}:ip:{client_ip(request)}", per_ip))
+        if per_user is not None:
+            username = _username_from_request(request)
+            if username:
+                checks.append((f"{scope}:user:{username}", per_user))
+        for key, limit in checks:
+            if getattr(backend, "blocking", True):
+                allowed, retry_after = await run_in_threadpool(backend.consume, key, limit)
+            else:
+                allowed, retry_after = backend.consume(key, limit)
+            if not allowed:
+                raise HTTPException(
+                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                    detail="Demasiadas peticiones, inténtalo más tarde",
+                    headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+                )
+
+    return dependency
+
+
+__all__ = [
+    "RateLimit",
+    "RateLimitBackend",
+    "MemoryBackend",
+    "RedisBackend",
+    "parse_rate",
+    "limit_from_env",
+    "get_backend",
+    "set_backend",
+    "rate_limit",
+]
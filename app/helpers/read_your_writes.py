@@ -0,0 +1,107 @@
+"""Lectura de las propias escrituras con réplica de lectura (`DATABASE_READ_URL`).
+
+La réplica va con algo de retraso respecto al primario. Para que un usuario vea
+enseguida lo que acaba de escribir, cada escritura con éxito (POST/PUT/PATCH/
+DELETE con estado < 400) marca a su autor durante `DATABASE_READ_STICKY_SECONDS`;
+mientras dure la marca, sus lecturas (`get_read_session`) van al primario.
+
+El autor se identifica por el `sub` del token o, sin token, por la IP (como el
+límite de peticiones). Las marcas son por worker: con varios workers conviene
+que el balanceador mantenga la afinidad por cliente o que la ventana cubra el
+retraso habitual de la réplica.
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+
+from fastapi import HTTPException, Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+READ_STICKY_SECONDS = float(os.getenv("DATABASE_READ_STICKY_SECONDS", "5"))
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+def request_identity(request: Request) -> str:
+    from app.helpers.rate_limit import client_ip  # import tardío: evita ciclos con app.db
+    auth = request.headers.get("authorization") or ""
+    if auth.lower().startswith("bearer "):
+        from app.endpoints.auth import decode_token
+        try:
+            sub = decode_token(auth[7:].strip()).get("sub")
+        except HTTPException:
+            sub = None
+        if sub:
+            return f"user:{sub}"
+    return f"ip:{client_ip(request)}"
+
+
+class StickyWrites:
+    """Autores con escrituras recientes -> instante (monotónico) hasta el que leen del primario."""
+
+    def __init__(self, seconds: float = READ_STICKY_SECONDS) -> None:
+        self.seconds = seconds
+        self._until: dict[str, float] = {}
+        self._latest = 0.0  # última marca vigente de cualquier autor
+        self._lock = threading.Lock()
+
+    def mark(self, identity: str) -> None:
+        if self.seconds <= 0:
+            return
+        now = time.monotonic()
+        with self._lock:
+            self._until[identity] = self._latest = now + self.seconds
+            if len(self._until) > 1024:  # purgar caducadas de vez en cuando
+                self._until = {k: v for k, v in self._until.items() if v > now}
+
+    def is_sticky(self, identity: str) -> bool:
+        until = self._until.get(identity)
+        return until is not None and until > time.monotonic()
+
+    def any_active(self) -> bool:
+        return self._latest > time.monotonic()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._until.clear()
+            self._latest = 0.0
+
+
+sticky_writes = StickyWrites()
+
+
+def prefers_primary(request: Request) -> bool:
+    """True si el autor de la petición ha escrito hace menos de la ventana configurada."""
+    if not sticky_writes.any_active():  # caso habitual: sin decodificar el token
+        return False
+    return sticky_writes.is_sticky(request_identity(request))
+
+
+class ReadYourWritesMiddleware:
+    """Marca al autor de cada escritura con éxito (ver `StickyWrites`)."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                sticky_writes.mark(request_identity(Request(scope)))
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+__all__ = [
+    "READ_STICKY_SECONDS",
+    "ReadYourWritesMiddleware",
+    "StickyWrites",
+    "prefers_primary",
+    "request_identity",
+    "sticky_writes",
+]
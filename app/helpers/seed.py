@@ -1,20 +1,30 @@
-from sqlmodel import Session, select
+from sqlalchemy import insert
+from sqlmodel import Session, SQLModel, select
 from app.db import engine
 from app.helpers.db_memory import DB
 
 from app.models.barbershop import BarbershopTable
+from app.helpers.geo import set_geohash
 from app.models.barber import BarberTable
+from app.helpers.barber_services import backfill_barber_services
+from app.helpers.inventory import backfill_inventory
 from app.models.category import ServiceCategoryTable, ProductCategoryTable
 from app.models.service import ServiceTable
 from app.models.product import ProductTable
 from app.models.gallery import GalleryItemTable
 from app.models.review import ReviewTable
 from app.models.booking import BookingTable
+from app.models.seed_state import SeedStateTable
 from app.models.user import UserTable
 from app.endpoints.auth import pwd_context
 
 from datetime import datetime, timezone
 
+# Subir la versión cuando cambien los datos de ejemplo o el admin por defecto:
+# las BD con una versión anterior vuelven a pasar por el seed (que no pisa datos).
+MEMORY_SEED_VERSION = 1
+ADMIN_SEED_VERSION = 1
+
 
 def _to_dt(value):
     if isinstance(value, datetime):
@@ -27,73 +37,90 @@ def _to_dt(value):
     return datetime.now(timezone.utc)
 
 
-def seed_memory_data() -> None:
-    """
-    Inserta los datos de DB (memoria) en las tablas SQL SOLO si están vacías.
-    No pisa registros existentes.
-    """
-    with Session(engine) as session:
-        # Barbershop (uno)
-        if DB.get("barbershop") and not session.exec(select(BarbershopTable)).first():
-            session.add(BarbershopTable(**DB["barbershop"]))
-            session.commit()
+def _seed_versions(session: Session) -> dict[str, int]:
+    return {s.key: s.version for s in session.exec(select(SeedStateTable)).all()}
 
-        # Service Categories
-        if DB.get("serviceCategories") and not session.exec(select(ServiceCategoryTable)).first():
-            for sc in DB["serviceCategories"]:
-                session.add(ServiceCategoryTable(**sc))
-            session.commit()
 
-        # Product Categories
-        if DB.get("productCategories") and not session.exec(select(ProductCategoryTable)).first():
-            for pc in DB["productCategories"]:
-                session.add(ProductCategoryTable(**pc))
-            session.commit()
+def _mark_seeded(session: Session, key: str, version: int) -> None:
+    state = session.get(SeedStateTable, key) or SeedStateTable(key=key, version=version)
+    state.version = version
+    state.applied_at = datetime.now(timezone.utc)
+    session.add(state)
+    session.commit()
 
-        # Services
-        if DB.get("services") and not session.exec(select(ServiceTable)).first():
-            for s in DB["services"]:
-                session.add(ServiceTable(**s))
-            session.commit()
 
-        # Products
-        if DB.get("products") and not session.exec(select(ProductTable)).first():
-            for p in DB["products"]:
-                session.add(ProductTable(**p))
-            session.commit()
+def _bulk_insert(session: Session, table: type[SQLModel], rows: list[dict]) -> int:
+    """INSERT en bloque (un executemany) si la tabla está vacía. Sin commit."""
+    if not rows or session.exec(select(table).limit(1)).first() is not None:
+        return 0
+    # Pasar por el modelo para aplicar valores por defecto y descartar claves de más
+    columns = [c.name for c in table.__table__.columns]
+    values = []
+    for r in rows:
+        obj = table(**r)
+        values.append({c: getattr(obj, c) for c in columns})
+    session.execute(insert(table), values)
+    return len(rows)
 
-        # Barbers
-        if DB.get("barbers") and not session.exec(select(BarberTable)).first():
-            for b in DB["barbers"]:
-                session.add(BarberTable(**b))
-            session.commit()
 
-        # Gallery
-        if DB.get("gallery") and not session.exec(select(GalleryItemTable)).first():
-            for g in DB["gallery"]:
-                session.add(GalleryItemTable(**g))
-            session.commit()
+def seed_database() -> None:
+    """Seed de arranque: con una sola consulta a `seed_state` decide si hay algo que hacer."""
+    with Session(engine) as session:
+        applied = _seed_versions(session)
+    if applied.get("memory", 0) < MEMORY_SEED_VERSION:
+        seed_memory_data()
+    if applied.get("admin", 0) < ADMIN_SEED_VERSION:
+        ensure_admin_user()
 
-        # Reviews  (convertimos createdAt a datetime)
-        if DB.get("reviews") and not session.exec(select(ReviewTable)).first():
-            for r in DB["reviews"]:
-                session.add(ReviewTable(
-                    barberId=r["barberId"],
-                    serviceId=r["serviceId"],
-                    rating=r["rating"],
-                    comment=r["comment"],
-                    userName=r["userName"],
-                    createdAt=_to_dt(r.get("createdAt")),
-                ))
-            session.commit()
 
-        # Bookings
-        if DB.get("bookings") and not session.exec(select(BookingTable)).first():
-            for bk in DB["bookings"]:
-                session.add(BookingTable(**bk))
-            session.commit()
+def seed_memory_data() -> None:
+    """
+    Inserta los datos de DB (memoria) en las tablas SQL SOLO si están vacías.
+    No pisa registros existentes. El fixture solo se lee si el seed no está aplicado.
+
+    Todas las inserciones van en una transacción (INSERT en bloque por tabla);
+    al terminar se guarda la versión en `seed_state`.
+    """
+    with Session(engine) as session:
+        if _seed_versions(session).get("memory", 0) >= MEMORY_SEED_VERSION:
+            return
 
-        print("[SEED] Datos de memoria insertados (si las tablas estaban vacías).")
+        inserted = 0
+        shop = DB.get("barbershop")
+        if shop:
+            inserted += _bulk_insert(session, BarbershopTable, [{**shop, "geohash": set_geohash(BarbershopTable(**shop)).geohash}])
+        inserted += _bulk_insert(session, ServiceCategoryTable, DB.get("serviceCategories", []))
+        inserted += _bulk_insert(session, ProductCategoryTable, DB.get("productCategories", []))
+        inserted += _bulk_insert(session, ServiceTable, DB.get("services", []))
+        inserted += _bulk_insert(session, ProductTable, DB.get("products", []))
+        inserted += _bulk_insert(session, BarberTable, DB.get("barbers", []))
+        inserted += _bulk_insert(session, GalleryItemTable, DB.get("gallery", []))
+        # Reviews  (convertimos createdAt a datetime)
+        inserted += _bulk_insert(session, ReviewTable, [
+            {
+                "barberId": r["barberId"],
+                "serviceId": r["serviceId"],
+                "rating": r["rating"],
+                "comment": r["comment"],
+                "userName": r["userName"],
+                "createdAt": _to_dt(r.get("createdAt")),
+            }
+            for r in DB.get("reviews", [])
+        ])
+        # Bookings (barbería del barbero; los barberos ya están insertados en esta transacción)
+        bookings = DB.get("bookings", [])
+        if bookings:
+            shop_by_barber = dict(session.exec(select(BarberTable.id, BarberTable.barbershopId)).all())
+            inserted += _bulk_insert(session, BookingTable, [
+                {**bk, "barbershopId": shop_by_barber.get(bk["barberId"])} for bk in bookings
+            ])
+        session.commit()
+
+        # Tablas derivadas (solo actúan si están vacías)
+        backfill_inventory(session)
+        backfill_barber_services(session)
+        _mark_seeded(session, "memory", MEMORY_SEED_VERSION)
+        print(f"[SEED] Datos de memoria insertados: {inserted} filas (solo en tablas vacías).")
 
 
 def ensure_admin_user(username: str = "admin", password: str = "admin") -> None:
@@ -102,21 +129,21 @@ def ensure_admin_user(username: str = "admin", password: str = "admin") -> None:
     - username: admin
     - password: admin
     - roles: ["admin"]
+
+    El hash de la contraseña solo se calcula si hay que crearlo.
     """
     with Session(engine) as session:
-        existing = session.exec(select(UserTable).where(UserTable.username == username)).first()
-        if existing:
-            return
-
-        hashed = pwd_context.hash(password)
-        admin = UserTable(
-            username=username,
-            email="admin@example.com",
-            name="Administrador",
-            password_hash=hashed,
-            roles=["admin"],
-        )
-        session.add(admin)
-        session.commit()
-        session.refresh(admin)
-        print(f"[SEED] Usuario admin creado: {admin.username}")
\ No newline at end of file
+        existing = session.exec(select(UserTable.id).where(UserTable.username == username)).first()
+        if existing is None:
+            hashed = pwd_context.hash(password)
+            admin = UserTable(
+                username=username,
+                email="admin@example.com",
+                name="Administrador",
+                password_hash=hashed,
+                roles=["admin"],
+            )
+            session.add(admin)
+            session.commit()
+            print(f"[SEED] Usuario admin creado: {username}")
+        _mark_seeded(session, "admin", ADMIN_SEED_VERSION)
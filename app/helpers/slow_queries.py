@@ -0,0 +1,251 @@
+"""Registro de consultas lentas con su plan de ejecución.
+
+Las sentencias que tardan más de `SLOW_QUERY_MS` se guardan en un buffer
+circular en memoria (`SLOW_QUERY_BUFFER` entradas, por worker) con:
+
+- La sentencia normalizada (`fingerprint`: sin literales) y los parámetros
+  redactados: solo tipo y longitud (`<str:9>`, `<num>`...), nunca el valor.
+- La ruta de la petición que la lanzó (ver `app/helpers/query_stats.py`).
+- El plan: `EXPLAIN QUERY PLAN` en SQLite; `EXPLAIN` en PostgreSQL, dentro de
+  un SAVEPOINT para no romper la transacción si falla. Cada forma se explica
+  como mucho una vez cada `SLOW_QUERY_EXPLAIN_INTERVAL` segundos.
+
+`EXPLAIN (ANALYZE, BUFFERS)` vuelve a ejecutar la consulta, así que solo se
+usa con `SLOW_QUERY_EXPLAIN_ANALYZE=1` y únicamente en lecturas puras: SELECT
+sin `FOR UPDATE/SHARE` ni más funciones que las de `_ANALYZE_SAFE_FUNCTIONS`
+(un `SELECT pg_advisory_lock(...)` o un `nextval(...)` repetidos tendrían
+efectos).
+
+`GET /admin/slow-queries` lo muestra agrupado por fingerprint.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import threading
+import time
+from collections import deque
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.helpers.query_stats import current_queries, fingerprint
+
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "200"))  # 0 desactiva
+SLOW_QUERY_BUFFER = int(os.getenv("SLOW_QUERY_BUFFER", "500"))
+SLOW_QUERY_EXPLAIN = os.getenv("SLOW_QUERY_EXPLAIN", "1").lower() not in {"0", "false", "no"}
+SLOW_QUERY_EXPLAIN_INTERVAL = float(os.getenv("SLOW_QUERY_EXPLAIN_INTERVAL", "300"))
+SLOW_QUERY_EXPLAIN_ANALYZE = os.getenv("SLOW_QUERY_EXPLAIN_ANALYZE", "0").lower() not in {"0", "false", "no"}
+
+_EXPLAINABLE = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE")
+_MAX_PARAMETERS = 20  # listas largas (`IN (...)`) se recortan
+
+# Funciones sin efectos que pueden aparecer en una lectura explicada con ANALYZE
+_ANALYZE_SAFE_FUNCTIONS = {
+    "count", "sum", "avg", "min", "max", "coalesce", "lower", "upper", "length",
+    "cast", "date", "extract", "abs", "round", "nullif", "greatest", "least",
+}
+# Palabras clave seguidas de paréntesis que no son llamadas a función
+_SQL_KEYWORDS = {"in", "exists", "any", "all", "as", "on", "from", "join", "where", "and", "or", "not", "over", "filter", "select", "using", "values"}
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_CALL = re.compile(r"\b(\w+)\s*\(")
+_LOCKING = re.compile(r"\bFOR\s+(?:NO\s+KEY\s+)?(?:UPDATE|SHARE|KEY\s+SHARE)\b", re.IGNORECASE)
+_WRITES = re.compile(r"\b(?:INSERT|UPDATE|DELETE|MERGE)\b", re.IGNORECASE)
+
+
+def _redact_value(value: Any) -> Any:
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return "<bool>"
+    if isinstance(value, (int, float, Decimal)):
+        return "<num>"
+    if isinstance(value, str):
+        return f"<str:{len(value)}>"
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return f"<bytes:{len(value)}>"
+    if isinstance(value, (datetime, date)):
+        return "<fecha>"
+    return f"<{type(value).__name__}>"
+
+
+def redact_parameters(parameters: Any, executemany: bool = False) -> Any:
+    """Parámetros sin valores: solo su tipo (y longitud en textos y binarios)."""
+    if executemany:
+        return f"<{len(parameters)} filas>"
+    if isinstance(parameters, dict):
+        return {k: _redact_value(v) for k, v in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        redacted = [_redact_value(v) for v in parameters[:_MAX_PARAMETERS]]
+        if len(parameters) > _MAX_PARAMETERS:
+            redacted.append(f"<+{len(parameters) - _MAX_PARAMETERS} más>")
+        return redacted
+    return _redact_value(parameters)
+
+
+def _sqlite_plan(cursor, statement: str, parameters: Any) -> list[str]:
+    cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+    depth: dict[int, int] = {0: -1}
+    lines = []
+    for node_id, parent, _unused, detail in cursor.fetchall():
+        depth[node_id] = depth.get(parent, -1) + 1
+        lines.append("  " * depth[node_id] + str(detail))
+    return lines
+
+
+def _plain_read(statement: str) -> bool:
+    """SELECT que se puede volver a ejecutar sin efectos (ni bloqueos, ni escrituras, ni funciones)."""
+    if not statement.lstrip().upper().startswith("SELECT"):
+        return False  # WITH puede llevar un INSERT/UPDATE/DELETE dentro
+    sql = _STRING.sub("''", statement)
+    if _LOCKING.search(sql) or _WRITES.search(sql):
+        return False
+    calls = {name.lower() for name in _CALL.findall(sql)}
+    return calls <= _ANALYZE_SAFE_FUNCTIONS | _SQL_KEYWORDS
+
+
+def _postgres_plan(cursor, statement: str, parameters: Any) -> list[str]:
+    analyze = SLOW_QUERY_EXPLAIN_ANALYZE and _plain_read(statement)
+    prefix = "EXPLAIN (ANALYZE, BUFFERS) " if analyze else "EXPLAIN "
+    cursor.execute("SAVEPOINT slow_query_explain")
+    try:
+        cursor.execute(prefix + statement, parameters)
+        lines = [str(row[0]) for row in cursor.fetchall()]
+    except Exception:
+        cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+        raise
+    cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+    return lines
+
+
+def explain(conn, statement: str, parameters: Any) -> Optional[list[str]]:
+    """Plan de la sentencia en la misma conexión (cursor DBAPI: no vuelve a disparar eventos)."""
+    dialect = conn.dialect.name
+    if dialect not in ("sqlite", "postgresql") or not statement.lstrip().upper().startswith(_EXPLAINABLE):
+        return None
+    cursor = conn.connection.cursor()
+    try:
+        if dialect == "sqlite":
+            return _sqlite_plan(cursor, statement, parameters)
+        return _postgres_plan(cursor, statement, parameters)
+    except Exception as exc:
+        return [f"(sin plan: {type(exc).__name__}: {exc})"]
+    finally:
+        cursor.close()
+
+
+class SlowQueryLog:
+    """Buffer circular de consultas lentas (las más antiguas se descartan)."""
+
+    def __init__(self, threshold_ms: float = SLOW_QUERY_MS, capacity: int = SLOW_QUERY_BUFFER) -> None:
+        self.threshold_ms = threshold_ms
+        self.capacity = max(1, capacity)
+        self._entries: deque[dict[str, Any]] = deque(maxlen=self.capacity)
+        self._explained_at: dict[str, float] = {}  # fingerprint -> último EXPLAIN
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.threshold_ms > 0
+
+    def _should_explain(self, key: str) -> bool:
+        if not SLOW_QUERY_EXPLAIN:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            last = self._explained_at.get(key)
+            if last is not None and now - last < SLOW_QUERY_EXPLAIN_INTERVAL:
+                return False
+            if len(self._explained_at) > 4 * self.capacity:
+                self._explained_at.clear()
+            self._explained_at[key] = now
+        return True
+
+    def record(self, conn, statement: str, parameters: Any, executemany: bool, ms: float) -> None:
+        key = fingerprint(statement)
+        plan = None
+        if not executemany and self._should_explain(key):
+            plan = explain(conn, statement, parameters)
+        queries = current_queries()
+        entry = {
+            "at": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+            "ms": round(ms, 2),
+            "fingerprint": key,
+            "parameters": redact_parameters(parameters, executemany),
+            "route": queries.route if queries is not None else None,
+            "plan": plan,
+        }
+        with self._lock:
+            self._entries.append(entry)
+
+    def entries(self) -> list[dict[str, Any]]:
+        with self._lock:
+            return list(self._entries)
+
+    def grouped(self) -> list[dict[str, Any]]:
+        """Entradas agrupadas por fingerprint, de mayor a menor tiempo total."""
+        groups: dict[str, dict[str, Any]] = {}
+        for e in self.entries():  # de la más antigua a la más reciente
+            g = groups.get(e["fingerprint"])
+            if g is None:
+                g = groups[e["fingerprint"]] = {
+                    "id": hashlib.blake2b(e["fingerprint"].encode(), digest_size=6).hexdigest(),
+                    "fingerprint": e["fingerprint"],
+                    "count": 0,
+                    "totalMs": 0.0,
+                    "maxMs": 0.0,
+                    "routes": set(),
+                    "plan": None,
+                }
+            g["count"] += 1
+            g["totalMs"] += e["ms"]
+            g["maxMs"] = max(g["maxMs"], e["ms"])
+            g["lastSeen"] = e["at"]
+            g["lastParameters"] = e["parameters"]
+            if e["route"]:
+                g["routes"].add(e["route"])
+            if e["plan"] is not None:
+                g["plan"] = e["plan"]
+        result = []
+        for g in groups.values():
+            g["totalMs"] = round(g["totalMs"], 2)
+            g["avgMs"] = round(g["totalMs"] / g["count"], 2)
+            g["routes"] = sorted(g["routes"])
+            result.append(g)
+        return sorted(result, key=lambda g: -g["totalMs"])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._explained_at.clear()
+
+
+slow_query_log = SlowQueryLog()
+
+
+def _before_execute(_conn, _cursor, _statement, _parameters, context, _executemany) -> None:
+    context._slow_query_started = time.perf_counter()
+
+
+def _after_execute(conn, _cursor, statement, parameters, context, executemany) -> None:
+    started = getattr(context, "_slow_query_started", None)
+    if started is None:
+        return
+    ms = (time.perf_counter() - started) * 1000
+    if ms >= slow_query_log.threshold_ms:
+        slow_query_log.record(conn, statement, parameters, executemany, ms)
+
+
+def attach_slow_query_log(target: Engine) -> None:
+    """Registra los eventos del registro de consultas lentas (nada si `SLOW_QUERY_MS=0`)."""
+    if not slow_query_log.enabled:
+        return
+    event.listen(target, "before_cursor_execute", _before_execute)
+    event.listen(target, "after_cursor_execute", _after_execute)
+
+
+__all__ = ["SlowQueryLog", "attach_slow_query_log", "explain", "redact_parameters", "slow_query_log"]
@@ -0,0 +1,215 @@
+"""Servidor de estáticos con caché HTTP para `/static`.
+
+Sobre `StaticFiles` de Starlette añade:
+- `Cache-Control: immutable` (1 año) para ficheros con nombre por hash de
+  contenido (fotos de usuario y sus variantes); el resto se revalida siempre.
+- ETag fuerte y respuestas 304 (`If-None-Match` / `If-Modified-Since`).
+- Peticiones por rangos (`Range: bytes=...`, con `If-Range`).
+- Ficheros precomprimidos hermanos (`.br`, `.gz`) si el cliente los acepta.
+- Envío sin copia: usa las extensiones ASGI `http.response.zerocopysend`
+  (sendfile) o `http.response.pathsend` cuando el servidor las anuncia, y si no
+  lee el fichero por bloques en un hilo.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+from email.utils import formatdate, parsedate_to_datetime
+from mimetypes import guess_type
+from typing import Optional
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Receive, Scope, Send
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "public, max-age=0, must-revalidate"
+
+# `<sha256>.ext` o `<sha256>_w<size>.ext` (ver app.helpers.images)
+_HASHED_NAME_RE = re.compile(r"^([0-9a-f]{64}(?:_w\d+)?)\.[A-Za-z0-9]+$")
+_PRECOMPRESSED = (("br", ".br"), ("gzip", ".gz"))
+
+
+def _accepted_encodings(header: str) -> set[str]:
+    accepted = set()
+    for part in header.split(","):
+        token, *params = [p.strip() for p in part.split(";")]
+        quality = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        if token and quality > 0:
+            accepted.add(token.lower())
+    return accepted
+
+
+def _parse_range(header: str, size: int) -> Optional[tuple[int, int]]:
+    """Devuelve (inicio, fin) inclusivos para un único rango; None si no aplica.
+
+    Lanza ValueError si el rango es sintácticamente válido pero no satisfacible.
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None  # multirango u otra unidad: se sirve el fichero completo
+    first, sep, last = spec.strip().partition("-")
+    if not sep or not (first.isdigit() or first == "") or not (last.isdigit() or last == ""):
+        return None
+    if first == "":
+        if last == "" or int(last) == 0:
+            raise ValueError("rango no satisfacible")
+        start, end = max(0, size - int(last)), size - 1
+    else:
+        start = int(first)
+        end = int(last) if last else size - 1
+    if start >= size or start > end:
+        raise ValueError("rango no satisfacible")
+    return start, min(end, size - 1)
+
+
+class StaticFileResponse(Response):
+    chunk_size = 64 * 1024
+
+    def __init__(
+        self,
+        path: str,
+        headers: dict[str, str],
+        media_type: str,
+        start: int,
+        end: int,
+        size: int,
+        status_code: int = 200,
+    ) -> None:
+        self.path = path
+        self.start = start
+        self.length = end - start + 1 if size else 0
+        self.full = start == 0 and self.length == size
+        self.status_code = status_code
+        self.media_type = media_type
+        self.background = None
+        headers = dict(headers)
+        headers["content-length"] = str(self.length)
+        self.init_headers(headers)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send({
+            "type": "http.response.start",
+            "status": self.status_code,
+            "headers": self.raw_headers,
+        })
+        if scope["method"] == "HEAD" or self.length == 0:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+        extensions = scope.get("extensions") or {}
+        if "http.response.zerocopysend" in extensions:
+            with open(self.path, "rb") as fh:
+                await send({
+                    "type": "http.response.zerocopysend",
+                    "file": fh,
+                    "offset": self.start,
+                    "count": self.length,
+                    "more_body": False,
+                })
+            return
+        if self.full and "http.response.pathsend" in extensions:
+            await send({"type": "http.response.pathsend", "path": self.path})
+            return
+        remaining = self.length
+        async with await anyio.open_file(self.path, mode="rb") as fh:
+            if self.start:
+                await fh.seek(self.start)
+            while remaining > 0:
+                chunk = await fh.read(min(self.chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                await send({"type": "http.response.body", "body": chunk, "more_body": remaining > 0})
+        if remaining > 0:  # fichero truncado mientras se servía
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
+class CachedStaticFiles(StaticFiles):
+    def file_response(
+        self,
+        full_path,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        full_path = str(full_path)
+        request_headers = Headers(scope=scope)
+        filename = os.path.basename(full_path)
+        media_type = guess_type(filename)[0] or "text/plain"
+        hashed = _HASHED_NAME_RE.match(filename)
+
+        # Variante precomprimida si existe y el cliente la acepta
+        serve_path, serve_stat, encoding = full_path, stat_result, None
+        accepted = _accepted_encodings(request_headers.get("accept-encoding", ""))
+        for enc, suffix in _PRECOMPRESSED:
+            if enc in accepted:
+                try:
+                    serve_stat = os.stat(full_path + suffix)
+                    serve_path, encoding = full_path + suffix, enc
+                    break
+                except OSError:
+                    continue
+
+        if hashed:
+            tag = hashed.group(1)
+        else:
+            tag = hashlib.md5(
+                f"{serve_stat.st_mtime_ns}-{serve_stat.st_size}-{serve_stat.st_ino}".encode(),
+                usedforsecurity=False,
+            ).hexdigest()
+        etag = f'"{tag}-{encoding}"' if encoding else f'"{tag}"'
+
+        headers = {
+            "etag": etag,
+            "last-modified": formatdate(stat_result.st_mtime, usegmt=True),
+            "cache-control": IMMUTABLE_CACHE_CONTROL if hashed else REVALIDATE_CACHE_CONTROL,
+            "accept-ranges": "bytes",
+            "vary": "Accept-Encoding",
+        }
+        if encoding:
+            headers["content-encoding"] = encoding
+
+        if self._not_modified(request_headers, etag, stat_result.st_mtime):
+            return Response(status_code=304, headers=headers)
+
+        size = serve_stat.st_size
+        range_header = request_headers.get("range")
+        if_range = request_headers.get("if-range")
+        if range_header and status_code == 200 and (if_range is None or if_range == etag):
+            try:
+                byte_range = _parse_range(range_header, size)
+            except ValueError:
+                headers["content-range"] = f"bytes */{size}"
+                return Response(status_code=416, headers=headers)
+            if byte_range is not None:
+                start, end = byte_range
+                headers["content-range"] = f"bytes {start}-{end}/{size}"
+                return StaticFileResponse(serve_path, headers, media_type, start, end, size, status_code=206)
+
+        return StaticFileResponse(serve_path, headers, media_type, 0, size - 1, size, status_code=status_code)
+
+    @staticmethod
+    def _not_modified(request_headers: Headers, etag: str, mtime: float) -> bool:
+        if_none_match = request_headers.get("if-none-match")
+        if if_none_match is not None:
+            tags = [t.strip() for t in if_none_match.split(",")]
+            return "*" in tags or etag in tags or f"W/{etag}" in tags
+        if_modified_since = request_headers.get("if-modified-since")
+        if if_modified_since:
+            try:
+                return int(mtime) <= parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+        return False
+
+
+__all__ = ["CachedStaticFiles", "StaticFileResponse"]
@@ -0,0 +1,96 @@
+"""Almacén en proceso de `jti` de refresh tokens usados o revocados.
+
+- Comprobación O(1): diccionario `jti -> exp`.
+- Memoria acotada: un heap ordenado por `exp` permite purgar los expirados
+  de forma amortizada en cada operación (un token expirado ya lo rechaza el
+  propio JWT, no hace falta recordarlo).
+- Persistencia: cada revocación se inserta en `revoked_tokens`; al arrancar se
+  recargan las filas vigentes. La PK sobre `jti` hace que, con varios workers,
+  solo uno pueda consumir el mismo refresh token.
+"""
+from __future__ import annotations
+
+import heapq
+import threading
+import time
+from typing import Optional
+
+from sqlalchemy import delete
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, select
+
+from app.models.token import RevokedTokenTable
+
+
+class RevocationStore:
+    def __init__(self) -> None:
+        self._expiry: dict[str, int] = {}
+        self._heap: list[tuple[int, str]] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._expiry)
+
+    def _purge(self, now: int) -> None:
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            exp, jti = heapq.heappop(heap)
+            if self._expiry.get(jti) == exp:
+                del self._expiry[jti]
+
+    def _add(self, jti: str, exp: int) -> None:
+        self._expiry[jti] = exp
+        heapq.heappush(self._heap, (exp, jti))
+
+    def is_revoked(self, jti: str, now: Optional[int] = None) -> bool:
+        now = int(time.time()) if now is None else now
+        with self._lock:
+            self._purge(now)
+            return jti in self._expiry
+
+    def add(self, jti: str, exp: int) -> None:
+        """Registra el `jti` solo en memoria (sin tocar la BD)."""
+        now = int(time.time())
+        with self._lock:
+            self._purge(now)
+            if exp > now and jti not in self._expiry:
+                self._add(jti, exp)
+
+    def revoke(self, session: Session, jti: str, exp: int) -> bool:
+        """Marca el `jti` como usado/revocado y lo persiste.
+
+        Devuelve False si ya estaba revocado (en memoria o en BD por otro worker).
+        """
+        if self.is_revoked(jti):
+            return False
+        session.add(RevokedTokenTable(jti=jti, expires_at=exp))
+        try:
+            session.commit()
+        except IntegrityError:
+            session.rollback()
+            self.add(jti, exp)
+            return False
+        self.add(jti, exp)
+        return True
+
+    def load(self, session: Session) -> int:
+        """Recarga desde BD los `jti` vigentes y borra los expirados."""
+        now = int(time.time())
+        session.exec(delete(RevokedTokenTable).where(RevokedTokenTable.expires_at <= now))
+        session.commit()
+        rows = session.exec(
+            select(RevokedTokenTable.jti, RevokedTokenTable.expires_at)
+            .where(RevokedTokenTable.expires_at > now)
+        ).all()
+        with self._lock:
+            self._expiry.clear()
+            self._heap = [(exp, jti) for jti, exp in rows]
+            heapq.heapify(self._heap)
+            for exp, jti in self._heap:
+                self._expiry[jti] = exp
+        return len(rows)
+
+
+revocation_store = RevocationStore()
+
+__all__ = ["RevocationStore", "revocation_store"]
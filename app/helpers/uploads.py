@@ -0,0 +1,165 @@
+"""Recepción de ficheros multipart en streaming con límite de tamaño.
+
+A diferencia de `UploadFile` (FastAPI parsea el cuerpo completo antes de
+llamar al handler), aquí el cuerpo se consume trozo a trozo desde
+`request.stream()` y se vuelca a un `SpooledTemporaryFile`. El límite se
+comprueba mientras llegan los datos, y una cabecera `Content-Length` excesiva
+se rechaza antes de leer nada.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from tempfile import SpooledTemporaryFile
+from typing import Callable, Optional
+
+from fastapi import HTTPException, Request, status
+from multipart.multipart import MultipartParser, parse_options_header
+
+# Margen para cabeceras multipart y otros campos pequeños del formulario
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+SPOOL_MAX_MEMORY_BYTES = 1024 * 1024
+
+
+@dataclass
+class StreamedUpload:
+    file: SpooledTemporaryFile
+    filename: Optional[str]
+    content_type: Optional[str]
+    size: int
+
+    def close(self) -> None:
+        self.file.close()
+
+
+def _too_large(max_bytes: int) -> HTTPException:
+    mb = max_bytes // (1024 * 1024)
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"Archivo demasiado grande (máx. {mb} MB)",
+    )
+
+
+async def receive_upload(
+    request: Request,
+    field_name: str,
+    max_bytes: int,
+    header_check: Optional[Callable[[bytes], bool]] = None,
+    header_bytes: int = 0,
+) -> StreamedUpload:
+    """Lee del cuerpo multipart el fichero `field_name` sin superar `max_bytes`.
+
+    Si se indica `header_check`, se llama con los primeros `header_bytes` bytes
+    del fichero en cuanto llegan; si devuelve False se corta la subida (415).
+    """
+    content_type, params = parse_options_header(request.headers.get("content-type", ""))
+    boundary = params.get(b"boundary")
+    if content_type != b"multipart/form-data" or not boundary:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Se esperaba multipart/form-data")
+
+    max_body = max_bytes + MULTIPART_OVERHEAD_BYTES
+    declared = request.headers.get("content-length")
+    if declared and declared.isdigit() and int(declared) > max_body:
+        raise _too_large(max_bytes)
+
+    spool = SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY_BYTES)
+    state = {
+        "header_field": b"",
+        "header_value": b"",
+        "headers": {},
+        "in_target": False,
+        "found": False,
+        "size": 0,
+        "overflow": False,
+        "rejected": False,
+        "header": b"" if header_check else None,
+        "filename": None,
+        "content_type": None,
+    }
+
+    def on_part_begin() -> None:
+        state["headers"] = {}
+        state["in_target"] = False
+
+    def on_header_field(data: bytes, start: int, end: int) -> None:
+        state["header_field"] += data[start:end]
+
+    def on_header_value(data: bytes, start: int, end: int) -> None:
+        state["header_value"] += data[start:end]
+
+    def on_header_end() -> None:
+        state["headers"][state["header_field"].lower()] = state["header_value"]
+        state["header_field"] = b""
+        state["header_value"] = b""
+
+    def on_headers_finished() -> None:
+        _, disp = parse_options_header(state["headers"].get(b"content-disposition", b""))
+        name = disp.get(b"name", b"").decode("latin-1")
+        if name == field_name and not state["found"] and b"filename" in disp:
+            state["in_target"] = True
+            state["found"] = True
+            state["filename"] = disp[b"filename"].decode("utf-8", "replace")
+            ctype = state["headers"].get(b"content-type")
+            state["content_type"] = ctype.decode("latin-1") if ctype else None
+
+    def on_part_data(data: bytes, start: int, end: int) -> None:
+        if not state["in_target"] or state["overflow"] or state["rejected"]:
+            return
+        state["size"] += end - start
+        if state["size"] > max_bytes:
+            state["overflow"] = True
+            return
+        if state["header"] is not None:
+            state["header"] += data[start:end][:header_bytes]
+            if len(state["header"]) >= header_bytes:
+                state["rejected"] = not header_check(state["header"][:header_bytes])
+                state["header"] = None
+        spool.write(data[start:end])
+
+    def on_part_end() -> None:
+        state["in_target"] = False
+
+    parser = MultipartParser(boundary, {
+        "on_part_begin": on_part_begin,
+        "on_header_field": on_header_field,
+        "on_header_value": on_header_value,
+        "on_header_end": on_header_end,
+        "on_headers_finished": on_headers_finished,
+        "on_part_data": on_part_data,
+        "on_part_end": on_part_end,
+    })
+
+    received = 0
+    try:
+        async for chunk in request.stream():
+            received += len(chunk)
+            if received > max_body:
+                raise _too_large(max_bytes)
+            parser.write(chunk)
+            if state["overflow"]:
+                raise _too_large(max_bytes)
+            if state["rejected"]:
+                raise HTTPException(
+                    status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                    detail="Formato de archivo no soportado",
+                )
+        parser.finalize()
+    except HTTPException:
+        spool.close()
+        raise
+    except Exception:
+        spool.close()
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cuerpo multipart inválido")
+
+    if not state["found"]:
+        spool.close()
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Falta el archivo '{field_name}'")
+    spool.seek(0)
+    return StreamedUpload(
+        file=spool,
+        filename=state["filename"],
+        content_type=state["content_type"],
+        size=state["size"],
+    )
+
+
+__all__ = ["StreamedUpload", "receive_upload"]
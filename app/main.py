@@ -3,6 +3,7 @@ from pathlib import Path
 import sys
 import logging
 import os
+import time
 
 CURRENT_FILE = Path(__file__).resolve()
 PROJECT_ROOT = CURRENT_FILE.parent.parent  # .../TFG
@@ -14,15 +15,22 @@ import asyncio
 from datetime import datetime
 from sqlmodel import Session
 
-from app.db import engine
+from app.db import engine, read_replica_enabled
 from app.models.booking import BookingTable as BookingDB
 from app.endpoints.bookings import persist_completed_bookings, CANCELLED_STATES, COMPLETED_STATES
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
+from app.helpers.static_files import CachedStaticFiles
+from app.helpers.conditional import ETagHeaderMiddleware
+from app.helpers.cache import catalog_cache
+from app.helpers.read_your_writes import READ_STICKY_SECONDS, ReadYourWritesMiddleware
+from app.helpers.query_stats import QueryStatsMiddleware
 
 from app.endpoints import register_routers
 from app.db import create_db_and_tables
-from app.helpers.seed import seed_memory_data, ensure_admin_user
+from app.helpers.seed import seed_database
+from app.helpers.token_store import revocation_store
+from app.helpers.images import shutdown_image_pool
+from app.endpoints.gallery import schedule_missing_thumbnails
 from pathlib import Path as _P
 
 app = FastAPI(
@@ -40,17 +48,38 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# ETag/Cache-Control en los GET con `conditional_get` (ver app.helpers.conditional)
+app.add_middleware(ETagHeaderMiddleware)
+
+# Réplica de lectura: quien acaba de escribir lee del primario durante unos segundos
+# y la caché del catálogo no guarda lo leído mientras la réplica se pone al día
+app.add_middleware(ReadYourWritesMiddleware)
+if read_replica_enabled():
+    catalog_cache.settle_seconds = READ_STICKY_SECONDS
+
+# Consultas SQL por petición: cabecera Server-Timing y aviso de N+1 en el log
+app.add_middleware(QueryStatsMiddleware)
+
 # Registrar routers
 register_routers(app)
 
 # Archivos estáticos (fotos de usuario, etc.)
-app.mount("/static", StaticFiles(directory="static", check_dir=False), name="static")
+app.mount("/static", CachedStaticFiles(directory="static", check_dir=False), name="static")
 
 # Crear tablas al arrancar
 @app.on_event("startup")
 def on_startup():
+    started = time.perf_counter()
     # DB init + seed
     create_db_and_tables()
+    db_ms = (time.perf_counter() - started) * 1000
+
+    # Recargar refresh tokens revocados (rotación/logout) en memoria
+    try:
+        with Session(engine) as session:
+            revocation_store.load(session)
+    except Exception:
+        logging.getLogger(__name__).exception("Error cargando tokens revocados")
 
     # Lanzar tarea en segundo plano para ir marcando reservas completadas.
     interval = int(os.getenv("AUTO_COMPLETE_INTERVAL_SECONDS", "300"))  # 5 min por defecto
@@ -70,21 +99,25 @@ def on_startup():
     except RuntimeError:
         # Si no hay loop (ejecución síncrona directa), ignoramos.
         pass
+    # Datos de ejemplo y usuario admin/admin: se omite si `seed_state` ya está al día
+    seed_started = time.perf_counter()
     try:
-        seed_memory_data()
-    except Exception:
-        logging.getLogger(__name__).exception("Error durante seed_memory_data")
-
-    # Crear usuario admin: admin/admin si no existe
-    try:
-        ensure_admin_user()
+        seed_database()
     except Exception:
-        logging.getLogger(__name__).exception("Error creando usuario admin por defecto")
+        logging.getLogger(__name__).exception("Error durante el seed inicial")
+    seed_ms = (time.perf_counter() - seed_started) * 1000
 
     # Asegurar carpeta estática de fotos
     static_dir = _P(__file__).resolve().parents[1] / "static" / "user-photos"
     static_dir.mkdir(parents=True, exist_ok=True)
 
+    # Miniaturas de galería pendientes (se generan en segundo plano)
+    try:
+        with Session(engine) as session:
+            schedule_missing_thumbnails(session)
+    except Exception:
+        logging.getLogger(__name__).exception("Error encolando miniaturas de galería")
+
     # Chequeo de Pillow
     log = logging.getLogger(__name__)
     try:
@@ -94,6 +127,14 @@ def on_startup():
     except Exception:
         log.warning("Pillow NO disponible. Instala dependencia en este intérprete: %s", sys.executable)
 
+    total_ms = (time.perf_counter() - started) * 1000
+    print(f"[STARTUP] Arranque en {total_ms:.0f} ms (BD {db_ms:.0f} ms, seed {seed_ms:.0f} ms)")
+
+@app.on_event("shutdown")
+def on_shutdown():
+    # Liberar el pool de procesos de imágenes (subida de fotos)
+    shutdown_image_pool()
+
 # Permitir arrancar con: python app/main.py
 if __name__ == "__main__":
     import uvicorn
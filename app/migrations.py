@@ -0,0 +1,221 @@
+"""Migraciones de esquema versionadas.
+
+Cada migración tiene un número de versión y se registra en `schema_migrations`
+al aplicarse. Al arrancar basta una consulta (`MAX(version)`): si coincide con
+la última no se hace nada más. Si faltan, se aplican en orden bajo un bloqueo
+para que varios workers arrancando a la vez no ejecuten DDL en paralelo:
+
+- PostgreSQL: `pg_advisory_lock` (bloqueo de sesión).
+- SQLite: `BEGIN IMMEDIATE` (reserva la escritura de la BD).
+
+Cada migración va en su propia transacción junto con su fila del registro y
+se vuelve a comprobar dentro del bloqueo, así que nunca se aplica dos veces.
+Las migraciones 2+ son idempotentes: en BD anteriores al registro las columnas
+o índices pueden existir ya.
+
+Para cambiar el esquema: añadir una función al final de `MIGRATIONS` con la
+siguiente versión (nunca modificar ni reordenar las ya publicadas).
+"""
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+from sqlalchemy import event, func, inspect, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError, ProgrammingError
+from sqlalchemy.pool import NullPool
+from sqlalchemy.schema import CreateIndex
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from app.models.schema_migration import SchemaMigrationTable
+
+_LEDGER = SchemaMigrationTable.__table__
+_PG_LOCK_KEY = 7318420  # clave arbitraria del advisory lock de migraciones
+
+
+# --- utilidades ---------------------------------------------------------------
+
+def _add_column(conn: Connection, table: str, column: str, ddl_type: str) -> None:
+    if column in {c["name"] for c in inspect(conn).get_columns(table)}:
+        return
+    q = conn.dialect.identifier_preparer.quote
+    conn.execute(text(f"ALTER TABLE {q(table)} ADD COLUMN {q(column)} {ddl_type}"))
+
+
+def _create_indexes(conn: Connection, *tables: str) -> None:
+    """Índices declarados en `__table_args__` que falten en tablas ya existentes."""
+    for name in tables:
+        table = SQLModel.metadata.tables.get(name)
+        if table is None:
+            continue
+        for index in table.indexes:
+            # IF NOT EXISTS: la reflexión de SQLite no ve los índices de expresión (lower(brand))
+            conn.execute(CreateIndex(index, if_not_exists=True))
+
+
+@contextmanager
+def _session(conn: Connection) -> Iterator[Session]:
+    # Los helpers hacen commit: dentro de la migración solo liberan un savepoint
+    with Session(bind=conn, join_transaction_mode="create_savepoint") as session:
+        yield session
+
+
+# --- migraciones ----------------------------------------------------------------
+
+def _m001_base_schema(conn: Connection) -> None:
+    SQLModel.metadata.create_all(conn)
+
+
+def _m002_user_profile(conn: Connection) -> None:
+    _add_column(conn, "user", "phone", "VARCHAR(30)")
+    _add_column(conn, "user", "birth_date", "DATE")
+    _add_column(conn, "user", "photo_url", "VARCHAR(255)")
+
+
+def _m003_review_user(conn: Connection) -> None:
+    _add_column(conn, "reviews", "userPhotoUrl", "VARCHAR(255)")
+    _add_column(conn, "reviews", "userId", "INTEGER")
+
+
+def _m004_booking_shop(conn: Connection) -> None:
+    _add_column(conn, "bookings", "barbershopId", "INTEGER REFERENCES barbershops(id)")
+    # Reservas anteriores a multi-barbería: la barbería es la de su barbero
+    conn.execute(text(
+        'UPDATE bookings SET "barbershopId" = '
+        '(SELECT barbers."barbershopId" FROM barbers WHERE barbers.id = bookings."barberId") '
+        'WHERE "barbershopId" IS NULL'
+    ))
+
+
+def _m005_barbershop_geohash(conn: Connection) -> None:
+    from app.helpers.geo import set_geohash
+    from app.models.barbershop import BarbershopTable
+    _add_column(conn, "barbershops", "geohash", "VARCHAR(12)")
+    with _session(conn) as session:
+        for row in session.exec(select(BarbershopTable).where(BarbershopTable.geohash == None)).all():  # noqa: E711
+            session.add(set_geohash(row))
+        session.commit()
+
+
+def _m006_query_indexes(conn: Connection) -> None:
+    _create_indexes(conn, "barbershops", "products", "barber_services", "gallery_items", "barbers", "services", "bookings")
+
+
+def _m007_barber_services(conn: Connection) -> None:
+    from app.helpers.barber_services import backfill_barber_services
+    with _session(conn) as session:
+        backfill_barber_services(session)
+
+
+def _m008_inventory(conn: Connection) -> None:
+    from app.helpers.inventory import backfill_inventory
+    with _session(conn) as session:
+        backfill_inventory(session)
+
+
+def _m009_read_indexes(conn: Connection) -> None:
+    _create_indexes(conn, "reviews", "bookings")
+
+
+def _m010_products_brand_lower(conn: Connection) -> None:
+    _create_indexes(conn, "products")
+
+
+MIGRATIONS: list[tuple[int, str, Callable[[Connection], None]]] = [
+    (1, "esquema base (create_all)", _m001_base_schema),
+    (2, "user: phone, birth_date, photo_url", _m002_user_profile),
+    (3, "reviews: userPhotoUrl, userId", _m003_review_user),
+    (4, "bookings.barbershopId + relleno desde barbers", _m004_booking_shop),
+    (5, "barbershops.geohash + relleno", _m005_barbershop_geohash),
+    (6, "índices de consulta en tablas existentes", _m006_query_indexes),
+    (7, "barber_services desde servicesOffered", _m007_barber_services),
+    (8, "inventario desde products.stock", _m008_inventory),
+    (9, "índices de lectura: reviews (barberId, createdAt), bookings (barberId, start)", _m009_read_indexes),
+    (10, "índice funcional products lower(brand)", _m010_products_brand_lower),
+]
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+# --- ejecución --------------------------------------------------------------------
+
+def current_version(engine: Engine) -> int:
+    """Última versión aplicada (0 si aún no existe el registro)."""
+    try:
+        with engine.connect() as conn:
+            return conn.execute(select(func.max(_LEDGER.c.version))).scalar() or 0
+    except (OperationalError, ProgrammingError):
+        return 0
+
+
+def _sqlite_lock_engine(engine: Engine) -> Engine:
+    """Engine propio para migrar en SQLite: cada transacción empieza con BEGIN IMMEDIATE."""
+    if engine.url.database in (None, "", ":memory:"):
+        return engine  # BD en memoria: un solo proceso, sin bloqueo entre workers
+    lock_engine = create_engine(engine.url, connect_args={"check_same_thread": False, "timeout": 60}, poolclass=NullPool)
+
+    @event.listens_for(lock_engine, "connect")
+    def _no_implicit_begin(dbapi_conn, _record):
+        dbapi_conn.isolation_level = None  # controlar BEGIN nosotros (y que funcionen los SAVEPOINT)
+
+    @event.listens_for(lock_engine, "begin")
+    def _begin_immediate(conn):
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+    return lock_engine
+
+
+@contextmanager
+def _locked(engine: Engine) -> Iterator[Connection]:
+    if engine.url.drivername.startswith("postgresql"):
+        # Conexión propia, sin los eventos de métricas y consultas lentas del
+        # engine principal (un EXPLAIN ANALYZE repetiría el advisory lock).
+        lock_engine = create_engine(engine.url, poolclass=NullPool)
+        try:
+            with lock_engine.connect() as conn:
+                conn.execute(text("SELECT pg_advisory_lock(:k)"), {"k": _PG_LOCK_KEY})
+                conn.commit()
+                try:
+                    yield conn
+                finally:
+                    conn.rollback()
+                    conn.execute(text("SELECT pg_advisory_unlock(:k)"), {"k": _PG_LOCK_KEY})
+                    conn.commit()
+        finally:
+            lock_engine.dispose()
+    elif engine.url.drivername.startswith("sqlite"):
+        lock_engine = _sqlite_lock_engine(engine)
+        try:
+            with lock_engine.connect() as conn:
+                yield conn
+        finally:
+            if lock_engine is not engine:
+                lock_engine.dispose()
+    else:
+        with engine.connect() as conn:
+            yield conn
+
+
+def migrate(engine: Engine) -> list[int]:
+    """Aplica las migraciones pendientes. Devuelve las versiones aplicadas por este proceso."""
+    if current_version(engine) >= LATEST_VERSION:
+        return []
+    applied: list[int] = []
+    with _locked(engine) as conn:
+        _LEDGER.create(conn, checkfirst=True)
+        conn.commit()
+        for version, name, apply in MIGRATIONS:
+            # Comprobar de nuevo ya con el bloqueo: otro worker puede haberla aplicado
+            done = conn.execute(select(_LEDGER.c.version).where(_LEDGER.c.version == version)).first()
+            if done is not None:
+                conn.commit()
+                continue
+            apply(conn)
+            conn.execute(_LEDGER.insert().values(version=version, name=name))
+            conn.commit()
+            applied.append(version)
+            print(f"[MIGRATE] {version:03d} {name}")
+    return applied
+
+
+__all__ = ["MIGRATIONS", "LATEST_VERSION", "current_version", "migrate"]
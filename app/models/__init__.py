@@ -10,15 +10,26 @@ from .booking import (
 from .barber import Barber, BarberSchedule, DayOfWeek
 from .barbershop import (
     Barbershop,
+    NearbyBarbershop,
     BarbershopSchedule,
     SocialLinks,
     OpeningHours,
     DayHours,
 )
 
+from .bootstrap import Bootstrap
 from .category import ProductCategory, ServiceCategory
-from .gallery import GalleryItem
-from .product import Product, InventoryItem, InventoryRecord
+from .gallery import GalleryItem, GalleryItemPage
+from .product import (
+    Product,
+    ProductSearchPage,
+    InventoryItem,
+    InventoryRecord,
+    StockLine,
+    StockReservation,
+    StockAdjustmentLine,
+    StockAdjustment,
+)
 
 """Model exports."""
 from .review import (
@@ -31,6 +42,7 @@ from .review import (
 )
 
 from .service import ServiceOffering, Service
+from .user import PhotoVariant
 
 
 __all__ = [
@@ -47,19 +59,28 @@ __all__ = [
     "DayOfWeek",
     # Barbershop
     "Barbershop",
+    "NearbyBarbershop",
     "BarbershopSchedule",
     "SocialLinks",
     "OpeningHours",
     "DayHours",
+    # Bootstrap
+    "Bootstrap",
     # Categories
     "ProductCategory",
     "ServiceCategory",
     # Gallery
     "GalleryItem",
+    "GalleryItemPage",
     # Products & Inventory
     "Product",
+    "ProductSearchPage",
     "InventoryItem",
     "InventoryRecord",
+    "StockLine",
+    "StockReservation",
+    "StockAdjustmentLine",
+    "StockAdjustment",
     "Review",
     "CreateReview",
     "ReviewLegacy",
@@ -71,4 +92,5 @@ __all__ = [
     "Service",
     # User
     "User",
+    "PhotoVariant",
 ]
\ No newline at end of file
@@ -5,7 +5,7 @@ from enum import IntEnum
 from typing import Optional
 from pydantic import BaseModel
 from sqlmodel import SQLModel, Field
-from sqlalchemy import Column, JSON
+from sqlalchemy import Column, JSON, Index
 
 
 class DayOfWeek(IntEnum):
@@ -37,6 +37,8 @@ class BarberSchedule(BaseModel):
 
 class BarberTable(SQLModel, table=True):
     __tablename__ = "barbers"
+    # Listados por barbería (`/barbershops/{id}/barbers`)
+    __table_args__ = (Index("ix_barbers_shop_id", "barbershopId", "id"),)
     id: Optional[int] = Field(default=None, primary_key=True)
     barbershopId: int = Field(foreign_key="barbershops.id")
     name: str
@@ -48,4 +50,16 @@ class BarberTable(SQLModel, table=True):
     servicesOffered: Optional[list[int]] = Field(default=None, sa_column=Column(JSON))
 
 
-__all__ = ["Barber", "BarberSchedule", "DayOfWeek", "BarberTable"]
\ No newline at end of file
+class BarberServiceTable(SQLModel, table=True):
+    """Relación barbero↔servicio (normaliza `BarberTable.servicesOffered`).
+
+    La PK (barberId, serviceId) cubre "servicios de un barbero"; el índice
+    inverso, "barberos de un servicio" (`/barbers/by-service`).
+    """
+    __tablename__ = "barber_services"
+    __table_args__ = (Index("ix_barber_services_service_barber", "serviceId", "barberId"),)
+    barberId: int = Field(foreign_key="barbers.id", primary_key=True)
+    serviceId: int = Field(foreign_key="services.id", primary_key=True)
+
+
+__all__ = ["Barber", "BarberSchedule", "DayOfWeek", "BarberTable", "BarberServiceTable"]
\ No newline at end of file
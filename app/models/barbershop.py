@@ -3,7 +3,7 @@ from datetime import time
 from typing import List, Optional
 from pydantic import BaseModel
 from sqlmodel import SQLModel, Field
-from sqlalchemy import Column, JSON
+from sqlalchemy import Column, Index, JSON
 
 from .barber import DayOfWeek
 
@@ -49,6 +49,11 @@ class Barbershop(BaseModel):
     openingHours: Optional[OpeningHours] = None
 
 
+class NearbyBarbershop(Barbershop):
+    distanceKm: float
+    isOpenNow: bool = False
+
+
 class BarbershopSchedule(BaseModel):
     id: int
     barbershopId: int
@@ -59,6 +64,7 @@ class BarbershopSchedule(BaseModel):
 
 class BarbershopTable(SQLModel, table=True):
     __tablename__ = "barbershops"
+    __table_args__ = (Index("ix_barbershops_geohash", "geohash"),)
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str
     phone: str
@@ -74,10 +80,13 @@ class BarbershopTable(SQLModel, table=True):
     about: Optional[str] = None
     social: Optional[dict] = Field(default=None, sa_column=Column(JSON))
     openingHours: Optional[dict] = Field(default=None, sa_column=Column(JSON))
+    # Celda de geohash de (latitude, longitude) para /barbershops/nearby (ver helpers/geo.py)
+    geohash: Optional[str] = Field(default=None, max_length=12)
 
 
 __all__ = [
     "Barbershop",
+    "NearbyBarbershop",
     "BarbershopSchedule",
     "SocialLinks",
     "OpeningHours",
@@ -58,6 +58,7 @@ class Booking(BaseModel):
     start: str   # ISO YYYY-MM-DDTHH:MM
     end: str     # ISO YYYY-MM-DDTHH:MM
     status: str  # suggested: "confirmed", etc.
+    barbershopId: Optional[int] = None
     # Enriquecidos para UI
     barberName: Optional[str] = None
     serviceName: Optional[str] = None
@@ -137,8 +138,14 @@ class BookingTable(SQLModel, table=True):
     __tablename__ = "bookings"
     __table_args__ = (
         Index("ix_bookings_user_start", "userId", "start"),
+        Index("ix_bookings_shop_start", "barbershopId", "start"),
+        Index("ix_bookings_shop_barber_start", "barbershopId", "barberId", "start"),
+        # Disponibilidad: reservas de un barbero en un día (sin barbería en la consulta)
+        Index("ix_bookings_barber_start", "barberId", "start"),
     )
     id: Optional[int] = SQLField(default=None, primary_key=True)
+    # Barbería del barbero (se rellena al crear; migración: desde barbers.barbershopId)
+    barbershopId: Optional[int] = SQLField(default=None, foreign_key="barbershops.id")
     barberId: int = SQLField(foreign_key="barbers.id")
     serviceId: int = SQLField(foreign_key="services.id")
     # Nueva columna opcional vinculada al usuario autenticado (para histórico propio)
@@ -0,0 +1,23 @@
+from __future__ import annotations
+from pydantic import BaseModel
+
+from .barber import Barber
+from .barbershop import Barbershop
+from .category import ProductCategory, ServiceCategory
+from .gallery import GalleryItem
+from .product import Product
+from .service import Service
+
+
+class Bootstrap(BaseModel):
+    """Datos de arranque de la app en una sola respuesta (`/bootstrap`)."""
+    barbershop: Barbershop
+    barbers: list[Barber]
+    services: list[Service]
+    serviceCategories: list[ServiceCategory]
+    products: list[Product]
+    productCategories: list[ProductCategory]
+    gallery: list[GalleryItem]
+
+
+__all__ = ["Bootstrap"]
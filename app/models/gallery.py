@@ -1,6 +1,7 @@
 from __future__ import annotations
 from typing import Optional
 from pydantic import BaseModel
+from sqlalchemy import Index
 from sqlmodel import SQLModel, Field
 
 
@@ -15,9 +16,24 @@ class GalleryItem(BaseModel):
     order: int
     serviceId: Optional[int] = None
     barberId: Optional[int] = None
+    # Miniatura generada por el servidor (ruta relativa al host); None si aún no existe
+    thumbnailUrl: Optional[str] = None
+
+
+class GalleryItemPage(BaseModel):
+    items: list[GalleryItem]
+    nextCursor: Optional[str] = None
+
 
 class GalleryItemTable(SQLModel, table=True):
     __tablename__ = "gallery_items"
+    # Paginación por clave (order, id), con y sin filtro por barbería/barbero/servicio
+    __table_args__ = (
+        Index("ix_gallery_items_order_id", "order", "id"),
+        Index("ix_gallery_items_shop_order", "barbershopId", "order", "id"),
+        Index("ix_gallery_items_barber_order", "barberId", "order", "id"),
+        Index("ix_gallery_items_service_order", "serviceId", "order", "id"),
+    )
     id: Optional[int] = Field(default=None, primary_key=True)
     barbershopId: int = Field(foreign_key="barbershops.id")
     title: str
@@ -30,4 +46,4 @@ class GalleryItemTable(SQLModel, table=True):
     barberId: Optional[int] = Field(default=None, foreign_key="barbers.id")
 
 
-__all__ = ["GalleryItem", "GalleryItemTable"]
\ No newline at end of file
+__all__ = ["GalleryItem", "GalleryItemPage", "GalleryItemTable"]
\ No newline at end of file
@@ -2,6 +2,7 @@ from __future__ import annotations
 from decimal import Decimal
 from typing import Optional
 from pydantic import BaseModel, Field, model_validator, ConfigDict
+from sqlalchemy import CheckConstraint, Index, text
 from sqlmodel import SQLModel, Field as SQLField
 
 
@@ -44,6 +45,12 @@ class Product(BaseModel):
         return data
 
 
+class ProductSearchPage(BaseModel):
+    """Página de `/products/search`; `nextCursor` es None en la última página."""
+    items: list[Product]
+    nextCursor: Optional[str] = None
+
+
 class InventoryItem(BaseModel):
     id: int
     name: str
@@ -62,8 +69,61 @@ class InventoryRecord(BaseModel):
     order: int
 
 
+class StockLine(BaseModel):
+    productId: int
+    quantity: int = Field(ge=1)
+
+
+class StockReservation(BaseModel):
+    """Compra/reserva: descuenta todas las líneas o ninguna."""
+    items: list[StockLine] = Field(min_length=1)
+
+
+class StockAdjustmentLine(BaseModel):
+    """Línea de inventario (recuento): `stock` fija el valor contado, `delta` suma/resta."""
+    productId: int
+    stock: Optional[int] = Field(default=None, ge=0)
+    delta: Optional[int] = None
+    isVisible: Optional[bool] = None
+    order: Optional[int] = None
+
+    @model_validator(mode="after")
+    def stock_or_delta(self):
+        if self.stock is not None and self.delta is not None:
+            raise ValueError("Indica 'stock' o 'delta', no ambos")
+        return self
+
+
+class StockAdjustment(BaseModel):
+    items: list[StockAdjustmentLine] = Field(min_length=1)
+
+
+class InventoryTable(SQLModel, table=True):
+    """Stock de cada producto en cada barbería (`products.stock` es la suma)."""
+    __tablename__ = "inventory"
+    __table_args__ = (
+        CheckConstraint("stock >= 0", name="ck_inventory_stock_non_negative"),
+        Index("ix_inventory_product", "productId"),
+    )
+    barbershopId: int = SQLField(foreign_key="barbershops.id", primary_key=True)
+    productId: int = SQLField(foreign_key="products.id", primary_key=True)
+    stock: int = 0
+    isVisible: bool = True
+    order: int = 0
+
+
 class ProductTable(SQLModel, table=True):
     __tablename__ = "products"
+    # Índices para /products/search: filtros habituales y orden (columna, id) del cursor
+    __table_args__ = (
+        Index("ix_products_category_price", "categoryId", "price", "id"),
+        Index("ix_products_brand", "brand"),
+        Index("ix_products_brand_lower", text("lower(brand)")),  # filtro `brand=` sin distinguir mayúsculas
+        Index("ix_products_active", "isActive"),
+        Index("ix_products_price_id", "price", "id"),
+        Index("ix_products_name_id", "name", "id"),
+        Index("ix_products_stock_id", "stock", "id"),
+    )
     id: Optional[int] = SQLField(default=None, primary_key=True)
     categoryId: int = SQLField(foreign_key="product_categories.id")
     name: str
@@ -76,4 +136,15 @@ class ProductTable(SQLModel, table=True):
     isActive: bool = True
 
 
-__all__ = ["Product", "InventoryItem", "InventoryRecord", "ProductTable"]
\ No newline at end of file
+__all__ = [
+    "Product",
+    "ProductSearchPage",
+    "InventoryItem",
+    "InventoryRecord",
+    "StockLine",
+    "StockReservation",
+    "StockAdjustmentLine",
+    "StockAdjustment",
+    "InventoryTable",
+    "ProductTable",
+]
\ No newline at end of file
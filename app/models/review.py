@@ -1,8 +1,11 @@
 from __future__ import annotations
 from datetime import datetime, timezone
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, Field
 from sqlmodel import SQLModel, Field as SQLField
+from sqlalchemy import Index
+
+from .user import PhotoVariant
 
 # Modelos nuevos
 class ReviewNew(BaseModel):
@@ -33,6 +36,8 @@ class ReviewLegacy(BaseModel):
     userName: Optional[str] = None
     createdAt: str  # ISO string
     userPhotoUrl: Optional[str] = None
+    # Miniaturas de la foto del usuario (64/128/512 px en webp y jpg)
+    userPhotoVariants: Optional[List[PhotoVariant]] = None
 
 
 class CreateReviewLegacy(BaseModel):
@@ -51,6 +56,8 @@ CreateReview = CreateReviewLegacy
 
 class ReviewTable(SQLModel, table=True):
     __tablename__ = "reviews"
+    # Listado por barbero, de la más reciente a la más antigua (`/reviews?barberId=`)
+    __table_args__ = (Index("ix_reviews_barber_created", "barberId", "createdAt"),)
     id: Optional[int] = SQLField(default=None, primary_key=True)
     barberId: Optional[int] = SQLField(default=None, foreign_key="barbers.id")
     serviceId: Optional[int] = SQLField(default=None, foreign_key="services.id")
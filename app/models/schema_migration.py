@@ -0,0 +1,15 @@
+from __future__ import annotations
+from datetime import datetime, timezone
+
+from sqlmodel import SQLModel, Field
+
+
+class SchemaMigrationTable(SQLModel, table=True):
+    """Migraciones de esquema ya aplicadas (ver `app/migrations.py`)."""
+    __tablename__ = "schema_migrations"
+    version: int = Field(primary_key=True)
+    name: str = Field(max_length=120)
+    applied_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+__all__ = ["SchemaMigrationTable"]
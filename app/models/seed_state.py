@@ -0,0 +1,18 @@
+from __future__ import annotations
+from datetime import datetime, timezone
+
+from sqlmodel import SQLModel, Field
+
+
+class SeedStateTable(SQLModel, table=True):
+    """Versión aplicada de cada seed (`memory`: datos de ejemplo, `admin`: usuario admin).
+
+    Si la versión guardada es la actual, el arranque no vuelve a sembrar.
+    """
+    __tablename__ = "seed_state"
+    key: str = Field(primary_key=True, max_length=32)
+    version: int
+    applied_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+__all__ = ["SeedStateTable"]
@@ -3,6 +3,7 @@ from decimal import Decimal
 from typing import Optional
 from pydantic import BaseModel
 from sqlmodel import SQLModel, Field
+from sqlalchemy import Index
 
 
 class ServiceOffering(BaseModel):
@@ -20,6 +21,8 @@ Service = ServiceOffering
 
 class ServiceTable(SQLModel, table=True):
     __tablename__ = "services"
+    # Listados por barbería, con o sin categoría (`/barbershops/{id}/services`)
+    __table_args__ = (Index("ix_services_shop_category", "barbershopId", "categoryId", "id"),)
     id: Optional[int] = Field(default=None, primary_key=True)
     barbershopId: int = Field(foreign_key="barbershops.id")
     categoryId: int = Field(foreign_key="service_categories.id")
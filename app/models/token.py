@@ -0,0 +1,19 @@
+from __future__ import annotations
+from datetime import datetime, timezone
+
+from sqlmodel import SQLModel, Field
+
+
+class RevokedTokenTable(SQLModel, table=True):
+    """Refresh tokens (por `jti`) ya usados o revocados.
+
+    `expires_at` es el `exp` del token (epoch en segundos): pasado ese instante
+    el token ya no es válido por sí mismo y la fila se puede purgar.
+    """
+    __tablename__ = "revoked_tokens"
+    jti: str = Field(primary_key=True, max_length=64)
+    expires_at: int = Field(index=True)
+    revoked_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+__all__ = ["RevokedTokenTable"]
@@ -2,10 +2,17 @@ from __future__ import annotations
 from datetime import datetime, timezone, date
 from typing import List, Optional
 
+from pydantic import BaseModel
 from sqlmodel import SQLModel, Field, Column
 from sqlalchemy import JSON
 
 
+class PhotoVariant(BaseModel):
+    size: int      # lado en px (imagen cuadrada)
+    format: str    # "webp" | "jpg"
+    url: str
+
+
 class UserTable(SQLModel, table=True):
     __tablename__ = "user"
     id: Optional[int] = Field(default=None, primary_key=True)
@@ -20,4 +27,4 @@ class UserTable(SQLModel, table=True):
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 
-__all__ = ["UserTable"]
+__all__ = ["PhotoVariant", "UserTable"]
@@ -0,0 +1,192 @@
+"""Latencia de las lecturas `async def` frente a una lectura síncrona con concurrencia creciente.
+
+- Crea una BD SQLite temporal (o usa `--database-url`) y la llena con
+  `generate_dataset.py` (semilla fija, reproducible).
+- Arranca la API con uvicorn (un worker, caché del catálogo desactivada para
+  medir siempre la consulta) y simula escrituras lentas: el script retiene el
+  bloqueo de escritura de SQLite (`--lock-ms` de cada ciclo) mientras
+  `--blockers` clientes crean reviews; esos handlers síncronos esperan el
+  bloqueo ocupando hilos del threadpool. Mientras tanto mide, con `--requests`
+  peticiones por nivel de `--concurrency`:
+    - async: `/availability`, `/reviews?barberId=`, `/services`
+    - sync (control): `/bookings?barberId=&date=` (consulta equivalente a la de disponibilidad)
+- Muestra p50/p95/p99 y peticiones/s por ruta y nivel de concurrencia.
+
+Uso (PowerShell, desde la raíz del proyecto):
+    .\.venv\Scripts\python.exe .\scripts\bench_async_reads.py [--concurrency 1 8 32 64] [--requests 400] [--blockers 48] [--max-seconds 10]
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import sqlite3
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+# Asegurar que la raíz del proyecto (carpeta que contiene 'app/') está en sys.path
+CURRENT_FILE = Path(__file__).resolve()
+PROJECT_ROOT = CURRENT_FILE.parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import httpx  # noqa: E402
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 64], help="Niveles de concurrencia")
+    parser.add_argument("--requests", type=int, default=400, help="Peticiones por ruta y nivel")
+    parser.add_argument("--max-seconds", type=float, default=10.0, help="Tiempo máximo por ruta y nivel (se cortan las peticiones restantes)")
+    parser.add_argument("--blockers", type=int, default=48, help="Clientes con escrituras lentas de fondo (0 = sin carga de fondo)")
+    parser.add_argument("--lock-ms", type=int, default=200, help="Milisegundos que se retiene el bloqueo de escritura en cada ciclo (solo SQLite)")
+    parser.add_argument("--shops", type=int, default=5, help="Barberías del conjunto de datos")
+    parser.add_argument("--days", type=int, default=180, help="Días de histórico de reservas")
+    parser.add_argument("--seed", type=int, default=42, help="Semilla aleatoria")
+    parser.add_argument("--database-url", default=None, help="BD a usar (por defecto, SQLite temporal recién generada)")
+    return parser.parse_args()
+
+
+ARGS = _parse_args() if __name__ == "__main__" else None
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _pct(values: list[float], p: float) -> float:
+    return statistics.quantiles(values, n=100)[int(p) - 1] if len(values) > 1 else values[0]
+
+
+async def _wait_ready(client: httpx.AsyncClient, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if (await client.get("/health")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.2)
+    raise SystemExit("La API no arrancó a tiempo")
+
+
+def _hold_write_lock(path: str, hold_ms: int, stop: threading.Event) -> None:
+    """Retiene el bloqueo de escritura de SQLite a ciclos (escritor lento externo)."""
+    conn = sqlite3.connect(path, isolation_level=None, timeout=30)
+    try:
+        while not stop.is_set():
+            conn.execute("BEGIN IMMEDIATE")
+            time.sleep(hold_ms / 1000)
+            conn.execute("COMMIT")
+            time.sleep(0.02)
+    finally:
+        conn.close()
+
+
+async def _blocker(client: httpx.AsyncClient, headers: dict[str, str], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        try:
+            await client.post("/reviews", json={"rating": 5, "comment": "bench"}, headers=headers)
+        except httpx.TransportError:
+            pass
+
+
+async def _measure(client: httpx.AsyncClient, make_url, requests: int, concurrency: int, max_seconds: float) -> tuple[list[float], float]:
+    """`concurrency` clientes en paralelo hasta completar `requests` o agotar `max_seconds`."""
+    latencies: list[float] = []
+    pending = iter(range(requests))
+    deadline = time.perf_counter() + max_seconds
+
+    async def worker() -> None:
+        for i in pending:
+            if time.perf_counter() > deadline:
+                return
+            url = make_url(i)
+            start = time.perf_counter()
+            r = await client.get(url)
+            latencies.append((time.perf_counter() - start) * 1000)
+            if r.status_code != 200:
+                raise SystemExit(f"{url} -> {r.status_code}: {r.text[:200]}")
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, len(latencies) / (time.perf_counter() - started)
+
+
+async def _bench(base_url: str, args: argparse.Namespace, barber_ids: list[int], sqlite_path: str | None) -> None:
+    rnd = random.Random(args.seed)
+    days = [(date.today() - timedelta(days=d)).isoformat() for d in range(0, 60)]
+    routes = {
+        "async /availability": lambda i: f"/availability?barberId={rnd.choice(barber_ids)}&dateStr={rnd.choice(days)}",
+        "async /reviews": lambda i: f"/reviews?barberId={rnd.choice(barber_ids)}",
+        "async /services": lambda i: "/services",
+        "sync /bookings": lambda i: f"/bookings?barberId={rnd.choice(barber_ids)}&date={rnd.choice(days)}",
+    }
+    limits = httpx.Limits(max_connections=max(args.concurrency) + args.blockers + 10)
+    async with httpx.AsyncClient(base_url=base_url, timeout=120, limits=limits) as client:
+        await _wait_ready(client)
+        login = await client.post("/auth/login", json={"username": "admin", "password": "admin"})
+        headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+        stop, stop_lock = asyncio.Event(), threading.Event()
+        if args.blockers and sqlite_path:
+            threading.Thread(target=_hold_write_lock, args=(sqlite_path, args.lock_ms, stop_lock), daemon=True).start()
+        blockers = [asyncio.create_task(_blocker(client, headers, stop)) for _ in range(args.blockers)]
+        await asyncio.sleep(1.0 if blockers else 0)  # que el threadpool esté ya ocupado
+        print(f"{'Ruta':<22} {'conc.':>5} {'n':>5} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'req/s':>8}")
+        try:
+            for concurrency in args.concurrency:
+                for name, make_url in routes.items():
+                    latencies, rps = await _measure(client, make_url, args.requests, concurrency, args.max_seconds)
+                    print(f"{name:<22} {concurrency:>5} {len(latencies):>5} {_pct(latencies, 50):>8.1f} {_pct(latencies, 95):>8.1f} {_pct(latencies, 99):>8.1f} {rps:>8.0f}")
+        finally:
+            stop.set()
+            stop_lock.set()
+            await asyncio.gather(*blockers, return_exceptions=True)
+
+
+def run(args: argparse.Namespace) -> None:
+    url = args.database_url
+    if url is None:
+        url = f"sqlite:///{Path(tempfile.mkdtemp(prefix='bench_async_')) / 'bench.db'}"
+        subprocess.run(
+            [sys.executable, str(PROJECT_ROOT / "scripts" / "generate_dataset.py"), "--database-url", url,
+             "--shops", str(args.shops), "--days", str(args.days), "--future-days", "7", "--users", "5000",
+             "--seed", str(args.seed)],
+            check=True, cwd=PROJECT_ROOT,
+        )
+    os.environ["DATABASE_URL"] = url
+    from sqlmodel import Session, select  # noqa: E402
+    from app.db import engine  # type: ignore  # noqa: E402
+    from app.models.barber import BarberTable  # type: ignore  # noqa: E402
+    with Session(engine) as session:
+        barber_ids = list(session.exec(select(BarberTable.id)).all())
+    sqlite_path = engine.url.database if engine.dialect.name == "sqlite" else None
+
+    port = _free_port()
+    # busy_timeout amplio: los escritores de fondo deben esperar el bloqueo, no fallar
+    env = {**os.environ, "DATABASE_URL": url, "RATE_LIMIT_ENABLED": "0", "CATALOG_CACHE_TTL": "0", "SQLITE_BUSY_TIMEOUT_MS": "60000",
+           "DB_POOL_SIZE": "40", "DB_MAX_OVERFLOW": "10"}  # pool >= hilos del threadpool (40)
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=PROJECT_ROOT, env=env,
+    )
+    try:
+        print(f"BD: {url}; {len(barber_ids)} barberos; {args.blockers} escritores de fondo; {args.requests} peticiones por nivel")
+        asyncio.run(_bench(f"http://127.0.0.1:{port}", args, barber_ids, sqlite_path))
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+    print("Benchmark completado.")
+
+
+if __name__ == "__main__":
+    run(ARGS)
@@ -0,0 +1,140 @@
+"""Compara el modo JSON normal frente al rápido (`FAST_JSON`) en `/bookings` y `/reviews`.
+
+- Crea una BD SQLite temporal con datos de seed y N reservas/reviews sintéticas.
+- Llama a la app ASGI directamente (sin red): mide el coste del handler y la serialización.
+- Valida ambas respuestas contra el esquema (`list[Booking]` / `list[Review]`) y
+  comprueba que el contenido es idéntico en los dos modos.
+
+Uso (PowerShell, desde la raíz del proyecto):
+    .\.venv\Scripts\python.exe .\scripts\bench_fast_json.py [--rows 2000] [--requests 50]
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Asegurar que la raíz del proyecto (carpeta que contiene 'app/') está en sys.path
+CURRENT_FILE = Path(__file__).resolve()
+PROJECT_ROOT = CURRENT_FILE.parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+TMP_DIR = tempfile.mkdtemp(prefix="bench_fast_json_")
+# La BD se elige al importar app.db: configurar antes de importar la app
+os.environ["DATABASE_URL"] = f"sqlite:///{Path(TMP_DIR) / 'bench.db'}"
+os.environ["RATE_LIMIT_ENABLED"] = "0"
+
+from pydantic import TypeAdapter  # noqa: E402
+from sqlmodel import Session  # noqa: E402
+
+from app.db import engine, create_db_and_tables  # type: ignore  # noqa: E402
+from app.helpers import fast_json  # type: ignore  # noqa: E402
+from app.helpers.seed import seed_memory_data  # type: ignore  # noqa: E402
+from app.main import app  # type: ignore  # noqa: E402
+from app.models.booking import Booking, BookingTable  # type: ignore  # noqa: E402
+from app.models.review import Review, ReviewTable  # type: ignore  # noqa: E402
+
+SCHEMAS = {
+    "/bookings": TypeAdapter(list[Booking]),
+    "/reviews": TypeAdapter(list[Review]),
+}
+
+
+def populate(rows: int, seed: int) -> None:
+    rnd = random.Random(seed)
+    base = datetime(2025, 1, 1, 9, 0)
+    with Session(engine) as session:
+        for i in range(rows):
+            start = base + timedelta(days=rnd.randrange(365), minutes=30 * rnd.randrange(18))
+            session.add(BookingTable(
+                barberId=rnd.randint(1, 4),
+                serviceId=rnd.randint(1, 5),
+                customerName=f"Cliente {i}",
+                customerPhone=f"6{rnd.randrange(10**8):08d}",
+                start=start.strftime("%Y-%m-%dT%H:%M"),
+                end=(start + timedelta(minutes=30)).strftime("%Y-%m-%dT%H:%M"),
+                status=rnd.choice(["confirmed", "cancelled", "completed"]),
+            ))
+            session.add(ReviewTable(
+                barberId=rnd.randint(1, 4),
+                serviceId=rnd.randint(1, 5),
+                rating=rnd.randint(1, 5),
+                comment=f"Comentario {i}",
+                userName=f"Usuario {i}",
+                createdAt=datetime(2025, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=i),
+            ))
+        session.commit()
+
+
+async def _get(path: str) -> tuple[int, bytes]:
+    scope = {
+        "type": "http",
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "server": ("bench", 80),
+        "client": ("127.0.0.1", 0),
+    }
+    status = 0
+    body = bytearray()
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            body.extend(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status, bytes(body)
+
+
+async def run(rows: int, requests: int, seed: int) -> None:
+    create_db_and_tables()
+    seed_memory_data()
+    populate(rows, seed)
+    encoder = "orjson" if fast_json.orjson is not None else "json"
+    print(f"Filas: {rows} reservas + {rows} reviews; peticiones por modo: {requests}; encoder rápido: {encoder}")
+    print(f"{'Ruta':<10} {'normal':>14} {'rápido':>14} {'mejora':>8}")
+    for path, schema in SCHEMAS.items():
+        results = {}
+        for fast in (False, True):
+            fast_json.FAST_JSON_ENABLED = fast
+            status, body = await _get(path)  # calentamiento
+            if status != 200:
+                raise SystemExit(f"{path}: HTTP {status}")
+            schema.validate_json(body)  # el modo rápido no valida en runtime: se valida aquí
+            start = time.perf_counter()
+            for _ in range(requests):
+                await _get(path)
+            results[fast] = (requests / (time.perf_counter() - start), json.loads(body))
+        if results[False][1] != results[True][1]:
+            raise SystemExit(f"{path}: las respuestas difieren entre modos")
+        rps_normal, rps_fast = results[False][0], results[True][0]
+        print(f"{path:<10} {rps_normal:>10.1f} r/s {rps_fast:>10.1f} r/s {rps_fast / rps_normal:>7.2f}x")
+    print("Esquema validado y respuestas idénticas en ambos modos.")
+    print("Benchmark completado.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2000, help="Reservas y reviews sintéticas")
+    parser.add_argument("--requests", type=int, default=50, help="Peticiones por ruta y modo")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    asyncio.run(run(max(1, args.rows), max(1, args.requests), args.seed))
@@ -0,0 +1,130 @@
+"""Compras concurrentes sobre el mismo producto: comprueba que no se vende de más.
+
+- Crea una BD SQLite temporal (o usa `--database-url`, p. ej. PostgreSQL) con los datos de seed.
+- Deja el producto con `--stock` unidades y lanza `--buyers` compras de 1 unidad en paralelo.
+- Modo `naive`: lectura-modificación-escritura en Python (lo que hacía `PUT /products/{id}`).
+- Modo `atomic`: `reserve_stock` (UPDATE condicional `stock >= n`).
+- `perdidas`: descuentos que otra escritura concurrente sobrescribió (stock que no baja).
+- Comprueba que en modo atómico las ventas coinciden con el stock inicial y que
+  `products.stock` sigue siendo la suma del inventario.
+
+Uso (PowerShell, desde la raíz del proyecto):
+    .\.venv\Scripts\python.exe .\scripts\bench_inventory_contention.py [--stock 50] [--buyers 200] [--threads 16]
+"""
+from __future__ import annotations
+import argparse
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Asegurar que la raíz del proyecto (carpeta que contiene 'app/') está en sys.path
+CURRENT_FILE = Path(__file__).resolve()
+PROJECT_ROOT = CURRENT_FILE.parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stock", type=int, default=50, help="Stock inicial del producto")
+    parser.add_argument("--buyers", type=int, default=200, help="Compras de 1 unidad lanzadas")
+    parser.add_argument("--threads", type=int, default=16, help="Hilos concurrentes")
+    parser.add_argument("--product", type=int, default=1, help="Id del producto")
+    parser.add_argument("--database-url", default=None, help="BD a usar (por defecto, SQLite temporal)")
+    return parser.parse_args()
+
+
+ARGS = _parse_args() if __name__ == "__main__" else None
+if ARGS is not None:
+    # La BD se elige al importar app.db: configurar antes de importar la app
+    os.environ["DATABASE_URL"] = ARGS.database_url or f"sqlite:///{Path(tempfile.mkdtemp(prefix='bench_inventory_')) / 'bench.db'}"
+
+from fastapi import HTTPException  # noqa: E402
+from sqlmodel import Session, select  # noqa: E402
+
+from app.db import engine, create_db_and_tables  # type: ignore  # noqa: E402
+from app.helpers.inventory import adjust_stock, default_barbershop_id, reserve_stock  # type: ignore  # noqa: E402
+from app.helpers.seed import seed_memory_data  # type: ignore  # noqa: E402
+from app.models.product import InventoryTable, ProductTable, StockAdjustmentLine, StockLine  # type: ignore  # noqa: E402
+
+
+def _buy_naive(shop_id: int, product_id: int) -> bool:
+    with Session(engine) as session:
+        row = session.get(InventoryTable, (shop_id, product_id))
+        if row is None or row.stock < 1:
+            return False
+        time.sleep(0.001)  # ventana entre leer y escribir (latencia de red/ORM)
+        row.stock -= 1
+        session.add(row)
+        session.commit()
+        return True
+
+
+def _buy_atomic(shop_id: int, product_id: int) -> bool:
+    with Session(engine) as session:
+        try:
+            reserve_stock(session, shop_id, [StockLine(productId=product_id, quantity=1)])
+            return True
+        except HTTPException as e:
+            if e.status_code == 409:
+                return False
+            raise
+
+
+def _reset(shop_id: int, product_id: int, stock: int) -> None:
+    with Session(engine) as session:
+        adjust_stock(session, shop_id, [StockAdjustmentLine(productId=product_id, stock=stock)])
+        # El modo naive no mantiene products.stock: recalcularlo como suma del inventario
+        product = session.get(ProductTable, product_id)
+        product.stock = sum(session.exec(select(InventoryTable.stock).where(InventoryTable.productId == product_id)).all())
+        session.add(product)
+        session.commit()
+
+
+def _stocks(shop_id: int, product_id: int) -> tuple[int, int, int]:
+    with Session(engine) as session:
+        row = session.get(InventoryTable, (shop_id, product_id))
+        total = sum(session.exec(select(InventoryTable.stock).where(InventoryTable.productId == product_id)).all())
+        product = session.get(ProductTable, product_id)
+        return row.stock, total, product.stock
+
+
+def run(stock: int, buyers: int, threads: int, product_id: int) -> None:
+    create_db_and_tables()
+    seed_memory_data()
+    with Session(engine) as session:
+        shop_id = default_barbershop_id(session)
+    if shop_id is None:
+        raise SystemExit("No hay barberías en la BD")
+    print(f"BD: {engine.url}; stock inicial {stock}, {buyers} compras, {threads} hilos")
+    print(f"{'Modo':<8} {'vendidas':>9} {'rechazadas':>11} {'stock final':>12} {'sobreventa':>11} {'perdidas':>9} {'tiempo':>9}")
+    failed = False
+    for mode, buy in (("naive", _buy_naive), ("atomic", _buy_atomic)):
+        _reset(shop_id, product_id, stock)
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            results = list(pool.map(lambda _: buy(shop_id, product_id), range(buyers)))
+        elapsed = time.perf_counter() - start
+        sold = sum(results)
+        shop_stock, total, product_stock = _stocks(shop_id, product_id)
+        oversold = max(0, sold - stock)
+        lost = shop_stock - (stock - sold)  # descuentos pisados por otra escritura
+        print(f"{mode:<8} {sold:>9} {buyers - sold:>11} {shop_stock:>12} {oversold:>11} {lost:>9} {elapsed:>8.2f}s")
+        if mode == "atomic":
+            if sold != min(stock, buyers) or shop_stock != stock - sold:
+                print("ERROR: el modo atómico no cuadra (ventas/stock)")
+                failed = True
+            if product_stock != total:
+                print(f"ERROR: products.stock ({product_stock}) != suma del inventario ({total})")
+                failed = True
+    if failed:
+        raise SystemExit(1)
+    print("Sin sobreventa en modo atómico; products.stock coincide con el inventario.")
+    print("Benchmark completado.")
+
+
+if __name__ == "__main__":
+    run(max(0, ARGS.stock), max(1, ARGS.buyers), max(1, ARGS.threads), ARGS.product)
@@ -0,0 +1,119 @@
+"""Latencia de `/barbershops/nearby` con miles de barberías.
+
+- Crea una BD SQLite temporal (o usa `--database-url`) y añade `--shops` barberías
+  repartidas al azar por la península (semilla fija, reproducible).
+- Lanza `--queries` búsquedas desde puntos aleatorios con `query_nearby`
+  (poda por geohash en SQL + haversine) y las compara con la fuerza bruta
+  (haversine sobre todas las barberías): mismos ids y en el mismo orden.
+- Muestra p50/p95 de ambas y la media de candidatos leídos por búsqueda.
+
+Uso (PowerShell, desde la raíz del proyecto):
+    .\.venv\Scripts\python.exe .\scripts\bench_nearby.py [--shops 5000] [--queries 300] [--radius 5]
+"""
+from __future__ import annotations
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Asegurar que la raíz del proyecto (carpeta que contiene 'app/') está en sys.path
+CURRENT_FILE = Path(__file__).resolve()
+PROJECT_ROOT = CURRENT_FILE.parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--shops", type=int, default=5000, help="Barberías a generar")
+    parser.add_argument("--queries", type=int, default=300, help="Búsquedas a medir")
+    parser.add_argument("--radius", type=float, default=5.0, help="Radio en km")
+    parser.add_argument("--limit", type=int, default=20, help="Máximo de resultados por búsqueda")
+    parser.add_argument("--seed", type=int, default=42, help="Semilla aleatoria")
+    parser.add_argument("--database-url", default=None, help="BD a usar (por defecto, SQLite temporal)")
+    return parser.parse_args()
+
+
+ARGS = _parse_args() if __name__ == "__main__" else None
+if ARGS is not None:
+    # La BD se elige al importar app.db: configurar antes de importar la app
+    os.environ["DATABASE_URL"] = ARGS.database_url or f"sqlite:///{Path(tempfile.mkdtemp(prefix='bench_nearby_')) / 'bench.db'}"
+
+from sqlalchemy import insert  # noqa: E402
+from sqlmodel import Session, select  # noqa: E402
+
+from app.db import engine, create_db_and_tables  # type: ignore  # noqa: E402
+from app.endpoints.barbershop import query_nearby  # type: ignore  # noqa: E402
+from app.helpers.geo import covering_cells, geohash_encode, nearest  # type: ignore  # noqa: E402
+from app.helpers.seed import seed_memory_data  # type: ignore  # noqa: E402
+from app.models.barbershop import BarbershopTable  # type: ignore  # noqa: E402
+
+# Rectángulo aproximado de la península ibérica
+LAT_RANGE = (36.0, 43.7)
+LNG_RANGE = (-9.3, 3.3)
+HOURS = {d: {"open": "09:00", "close": "20:00"} for d in ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday")}
+
+
+def _populate(rnd: random.Random, shops: int) -> None:
+    rows = []
+    for i in range(shops):
+        lat, lng = rnd.uniform(*LAT_RANGE), rnd.uniform(*LNG_RANGE)
+        rows.append({
+            "name": f"Bench {i}", "phone": "000000000", "email": f"bench{i}@example.com",
+            "address": "-", "city": "-", "country": "ES", "latitude": lat, "longitude": lng,
+            "isActive": rnd.random() > 0.05, "timezone": "Europe/Madrid",
+            "openingHours": HOURS, "geohash": geohash_encode(lat, lng),
+        })
+    with engine.begin() as conn:
+        conn.execute(insert(BarbershopTable), rows)
+
+
+def _pct(values: list[float], p: float) -> float:
+    return statistics.quantiles(values, n=100)[int(p) - 1] if len(values) > 1 else values[0]
+
+
+def run(shops: int, queries: int, radius: float, limit: int, seed: int) -> None:
+    create_db_and_tables()
+    seed_memory_data()
+    rnd = random.Random(seed)
+    _populate(rnd, shops)
+    with Session(engine) as session:
+        everything = session.exec(select(BarbershopTable).where(BarbershopTable.isActive == True)).all()  # noqa: E712
+        total = session.exec(select(BarbershopTable.id)).all()
+    print(f"BD: {engine.url}; {len(total)} barberías, {queries} búsquedas, radio {radius} km")
+
+    t_index, t_brute, found, cells_count = [], [], [], []
+    mismatches = 0
+    with Session(engine) as session:
+        for _ in range(queries):
+            lat, lng = rnd.uniform(*LAT_RANGE), rnd.uniform(*LNG_RANGE)
+            start = time.perf_counter()
+            result = query_nearby(session, lat, lng, radius, limit=limit)
+            t_index.append((time.perf_counter() - start) * 1000)
+
+            start = time.perf_counter()
+            brute = nearest(everything, lat, lng, radius)[:limit]
+            t_brute.append((time.perf_counter() - start) * 1000)
+
+            cells_count.append(len(covering_cells(lat, lng, radius)))
+            found.append(len(result))
+            if [s.id for s in result] != [s.id for _, s in brute]:
+                mismatches += 1
+
+    print(f"{'Modo':<10} {'p50 ms':>8} {'p95 ms':>8}")
+    print(f"{'geohash':<10} {_pct(t_index, 50):>8.2f} {_pct(t_index, 95):>8.2f}")
+    print(f"{'bruta':<10} {_pct(t_brute, 50):>8.2f} {_pct(t_brute, 95):>8.2f}")
+    print(f"Resultados por búsqueda: media {statistics.mean(found):.1f}; celdas por búsqueda: media {statistics.mean(cells_count):.1f}")
+    if mismatches:
+        print(f"ERROR: {mismatches} búsquedas no coinciden con la fuerza bruta")
+        raise SystemExit(1)
+    print("Resultados idénticos a la fuerza bruta.")
+    print("Benchmark completado.")
+
+
+if __name__ == "__main__":
+    run(max(1, ARGS.shops), max(1, ARGS.queries), ARGS.radius, max(1, ARGS.limit), ARGS.seed)
@@ -0,0 +1,107 @@
+"""Compara peticiones/segundo de `StaticFiles` (montaje anterior) frente a `CachedStaticFiles`.
+
+- Llama directamente a la app ASGI (sin red ni servidor): mide solo el coste del handler.
+- Escenarios: GET completo, GET condicional (`If-None-Match`, 304) y GET con `Range`.
+- Usa un fichero temporal (por defecto 256 KB) con nombre por hash, como las fotos.
+
+Uso (PowerShell, desde la raíz del proyecto):
+    .\.venv\Scripts\python.exe .\scripts\bench_static.py [--requests 2000] [--size-kb 256]
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import hashlib
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Asegurar que la raíz del proyecto (carpeta que contiene 'app/') está en sys.path
+CURRENT_FILE = Path(__file__).resolve()
+PROJECT_ROOT = CURRENT_FILE.parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from starlette.staticfiles import StaticFiles  # noqa: E402
+from app.helpers.static_files import CachedStaticFiles  # type: ignore  # noqa: E402
+
+
+async def _request(app, path: str, headers: dict[str, str]) -> tuple[int, dict[str, str], int]:
+    scope = {
+        "type": "http",
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+        "server": ("bench", 80),
+        "client": ("127.0.0.1", 0),
+    }
+    status = 0
+    resp_headers: dict[str, str] = {}
+    received = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status, resp_headers, received
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            resp_headers = {k.decode(): v.decode() for k, v in message["headers"]}
+        elif message["type"] == "http.response.body":
+            received += len(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status, resp_headers, received
+
+
+async def _bench(app, path: str, headers: dict[str, str], n: int) -> tuple[float, int, int]:
+    status, _, size = await _request(app, path, headers)  # calentamiento
+    start = time.perf_counter()
+    for _ in range(n):
+        await _request(app, path, headers)
+    elapsed = time.perf_counter() - start
+    return n / elapsed, status, size
+
+
+async def run(n: int, size_kb: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        payload = os.urandom(size_kb * 1024)
+        name = f"{hashlib.sha256(payload).hexdigest()}.jpg"
+        Path(tmp, name).write_bytes(payload)
+        path = f"/{name}"
+
+        plain = StaticFiles(directory=tmp)
+        cached = CachedStaticFiles(directory=tmp)
+        _, plain_headers, _ = await _request(plain, path, {})
+        _, cached_headers, _ = await _request(cached, path, {})
+
+        scenarios = [
+            ("GET completo", {}, {}),
+            ("GET condicional", {"if-none-match": plain_headers["etag"]}, {"if-none-match": cached_headers["etag"]}),
+            ("GET Range 0-1023", {"range": "bytes=0-1023"}, {"range": "bytes=0-1023"}),
+        ]
+        print(f"Fichero: {size_kb} KB, peticiones por escenario: {n}")
+        print(f"{'Escenario':<20} {'StaticFiles':>22} {'CachedStaticFiles':>22}")
+        for label, plain_req, cached_req in scenarios:
+            rps_plain, st_plain, sz_plain = await _bench(plain, path, plain_req, n)
+            rps_cached, st_cached, sz_cached = await _bench(cached, path, cached_req, n)
+            print(
+                f"{label:<20} {rps_plain:>10.0f} req/s ({st_plain}, {sz_plain // 1024} KB)"
+                f" {rps_cached:>10.0f} req/s ({st_cached}, {sz_cached // 1024} KB)"
+            )
+        print(f"Cache-Control (nuevo): {cached_headers.get('cache-control')}")
+        print("Benchmark completado.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000, help="Peticiones por escenario")
+    parser.add_argument("--size-kb", type=int, default=256, help="Tamaño del fichero de prueba")
+    args = parser.parse_args()
+    asyncio.run(run(max(1, args.requests), max(1, args.size_kb)))
@@ -0,0 +1,53 @@
+"""Elimina fotos de usuario huérfanas (no referenciadas en BD) de `static/user-photos`.
+
+- Solo borra ficheros más antiguos que `--grace` segundos (subidas en curso).
+- Borra por lotes (`--batch`) con pausa opcional entre lotes (`--pause`).
+- `--dry-run` solo informa.
+
+Uso (PowerShell, desde la raíz del proyecto):
+    .\.venv\Scripts\python.exe .\scripts\gc_user_photos.py [--dry-run]
+"""
+from __future__ import annotations
+import argparse
+import sys
+from pathlib import Path
+from sqlmodel import Session
+
+# Asegurar que la raíz del proyecto (carpeta que contiene 'app/') está en sys.path
+CURRENT_FILE = Path(__file__).resolve()
+PROJECT_ROOT = CURRENT_FILE.parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.db import engine, create_db_and_tables  # type: ignore
+from app.helpers.photo_storage import PHOTOS_DIR, DEFAULT_GRACE_SECONDS, gc_orphan_photos  # type: ignore
+
+
+def run(folder: Path, grace: int, batch: int, pause: float, dry_run: bool) -> None:
+    create_db_and_tables()  # asegura metadata cargada
+    with Session(engine) as session:
+        stats = gc_orphan_photos(
+            session,
+            root=folder,
+            grace_seconds=grace,
+            batch_size=batch,
+            pause_seconds=pause,
+            dry_run=dry_run,
+        )
+    print(f"Ficheros escaneados: {stats.scanned}")
+    print(f"Huérfanos: {stats.orphans}")
+    print(f"Borrados: {stats.deleted} ({stats.freed_bytes / 1024:.1f} KB)")
+    for err in stats.errors:
+        print(f"[WARN] {err}")
+    print("GC completado." if not dry_run else "Dry-run: no se ha borrado nada.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--folder", type=Path, default=PHOTOS_DIR)
+    parser.add_argument("--grace", type=int, default=DEFAULT_GRACE_SECONDS, help="Segundos de gracia")
+    parser.add_argument("--batch", type=int, default=500, help="Ficheros por lote")
+    parser.add_argument("--pause", type=float, default=0.0, help="Pausa entre lotes (s)")
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+    run(args.folder, args.grace, args.batch, args.pause, args.dry_run)
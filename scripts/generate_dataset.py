@@ -0,0 +1,385 @@
+"""Genera un conjunto de datos sintético grande para pruebas de carga.
+
+Inserta directamente en la BD configurada (`DATABASE_URL` o `--database-url`)
+datos realistas y reproducibles (misma `--seed`, mismos datos):
+
+- `--shops` barberías repartidas por ciudades españolas, con horarios variados.
+- Servicios por barbería a partir de una plantilla (precio y duración con ruido).
+- `--barbers-per-shop` barberos con perfiles de horario distintos (jornada
+  completa, mañanas, tardes, fin de semana) y un subconjunto de servicios.
+- `--users` usuarios (todos con la contraseña `--password`; el hash se calcula una vez).
+- Reservas desde hace `--days` días hasta `--future-days` días vista. La
+  densidad sigue curvas por día de la semana, mes y hora del día, con un
+  crecimiento gradual del negocio y una popularidad distinta por barbero.
+  Estados: las pasadas, mayoritariamente `completed` con parte `cancelled`;
+  las futuras, `confirmed` con alguna cancelación.
+- Reviews de una fracción (`--review-rate`) de las reservas completadas de
+  usuarios registrados, con `userId` enlazado.
+
+Todo se inserta en bloque (INSERT con `--batch-size` filas por ejecución) con
+ids asignados aquí, sin pasar por el ORM fila a fila. Los datos se añaden a
+los existentes (los ids continúan tras el máximo actual). Con la API arrancada,
+las cachés del catálogo caducan por TTL.
+
+Uso (PowerShell, desde la raíz del proyecto):
+    .\.venv\Scripts\python.exe .\scripts\generate_dataset.py [--shops 20] [--barbers-per-shop 5] [--users 20000] [--days 365]
+    # Millones de reservas:
+    .\.venv\Scripts\python.exe .\scripts\generate_dataset.py --shops 200 --days 730 --users 200000
+"""
+from __future__ import annotations
+import argparse
+import math
+import os
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Iterator
+
+# Asegurar que la raíz del proyecto (carpeta que contiene 'app/') está en sys.path
+CURRENT_FILE = Path(__file__).resolve()
+PROJECT_ROOT = CURRENT_FILE.parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--shops", type=int, default=20, help="Barberías a generar")
+    parser.add_argument("--barbers-per-shop", type=int, default=5, help="Barberos por barbería (media)")
+    parser.add_argument("--users", type=int, default=20000, help="Usuarios a generar")
+    parser.add_argument("--days", type=int, default=365, help="Días de histórico de reservas")
+    parser.add_argument("--future-days", type=int, default=30, help="Días de reservas futuras")
+    parser.add_argument("--density", type=float, default=8.0, help="Reservas medias por barbero y día laborable")
+    parser.add_argument("--linked-rate", type=float, default=0.75, help="Fracción de reservas de usuarios registrados")
+    parser.add_argument("--review-rate", type=float, default=0.25, help="Fracción de reservas completadas (con usuario) que dejan review")
+    parser.add_argument("--batch-size", type=int, default=5000, help="Filas por INSERT en bloque")
+    parser.add_argument("--password", default="password", help="Contraseña de los usuarios generados")
+    parser.add_argument("--seed", type=int, default=42, help="Semilla aleatoria")
+    parser.add_argument("--database-url", default=None, help="BD destino (por defecto, la configurada en DATABASE_URL)")
+    return parser.parse_args()
+
+
+ARGS = _parse_args() if __name__ == "__main__" else None
+if ARGS is not None and ARGS.database_url:
+    # La BD se elige al importar app.db: configurar antes de importar la app
+    os.environ["DATABASE_URL"] = ARGS.database_url
+
+from sqlalchemy import func, insert, select, text  # noqa: E402
+from sqlalchemy.engine import Connection  # noqa: E402
+
+from app.db import engine, create_db_and_tables  # type: ignore  # noqa: E402
+from app.endpoints.auth import pwd_context  # type: ignore  # noqa: E402
+from app.helpers.geo import geohash_encode  # type: ignore  # noqa: E402
+from app.helpers.seed import seed_database  # type: ignore  # noqa: E402
+from app.models.barber import BarberServiceTable, BarberTable  # type: ignore  # noqa: E402
+from app.models.barbershop import BarbershopTable  # type: ignore  # noqa: E402
+from app.models.booking import BookingTable  # type: ignore  # noqa: E402
+from app.models.category import ServiceCategoryTable  # type: ignore  # noqa: E402
+from app.models.review import ReviewTable  # type: ignore  # noqa: E402
+from app.models.service import ServiceTable  # type: ignore  # noqa: E402
+from app.models.user import UserTable  # type: ignore  # noqa: E402
+
+# (ciudad, lat, lng, zona horaria)
+CITIES = [
+    ("Madrid", 40.4168, -3.7038, "Europe/Madrid"),
+    ("Barcelona", 41.3874, 2.1686, "Europe/Madrid"),
+    ("Valencia", 39.4699, -0.3763, "Europe/Madrid"),
+    ("Sevilla", 37.3891, -5.9845, "Europe/Madrid"),
+    ("Zaragoza", 41.6488, -0.8891, "Europe/Madrid"),
+    ("Málaga", 36.7213, -4.4214, "Europe/Madrid"),
+    ("Bilbao", 43.2630, -2.9350, "Europe/Madrid"),
+    ("Valladolid", 41.6523, -4.7245, "Europe/Madrid"),
+    ("A Coruña", 43.3623, -8.4115, "Europe/Madrid"),
+    ("Las Palmas", 28.1235, -15.4363, "Atlantic/Canary"),
+]
+STREETS = ["Calle Mayor", "Gran Vía", "Avenida de la Constitución", "Calle Real", "Paseo del Prado", "Calle Nueva", "Plaza de España"]
+FIRST_NAMES = ["Juan", "Carlos", "Lucía", "María", "Javier", "Pablo", "Ana", "Sergio", "Laura", "David",
+               "Marta", "Alejandro", "Sofía", "Daniel", "Elena", "Hugo", "Paula", "Adrián", "Carmen", "Diego"]
+LAST_NAMES = ["García", "Martínez", "López", "Sánchez", "Pérez", "Gómez", "Fernández", "Díaz", "Ruiz", "Moreno",
+              "Álvarez", "Romero", "Navarro", "Torres", "Domínguez", "Vázquez", "Ramos", "Gil", "Serrano", "Blanco"]
+SPECIALTIES = ["Fade", "Barba", "Clásico", "Color", "Diseño", "Niños", "Afeitado"]
+# (nombre, categoría, precio, duración en minutos)
+SERVICE_TEMPLATE = [
+    ("Corte clásico", "Corte", 15.0, 30),
+    ("Corte Premium", "Corte", 20.0, 45),
+    ("Fade", "Corte", 18.0, 45),
+    ("Arreglo de barba", "Barba", 10.0, 30),
+    ("Afeitado tradicional", "Barba", 14.0, 30),
+    ("Corte + barba", "Barba", 25.0, 60),
+    ("Mechas", "Color", 35.0, 60),
+    ("Corte infantil", "Niños", 12.0, 30),
+]
+COMMENTS = {
+    5: ["Perfecto, como siempre.", "El mejor fade de la ciudad.", "Muy profesional y atento.", "Repetiré sin duda."],
+    4: ["Muy buen corte.", "Bien, aunque tuve que esperar un poco.", "Buen trato y buen resultado."],
+    3: ["Correcto.", "Normal, sin más.", "El corte bien, la espera larga."],
+    2: ["No quedé del todo contento.", "Llegué a mi hora y me atendieron tarde."],
+    1: ["Mala experiencia.", "No era lo que pedí."],
+}
+DAY_NAMES = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+
+# Curvas de demanda: día de la semana (isoweekday), mes y hora del día
+WEEKDAY_FACTOR = {1: 0.7, 2: 0.8, 3: 0.9, 4: 1.0, 5: 1.3, 6: 1.5, 7: 0.6}
+MONTH_FACTOR = {1: 0.8, 2: 0.85, 3: 0.95, 4: 1.0, 5: 1.05, 6: 1.15, 7: 0.9, 8: 0.6, 9: 1.0, 10: 1.0, 11: 0.95, 12: 1.3}
+
+
+def _hour_weight(minute_of_day: int) -> float:
+    # Dos picos: mediodía y salida del trabajo
+    h = minute_of_day / 60
+    return 0.3 + math.exp(-((h - 12.0) ** 2) / 2.0) + 1.4 * math.exp(-((h - 18.5) ** 2) / 1.5)
+
+
+# (probabilidad, horario semanal {isoweekday: (apertura, cierre)})
+SCHEDULE_PROFILES = [
+    (0.45, {1: ("09:00", "18:00"), 2: ("09:00", "18:00"), 3: ("09:00", "18:00"), 4: ("09:00", "20:00"), 5: ("09:00", "20:00"), 6: ("10:00", "16:00")}),
+    (0.2, {1: ("08:00", "14:00"), 2: ("08:00", "14:00"), 3: ("08:00", "14:00"), 4: ("08:00", "14:00"), 5: ("08:00", "14:00"), 6: ("09:00", "14:00")}),
+    (0.2, {1: ("15:00", "21:00"), 2: ("15:00", "21:00"), 3: ("15:00", "21:00"), 4: ("15:00", "21:00"), 5: ("14:00", "21:00"), 6: ("10:00", "14:00")}),
+    (0.15, {4: ("10:00", "20:00"), 5: ("10:00", "20:00"), 6: ("09:00", "20:00"), 7: ("10:00", "15:00")}),
+]
+
+
+def _minutes(hhmm: str) -> int:
+    h, m = hhmm.split(":")
+    return int(h) * 60 + int(m)
+
+
+def _pick_profile(rnd: random.Random) -> dict[int, tuple[str, str]]:
+    r, acc = rnd.random(), 0.0
+    for p, profile in SCHEDULE_PROFILES:
+        acc += p
+        if r <= acc:
+            break
+    weekly = dict(profile)
+    # Variación individual: a veces libra un día entre semana
+    if len(weekly) > 4 and rnd.random() < 0.3:
+        weekly.pop(rnd.choice([d for d in weekly if d <= 5]))
+    return weekly
+
+
+def _next_ids(conn: Connection, *tables) -> dict[str, int]:
+    return {t.__tablename__: (conn.execute(select(func.max(t.id))).scalar() or 0) + 1 for t in tables}
+
+
+class _Writer:
+    """Acumula filas por tabla y las inserta en bloques de `batch_size` (un commit por bloque).
+
+    Las tablas se vacían en el orden en que recibieron su primera fila: al
+    insertar un bloque de una tabla se insertan antes las pendientes de las
+    anteriores (p. ej. `barbers` antes que `barber_services`), para no violar
+    claves ajenas en PostgreSQL.
+    """
+
+    def __init__(self, conn: Connection, batch_size: int):
+        self.conn = conn
+        self.batch_size = batch_size
+        self.buffers: dict[Any, list[dict]] = {}
+        self.counts: dict[str, int] = {}
+
+    def add(self, table, row: dict) -> None:
+        buf = self.buffers.setdefault(table, [])
+        buf.append(row)
+        if len(buf) >= self.batch_size:
+            self.flush(table)
+
+    def flush(self, table=None) -> None:
+        tables = list(self.buffers)
+        if table is not None:
+            tables = tables[: tables.index(table) + 1]  # la tabla y las que la preceden (padres)
+        for t in tables:
+            buf = self.buffers.get(t)
+            if not buf:
+                continue
+            self.conn.execute(insert(t), buf)
+            self.conn.commit()
+            self.counts[t.__tablename__] = self.counts.get(t.__tablename__, 0) + len(buf)
+            buf.clear()
+
+
+def _shops(rnd: random.Random, n: int, first_id: int) -> Iterator[dict]:
+    for i in range(n):
+        shop_id = first_id + i
+        city, lat, lng, tz = CITIES[i % len(CITIES)]
+        lat, lng = lat + rnd.uniform(-0.05, 0.05), lng + rnd.uniform(-0.05, 0.05)
+        close = rnd.choice(["20:00", "20:30", "21:00"])
+        hours: dict[str, Any] = {d: {"open": rnd.choice(["09:00", "09:30", "10:00"]), "close": close} for d in DAY_NAMES[:5]}
+        hours["saturday"] = {"open": "10:00", "close": rnd.choice(["14:00", "16:00", "20:00"])}
+        hours["sunday"] = {"open": "10:00", "close": "15:00"} if rnd.random() < 0.2 else None
+        yield {
+            "id": shop_id, "name": f"Barbería {rnd.choice(LAST_NAMES)} {shop_id}",
+            "phone": f"+34 9{rnd.randint(10000000, 99999999)}", "email": f"shop{shop_id}@example.com",
+            "address": f"{rnd.choice(STREETS)} {rnd.randint(1, 200)}", "city": city, "country": "España",
+            "latitude": lat, "longitude": lng, "geohash": geohash_encode(lat, lng),
+            "isActive": rnd.random() > 0.03, "timezone": tz, "openingHours": hours,
+            "images": [], "about": "Barbería generada para pruebas de carga.", "social": None,
+        }
+
+
+def generate(args: argparse.Namespace) -> None:
+    rnd = random.Random(args.seed)
+    create_db_and_tables()
+    seed_database()  # categorías y datos base si la BD es nueva
+    today = date.today()
+    now_str = datetime.now().strftime("%Y-%m-%dT%H:%M")
+    now_utc = datetime.now(timezone.utc)  # tope de `createdAt` de las reviews
+    first_day = today - timedelta(days=max(0, args.days))
+    last_day = today + timedelta(days=max(0, args.future_days))
+    total_days = max(1, (last_day - first_day).days)
+    print(f"BD: {engine.url}; semilla {args.seed}; reservas del {first_day} al {last_day}")
+
+    started = time.perf_counter()
+    with engine.connect() as conn:
+        ids = _next_ids(conn, BarbershopTable, ServiceTable, BarberTable, UserTable, BookingTable, ReviewTable)
+        categories = {name: cid for cid, name in conn.execute(select(ServiceCategoryTable.id, ServiceCategoryTable.name))}
+        default_category = next(iter(categories.values()), None)
+        writer = _Writer(conn, max(1, args.batch_size))
+
+        # Barberías y servicios
+        shop_rows = list(_shops(rnd, max(0, args.shops), ids["barbershops"]))
+        for row in shop_rows:
+            writer.add(BarbershopTable, row)
+        writer.flush()
+        services_by_shop: dict[int, list[tuple[int, int]]] = {}  # barbería -> [(id, duración)]
+        service_id = ids["services"]
+        for shop in shop_rows:
+            for name, category, price, duration in SERVICE_TEMPLATE:
+                if rnd.random() < 0.2:
+                    continue  # no todas las barberías ofrecen todo
+                writer.add(ServiceTable, {
+                    "id": service_id, "barbershopId": shop["id"], "categoryId": categories.get(category, default_category),
+                    "name": name, "description": None, "price": Decimal(str(round(price * rnd.uniform(0.85, 1.3), 2))),
+                    "durationMinutes": duration, "isActive": True,
+                })
+                services_by_shop.setdefault(shop["id"], []).append((service_id, duration))
+                service_id += 1
+        writer.flush()
+
+        # Barberos (horario, servicios y popularidad propios)
+        barbers: list[dict] = []
+        barber_id = ids["barbers"]
+        for shop in shop_rows:
+            offered = services_by_shop.get(shop["id"], [])
+            if not offered:
+                continue
+            for _ in range(max(1, round(rnd.gauss(args.barbers_per_shop, 1)))):
+                weekly = _pick_profile(rnd)
+                own = rnd.sample(offered, k=rnd.randint(min(2, len(offered)), len(offered)))
+                row = {
+                    "id": barber_id, "barbershopId": shop["id"],
+                    "name": f"{rnd.choice(FIRST_NAMES)} {rnd.choice(LAST_NAMES)}",
+                    "specialty": ", ".join(rnd.sample(SPECIALTIES, k=2)), "photoUrl": None,
+                    "isActive": rnd.random() > 0.05,
+                    "workingHours": {
+                        "timezone": shop["timezone"],
+                        "weekly": [{"day": d, "open": o, "close": c} for d, (o, c) in sorted(weekly.items())],
+                        "exceptions": [],
+                    },
+                    "servicesOffered": sorted(s for s, _ in own),
+                }
+                writer.add(BarberTable, row)
+                for s, _ in own:
+                    writer.add(BarberServiceTable, {"barberId": barber_id, "serviceId": s})
+                barbers.append({
+                    **row, "services": own, "weekly": {d: (_minutes(o), _minutes(c)) for d, (o, c) in weekly.items()},
+                    "popularity": rnd.lognormvariate(0, 0.35), "quality": rnd.uniform(-0.6, 0.4),
+                })
+                barber_id += 1
+        writer.flush()
+
+        # Usuarios (mismo hash para todos: calcularlo por usuario sería lo más lento del script)
+        password_hash = pwd_context.hash(args.password)
+        users: list[tuple[int, str]] = []
+        for i in range(max(0, args.users)):
+            uid = ids["user"] + i
+            name = f"{rnd.choice(FIRST_NAMES)} {rnd.choice(LAST_NAMES)}"
+            writer.add(UserTable, {
+                "id": uid, "username": f"loadtest{uid}", "email": f"loadtest{uid}@example.com", "name": name,
+                "phone": f"+34 6{rnd.randint(10000000, 99999999)}",
+                "birth_date": date(1950, 1, 1) + timedelta(days=rnd.randint(0, 365 * 55)), "photo_url": None,
+                "password_hash": password_hash, "roles": ["user"],
+                "created_at": datetime.combine(first_day, datetime.min.time(), timezone.utc) + timedelta(minutes=rnd.randint(0, total_days * 1440)),
+            })
+            users.append((uid, name))
+        writer.flush()
+
+        # Reservas y reviews, barbero a barbero y día a día
+        booking_id, review_id = ids["bookings"], ids["reviews"]
+        slot = 30
+        for barber in barbers:
+            services = barber["services"]
+            day = first_day
+            while day <= last_day:
+                hours = barber["weekly"].get(day.isoweekday())
+                if hours is None:
+                    day += timedelta(days=1)
+                    continue
+                open_m, close_m = hours
+                growth = 0.6 + 0.4 * (day - first_day).days / total_days  # el negocio crece con el tiempo
+                expected = args.density * barber["popularity"] * WEEKDAY_FACTOR[day.isoweekday()] * MONTH_FACTOR[day.month] * growth
+                starts = list(range(open_m, close_m - slot + 1, slot))
+                weights = [_hour_weight(m) for m in starts]
+                scale = expected / (sum(weights) or 1)
+                busy_until = -1
+                for m, w in zip(starts, weights):
+                    if m < busy_until or rnd.random() >= w * scale:
+                        continue
+                    service, duration = rnd.choice(services)
+                    if m + duration > close_m:
+                        continue
+                    busy_until = m + duration
+                    start_dt = datetime(day.year, day.month, day.day) + timedelta(minutes=m)
+                    end_dt = start_dt + timedelta(minutes=duration)
+                    start, end = start_dt.strftime("%Y-%m-%dT%H:%M"), end_dt.strftime("%Y-%m-%dT%H:%M")
+                    r = rnd.random()
+                    if end <= now_str:
+                        status = "completed" if r < 0.83 else "cancelled" if r < 0.95 else "confirmed"
+                    else:
+                        status = "confirmed" if r < 0.9 else "cancelled"
+                    user = None
+                    if users and rnd.random() < args.linked_rate:
+                        user = users[int(len(users) * rnd.random() ** 2)]  # clientes habituales: sesgo a los primeros
+                    writer.add(BookingTable, {
+                        "id": booking_id, "barbershopId": barber["barbershopId"], "barberId": barber["id"],
+                        "serviceId": service, "userId": user[0] if user else None,
+                        "customerName": user[1] if user else f"{rnd.choice(FIRST_NAMES)} {rnd.choice(LAST_NAMES)}",
+                        "customerPhone": f"+34 6{rnd.randint(10000000, 99999999)}",
+                        "start": start, "end": end, "status": status,
+                    })
+                    booking_id += 1
+                    if user and status == "completed" and rnd.random() < args.review_rate:
+                        score = rnd.gauss(4.3 + barber["quality"], 0.9)
+                        rating = min(5, max(1, round(score)))
+                        # Entre 1 y 72 h tras la cita, sin pasar de ahora (citas que acaban de terminar)
+                        created = end_dt.replace(tzinfo=timezone.utc) + timedelta(hours=rnd.uniform(1, 72))
+                        writer.add(ReviewTable, {
+                            "id": review_id, "barberId": barber["id"], "serviceId": service, "rating": rating,
+                            "comment": rnd.choice(COMMENTS[rating]) if rnd.random() < 0.7 else None,
+                            "userName": user[1], "userPhotoUrl": None, "userId": user[0],
+                            "createdAt": min(created, now_utc),
+                        })
+                        review_id += 1
+                day += timedelta(days=1)
+        writer.flush()
+
+        if engine.url.drivername.startswith("postgresql"):
+            # Ids explícitos: adelantar las secuencias para que los INSERT de la API no choquen
+            for table in (BarbershopTable, ServiceTable, BarberTable, UserTable, BookingTable, ReviewTable):
+                name = table.__tablename__
+                conn.execute(text(
+                    f"SELECT setval(pg_get_serial_sequence('\"{name}\"', 'id'), (SELECT COALESCE(MAX(id), 1) FROM \"{name}\"))"
+                ))
+            conn.commit()
+
+    elapsed = time.perf_counter() - started
+    total = sum(writer.counts.values())
+    print(f"{'Tabla':<16} {'Filas':>10}")
+    for name, count in writer.counts.items():
+        print(f"{name:<16} {count:>10}")
+    print(f"Total: {total} filas en {elapsed:.1f} s ({total / elapsed if elapsed else 0:,.0f} filas/s)")
+    print("Generación completada.")
+
+
+if __name__ == "__main__":
+    generate(ARGS)
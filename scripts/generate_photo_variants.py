@@ -0,0 +1,78 @@
+"""Regenera las miniaturas (64/128/512 px, webp y jpg) de las fotos de usuario.
+
+- Recorre `static/user-photos` y procesa cada original (ignora las variantes).
+- Por defecto solo genera las que faltan; `--force` las rehace todas.
+- Usa varios procesos (`--workers`).
+
+Uso (PowerShell, desde la raíz del proyecto):
+    .\.venv\Scripts\python.exe .\scripts\generate_photo_variants.py [--force] [--workers 4]
+"""
+from __future__ import annotations
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+# Asegurar que la raíz del proyecto (carpeta que contiene 'app/') está en sys.path
+CURRENT_FILE = Path(__file__).resolve()
+PROJECT_ROOT = CURRENT_FILE.parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.helpers.images import (  # type: ignore
+    PHOTO_VARIANT_FORMATS,
+    PHOTO_VARIANT_SIZES,
+    generate_variants,
+    is_variant_filename,
+    variant_filename,
+)
+
+PHOTO_EXTS = {".jpg", ".jpeg", ".png", ".webp"}
+
+
+def _originals(folder: Path) -> list[Path]:
+    return sorted(
+        p for p in folder.rglob("*")
+        if p.is_file() and p.suffix.lower() in PHOTO_EXTS and not is_variant_filename(p.name)
+    )
+
+
+def _missing_variants(path: Path) -> bool:
+    return any(
+        not (path.parent / variant_filename(path.name, size, fmt)).exists()
+        for size in PHOTO_VARIANT_SIZES
+        for fmt in PHOTO_VARIANT_FORMATS
+    )
+
+
+def run(folder: Path, force: bool, workers: int) -> None:
+    if not folder.is_dir():
+        print(f"No existe la carpeta: {folder}")
+        return
+    originals = _originals(folder)
+    pending = [p for p in originals if force or _missing_variants(p)]
+    print(f"Originales: {len(originals)}")
+    print(f"Pendientes: {len(pending)}")
+    done = failed = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(generate_variants, str(p)): p for p in pending}
+        for fut in as_completed(futures):
+            try:
+                fut.result()
+                done += 1
+            except Exception as e:
+                failed += 1
+                print(f"[WARN] {futures[fut].name}: {e}")
+    print(f"Generadas: {done}")
+    print(f"Fallidas: {failed}")
+    print("Variantes completadas.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--folder", type=Path, default=PROJECT_ROOT / "static" / "user-photos")
+    parser.add_argument("--force", action="store_true", help="Regenerar aunque ya existan")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+    run(args.folder, args.force, max(1, args.workers))